@@ -36,6 +36,7 @@ from bs4 import BeautifulSoup
 from app.core.adapter_registry import (
     DataSourceAdapter, AdapterConfig, FetchResult, DataSourceType
 )
+from app.core.http_cache import get_http_cache
 from app.core.http_client import ResilientHTTPClient, RateLimitConfig, RetryConfig
 from app.adapters.robots_checker import robots_checker, USER_AGENT
 
@@ -1117,6 +1118,7 @@ def get_comicbookrealm_client() -> ResilientHTTPClient:
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.5",
         },
+        cache=get_http_cache(),
     )
 
 
@@ -1,11 +1,15 @@
 """
-Comic Vine API Adapter v1.10.0
+Comic Vine API Adapter v1.11.0
 
 Integration with Comic Vine API for comic metadata enrichment.
 
 API Docs: https://comicvine.gamespot.com/api/documentation
 Rate Limit: 200 requests/hour (non-commercial use only)
 
+v1.11.0: PERF-035 - resolve_volume_ids() serves series -> volume IDs from
+the shared series resolution store; fetch_page() accepts issue_number so
+a known volume is an exact issue lookup instead of a free-text search.
+
 Per constitution_data_hygiene.json: No PII storage.
 Per constitution_logging.json: Structured logging with correlation IDs.
 """
@@ -155,6 +159,8 @@ class ComicVineAdapter(DataSourceAdapter):
                 filter_parts.append(f"volume:{filters['volume_id']}")
             if "name" in filters:
                 filter_parts.append(f"name:{filters['name']}")
+            if filters.get("issue_number"):
+                filter_parts.append(f"issue_number:{filters['issue_number']}")
 
             if filter_parts:
                 params["filter"] = ",".join(filter_parts)
@@ -326,6 +332,47 @@ class ComicVineAdapter(DataSourceAdapter):
                 errors=[{"message": str(e)}],
             )
 
+    async def resolve_volume_ids(
+        self,
+        series_name: str,
+        publisher_name: Optional[str] = None,
+        start_year: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Comic Vine volume IDs whose name matches series_name exactly
+        (after normalization), best candidates first.
+
+        PERF-035: Served from the series resolution store when known; only
+        a store miss costs a volume search. Failed searches aren't cached.
+        """
+        from app.services.series_resolution import get_series_resolution_store, names_match
+
+        async def search():
+            result = await self.search_volumes(series_name, limit=20)
+            if not result.success:
+                return None
+            matches = [
+                v for v in result.records
+                if v.get("id") and names_match(series_name, v.get("name"))
+            ]
+            if publisher_name:
+                same_publisher = [
+                    v for v in matches
+                    if names_match(publisher_name, (v.get("publisher") or {}).get("name"))
+                ]
+                matches = same_publisher or matches
+            if start_year:
+                matches.sort(key=lambda v: str(v.get("start_year")) != str(start_year))
+            confidence = 1.0 if len(matches) == 1 or (
+                start_year and matches and str(matches[0].get("start_year")) == str(start_year)
+            ) else 0.7
+            return [v["id"] for v in matches[:3]], confidence
+
+        resolution = await get_series_resolution_store().resolve(
+            "comicvine", series_name, search, publisher=publisher_name, start_year=start_year
+        )
+        return resolution.series_ids if resolution else []
+
     def normalize(self, record: Dict[str, Any]) -> Dict[str, Any]:
         """
         Normalize a Comic Vine record to our canonical schema.
@@ -30,6 +30,7 @@ import re
 from typing import Any, Dict, Optional, List, Tuple
 from bs4 import BeautifulSoup
 
+from app.core.http_cache import get_http_cache
 from app.core.http_client import ResilientHTTPClient, RateLimitConfig
 
 logger = logging.getLogger(__name__)
@@ -104,7 +105,8 @@ class FandomAdapter:
                     requests_per_second=1.0,
                     burst_limit=3,
                     min_request_interval=1.0,
-                )
+                ),
+                cache=get_http_cache(),
             )
         else:
             self.client = client
@@ -37,6 +37,7 @@ from app.core.adapter_registry import (
     FetchResult,
     MARVEL_FANDOM_CONFIG,
 )
+from app.core.http_cache import get_http_cache
 from app.core.http_client import ResilientHTTPClient
 
 logger = logging.getLogger(__name__)
@@ -64,7 +65,8 @@ class MarvelFandomAdapter(DataSourceAdapter):
                     requests_per_second=1.0,
                     burst_limit=3,
                     min_request_interval=1.0,
-                )
+                ),
+                cache=get_http_cache(),
             )
 
         super().__init__(config, client)
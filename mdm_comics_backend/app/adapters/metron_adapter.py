@@ -1,10 +1,15 @@
 """
-Metron Adapter v2.0.0
+Metron Adapter v2.1.0
 
 Adapter for Metron API using official Mokkari library.
 https://metron.cloud/
 https://github.com/Metron-Project/mokkari
 
+v2.1.0 Changes:
+- PERF-035: Series-name searches resolve the series ID through the shared
+  series resolution store, so a series is searched once (per TTL) across
+  all jobs and replicas instead of once per issue
+
 v2.0.0 Changes:
 - REFACTOR: Use official Mokkari library instead of custom HTTP client
 - Built-in rate limiting: 30 req/min, 10,000 req/day (SQLite persisted)
@@ -17,6 +22,7 @@ Per pipeline spec:
 import asyncio
 import os
 import logging
+import re
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -475,6 +481,38 @@ class MetronAdapter(DataSourceAdapter):
 
         return await self.fetch_page(page=page, endpoint="series", **filters)
 
+    async def resolve_series_ids(
+        self,
+        series_name: str,
+        publisher_name: Optional[str] = None,
+        year_began: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Up to 5 Metron series IDs for a series name.
+
+        PERF-035: Served from the series resolution store when known; only
+        a store miss costs a series search. Failed searches aren't cached.
+        """
+        from app.services.series_resolution import get_series_resolution_store, names_match
+
+        async def search():
+            result = await self.search_series(name=series_name, publisher_name=publisher_name, year_began=year_began)
+            if not result.success:
+                return None
+            records = [r for r in result.records[:5] if r.get("id")]
+            exact = any(
+                names_match(series_name, re.sub(r"\s*\(\d{4}\)$", "", r.get("name") or r.get("series") or ""))
+                for r in records
+            )
+            return [r["id"] for r in records], 1.0 if exact else 0.5
+
+        resolution = await get_series_resolution_store().resolve(
+            "metron", series_name, search, publisher=publisher_name, start_year=year_began
+        )
+        series_ids = resolution.series_ids if resolution else []
+        logger.debug(f"[METRON] Found {len(series_ids)} series matching '{series_name}'")
+        return series_ids
+
     async def search_issues(
         self,
         series_name: Optional[str] = None,
@@ -515,11 +553,7 @@ class MetronAdapter(DataSourceAdapter):
         # PRIORITY 3: Series name search - requires series ID lookup first
         series_ids = []
         if series_name:
-            series_result = await self.search_series(name=series_name, publisher_name=publisher_name)
-            if series_result.success and series_result.records:
-                # Get up to 5 matching series IDs
-                series_ids = [r.get("id") for r in series_result.records[:5] if r.get("id")]
-                logger.debug(f"[METRON] Found {len(series_ids)} series matching '{series_name}'")
+            series_ids = await self.resolve_series_ids(series_name, publisher_name)
 
             if not series_ids:
                 # No matching series found
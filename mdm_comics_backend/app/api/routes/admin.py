@@ -17,14 +17,39 @@ from sqlalchemy import select, func, text, and_, or_
 from sqlalchemy.orm import selectinload
 
 from app.core.database import get_db
+from app.core.response_cache import invalidates
+from app.core.pagination import (
+    InvalidCursor,
+    KeysetOrder,
+    cached_total,
+    count_total,
+    decode_cursor,
+    encode_cursor,
+    fetch_page,
+    filter_signature,
+    planner_estimate,
+)
 from app.api.deps import get_current_admin
 from app.models import User, Product, BarcodeQueue, StockMovement, InventoryAlert
-from app.services.barcode_matcher import match_barcode, process_barcode_queue_item
+from app.services.barcode_matcher import (
+    BarcodeScan,
+    process_barcode_queue_batch,
+    process_barcode_queue_item,
+    resolve_barcodes,
+    scan_barcodes,
+)
+from app.services.bundle_service import BundleService
+from app.services.stat_counters import StatsService, install_stat_counters, clear_stats_cache
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
+# PERF-039: Product writes drop cached storefront responses
+INVALIDATE_PRODUCTS = Depends(invalidates("products"))
+INVALIDATE_PRODUCT = Depends(invalidates("products", "product:{product_id}"))
+INVALIDATE_PRODUCT_PRICING = Depends(invalidates("products", "product:{product_id}", "bundles"))
+
 
 # ----- Pydantic Schemas -----
 
@@ -38,6 +63,17 @@ class BarcodeQueueRequest(BaseModel):
     barcodes: List[BarcodeInput]
 
 
+class ScanInput(BaseModel):
+    barcode: str = Field(..., min_length=8, max_length=50)
+    barcode_type: str = Field(default="UPC", pattern="^(UPC|ISBN|EAN)$")
+    scan_id: Optional[str] = Field(None, min_length=1, max_length=100)
+
+
+class ScanBatchRequest(BaseModel):
+    scans: List[ScanInput] = Field(..., min_length=1, max_length=1000)
+    auto_increment_stock: bool = True
+
+
 class QueueProcessRequest(BaseModel):
     action: str = Field(..., pattern="^(create_product|add_to_existing|skip)$")
     product_data: Optional[dict] = None
@@ -74,47 +110,24 @@ async def get_dashboard(
     current_user: User = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db)
 ):
-    """Get admin dashboard overview with key metrics."""
-    # Product stats - use COALESCE for low_stock_threshold in case column doesn't exist
-    try:
-        product_result = await db.execute(text("""
-            SELECT
-                COUNT(*) as total_products,
-                COALESCE(SUM(stock * price), 0) as total_value,
-                COUNT(*) FILTER (WHERE stock <= COALESCE(low_stock_threshold, 5)) as low_stock_count
-            FROM products
-            WHERE deleted_at IS NULL
-        """))
-        product_row = product_result.fetchone()
-        total_products = product_row[0]
-        total_value = float(product_row[1])
-        low_stock_count = product_row[2]
-    except Exception as e:
-        logger.warning(f"Product stats query failed: {e}")
-        total_products = 0
-        total_value = 0.0
-        low_stock_count = 0
-
-    # Pending barcode queue
-    try:
-        queue_result = await db.execute(text("""
-            SELECT COUNT(*) FROM barcode_queue WHERE status = 'pending'
-        """))
-        pending_queue = queue_result.scalar() or 0
-    except Exception as e:
-        logger.warning(f"Queue query failed: {e}")
-        pending_queue = 0
+    """
+    Get admin dashboard overview with key metrics.
 
-    # Recent orders (last 7 days)
+    v1.1.0: Totals come from trigger-maintained stat_counters (one small
+    read) instead of scanning products/barcode_queue/orders per request.
+    """
+    stats = StatsService(db)
     try:
-        orders_result = await db.execute(text("""
-            SELECT COUNT(*) FROM orders
-            WHERE created_at >= NOW() - INTERVAL '7 days'
-        """))
-        recent_orders = orders_result.scalar() or 0
+        total_products = await stats.counter("products.active")
+        total_value = float((await stats.get_counters()).get("products.inventory_value", 0))
+        low_stock_count = await stats.counter("products.low_stock")
+        pending_queue = await stats.counter("barcode_queue.pending")
+        # Orders in the last 7 days, at hour granularity
+        recent_orders = await stats.get_hourly_total("orders.created", hours=7 * 24)
     except Exception as e:
-        logger.warning(f"Orders count query failed: {e}")
-        recent_orders = 0
+        logger.warning(f"Dashboard counters query failed: {e}")
+        total_products = low_stock_count = pending_queue = recent_orders = 0
+        total_value = 0.0
 
     # Recent orders list (last 5) - join with users to get email
     recent_orders_list = []
@@ -151,7 +164,7 @@ async def get_dashboard(
 
 # ----- Barcode Queue Endpoints -----
 
-@router.post("/barcode-queue/")
+@router.post("/barcode-queue/", dependencies=[INVALIDATE_PRODUCTS])
 async def add_to_barcode_queue(
     request: BarcodeQueueRequest,
     current_user: User = Depends(get_current_admin),
@@ -167,16 +180,12 @@ async def add_to_barcode_queue(
     queue_ids = []
     results = []
 
-    for barcode_input in request.barcodes:
-        # Attempt to match the barcode
-        match_result = await match_barcode(
-            db=db,
-            barcode=barcode_input.barcode,
-            barcode_type=barcode_input.barcode_type,
-            user_id=current_user.id,
-            auto_increment_stock=False  # Don't auto-increment on queue add
-        )
+    # PERF-049: match the whole request at once; queue add never touches stock
+    matches = await resolve_barcodes(db, [
+        BarcodeScan(barcode=b.barcode, barcode_type=b.barcode_type) for b in request.barcodes
+    ])
 
+    for barcode_input, match_result in zip(request.barcodes, matches):
         # Create queue entry
         queue_item = BarcodeQueue(
             barcode=barcode_input.barcode,
@@ -214,6 +223,52 @@ async def add_to_barcode_queue(
     }
 
 
+@router.post("/barcode-queue/scan-batch", dependencies=[INVALIDATE_PRODUCTS])
+async def scan_barcode_batch(
+    request: ScanBatchRequest,
+    current_user: User = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Throughput scanning: match a batch and count matched products into stock.
+
+    PERF-049: One lookup per identifier type and one stock statement for
+    the whole batch. Resending a batch with the same scan_ids after a
+    timeout is safe - scans already counted come back with duplicate=true.
+    Unmatched scans are reported, not queued.
+    """
+    results = await scan_barcodes(
+        db,
+        [BarcodeScan(barcode=s.barcode, barcode_type=s.barcode_type, scan_id=s.scan_id) for s in request.scans],
+        user_id=current_user.id,
+        auto_increment_stock=request.auto_increment_stock,
+    )
+    await db.commit()
+
+    return {
+        "scanned": len(results),
+        "stock_incremented": sum(1 for r in results if r.stock_incremented),
+        "duplicates": sum(1 for r in results if r.duplicate),
+        "unmatched": sum(1 for r in results if not r.matched),
+        "results": [
+            {
+                "scan_id": r.scan_id,
+                "barcode": s.barcode,
+                "matched": r.matched,
+                "match_type": r.match_type,
+                "product_id": r.product_id,
+                "comic_id": r.comic_id,
+                "confidence": r.confidence,
+                "stock_incremented": r.stock_incremented,
+                "new_stock": r.new_stock,
+                "duplicate": r.duplicate,
+                "message": r.message,
+            }
+            for s, r in zip(request.scans, results)
+        ],
+    }
+
+
 @router.get("/barcode-queue/")
 async def list_barcode_queue(
     status: Optional[str] = Query(None, pattern="^(pending|matched|processing|processed|failed|skipped)$"),
@@ -269,7 +324,7 @@ async def list_barcode_queue(
     }
 
 
-@router.post("/barcode-queue/{queue_id}/process")
+@router.post("/barcode-queue/{queue_id}/process", dependencies=[INVALIDATE_PRODUCTS])
 async def process_queue_item(
     queue_id: int,
     request: QueueProcessRequest,
@@ -299,56 +354,37 @@ async def process_queue_item(
     return process_result
 
 
-@router.post("/barcode-queue/batch-process")
+@router.post("/barcode-queue/batch-process", dependencies=[INVALIDATE_PRODUCTS])
 async def batch_process_queue(
     request: BatchProcessRequest,
     current_user: User = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db)
 ):
-    """Process multiple queue items at once."""
-    results = []
-    success = 0
-    errors = 0
+    """
+    Process multiple queue items at once.
 
-    for queue_id in request.ids:
-        result = await db.execute(
-            select(BarcodeQueue).where(BarcodeQueue.id == queue_id)
-        )
-        queue_item = result.scalar_one_or_none()
-
-        if not queue_item or queue_item.status in ("processed", "skipped"):
-            errors += 1
-            continue
-
-        # Determine action based on request
-        if request.action == "add_all" and queue_item.matched_product_id:
-            action = "add_to_existing"
-            product_data = None
-        elif request.action == "skip_all":
-            action = "skip"
-            product_data = None
-        else:
-            errors += 1
-            continue
+    PERF-049: add_all and skip_all each run as one statement over all ids;
+    items already processed or skipped are counted as errors, as before.
+    """
+    if request.action == "create_products":
+        # Needs per-item product data; use /barcode-queue/{id}/process
+        return {"processed": 0, "errors": len(request.ids), "results": []}
+
+    outcome = await process_barcode_queue_batch(
+        db,
+        request.ids,
+        action="add_to_existing" if request.action == "add_all" else "skip",
+        user_id=current_user.id,
+    )
+    await db.commit()
 
-        try:
-            process_result = await process_barcode_queue_item(
-                db=db,
-                queue_item=queue_item,
-                action=action,
-                product_data=product_data,
-                user_id=current_user.id
-            )
-            results.append(process_result)
-            success += 1
-        except Exception as e:
-            logger.error(f"Error processing queue item {queue_id}: {e}")
-            errors += 1
+    for failure in outcome["failures"]:
+        logger.info(f"Queue item {failure['queue_id']} not processed: {failure['message']}")
 
     return {
-        "processed": success,
-        "errors": errors,
-        "results": results
+        "processed": outcome["processed"],
+        "errors": outcome["errors"],
+        "results": outcome["results"]
     }
 
 
@@ -363,10 +399,15 @@ async def list_products(
     sort: str = Query("-updated_at", pattern="^-?(name|price|stock|updated_at|created_at)$"),
     limit: int = Query(25, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from next_cursor (overrides offset)"),
     current_user: User = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db)
 ):
-    """Enhanced product listing with inventory data."""
+    """
+    Enhanced product listing with inventory data.
+
+    PERF-034: Keyset cursor per sort, cached total and summary stats.
+    """
     query = select(Product)
 
     # Exclude soft-deleted unless requested
@@ -393,35 +434,16 @@ async def list_products(
     if low_stock:
         query = query.where(Product.stock <= Product.low_stock_threshold)
 
-    # Sorting
-    sort_desc = sort.startswith("-")
-    sort_field = sort.lstrip("-")
-    sort_col = getattr(Product, sort_field)
-    query = query.order_by(sort_col.desc() if sort_desc else sort_col)
-
-    # Get total count
-    count_query = select(func.count(Product.id))
-    if not include_deleted:
-        count_query = count_query.where(Product.deleted_at.is_(None))
-    if search:
-        count_query = count_query.where(
-            or_(
-                Product.name.ilike(search_term),
-                Product.sku.ilike(search_term),
-                Product.upc.ilike(search_term)
-            )
-        )
-    if category:
-        count_query = count_query.where(Product.category == category)
-    if low_stock:
-        count_query = count_query.where(Product.stock <= Product.low_stock_threshold)
-
-    total_result = await db.execute(count_query)
-    total = total_result.scalar()
+    # Get total count (cached per filter set, same filters as the listing)
+    signature = filter_signature(
+        "admin.products", search=search, category=category,
+        low_stock=low_stock, include_deleted=include_deleted,
+    )
+    total, total_is_estimate = await count_total(db, query, signature)
 
     # Get summary stats
-    try:
-        stats_result = await db.execute(text("""
+    async def load_summary():
+        result = await db.execute(text("""
             SELECT
                 COUNT(*) as total,
                 COALESCE(SUM(stock * price), 0) as total_value,
@@ -429,15 +451,21 @@ async def list_products(
             FROM products
             WHERE deleted_at IS NULL
         """))
-        stats = stats_result.fetchone()
+        return tuple(result.fetchone())
+
+    try:
+        stats = await StatsService(db).cached("admin_products_summary", load_summary, ttl=30)
     except Exception as e:
         logger.warning(f"Product stats query failed: {e}")
         stats = (0, 0, 0)
 
-    # Get items with pagination
-    query = query.offset(offset).limit(limit)
-    result = await db.execute(query)
-    products = result.scalars().all()
+    # Get items with pagination (sorted, id tiebreaker in the same direction)
+    order = KeysetOrder(sort, Product, [sort.lstrip("-"), "id"], descending=sort.startswith("-"))
+    try:
+        page = await fetch_page(db, query, order, limit, cursor=cursor, offset=offset)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    products = page.items
 
     return {
         "items": [
@@ -477,12 +505,15 @@ async def list_products(
             for p in products
         ],
         "total": total,
+        "total_is_estimate": total_is_estimate,
+        "next_cursor": page.next_cursor,
+        "has_more": page.has_more,
         "total_value": float(stats[1]) if stats else 0,
         "low_stock_count": stats[2] if stats else 0
     }
 
 
-@router.patch("/products/{product_id}")
+@router.patch("/products/{product_id}", dependencies=[INVALIDATE_PRODUCT_PRICING])
 async def update_product(
     product_id: int,
     request: ProductUpdateRequest,
@@ -507,12 +538,18 @@ async def update_product(
         setattr(product, field, value)
 
     product.updated_at = datetime.now(timezone.utc)
+
+    # PERF-050: Bundle items snapshot price/cost at add time; refresh those of this product
+    if "price" in update_data or "original_price" in update_data:
+        await db.flush()
+        await BundleService.reprice_for_products(db, [product_id])
+
     await db.commit()
 
     return {"status": "updated", "product_id": product_id}
 
 
-@router.delete("/products/{product_id}")
+@router.delete("/products/{product_id}", dependencies=[INVALIDATE_PRODUCT])
 async def delete_product(
     product_id: int,
     current_user: User = Depends(get_current_admin),
@@ -538,7 +575,7 @@ async def delete_product(
     return {"status": "deleted", "product_id": product_id}
 
 
-@router.post("/products/{product_id}/restore")
+@router.post("/products/{product_id}/restore", dependencies=[INVALIDATE_PRODUCT])
 async def restore_product(
     product_id: int,
     current_user: User = Depends(get_current_admin),
@@ -564,7 +601,7 @@ async def restore_product(
     return {"status": "restored", "product_id": product_id}
 
 
-@router.post("/products/{product_id}/adjust-stock")
+@router.post("/products/{product_id}/adjust-stock", dependencies=[INVALIDATE_PRODUCT])
 async def adjust_product_stock(
     product_id: int,
     request: StockAdjustmentRequest,
@@ -668,7 +705,7 @@ class BulkClearImagesRequest(BaseModel):
     product_ids: List[int] = Field(..., min_length=1)
 
 
-@router.post("/products/{product_id}/image")
+@router.post("/products/{product_id}/image", dependencies=[INVALIDATE_PRODUCT])
 async def upload_product_image(
     product_id: int,
     file: UploadFile = File(...),
@@ -724,7 +761,7 @@ async def upload_product_image(
     return {"status": "uploaded", "product_id": product_id, "image_url": upload_result.url}
 
 
-@router.delete("/products/{product_id}/image")
+@router.delete("/products/{product_id}/image", dependencies=[INVALIDATE_PRODUCT])
 async def remove_product_image(
     product_id: int,
     current_user: User = Depends(get_current_admin),
@@ -748,7 +785,7 @@ async def remove_product_image(
     return {"status": "removed", "product_id": product_id, "previous_url": previous_url}
 
 
-@router.post("/products/{product_id}/gallery")
+@router.post("/products/{product_id}/gallery", dependencies=[INVALIDATE_PRODUCT])
 async def add_gallery_image(
     product_id: int,
     file: UploadFile = File(...),
@@ -795,7 +832,7 @@ async def add_gallery_image(
     return {"status": "added", "product_id": product_id, "image_url": upload_result.url, "gallery_count": len(images)}
 
 
-@router.delete("/products/{product_id}/gallery/{index}")
+@router.delete("/products/{product_id}/gallery/{index}", dependencies=[INVALIDATE_PRODUCT])
 async def remove_gallery_image(
     product_id: int,
     index: int,
@@ -828,7 +865,7 @@ class ReorderGalleryRequest(BaseModel):
     order: List[int] = Field(..., description="New order of image indices")
 
 
-@router.put("/products/{product_id}/gallery/reorder")
+@router.put("/products/{product_id}/gallery/reorder", dependencies=[INVALIDATE_PRODUCT])
 async def reorder_gallery_images(
     product_id: int,
     request: ReorderGalleryRequest,
@@ -870,7 +907,7 @@ async def reorder_gallery_images(
     return {"status": "reordered", "product_id": product_id, "gallery_count": len(new_images)}
 
 
-@router.post("/products/{product_id}/image/demote")
+@router.post("/products/{product_id}/image/demote", dependencies=[INVALIDATE_PRODUCT])
 async def demote_primary_to_gallery(
     product_id: int,
     current_user: User = Depends(get_current_admin),
@@ -908,7 +945,7 @@ async def demote_primary_to_gallery(
     }
 
 
-@router.post("/products/{product_id}/gallery/{index}/promote")
+@router.post("/products/{product_id}/gallery/{index}/promote", dependencies=[INVALIDATE_PRODUCT])
 async def promote_gallery_to_primary(
     product_id: int,
     index: int,
@@ -956,7 +993,7 @@ async def promote_gallery_to_primary(
     }
 
 
-@router.post("/products/bulk/clear-images")
+@router.post("/products/bulk/clear-images", dependencies=[INVALIDATE_PRODUCTS])
 async def bulk_clear_images(
     request: BulkClearImagesRequest,
     current_user: User = Depends(get_current_admin),
@@ -1624,50 +1661,60 @@ async def get_pipeline_stats(
     current_user: User = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db)
 ):
-    """Get pipeline statistics including DLQ counts and record counts."""
-    # DLQ counts by status
-    dlq_result = await db.execute(text("""
-        SELECT status, COUNT(*) as count
-        FROM dead_letter_queue
-        GROUP BY status
-    """))
-    dlq_counts = {r[0]: r[1] for r in dlq_result.fetchall()}
-
-    # Record counts with pricecharting_id
-    pc_result = await db.execute(text("""
-        SELECT
-            (SELECT COUNT(*) FROM funkos WHERE pricecharting_id IS NOT NULL) as funkos_with_pc,
-            (SELECT COUNT(*) FROM comic_issues WHERE pricecharting_id IS NOT NULL) as comics_with_pc,
-            (SELECT COUNT(*) FROM funkos) as total_funkos,
-            (SELECT COUNT(*) FROM comic_issues) as total_comics
-    """))
-    counts = pc_result.fetchone()
+    """
+    Get pipeline statistics including DLQ counts and record counts.
 
-    # Price changelog count (last 24h)
-    changelog_result = await db.execute(text("""
-        SELECT COUNT(*)
-        FROM price_changelog
-        WHERE changed_at > NOW() - INTERVAL '24 hours'
-    """))
-    changes_24h = changelog_result.scalar() or 0
+    v1.1.0: Served from stat_counters rather than COUNT(*) scans.
+    """
+    stats = StatsService(db)
+    counters = await stats.get_counters()
+    dlq_counts = {
+        name.split(".", 1)[1]: int(value)
+        for name, value in counters.items()
+        if name.startswith("dead_letter_queue.")
+    }
+    counts = (
+        int(counters.get("funkos.with_pricecharting", 0)),
+        int(counters.get("comic_issues.with_pricecharting", 0)),
+        int(counters.get("funkos.total", 0)),
+        int(counters.get("comic_issues.total", 0)),
+    )
+    changes_24h = await stats.get_hourly_total("price_changelog.changes", hours=24)
 
     return {
         "dlq": {
             "pending": dlq_counts.get("PENDING", 0),
             "retrying": dlq_counts.get("RETRYING", 0),
             "resolved": dlq_counts.get("RESOLVED", 0),
-            "dead": dlq_counts.get("DEAD", 0),
+            "dead": dlq_counts.get("ABANDONED", 0),
         },
         "records": {
-            "funkos_with_pricecharting": counts[0] if counts else 0,
-            "comics_with_pricecharting": counts[1] if counts else 0,
-            "total_funkos": counts[2] if counts else 0,
-            "total_comics": counts[3] if counts else 0,
+            "funkos_with_pricecharting": counts[0],
+            "comics_with_pricecharting": counts[1],
+            "total_funkos": counts[2],
+            "total_comics": counts[3],
         },
         "price_changes_24h": changes_24h,
     }
 
 
+
+@router.post("/stats/rebuild")
+async def rebuild_stat_counters(
+    current_user: User = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Reinstall stat counter triggers and recount from source tables.
+
+    Use after bulk loads that bypass triggers (COPY with triggers disabled,
+    restores) or if counters are suspected to have drifted.
+    """
+    result = await install_stat_counters(db)
+    clear_stats_cache()
+    logger.info(f"Stat counters rebuilt by {current_user.id}: {result}")
+    return result
+
 # ----- GCD Import Management (v1.8.0) -----
 
 class GCDImportRequest(BaseModel):
@@ -1745,27 +1792,30 @@ async def get_gcd_import_status(
     checkpoint = checkpoint_result.fetchone()
 
     # Count records with gcd_id
-    gcd_count_result = await db.execute(text("""
-        SELECT COUNT(*) FROM comic_issues WHERE gcd_id IS NOT NULL
-    """))
-    gcd_count = gcd_count_result.scalar() or 0
+    stats = StatsService(db)
+    gcd_count = await stats.counter("comic_issues.with_gcd")
 
     # Data quality stats for imported records (Option 5: Data Quality Summary)
-    quality_result = await db.execute(text("""
-        SELECT
-            COUNT(*) as total,
-            COUNT(CASE WHEN image IS NOT NULL AND image != '' THEN 1 END) as with_cover,
-            COUNT(CASE WHEN description IS NOT NULL AND description != '' THEN 1 END) as with_description,
-            COUNT(CASE WHEN isbn IS NOT NULL AND isbn != '' THEN 1 END) as with_isbn,
-            COUNT(CASE WHEN upc IS NOT NULL AND upc != '' THEN 1 END) as with_upc,
-            COUNT(CASE WHEN cover_date IS NOT NULL THEN 1 END) as with_cover_date,
-            COUNT(CASE WHEN pricecharting_id IS NOT NULL THEN 1 END) as with_pricing,
-            COUNT(DISTINCT gcd_publisher_id) as unique_publishers,
-            COUNT(DISTINCT gcd_series_id) as unique_series
-        FROM comic_issues
-        WHERE gcd_id IS NOT NULL
-    """))
-    quality_row = quality_result.fetchone()
+    # v1.1.0: Full-table aggregate, cached for a few minutes; polling clients
+    # no longer rescan comic_issues on every status check
+    async def load_quality():
+        result = await db.execute(text("""
+            SELECT
+                COUNT(*) as total,
+                COUNT(CASE WHEN image IS NOT NULL AND image != '' THEN 1 END) as with_cover,
+                COUNT(CASE WHEN description IS NOT NULL AND description != '' THEN 1 END) as with_description,
+                COUNT(CASE WHEN isbn IS NOT NULL AND isbn != '' THEN 1 END) as with_isbn,
+                COUNT(CASE WHEN upc IS NOT NULL AND upc != '' THEN 1 END) as with_upc,
+                COUNT(CASE WHEN cover_date IS NOT NULL THEN 1 END) as with_cover_date,
+                COUNT(CASE WHEN pricecharting_id IS NOT NULL THEN 1 END) as with_pricing,
+                COUNT(DISTINCT gcd_publisher_id) as unique_publishers,
+                COUNT(DISTINCT gcd_series_id) as unique_series
+            FROM comic_issues
+            WHERE gcd_id IS NOT NULL
+        """))
+        return tuple(result.fetchone() or ())
+
+    quality_row = await stats.cached("gcd_data_quality", load_quality)
 
     data_quality = None
     if quality_row and quality_row[0] > 0:
@@ -3406,6 +3456,7 @@ class CoverIngestionRequest(BaseModel):
     """
     folder_path: str = Field(..., description="Path to folder containing cover images")
     limit: Optional[int] = Field(default=None, ge=1, description="Max files to process (for testing)")
+    bulk: bool = Field(default=False, description="Use bulk mode (in-memory matching, parallel hashing/uploads)")
 
 
 class SingleCoverIngestionRequest(BaseModel):
@@ -3485,7 +3536,8 @@ async def ingest_covers(
         raise HTTPException(status_code=400, detail=f"Path is not a directory: {request.folder_path}")
 
     service = get_cover_ingestion_service(db)
-    result = await service.ingest_folder(
+    ingest = service.ingest_folder_bulk if request.bulk else service.ingest_folder
+    result = await ingest(
         folder_path=request.folder_path,
         user_id=current_user.id,
         limit=request.limit
@@ -3971,6 +4023,7 @@ async def trigger_data_ingestion(
     batch_size = options.get("batch_size", 1000)
     skip_existing = options.get("skip_existing", True)
     update_existing = options.get("update_existing", False)
+    conflict_columns = options.get("conflict_columns")
     dry_run = options.get("dry_run", False)
 
     logger.info(
@@ -4025,6 +4078,7 @@ async def trigger_data_ingestion(
                     batch_size=batch_size,
                     skip_existing=skip_existing,
                     update_existing=update_existing,
+                    conflict_columns=conflict_columns,
                 )
             except Exception as e:
                 logger.error(f"CSV ingestion job failed: {e}")
@@ -4041,6 +4095,7 @@ async def trigger_data_ingestion(
                     batch_size=batch_size,
                     skip_existing=skip_existing,
                     update_existing=update_existing,
+                    conflict_columns=conflict_columns,
                 )
             except Exception as e:
                 logger.error(f"JSON ingestion job failed: {e}")
@@ -4189,9 +4244,11 @@ async def trigger_bcw_image_sync(
         "products_processed": result.products_processed,
         "products_with_images": result.products_with_images,
         "total_images_uploaded": result.total_images_uploaded,
+        "total_images_reused": result.total_images_reused,
         "errors": result.errors[:10] if result.errors else [],
         "error_count": len(result.errors),
         "duration_ms": result.duration_ms,
+        "stages": result.stages,
     }
 
 
@@ -4443,7 +4500,8 @@ async def list_funkos(
     per_page: int = Query(50, ge=10, le=200, description="Items per page"),
     search: Optional[str] = Query(None, description="Search by title"),
     has_pc_id: Optional[bool] = Query(None, description="Filter by has pricecharting_id"),
-    needs_price: Optional[bool] = Query(None, description="Filter by missing prices")
+    needs_price: Optional[bool] = Query(None, description="Filter by missing prices"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from next_cursor (overrides page)"),
 ):
     """
     List Funkos with filtering for manual data entry.
@@ -4452,12 +4510,14 @@ async def list_funkos(
     - search: Search by title (case-insensitive)
     - has_pc_id: true=has pricecharting_id, false=missing
     - needs_price: true=has pc_id but no prices
+
+    PERF-034: Pass next_cursor back as ?cursor= to page by keyset.
     """
     offset = (page - 1) * per_page
 
     # Build query
     where_clauses = []
-    params = {"limit": per_page, "offset": offset}
+    params = {}
 
     if search:
         where_clauses.append("title ILIKE :search")
@@ -4476,27 +4536,54 @@ async def list_funkos(
 
     where_sql = " AND ".join(where_clauses) if where_clauses else "1=1"
 
-    # Get total count
-    count_result = await db.execute(text(f"""
-        SELECT COUNT(*) FROM funkos WHERE {where_sql}
-    """), params)
-    total = count_result.scalar()
+    # Get total count (cached per filter set)
+    async def exact_count():
+        return (await db.execute(text(f"SELECT COUNT(*) FROM funkos WHERE {where_sql}"), params)).scalar()
+
+    async def estimate_count():
+        return await planner_estimate(db, f"SELECT 1 FROM funkos WHERE {where_sql}", params)
+
+    total, total_is_estimate = await cached_total(
+        filter_signature("admin.funkos", search=search, has_pc_id=has_pc_id, needs_price=needs_price),
+        exact_count,
+        estimate_count,
+    )
+
+    # Get records: unmatched first, then title; id breaks ties for the cursor
+    sort_key = "CASE WHEN pricecharting_id IS NULL THEN 0 ELSE 1 END, title, id"
+    page_params = {**params, "limit": per_page + 1}
+    if cursor:
+        try:
+            has_pc_key, title_key, id_key = decode_cursor(cursor, "admin.funkos", 3)
+        except InvalidCursor as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        page_sql = f"AND ({sort_key}) > (:cursor_has_pc, :cursor_title, :cursor_id)"
+        page_params.update(cursor_has_pc=has_pc_key, cursor_title=title_key, cursor_id=id_key)
+        offset_sql = ""
+    else:
+        page_sql = ""
+        offset_sql = "OFFSET :offset"
+        page_params["offset"] = offset
 
-    # Get records
     result = await db.execute(text(f"""
         SELECT id, title, category, license, box_number, upc,
                pricecharting_id, price_loose, price_cib, price_new,
                pricecharting_synced_at, updated_at
         FROM funkos
-        WHERE {where_sql}
-        ORDER BY
-            CASE WHEN pricecharting_id IS NULL THEN 0 ELSE 1 END,
-            title
-        LIMIT :limit OFFSET :offset
-    """), params)
+        WHERE {where_sql} {page_sql}
+        ORDER BY {sort_key}
+        LIMIT :limit {offset_sql}
+    """), page_params)
+    rows = result.fetchall()
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+    next_cursor = None
+    if has_more:
+        last = rows[-1]
+        next_cursor = encode_cursor("admin.funkos", [0 if last[6] is None else 1, last[1], last[0]])
 
     funkos = []
-    for row in result.fetchall():
+    for row in rows:
         funkos.append({
             "id": row[0],
             "title": row[1],
@@ -4515,9 +4602,12 @@ async def list_funkos(
     return {
         "items": funkos,
         "total": total,
+        "total_is_estimate": total_is_estimate,
         "page": page,
         "per_page": per_page,
         "pages": (total + per_page - 1) // per_page,
+        "next_cursor": next_cursor,
+        "has_more": has_more,
         "filters": {
             "search": search,
             "has_pc_id": has_pc_id,
@@ -18,6 +18,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.response_cache import invalidates
 from app.api.deps import get_current_admin
 from app.models.user import User
 from app.models.bundle import BundleStatus
@@ -34,11 +35,17 @@ from app.schemas.bundle import (
     BundleItemResponse,
     BundlePricingRequest,
     BundlePricingResponse,
+    BundleRepriceRequest,
+    BundleRepriceResponse,
 )
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/admin/bundles", tags=["admin-bundles"])
+# PERF-039: Any bundle write drops cached storefront bundle responses
+router = APIRouter(
+    prefix="/admin/bundles", tags=["admin-bundles"],
+    dependencies=[Depends(invalidates("bundles"))],
+)
 storage = StorageService()
 
 
@@ -85,6 +92,8 @@ def bundle_to_response(bundle) -> BundleResponse:
             unit_cost=item.unit_cost,
             line_price=item.line_price,
             line_cost=item.line_cost,
+            price_override=item.price_override,
+            cost_override=item.cost_override,
             display_order=item.display_order,
             is_featured=item.is_featured,
             custom_label=item.custom_label,
@@ -483,3 +492,28 @@ async def calculate_pricing(
     """Calculate pricing preview for proposed bundle items."""
     result = BundleService.calculate_pricing(data)
     return result
+
+
+@router.post("/reprice", response_model=BundleRepriceResponse)
+async def reprice_bundles(
+    data: BundleRepriceRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_admin),
+):
+    """
+    Refresh item prices and bundle totals from current product prices.
+
+    PERF-050: One set-based pass over every bundle containing the given
+    products (or every bundle), for bulk price changes made outside the
+    product edit routes. reset_overrides also reverts admin-set item
+    prices/costs, e.g. stale items flagged when the override columns
+    were added.
+    """
+    result = await BundleService.reprice_for_products(db, data.product_ids, data.reset_overrides)
+    await db.commit()
+
+    logger.info(
+        f"Admin {current_user.id} repriced {result['bundles_repriced']} of "
+        f"{result['bundles_checked']} bundles"
+    )
+    return result
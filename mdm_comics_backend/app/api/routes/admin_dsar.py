@@ -4,10 +4,11 @@ Admin DSAR (Data Subject Access Request) Routes
 User Management System v1.0.0
 Per constitution_pii.json: GDPR/CCPA compliance management
 """
+import os
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, RedirectResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 
@@ -16,6 +17,7 @@ from app.core.permissions import require_permission, Permission
 from app.models.user import User
 from app.models.user_audit_log import AuditAction
 from app.services.dsar_service import DSARService
+from app.services.dsar_export import get_export_progress
 from app.services.retention_service import RetentionService
 from app.services.audit_service import AuditService
 
@@ -50,6 +52,7 @@ class DSARRequestResponse(BaseModel):
     processed_by: Optional[int]
     notes: Optional[str]
     ledger_tx_id: Optional[str]
+    export_progress: Optional[Dict[str, Any]] = None  # PERF-047: export requests only
 
 
 class DSARListResponse(BaseModel):
@@ -197,6 +200,10 @@ async def get_dsar_request(
         processed_by=dsar_request.processed_by,
         notes=dsar_request.notes,
         ledger_tx_id=dsar_request.ledger_tx_id,
+        export_progress=(
+            await get_export_progress(db, request_id)
+            if dsar_request.request_type == "export" else None
+        ),
     )
 
 
@@ -247,7 +254,11 @@ async def process_export_request(
     db: AsyncSession = Depends(get_db)
 ):
     """
-    Process a DSAR export request and return the data.
+    Process a DSAR export request.
+
+    The export is streamed to a ZIP of NDJSON sections (PERF-047); the
+    response carries its manifest, and the file is fetched from
+    GET /{request_id}/export-download.
 
     Requires: dsar:admin permission
     """
@@ -275,12 +286,14 @@ async def process_export_request(
 
         await db.commit()
 
-        # Return the full export data
         return JSONResponse(
             content={
                 "request_id": result["request_id"],
-                "export_data": result["export_data"],
+                "manifest": result["manifest"],
                 "export_hash": result["export_hash"],
+                "storage": result["storage"],
+                "rows": result["rows"],
+                "download_url": f"{request.url.path.rsplit('/', 1)[0]}/export-download",
                 "completed_at": result["completed_at"],
             }
         )
@@ -292,6 +305,49 @@ async def process_export_request(
         )
 
 
+@router.get("/{request_id}/export-download")
+async def download_export(
+    request_id: int,
+    current_user: User = Depends(require_permission(Permission.DSAR_ADMIN)),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Download a completed export: the ZIP itself when stored locally, a
+    short-lived redirect when stored in S3.
+
+    Requires: dsar:admin permission
+    """
+    progress = await get_export_progress(db, request_id)
+    if not progress or progress["status"] != "complete" or not progress["location"]:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No completed export for this request"
+        )
+
+    if progress["storage"] == "s3":
+        from app.services.storage import StorageService
+        url = StorageService().presigned_download_url(progress["location"], expires_in=900)
+        if not url:
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                detail="Could not sign export download"
+            )
+        return RedirectResponse(url)
+
+    if not os.path.exists(progress["location"]):
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Export file is no longer available"
+        )
+
+    return FileResponse(
+        progress["location"],
+        media_type="application/zip",
+        filename=f"dsar-export-{request_id}.zip",
+        headers={"Cache-Control": "private, no-store"},
+    )
+
+
 @router.post("/{request_id}/process-deletion", response_model=ProcessDeletionResponse)
 async def process_deletion_request(
     request_id: int,
@@ -2,6 +2,8 @@
 Admin API Routes for Site Settings Management
 
 v1.0.0: CRUD operations for site-wide settings (branding URLs, feature flags, etc.)
+v1.1.0: PERF-040 - Writes reach other replicas through the site_settings
+NOTIFY trigger; the public branding endpoint reads the config snapshot
 
 Per constitution_cyberSec.json Section 3:
 - All admin endpoints require is_admin=True
@@ -16,6 +18,7 @@ from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 
+from app.core import config_snapshot
 from app.core.database import get_db
 from app.api.deps import get_current_admin
 from app.models.user import User
@@ -159,6 +162,7 @@ async def create_setting(
     )
     db.add(setting)
     await db.commit()
+    config_snapshot.invalidate()
     await db.refresh(setting)
 
     logger.info(f"Created setting {request.key} by user {current_user.id}")
@@ -196,6 +200,7 @@ async def update_setting(
     setting.updated_by = current_user.id
 
     await db.commit()
+    config_snapshot.invalidate()
 
     logger.info(f"Updated setting {key}: '{old_value[:50]}...' -> '{request.value[:50]}...' by user {current_user.id}")
 
@@ -223,6 +228,7 @@ async def delete_setting(
 
     await db.delete(setting)
     await db.commit()
+    config_snapshot.invalidate()
 
     logger.info(f"Deleted setting {key} by user {current_user.id}")
 
@@ -255,6 +261,7 @@ async def bulk_update_settings(
         updated += 1
 
     await db.commit()
+    config_snapshot.invalidate()
 
     logger.info(f"Bulk updated {updated} settings by user {current_user.id}")
 
@@ -275,14 +282,6 @@ async def get_public_branding(
 
     This endpoint is for the frontend to fetch logo URLs, etc.
     """
-    result = await db.execute(
-        select(SiteSettings).where(SiteSettings.category == "branding")
-    )
-    settings = result.scalars().all()
-
-    return {
-        key: val
-        for s in settings
-        for key, val in [(s.key, s.value)]
-        if s.value  # Only include non-empty values
-    }
+    # Only non-empty values
+    snapshot = await config_snapshot.get_snapshot(db)
+    return snapshot.settings_in("branding")
@@ -23,12 +23,17 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_admin, get_db
+from app.core.response_cache import invalidates
 from app.models.user import User
+from app.services.bundle_service import BundleService
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/admin/bcw/catalog", tags=["Admin - BCW Catalog"])
 
+# PERF-050: Price writes reprice the bundles containing the product
+INVALIDATE_BUNDLES = Depends(invalidates("bundles"))
+
 
 # ==============================================================================
 # Schemas
@@ -285,7 +290,7 @@ async def get_bcw_product(
 # BCW Pricing Management
 # ==============================================================================
 
-@router.patch("/{mdm_sku}/pricing")
+@router.patch("/{mdm_sku}/pricing", dependencies=[INVALIDATE_BUNDLES])
 async def update_bcw_pricing(
     mdm_sku: str,
     pricing: BCWPricingUpdate,
@@ -327,10 +332,12 @@ async def update_bcw_pricing(
 
         # Also update products table price if linked and our_price changed
         if pricing.our_price is not None:
-            await db.execute(text("""
+            repriced = await db.execute(text("""
                 UPDATE products SET price = :price, updated_at = NOW()
                 WHERE sku = :mdm_sku AND deleted_at IS NULL
+                RETURNING id
             """), {"mdm_sku": mdm_sku, "price": pricing.our_price})
+            await BundleService.reprice_for_products(db, [r.id for r in repriced.fetchall()])
 
         await db.commit()
 
@@ -422,7 +429,7 @@ async def trigger_inventory_sync(
 # BCW Product Activation
 # ==============================================================================
 
-@router.post("/{mdm_sku}/activate")
+@router.post("/{mdm_sku}/activate", dependencies=[INVALIDATE_BUNDLES])
 async def activate_bcw_product(
     mdm_sku: str,
     price: float = Query(..., ge=0.01, description="Selling price for the product"),
@@ -473,6 +480,7 @@ async def activate_bcw_product(
                 "case_weight": row.weight,
                 "case_dims": row.dimensions
             })
+            await BundleService.reprice_for_products(db, [row.product_id])
             action = "updated"
         else:
             # Create new product
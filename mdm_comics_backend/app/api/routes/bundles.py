@@ -7,6 +7,9 @@ No authentication required for listing/detail.
 Per constitution_ui.json:
 - Section 2: Response within target hydration time
 - Section 6: Every action returns feedback state
+
+PERF-039: Responses are served from the shared response cache and
+dropped by admin bundle writes (tag "bundles").
 """
 import logging
 from typing import Optional
@@ -16,6 +19,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.response_cache import CachedJSONResponse, cached_response
 from app.models.bundle import BundleStatus
 from app.services.bundle_service import BundleService
 from app.schemas.bundle import (
@@ -30,6 +34,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/bundles", tags=["bundles"])
 
+BUNDLE_CACHE_TTL = 300
+CACHE_BUNDLES = Depends(cached_response(BUNDLE_CACHE_TTL, ["bundles"]))
+
 
 # ==================== Helper Functions ====================
 
@@ -115,7 +122,8 @@ def bundle_to_public_list_response(bundle) -> PublicBundleListResponse:
 
 # ==================== Public Routes ====================
 
-@router.get("/", response_model=PaginatedPublicBundleList)
+@router.get("/", response_model=PaginatedPublicBundleList, response_class=CachedJSONResponse,
+            dependencies=[CACHE_BUNDLES])
 async def list_bundles(
     category: Optional[str] = Query(None, description="Filter by category"),
     sort: Optional[str] = Query("display_order", description="Sort field"),
@@ -146,7 +154,8 @@ async def list_bundles(
     )
 
 
-@router.get("/featured", response_model=list[PublicBundleListResponse])
+@router.get("/featured", response_model=list[PublicBundleListResponse], response_class=CachedJSONResponse,
+            dependencies=[CACHE_BUNDLES])
 async def get_featured_bundles(
     limit: int = Query(5, ge=1, le=10, description="Max bundles to return"),
     db: AsyncSession = Depends(get_db),
@@ -167,7 +176,8 @@ async def get_featured_bundles(
     return [bundle_to_public_list_response(b) for b in bundles]
 
 
-@router.get("/{slug}", response_model=PublicBundleResponse)
+@router.get("/{slug}", response_model=PublicBundleResponse, response_class=CachedJSONResponse,
+            dependencies=[CACHE_BUNDLES])
 async def get_bundle_by_slug(
     slug: str,
     db: AsyncSession = Depends(get_db),
@@ -196,7 +206,8 @@ async def get_bundle_by_slug(
     return bundle_to_public_response(bundle)
 
 
-@router.get("/id/{bundle_id}", response_model=PublicBundleResponse)
+@router.get("/id/{bundle_id}", response_model=PublicBundleResponse, response_class=CachedJSONResponse,
+            dependencies=[CACHE_BUNDLES])
 async def get_bundle_by_id(
     bundle_id: int,
     db: AsyncSession = Depends(get_db),
@@ -224,7 +235,8 @@ async def get_bundle_by_id(
     return bundle_to_public_response(bundle)
 
 
-@router.get("/categories", response_model=list[str])
+@router.get("/categories", response_model=list[str], response_class=CachedJSONResponse,
+            dependencies=[CACHE_BUNDLES])
 async def list_categories(
     db: AsyncSession = Depends(get_db),
 ):
@@ -2,7 +2,8 @@
 Stripe Checkout API Routes
 
 SAFE CHECKOUT FLOW with stock reservation per constitution.json §15:
-1. create-payment-intent: FOR UPDATE lock on products, reserve stock
+1. create-payment-intent: conditional stock decrement, reserve stock
+   (PERF-042: no row lock held across the Stripe call)
 2. confirm-order: Verify reservation, convert to sale
 3. Background job: Release expired reservations
 4. P1-4: Stripe webhook for payment verification (replaces client-trust model)
@@ -22,17 +23,20 @@ from fastapi import APIRouter, HTTPException, Depends, Request, Header
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete, update
+from sqlalchemy import select
 
 from app.core.config import settings
 from app.core.database import get_db, AsyncSessionLocal
 from app.core.rate_limit import limiter
 from app.core.redis_client import is_webhook_processed, mark_webhook_processed
 from app.api.routes.auth import get_current_user
-from app.models import User, Product, Order, OrderItem, StockReservation
+from app.models import User, Product, Order, OrderItem
 from app.models.stock_reservation import RESERVATION_TTL_MINUTES
 from app.services.order_service import (
-    order_service, dollars_to_cents, cents_to_dollars, build_product_snapshot
+    order_service, dollars_to_cents, cents_to_dollars
+)
+from app.services.stock_reservations import (
+    InsufficientStockError, attach_payment_intent, release_reservations, reserve_stock
 )
 
 logger = logging.getLogger(__name__)
@@ -76,12 +80,12 @@ async def create_payment_intent(
     Create a Stripe PaymentIntent with stock reservation.
 
     SAFE CHECKOUT FLOW:
-    1. Lock products with FOR UPDATE (pessimistic locking)
-    2. Validate stock availability
-    3. Decrement stock (reserve)
-    4. Create reservation records
-    5. Create Stripe PaymentIntent
-    6. Return client_secret
+    1. Load products (no lock) and price the cart
+    2. Reserve: conditional decrement per product + reservation records,
+       committed in one short transaction (PERF-042)
+    3. Create Stripe PaymentIntent; on failure release the reservation
+    4. Attach the PaymentIntent id to the reservations
+    5. Return client_secret
 
     If payment fails/expires, background job restores stock.
     """
@@ -97,12 +101,9 @@ async def create_payment_intent(
     product_ids = [item.product_id for item in payload.items]
     quantities = {item.product_id: item.quantity for item in payload.items}
 
-    # Step 1: Single query with FOR UPDATE lock
-    # This prevents other transactions from modifying these rows
+    # Step 1: Plain read for prices and snapshots; no row locks taken here
     result = await db.execute(
-        select(Product)
-        .where(Product.id.in_(product_ids))
-        .with_for_update()  # Pessimistic lock
+        select(Product).where(Product.id.in_(product_ids))
     )
     products = {p.id: p for p in result.scalars().all()}
 
@@ -114,14 +115,13 @@ async def create_payment_intent(
             detail=f"Products not found: {list(missing)}"
         )
 
-    # Step 2 & 3: Validate stock and reserve
     total_cents = 0
     line_items = []
-    reservations_to_create = []
 
     for product_id, qty in quantities.items():
         product = products[product_id]
 
+        # Early reject on the snapshot; the conditional decrement decides
         if product.stock < qty:
             raise HTTPException(
                 status_code=400,
@@ -129,9 +129,6 @@ async def create_payment_intent(
                        f"(requested: {qty}, available: {product.stock})"
             )
 
-        # Reserve stock (decrement now)
-        product.stock -= qty
-
         unit_price_cents = dollars_to_cents(product.price)
         item_total = unit_price_cents * qty
         total_cents += item_total
@@ -143,17 +140,18 @@ async def create_payment_intent(
             "unit_price": unit_price_cents
         })
 
-        reservations_to_create.append({
-            "product_id": product.id,
-            "quantity": qty,
-            "unit_price_cents": unit_price_cents,
-            "product_snapshot": build_product_snapshot(product)
-        })
-
     if total_cents < 50:  # Stripe minimum
         raise HTTPException(status_code=400, detail="Order total must be at least $0.50")
 
-    # Step 5: Create Stripe PaymentIntent
+    # Step 2: Conditional decrements + reservation rows, committed at once
+    try:
+        reservation_key, expires_at = await reserve_stock(
+            db, current_user.id, quantities, products, RESERVATION_CURRENCY_CODE
+        )
+    except InsufficientStockError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # Step 3: Create Stripe PaymentIntent (no locks held)
     try:
         intent = stripe.PaymentIntent.create(
             amount=total_cents,
@@ -167,26 +165,12 @@ async def create_payment_intent(
     except stripe.error.StripeError as e:
         # HIGH-001: Sanitize Stripe errors - log details, return generic message
         logger.error(f"Stripe PaymentIntent creation failed: {e}", exc_info=True)
+        await release_reservations(db, reservation_key)
+        await db.commit()
         raise HTTPException(status_code=400, detail="Payment processing failed. Please try again.")
 
-    # Step 4: Create reservation records
-    expires_at = StockReservation.create_expiry(RESERVATION_TTL_MINUTES)
-
-    for res in reservations_to_create:
-        reservation = StockReservation(
-            user_id=current_user.id,
-            product_id=res["product_id"],
-            quantity=res["quantity"],
-            payment_intent_id=intent.id,
-            expires_at=expires_at,
-            unit_price_cents=res["unit_price_cents"],
-            currency_code=RESERVATION_CURRENCY_CODE,
-            product_snapshot=res["product_snapshot"]
-        )
-        db.add(reservation)
-
-    # Commit: stock decremented + reservations created
-    await db.commit()
+    # Step 4: Key the reservations by the PaymentIntent
+    await attach_payment_intent(db, reservation_key, intent.id)
 
     # P2-9: Observability - log checkout metrics
     duration_ms = (time.time() - start_time) * 1000
@@ -195,7 +179,7 @@ async def create_payment_intent(
         f"user_id={current_user.id} "
         f"intent_id={intent.id} "
         f"amount_cents={total_cents} "
-        f"item_count={len(reservations_to_create)} "
+        f"item_count={len(quantities)} "
         f"duration_ms={duration_ms:.2f}"
     )
 
@@ -308,39 +292,21 @@ async def cancel_reservation(
     Cancel a reservation and restore stock.
     Called when user cancels checkout.
     """
-    # Find reservations for this payment intent
-    result = await db.execute(
-        select(StockReservation)
-        .where(StockReservation.payment_intent_id == payment_intent_id)
-        .where(StockReservation.user_id == current_user.id)
-    )
-    reservations = result.scalars().all()
+    # PERF-042: Delete + restore in one statement; a concurrent expiry or
+    # payment_failed release of the same rows restores nothing twice
+    released = await release_reservations(db, payment_intent_id, current_user.id)
+    await db.commit()
 
-    if not reservations:
+    if not released["reservations_released"]:
         return {"status": "no_reservation", "message": "No active reservation found"}
 
-    # Restore stock for each reservation
-    for reservation in reservations:
-        await db.execute(
-            update(Product)
-            .where(Product.id == reservation.product_id)
-            .values(stock=Product.stock + reservation.quantity)
-        )
-
-    # Delete reservations
-    await db.execute(
-        delete(StockReservation)
-        .where(StockReservation.payment_intent_id == payment_intent_id)
-        .where(StockReservation.user_id == current_user.id)
+    logger.info(
+        f"Cancelled {released['reservations_released']} reservations for payment {payment_intent_id}"
     )
 
-    await db.commit()
-
-    logger.info(f"Cancelled {len(reservations)} reservations for payment {payment_intent_id}")
-
     return {
         "status": "cancelled",
-        "reservations_released": len(reservations)
+        "reservations_released": released["reservations_released"]
     }
 
 
@@ -356,6 +322,7 @@ async def get_stripe_config():
 
 
 @router.post("/stripe-webhook")
+@limiter.exempt  # Stripe retries bursts from shared IPs; signature-verified
 async def stripe_webhook(request: Request):
     """
     P1-4: Stripe webhook handler with signature verification.
@@ -517,40 +484,17 @@ async def handle_payment_failed(payment_intent: dict):
 
     async with AsyncSessionLocal() as db:
         try:
-            # Find reservations for this payment
-            result = await db.execute(
-                select(StockReservation)
-                .where(StockReservation.payment_intent_id == payment_intent_id)
-            )
-            reservations = result.scalars().all()
+            # HIGH-002 / PERF-042: Delete + restore in one atomic statement, so
+            # racing with the expiry job cannot restore the same stock twice
+            released = await release_reservations(db, payment_intent_id)
+            await db.commit()
 
-            if not reservations:
+            if not released["reservations_released"]:
                 logger.info(f"No reservations to release for failed payment {payment_intent_id}")
                 return
 
-            # HIGH-002: Atomic stock restoration using single UPDATE with JOIN
-            # This prevents race conditions where concurrent operations could corrupt counts
-            from sqlalchemy import text
-            await db.execute(
-                text("""
-                    UPDATE products p
-                    SET stock = p.stock + r.quantity
-                    FROM stock_reservations r
-                    WHERE r.payment_intent_id = :pi_id
-                    AND p.id = r.product_id
-                """),
-                {"pi_id": payment_intent_id}
-            )
-
-            # Delete reservations
-            await db.execute(
-                delete(StockReservation)
-                .where(StockReservation.payment_intent_id == payment_intent_id)
-            )
-
-            await db.commit()
             logger.info(
-                f"Released {len(reservations)} reservations for failed payment {payment_intent_id}"
+                f"Released {released['reservations_released']} reservations for failed payment {payment_intent_id}"
             )
         except Exception as e:
             await db.rollback()
@@ -7,18 +7,24 @@ Modes:
 - update: Match existing records and update metadata (default)
 - create: Create new comic_issues for unmatched rows
 - full: Both update existing and create new records
+
+Bulk pipeline (default): the CSV is COPYed into a temp staging table,
+matched with set-based joins (UPC, then normalized series + issue + year)
+and applied with one UPDATE ... FROM and one INSERT ... SELECT. Every row
+gets an outcome in the report; dry-runs include a per-field diff.
 """
+import asyncio
 import csv
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_db, get_db_session
 from app.api.deps import get_current_admin
 
 router = APIRouter(prefix="/clz-import", tags=["CLZ Import"])
@@ -35,6 +41,9 @@ import_status: Dict[str, Any] = {
     "errors": [],
 }
 
+# Per-row outcomes from the last bulk run (served by /report)
+import_report: List[Dict[str, Any]] = []
+
 # CSV column to DB column mapping
 CSV_TO_DB_MAPPING = {
     # Core fields
@@ -327,6 +336,313 @@ async def run_import_job(db: AsyncSession, limit: int = 0, execute: bool = False
     import_status["running"] = False
 
 
+# ----- Bulk staging pipeline -----
+
+# Staging columns in COPY order; anything not listed here is TEXT
+STAGING_TYPED_COLUMNS = {
+    "price": "DOUBLE PRECISION",
+    "year": "INTEGER",
+    "series_year_began": "INTEGER",
+    "is_key_issue": "BOOLEAN",
+    "clz_raw_data": "JSONB",
+}
+STAGING_DATA_COLUMNS = list(dict.fromkeys(CSV_TO_DB_MAPPING.values())) + ["clz_raw_data"]
+
+# Columns compared in the dry-run diff (raw JSON is excluded as noise)
+DIFF_COLUMNS = [c for c in STAGING_DATA_COLUMNS if c != "clz_raw_data"]
+
+
+def _staging_ddl() -> str:
+    columns = ",\n".join(
+        f"    {col} {STAGING_TYPED_COLUMNS.get(col, 'TEXT')}" for col in STAGING_DATA_COLUMNS
+    )
+    return f"""
+        CREATE TEMP TABLE clz_staging (
+            row_num INTEGER PRIMARY KEY,
+            series_key TEXT,
+{columns},
+            matched_issue_id INTEGER,
+            match_method TEXT,
+            outcome TEXT
+        ) ON COMMIT DROP
+    """
+
+
+def parse_csv_records(csv_path: Path, limit: int = 0) -> List[tuple]:
+    """Parse the CLZ CSV into staging records (row_num, series_key, *data columns)."""
+    records = []
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        for idx, row in enumerate(reader, start=1):
+            if limit and idx > limit:
+                break
+            data = extract_row_data(row)
+            series = data.get("series_sort_name") or ""
+            records.append((
+                idx,
+                series.strip().lower() or None,
+                *(data.get(col) for col in STAGING_DATA_COLUMNS),
+            ))
+    return records
+
+
+async def _copy_to_staging(db: AsyncSession, records: List[tuple]) -> None:
+    """COPY parsed rows into the staging table on the session's connection."""
+    conn = await db.connection()
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        "clz_staging",
+        records=records,
+        columns=["row_num", "series_key", *STAGING_DATA_COLUMNS],
+    )
+
+
+MATCH_BY_UPC_SQL = text("""
+        UPDATE clz_staging s
+        SET matched_issue_id = m.id, match_method = 'upc'
+        FROM (
+            SELECT DISTINCT ON (ci.upc) ci.upc, ci.id
+            FROM comic_issues ci
+            WHERE ci.upc IN (SELECT upc FROM clz_staging WHERE upc IS NOT NULL)
+            ORDER BY ci.upc, ci.id
+        ) m
+        WHERE s.upc = m.upc
+    """)
+
+# Same predicates as match_issue, split into three equi-joins so each
+# can hash-join instead of OR-ing across comic_issues
+MATCH_BY_SERIES_SQL = text("""
+        UPDATE clz_staging s
+        SET matched_issue_id = m.issue_id, match_method = 'series_issue'
+        FROM (
+            SELECT DISTINCT ON (c.row_num) c.row_num, c.issue_id
+            FROM (
+                SELECT st.row_num, ci.id AS issue_id
+                FROM clz_staging st
+                JOIN comic_issues ci
+                  ON LOWER(ci.series_sort_name) = st.series_key AND ci.number = st.number
+                WHERE st.matched_issue_id IS NULL
+                  AND (st.publisher_name IS NULL OR ci.publisher_name ILIKE '%' || st.publisher_name || '%')
+                  AND (st.year IS NULL OR ci.year = st.year OR ci.series_year_began = st.year)
+                UNION ALL
+                SELECT st.row_num, ci.id
+                FROM clz_staging st
+                JOIN comic_series cs ON LOWER(cs.name) = st.series_key
+                JOIN comic_issues ci ON ci.series_id = cs.id AND ci.number = st.number
+                WHERE st.matched_issue_id IS NULL
+                  AND (st.publisher_name IS NULL OR ci.publisher_name ILIKE '%' || st.publisher_name || '%')
+                  AND (st.year IS NULL OR ci.year = st.year OR ci.series_year_began = st.year)
+                UNION ALL
+                SELECT st.row_num, ci.id
+                FROM clz_staging st
+                JOIN comic_series cs ON LOWER(cs.sort_name) = st.series_key
+                JOIN comic_issues ci ON ci.series_id = cs.id AND ci.number = st.number
+                WHERE st.matched_issue_id IS NULL
+                  AND (st.publisher_name IS NULL OR ci.publisher_name ILIKE '%' || st.publisher_name || '%')
+                  AND (st.year IS NULL OR ci.year = st.year OR ci.series_year_began = st.year)
+            ) c
+            ORDER BY c.row_num, c.issue_id
+        ) m
+        WHERE s.row_num = m.row_num
+    """)
+
+
+async def _resolve_matches(db: AsyncSession) -> None:
+    """Set matched_issue_id by UPC, then by (series, number, year[, publisher])."""
+    await db.execute(MATCH_BY_UPC_SQL)
+    await db.execute(MATCH_BY_SERIES_SQL)
+
+
+SKIP_UNKEYED_SQL = text("""
+        UPDATE clz_staging SET outcome = 'skipped'
+        WHERE series_key IS NULL OR number IS NULL
+    """)
+
+# One winner (the last row) per target; the rest are 'superseded'
+CLASSIFY_MATCHED_SQL = text("""
+        UPDATE clz_staging s
+        SET outcome = CASE WHEN s.row_num = w.winner THEN :matched_outcome ELSE 'superseded' END
+        FROM (
+            SELECT matched_issue_id, MAX(row_num) AS winner
+            FROM clz_staging
+            WHERE matched_issue_id IS NOT NULL AND outcome IS NULL
+            GROUP BY matched_issue_id
+        ) w
+        WHERE s.matched_issue_id = w.matched_issue_id AND s.outcome IS NULL
+    """)
+
+CLASSIFY_UNMATCHED_SQL = text("""
+        UPDATE clz_staging s
+        SET outcome = CASE WHEN s.row_num = w.winner THEN :unmatched_outcome ELSE 'superseded' END
+        FROM (
+            SELECT series_key, number, COALESCE(year, 0) AS year_key, MAX(row_num) AS winner
+            FROM clz_staging
+            WHERE matched_issue_id IS NULL AND outcome IS NULL
+            GROUP BY series_key, number, COALESCE(year, 0)
+        ) w
+        WHERE s.series_key = w.series_key AND s.number = w.number
+          AND COALESCE(s.year, 0) = w.year_key AND s.outcome IS NULL
+    """)
+
+
+async def _assign_outcomes(db: AsyncSession, mode: str) -> None:
+    """
+    Classify every staged row.
+
+    When several rows target the same issue (or would create the same
+    series/number/year) the last row wins, as it would have row by row;
+    earlier rows are marked 'superseded'.
+    """
+    do_update = mode in ("update", "full")
+    do_create = mode in ("create", "full")
+
+    await db.execute(SKIP_UNKEYED_SQL)
+    await db.execute(CLASSIFY_MATCHED_SQL, {"matched_outcome": "update" if do_update else "matched"})
+    await db.execute(CLASSIFY_UNMATCHED_SQL, {"unmatched_outcome": "create" if do_create else "not_found"})
+
+
+async def _apply_changes(db: AsyncSession) -> Dict[str, int]:
+    """One UPDATE ... FROM for matched rows and one INSERT ... SELECT for new ones."""
+    # Same semantics as update_issue: only non-null incoming values overwrite.
+    # clz_raw_data is always present and is assigned directly (the column is
+    # JSON in some environments and JSONB in others).
+    set_clauses = ",\n".join(
+        f"{col} = s.{col}" if col == "clz_raw_data" else f"{col} = COALESCE(s.{col}, ci.{col})"
+        for col in STAGING_DATA_COLUMNS
+    )
+    updated = await db.execute(text(f"""
+        UPDATE comic_issues ci
+        SET {set_clauses},
+            updated_at = NOW()
+        FROM clz_staging s
+        WHERE s.outcome = 'update' AND ci.id = s.matched_issue_id
+    """))
+
+    insert_cols = ", ".join(STAGING_DATA_COLUMNS)
+    select_cols = ", ".join(
+        "COALESCE(s.is_key_issue, FALSE)" if col == "is_key_issue" else f"s.{col}"
+        for col in STAGING_DATA_COLUMNS
+    )
+    created = await db.execute(text(f"""
+        INSERT INTO comic_issues ({insert_cols}, data_source, created_at, updated_at)
+        SELECT {select_cols}, 'clz', NOW(), NOW()
+        FROM clz_staging s
+        WHERE s.outcome = 'create'
+        ORDER BY s.row_num
+    """))
+    return {"updated": updated.rowcount or 0, "created": created.rowcount or 0}
+
+
+async def _build_report(db: AsyncSession, include_diff: bool) -> List[Dict[str, Any]]:
+    """Per-row outcome table; dry-runs include {column: [current, incoming]} diffs."""
+    if include_diff:
+        diff_pairs = ", ".join(
+            f"'{col}', CASE WHEN s.{col} IS NOT NULL AND s.{col} IS DISTINCT FROM ci.{col} "
+            f"THEN jsonb_build_array(ci.{col}, s.{col}) END"
+            for col in DIFF_COLUMNS
+        )
+        diff_expr = f"jsonb_strip_nulls(jsonb_build_object({diff_pairs}))"
+    else:
+        diff_expr = "NULL::jsonb"
+
+    result = await db.execute(text(f"""
+        SELECT s.row_num, s.series_sort_name, s.number, s.upc,
+               s.matched_issue_id, s.match_method, s.outcome,
+               CASE WHEN ci.id IS NOT NULL THEN {diff_expr} END AS diff
+        FROM clz_staging s
+        LEFT JOIN comic_issues ci ON ci.id = s.matched_issue_id
+        ORDER BY s.row_num
+    """))
+    return [
+        {
+            "row": row.row_num,
+            "series": row.series_sort_name,
+            "issue": row.number,
+            "upc": row.upc,
+            "issue_id": row.matched_issue_id,
+            "match_method": row.match_method,
+            "outcome": row.outcome,
+            "diff": row.diff,
+        }
+        for row in result
+    ]
+
+
+async def run_bulk_import_job(limit: int = 0, execute: bool = False, mode: str = "full"):
+    """Set-based CLZ import through a temp staging table.
+
+    Uses its own session (the request session is closed once the response
+    is sent). Without execute, the transaction is rolled back after the
+    diff report is built.
+
+    Args:
+        limit: Row limit (0 = all)
+        execute: If True, commit changes; if False, dry-run with diff report
+        mode: 'update' (only update), 'create' (only create), 'full' (both)
+    """
+    global import_status, import_report
+
+    import_status["running"] = True
+    import_status["last_run"] = datetime.utcnow().isoformat()
+    import_status["mode"] = mode
+    import_status["errors"] = []
+    import_report = []
+
+    stats = {
+        "rows": 0,
+        "matched": 0,
+        "updated": 0,
+        "created": 0,
+        "not_found": 0,
+        "skipped": 0,
+        "superseded": 0,
+    }
+
+    try:
+        if not CSV_PATH.exists():
+            import_status["errors"].append(f"CSV not found: {CSV_PATH}")
+            import_status["running"] = False
+            return
+
+        # csv parsing is CPU-bound; keep it off the event loop
+        records = await asyncio.to_thread(parse_csv_records, CSV_PATH, limit)
+        stats["rows"] = len(records)
+
+        async with get_db_session() as db:
+            await db.execute(text(_staging_ddl()))
+            await _copy_to_staging(db, records)
+            await db.execute(text("ANALYZE clz_staging"))
+
+            await _resolve_matches(db)
+            await _assign_outcomes(db, mode)
+
+            if execute:
+                applied = await _apply_changes(db)
+                stats["updated"] = applied["updated"]
+                stats["created"] = applied["created"]
+
+            import_report = await _build_report(db, include_diff=not execute)
+
+            if execute:
+                await db.commit()
+            else:
+                await db.rollback()
+
+        for row in import_report:
+            if row["outcome"] in ("skipped", "superseded"):
+                stats[row["outcome"]] += 1
+            elif row["issue_id"]:
+                stats["matched"] += 1
+            else:
+                stats["not_found"] += 1
+
+    except Exception as e:
+        import_status["errors"].append(f"Fatal error: {str(e)}")
+
+    import_status["stats"] = stats
+    import_status["running"] = False
+
+
 @router.get("/status")
 async def get_import_status(
     _admin=Depends(get_current_admin),
@@ -335,6 +651,23 @@ async def get_import_status(
     return import_status
 
 
+@router.get("/report")
+async def get_import_report(
+    outcome: Optional[str] = Query(None, description="Filter: update, create, matched, not_found, skipped, superseded"),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    _admin=Depends(get_current_admin),
+):
+    """Per-row outcomes (and dry-run diffs) from the last bulk import."""
+    rows = [r for r in import_report if outcome is None or r["outcome"] == outcome]
+    return {
+        "total": len(rows),
+        "offset": offset,
+        "limit": limit,
+        "rows": rows[offset:offset + limit],
+    }
+
+
 @router.post("/run")
 async def trigger_import(
     background_tasks: BackgroundTasks,
@@ -342,6 +675,7 @@ async def trigger_import(
     limit: int = Query(0, description="Row limit (0 = all)"),
     execute: bool = Query(False, description="Actually commit changes"),
     mode: str = Query("full", description="Mode: 'update', 'create', or 'full'"),
+    bulk: bool = Query(True, description="Use the set-based staging pipeline"),
     _admin=Depends(get_current_admin),
 ):
     """
@@ -353,6 +687,7 @@ async def trigger_import(
         - 'update': Only update existing matched records
         - 'create': Only create new records for unmatched
         - 'full': Both update and create (default)
+    - bulk: Staging-table pipeline (default); False uses the row-by-row job
     """
     global import_status
 
@@ -363,12 +698,17 @@ async def trigger_import(
         raise HTTPException(status_code=400, detail="Mode must be 'update', 'create', or 'full'")
 
     # Run in background
-    background_tasks.add_task(run_import_job, db, limit, execute, mode)
+    if bulk:
+        background_tasks.add_task(run_bulk_import_job, limit, execute, mode)
+    else:
+        background_tasks.add_task(run_import_job, db, limit, execute, mode)
 
     return {
         "message": "Import started",
         "limit": limit,
         "execute": execute,
         "mode": mode,
+        "bulk": bulk,
         "check_status_at": "/api/clz-import/status",
+        "report_at": "/api/clz-import/report",
     }
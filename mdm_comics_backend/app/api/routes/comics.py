@@ -3,6 +3,7 @@ Comic search and lookup routes using Metron API
 All searches are cached to local database for data capture.
 
 P2-1: Image upload validation with magic bytes check
+PERF-039: Issue detail is served from the shared response cache
 """
 from typing import Optional, List
 import io
@@ -14,6 +15,7 @@ from PIL import Image
 import imagehash
 
 from app.core.database import get_db
+from app.core.response_cache import CachedJSONResponse, cached_response
 from app.core.upload_validation import validate_image_upload
 from app.services.comic_cache import comic_cache
 from app.services.metron import metron_service
@@ -84,7 +86,10 @@ async def search_comics(
         raise HTTPException(status_code=500, detail=f"Error searching comics: {str(e)}")
 
 
-@router.get("/issue/{issue_id}")
+@router.get(
+    "/issue/{issue_id}", response_class=CachedJSONResponse,
+    dependencies=[Depends(cached_response(600, ["comic_issue:{issue_id}"]))],
+)
 async def get_issue(
     issue_id: int,
     request: Request,
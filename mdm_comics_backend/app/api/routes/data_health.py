@@ -20,6 +20,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.deps import get_current_user, get_db
 from app.core.adapter_registry import adapter_registry
 from app.core.utils import utcnow
+from app.services.stat_counters import StatsService
 from app.models.pipeline import (
     DeadLetterQueue,
     DLQStatus,
@@ -50,9 +51,10 @@ async def get_data_health_overview(
     Gracefully handles missing tables (returns 0 counts).
 
     v1.1: Added explicit database connection verification with latency.
+    v1.2: Counts read from stat_counters instead of table scans.
+    v1.3: Includes scheduler leader and backlog summary.
     """
     now = utcnow()
-    last_24h = now - timedelta(hours=24)
 
     # v1.1: Actual database connection verification
     db_healthy = False
@@ -68,41 +70,18 @@ async def get_data_health_overview(
     # Get adapter statuses
     adapter_stats = adapter_registry.get_stats()
 
-    # Dead Letter Queue stats (graceful if table missing)
+    # v1.2: DLQ, quarantine and 24h change counts come from trigger-maintained
+    # stat_counters (graceful if counters are not installed yet)
+    stats = StatsService(db)
     dlq_pending_count = 0
-    try:
-        dlq_pending = await db.execute(
-            text("SELECT COUNT(*) FROM dead_letter_queue WHERE status = 'pending'")
-        )
-        dlq_pending_count = dlq_pending.scalar() or 0
-    except Exception as e:
-        logger.warning(f"[data_health] dead_letter_queue query failed: {e}")
-        await db.rollback()
-
-    # Quarantine stats (graceful if table missing)
     quarantine_pending_count = 0
-    try:
-        quarantine_pending = await db.execute(
-            text("SELECT COUNT(*) FROM data_quarantine WHERE is_resolved = false")
-        )
-        quarantine_pending_count = quarantine_pending.scalar() or 0
-    except Exception as e:
-        logger.warning(f"[data_health] data_quarantine query failed: {e}")
-        await db.rollback()
-
-    # Recent changes (last 24h) - graceful if table missing
     changes_24h_count = 0
     try:
-        changes_24h = await db.execute(
-            text("""
-                SELECT COUNT(*) FROM price_changelog
-                WHERE changed_at >= :since
-            """),
-            {"since": last_24h}
-        )
-        changes_24h_count = changes_24h.scalar() or 0
+        dlq_pending_count = await stats.counter(f"dead_letter_queue.{DLQStatus.PENDING.name}")
+        quarantine_pending_count = await stats.counter("data_quarantine.unresolved")
+        changes_24h_count = await stats.get_hourly_total("price_changelog.changes", hours=24)
     except Exception as e:
-        logger.warning(f"[data_health] price_changelog query failed: {e}")
+        logger.warning(f"[data_health] stat_counters query failed: {e}")
         await db.rollback()
 
     # Pipeline job status (graceful if table missing)
@@ -119,21 +98,32 @@ async def get_data_health_overview(
     # Get last sync times for each entity type (graceful if table missing)
     last_sync_by_type = {}
     try:
-        last_syncs = await db.execute(
-            text("""
-                SELECT entity_type, MAX(changed_at) as last_sync
-                FROM price_changelog
-                GROUP BY entity_type
-            """)
-        )
-        last_sync_by_type = {
-            row[0]: row[1].isoformat() if row[1] else None
-            for row in last_syncs.fetchall()
-        }
+        async def load_last_syncs():
+            result = await db.execute(
+                text("""
+                    SELECT entity_type, MAX(changed_at) as last_sync
+                    FROM price_changelog
+                    GROUP BY entity_type
+                """)
+            )
+            return {
+                row[0]: row[1].isoformat() if row[1] else None
+                for row in result.fetchall()
+            }
+        last_sync_by_type = await stats.cached("last_sync_by_type", load_last_syncs, ttl=60)
     except Exception as e:
         logger.warning(f"[data_health] price_changelog sync times query failed: {e}")
         await db.rollback()
 
+    # v1.3: Scheduler leader and jobs still working through a backlog
+    scheduler_state = await _scheduler_state()
+    scheduler_jobs = scheduler_state.get("jobs", {})
+    scheduler_summary = {
+        "leader": scheduler_state.get("instance_id") if scheduler_state.get("is_leader") else None,
+        "backlog_jobs": sorted(name for name, job in scheduler_jobs.items() if job.get("has_backlog")),
+        "running_jobs": sorted(name for name, job in scheduler_jobs.items() if job.get("status") == "running"),
+    }
+
     # v1.1: Overall health considers DB connection
     overall_healthy = db_healthy and dlq_pending_count < 100
 
@@ -156,6 +146,7 @@ async def get_data_health_overview(
         },
         "pipeline": {
             "running_jobs": running_jobs_count,
+            "scheduler": scheduler_summary,
         },
         "last_sync_by_type": last_sync_by_type,
     }
@@ -392,6 +383,116 @@ async def resolve_quarantine_entry(
 # Pipeline Job Management
 # ==============================================================================
 
+async def _scheduler_state() -> Dict[str, Any]:
+    """Leader scheduler state (v1.3: next-run/backlog per job); {} if unavailable."""
+    try:
+        from app.jobs.pipeline_scheduler import pipeline_scheduler
+        return await pipeline_scheduler.get_cluster_state()
+    except Exception as e:
+        logger.warning(f"[data_health] scheduler state unavailable: {e}")
+        return {}
+
+
+@router.get("/pipeline/scheduler")
+async def get_pipeline_scheduler(
+    current_user = Depends(get_current_user),
+) -> Dict[str, Any]:
+    """
+    Get work-aware scheduler state.
+
+    v1.3: Leader instance, concurrency budget usage, and per job the next
+    run time, last outcome (busy/idle/blocked/held) and backlog flag.
+    """
+    return await _scheduler_state()
+
+
+@router.get("/pipeline/http-cache")
+async def get_http_cache_stats(
+    current_user = Depends(get_current_user),
+) -> Dict[str, Any]:
+    """
+    Get scraper HTTP cache statistics.
+
+    v1.4: Per host hits, 304 revalidations, misses, hit ratio and bytes
+    saved by the conditional-request cache used by the scraper adapters.
+    """
+    from app.core.http_cache import get_http_cache
+    cache = get_http_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **(await cache.stats())}
+
+
+@router.get("/pipeline/series-resolution")
+async def get_series_resolution_stats(
+    current_user = Depends(get_current_user),
+) -> Dict[str, Any]:
+    """
+    Get series resolution store statistics for this worker.
+
+    v1.5: Memory/table hit rates, misses, coalesced lookups and LRU
+    evictions for the shared series -> source ID cache.
+    """
+    from app.services.series_resolution import get_series_resolution_store
+    return get_series_resolution_store().get_stats()
+
+
+@router.get("/pipeline/price-events")
+async def get_price_event_stats(
+    db: AsyncSession = Depends(get_db),
+    current_user = Depends(get_current_user),
+) -> Dict[str, Any]:
+    """
+    Get price change capture statistics.
+
+    v1.6: Queued price_change_events and each consumer's backlog
+    (changelog sync and any other subscriber).
+    """
+    from app.services.price_events import get_price_event_stats as load_stats, price_cdc_installed
+    if not await price_cdc_installed(db):
+        return {"installed": False}
+    return {"installed": True, **await load_stats(db)}
+
+
+@router.get("/pipeline/response-cache")
+async def get_response_cache_stats(
+    current_user = Depends(get_current_user),
+) -> Dict[str, Any]:
+    """
+    Get public response cache statistics for this worker.
+
+    v1.6: Hits, misses, 304s, stores and tag invalidations.
+    """
+    from app.core.response_cache import get_response_cache_stats as load_stats
+    return load_stats()
+
+
+@router.get("/pipeline/config-snapshot")
+async def get_config_snapshot_stats(
+    current_user = Depends(get_current_user),
+) -> Dict[str, Any]:
+    """
+    Get configuration snapshot state for this worker.
+
+    v1.6: Snapshot version and age, reloads, notifications, listener status.
+    """
+    from app.core.config_snapshot import get_config_snapshot_stats as load_stats
+    return load_stats()
+
+
+@router.get("/pipeline/rate-limits")
+async def get_rate_limit_stats(
+    current_user = Depends(get_current_user),
+) -> Dict[str, Any]:
+    """
+    Get inbound rate limiter state for this worker.
+
+    v1.6: Allowed/limited per route, exact vs batched vs local decisions, Redis sync.
+    """
+    from app.core.rate_limit import get_rate_limit_stats as load_stats
+    return load_stats()
+
+
 @router.get("/pipeline/jobs")
 async def get_pipeline_jobs(
     db: AsyncSession = Depends(get_db),
@@ -405,6 +506,7 @@ async def get_pipeline_jobs(
         """)
     )
     rows = result.fetchall()
+    schedule = (await _scheduler_state()).get("jobs", {})
 
     return {
         "jobs": [
@@ -419,6 +521,7 @@ async def get_pipeline_jobs(
                 "last_run_started": row.last_run_started.isoformat() if row.last_run_started else None,
                 "last_run_completed": row.last_run_completed.isoformat() if row.last_run_completed else None,
                 "last_error": row.last_error[:200] if row.last_error else None,
+                "schedule": schedule.get(row.job_name),
             }
             for row in rows
         ]
@@ -866,6 +969,7 @@ async def get_job_status(
             "updated_at": row.updated_at.isoformat() if row.updated_at else None,
         },
         "last_error": row.last_error[:500] if row.last_error else None,
+        "schedule": (await _scheduler_state()).get("jobs", {}).get(job_name),
     }
 
 
@@ -1,6 +1,9 @@
 """
 Funko POP API routes
 Search and retrieve Funko data from local database.
+
+PERF-034: /search and /series page by keyset cursor with cached totals.
+PERF-039: Public GETs are served from the shared response cache.
 """
 from typing import List, Optional
 from fastapi import APIRouter, Depends, Query, HTTPException
@@ -10,10 +13,24 @@ from sqlalchemy.orm import selectinload
 from pydantic import BaseModel
 
 from app.core.database import get_db
+from app.core.response_cache import CachedJSONResponse, cached_response
+from app.core.pagination import (
+    InvalidCursor,
+    KeysetOrder,
+    count_total,
+    fetch_page,
+    filter_signature,
+)
 from app.models.funko import Funko, FunkoSeriesName
 
 router = APIRouter(prefix="/funkos", tags=["funkos"])
 
+# Funkos change only through pipeline jobs; entries simply expire
+FUNKO_CACHE_TTL = 600
+
+FUNKO_TITLE_ORDER = KeysetOrder("title", Funko, ["title", "id"])
+SERIES_NAME_ORDER = KeysetOrder("name", FunkoSeriesName, ["name", "id"])
+
 
 # Response schemas
 class FunkoSeriesResponse(BaseModel):
@@ -45,14 +62,22 @@ class FunkoSearchResponse(BaseModel):
     total: int
     page: int
     pages: int
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+    total_is_estimate: bool = False
 
 
 class SeriesSearchResponse(BaseModel):
     results: List[FunkoSeriesResponse]
     total: int
+    next_cursor: Optional[str] = None
+    has_more: bool = False
 
 
-@router.get("/search", response_model=FunkoSearchResponse)
+@router.get(
+    "/search", response_model=FunkoSearchResponse, response_class=CachedJSONResponse,
+    dependencies=[Depends(cached_response(FUNKO_CACHE_TTL, ["funkos"]))],
+)
 async def search_funkos(
     q: str = Query(None, description="Search query (title)"),
     series: str = Query(None, description="Filter by series name"),
@@ -62,11 +87,14 @@ async def search_funkos(
     box_number: str = Query(None, description="Filter by box number"),
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from next_cursor (overrides page)"),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Search Funkos by title, series, category, license, product type, or box number.
     Returns paginated results.
+
+    PERF-034: Pass next_cursor back as ?cursor= to page by keyset.
     """
     query = select(Funko).options(selectinload(Funko.series))
 
@@ -76,7 +104,8 @@ async def search_funkos(
         query = query.where(Funko.title.ilike(search_term))
 
     if series:
-        query = query.join(Funko.series).where(FunkoSeriesName.name.ilike(f"%{series}%"))
+        # EXISTS rather than a join: one row per Funko, so counts and pages line up
+        query = query.where(Funko.series.any(FunkoSeriesName.name.ilike(f"%{series}%")))
 
     if category:
         query = query.where(Funko.category.ilike(f"%{category}%"))
@@ -90,32 +119,43 @@ async def search_funkos(
     if box_number:
         query = query.where(Funko.box_number == box_number)
 
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+    # Get total count (cached per filter set)
+    signature = filter_signature(
+        "funkos.search", q=q, series=series, category=category, license=license,
+        product_type=product_type, box_number=box_number,
+    )
+    total, total_is_estimate = await count_total(db, query, signature)
 
     # Apply pagination
-    offset = (page - 1) * per_page
-    query = query.offset(offset).limit(per_page).order_by(Funko.title)
-
-    result = await db.execute(query)
-    funkos = result.scalars().unique().all()
+    try:
+        result = await fetch_page(
+            db, query, FUNKO_TITLE_ORDER, per_page,
+            cursor=cursor, offset=(page - 1) * per_page, unique=True,
+        )
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     pages = (total + per_page - 1) // per_page
 
     return FunkoSearchResponse(
-        results=[FunkoResponse.model_validate(f) for f in funkos],
+        results=[FunkoResponse.model_validate(f) for f in result.items],
         total=total,
         page=page,
-        pages=pages
+        pages=pages,
+        next_cursor=result.next_cursor,
+        has_more=result.has_more,
+        total_is_estimate=total_is_estimate,
     )
 
 
-@router.get("/series", response_model=SeriesSearchResponse)
+@router.get(
+    "/series", response_model=SeriesSearchResponse, response_class=CachedJSONResponse,
+    dependencies=[Depends(cached_response(FUNKO_CACHE_TTL, ["funkos"]))],
+)
 async def get_series(
     q: str = Query(None, description="Search series name"),
     limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from next_cursor"),
     db: AsyncSession = Depends(get_db)
 ):
     """Get list of Funko series/categories"""
@@ -124,25 +164,26 @@ async def get_series(
     if q:
         query = query.where(FunkoSeriesName.name.ilike(f"%{q}%"))
 
-    query = query.order_by(FunkoSeriesName.name).limit(limit)
+    try:
+        result = await fetch_page(db, query, SERIES_NAME_ORDER, limit, cursor=cursor)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    result = await db.execute(query)
-    series_list = result.scalars().all()
-
-    # Get total count
-    count_query = select(func.count(FunkoSeriesName.id))
-    if q:
-        count_query = count_query.where(FunkoSeriesName.name.ilike(f"%{q}%"))
-    count_result = await db.execute(count_query)
-    total = count_result.scalar() or 0
+    # Get total count (cached per filter set)
+    total, _ = await count_total(db, query, filter_signature("funkos.series", q=q))
 
     return SeriesSearchResponse(
-        results=[FunkoSeriesResponse.model_validate(s) for s in series_list],
-        total=total
+        results=[FunkoSeriesResponse.model_validate(s) for s in result.items],
+        total=total,
+        next_cursor=result.next_cursor,
+        has_more=result.has_more,
     )
 
 
-@router.get("/{funko_id}", response_model=FunkoResponse)
+@router.get(
+    "/{funko_id}", response_model=FunkoResponse, response_class=CachedJSONResponse,
+    dependencies=[Depends(cached_response(FUNKO_CACHE_TTL, ["funko:{funko_id}"]))],
+)
 async def get_funko(
     funko_id: int,
     db: AsyncSession = Depends(get_db)
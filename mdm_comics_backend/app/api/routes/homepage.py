@@ -7,6 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_db, get_current_admin
+from app.core.response_cache import CachedJSONResponse, cached_response
 from app.models.user import User
 from app.schemas.homepage import (
     HomepageSectionsResponse,
@@ -16,7 +17,10 @@ from app.services.homepage_service import HomepageService
 
 router = APIRouter()
 
-@router.get("/homepage/sections", response_model=HomepageSectionsResponse)
+@router.get(
+    "/homepage/sections", response_model=HomepageSectionsResponse, response_class=CachedJSONResponse,
+    dependencies=[Depends(cached_response(300, ["homepage"]))],
+)
 async def get_homepage_sections(
     db: AsyncSession = Depends(get_db)
 ) -> Any:
@@ -2,23 +2,49 @@
 Product routes
 
 P2-6: Admin actions are audit logged
+PERF-034: Listing uses keyset cursors per sort order and cached totals
+PERF-039: Public GETs are served from the shared response cache
 """
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select
 
 from app.core.database import get_db
+from app.core.pagination import (
+    InvalidCursor,
+    KeysetOrder,
+    count_total,
+    fetch_page,
+    filter_signature,
+)
+from app.core.response_cache import CachedJSONResponse, cached_response, invalidates
 from app.core.audit_log import log_admin_action, ACTION_PRODUCT_CREATE, ACTION_PRODUCT_UPDATE, ACTION_PRODUCT_DELETE
 from app.models.product import Product
 from app.models.user import User
 from app.schemas.product import ProductCreate, ProductUpdate, ProductResponse, ProductList
+from app.services.bundle_service import BundleService
 from app.api.deps import get_current_admin
 
 router = APIRouter()
 
+# Short TTL: checkout stock changes are not invalidated explicitly
+PRODUCT_CACHE_TTL = 60
 
-@router.get("", response_model=ProductList)
+# Sort orders for list_products; id breaks ties so cursors are unambiguous
+PRODUCT_ORDERS = {
+    "price_asc": KeysetOrder("price_asc", Product, ["price", "id"]),
+    "price_desc": KeysetOrder("price_desc", Product, ["price", "id"], descending=True),
+    "rating": KeysetOrder("rating", Product, ["rating", "id"], descending=True),
+    "newest": KeysetOrder("newest", Product, ["created_at", "id"], descending=True),
+    "featured": KeysetOrder("featured", Product, ["featured", "created_at", "id"], descending=True),
+}
+
+
+@router.get(
+    "", response_model=ProductList, response_class=CachedJSONResponse,
+    dependencies=[Depends(cached_response(PRODUCT_CACHE_TTL, ["products"]))],
+)
 async def list_products(
     category: Optional[str] = None,
     subcategory: Optional[str] = None,
@@ -30,9 +56,15 @@ async def list_products(
     sort: str = Query("featured", regex="^(featured|price_asc|price_desc|rating|newest)$"),
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from next_cursor (overrides page)"),
     db: AsyncSession = Depends(get_db)
 ):
-    """List products with filtering, sorting, and pagination"""
+    """
+    List products with filtering, sorting, and pagination.
+
+    PERF-034: Pass next_cursor back as ?cursor= to page by keyset; page
+    numbers still work. total is cached briefly per filter set.
+    """
     query = select(Product)
     
     # Filters
@@ -54,39 +86,38 @@ async def list_products(
             Product.name.ilike(search_term) |
             Product.description.ilike(search_term)
         )
-    
-    # Sorting
-    if sort == "price_asc":
-        query = query.order_by(Product.price.asc())
-    elif sort == "price_desc":
-        query = query.order_by(Product.price.desc())
-    elif sort == "rating":
-        query = query.order_by(Product.rating.desc())
-    elif sort == "newest":
-        query = query.order_by(Product.created_at.desc())
-    else:  # featured
-        query = query.order_by(Product.featured.desc(), Product.created_at.desc())
-    
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total = await db.scalar(count_query)
-    
-    # Pagination
-    offset = (page - 1) * per_page
-    query = query.offset(offset).limit(per_page)
-    
-    result = await db.execute(query)
-    products = result.scalars().all()
-    
+
+    # Count total (cached per filter set)
+    signature = filter_signature(
+        "products", category=category, subcategory=subcategory, search=search, featured=featured,
+        min_price=min_price, max_price=max_price, in_stock=in_stock or None,
+    )
+    total, total_is_estimate = await count_total(db, query, signature)
+
+    # Sorting + pagination
+    try:
+        result = await fetch_page(
+            db, query, PRODUCT_ORDERS[sort], per_page,
+            cursor=cursor, offset=(page - 1) * per_page,
+        )
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     return ProductList(
-        products=products,
+        products=result.items,
         total=total,
         page=page,
-        per_page=per_page
+        per_page=per_page,
+        next_cursor=result.next_cursor,
+        has_more=result.has_more,
+        total_is_estimate=total_is_estimate,
     )
 
 
-@router.get("/{product_id}", response_model=ProductResponse)
+@router.get(
+    "/{product_id}", response_model=ProductResponse, response_class=CachedJSONResponse,
+    dependencies=[Depends(cached_response(PRODUCT_CACHE_TTL, ["product:{product_id}"]))],
+)
 async def get_product(product_id: int, db: AsyncSession = Depends(get_db)):
     """Get single product by ID"""
     result = await db.execute(select(Product).where(Product.id == product_id))
@@ -101,7 +132,10 @@ async def get_product(product_id: int, db: AsyncSession = Depends(get_db)):
     return product
 
 
-@router.post("", response_model=ProductResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "", response_model=ProductResponse, status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(invalidates("products"))],
+)
 async def create_product(
     request: Request,
     product_data: ProductCreate,
@@ -136,7 +170,10 @@ async def create_product(
     return product
 
 
-@router.patch("/{product_id}", response_model=ProductResponse)
+@router.patch(
+    "/{product_id}", response_model=ProductResponse,
+    dependencies=[Depends(invalidates("products", "product:{product_id}", "bundles"))],
+)
 async def update_product(
     request: Request,
     product_id: int,
@@ -158,6 +195,12 @@ async def update_product(
     for field, value in update_dict.items():
         setattr(product, field, value)
 
+    # PERF-050: Price edits via the product API reprice bundles too; the
+    # route's cache dependency drops the "bundles" tag to match
+    if "price" in update_dict or "original_price" in update_dict:
+        await db.flush()
+        await BundleService.reprice_for_products(db, [product_id])
+
     await db.commit()
     await db.refresh(product)
 
@@ -175,7 +218,10 @@ async def update_product(
     return product
 
 
-@router.delete("/{product_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete(
+    "/{product_id}", status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(invalidates("products", "product:{product_id}"))],
+)
 async def delete_product(
     request: Request,
     product_id: int,
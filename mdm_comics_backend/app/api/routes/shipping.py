@@ -28,7 +28,8 @@ from app.models.carrier import CarrierCode
 from app.core.feature_flags import FeatureFlags
 from app.services.shipping_service import ShippingService, ShippingError, get_shipping_service
 from app.services.multi_carrier_service import MultiCarrierService
-from app.services.encryption import mask_address_line, decrypt_pii
+from app.services.encryption import mask_address_line
+from app.services.pii_access import decrypt_address, decrypt_cached, pii_request_scope
 from app.modules.shipping.carriers.base import AddressInput, Package
 from app.schemas.shipping import (
     AddressCreate,
@@ -55,12 +56,16 @@ from app.schemas.shipping import (
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/shipping", tags=["shipping"])
+# PERF-046: Decrypted PII is cached for the request and zeroized after it
+router = APIRouter(prefix="/shipping", tags=["shipping"], dependencies=[Depends(pii_request_scope)])
 
 
 # ==================== Helper Functions ====================
 
 
+RESPONSE_PII_FIELDS = ("recipient_name", "company_name", "address_line1")
+
+
 def mask_name(name: str) -> str:
     """Mask a name for display."""
     if not name or len(name) < 2:
@@ -70,16 +75,15 @@ def mask_name(name: str) -> str:
 
 def address_to_response(address: Address) -> AddressResponse:
     """Convert address model to response with masked PII."""
-    # Decrypt and mask PII
-    recipient_name = decrypt_pii(address.recipient_name_encrypted) if address.recipient_name_encrypted else ""
-    address_line1 = decrypt_pii(address.address_line1_encrypted) if address.address_line1_encrypted else ""
+    # Decrypt and mask PII (only the columns the response shows)
+    pii = decrypt_address(address, fields=RESPONSE_PII_FIELDS)
 
     return AddressResponse(
         id=address.id,
         address_type=address.address_type.value if address.address_type else "shipping",
-        recipient_name_masked=mask_name(recipient_name),
-        company_name=decrypt_pii(address.company_name_encrypted) if address.company_name_encrypted else None,
-        address_line1_masked=mask_address_line(address_line1),
+        recipient_name_masked=mask_name(pii.recipient_name or ""),
+        company_name=pii.company_name,
+        address_line1_masked=mask_address_line(pii.address_line1 or ""),
         city=address.city,
         state_province=address.state_province,
         postal_code=address.postal_code,
@@ -238,7 +242,7 @@ async def validate_address(
 
         # Build response
         original = {
-            "address_line1": mask_address_line(decrypt_pii(address.address_line1_encrypted)),
+            "address_line1": mask_address_line(decrypt_cached(address.address_line1_encrypted)),
             "city": address.city,
             "state_province": address.state_province,
             "postal_code": address.postal_code,
@@ -248,7 +252,7 @@ async def validate_address(
         corrected_dict = None
         if corrected:
             corrected_dict = {
-                "address_line1": mask_address_line(decrypt_pii(corrected.address_line1_encrypted)),
+                "address_line1": mask_address_line(decrypt_cached(corrected.address_line1_encrypted)),
                 "city": corrected.city,
                 "state_province": corrected.state_province,
                 "postal_code": corrected.postal_code,
@@ -437,17 +441,18 @@ async def get_multi_carrier_rates(
         residential=False,
     )
 
+    pii = decrypt_address(address)
     destination = AddressInput(
-        address_line1=decrypt_pii(address.address_line1_encrypted) if address.address_line1_encrypted else "",
-        address_line2=decrypt_pii(address.address_line2_encrypted) if address.address_line2_encrypted else None,
+        address_line1=pii.address_line1 or "",
+        address_line2=pii.address_line2,
         city=address.city,
         state_province=address.state_province,
         postal_code=address.postal_code,
         country_code=address.country_code,
-        recipient_name=decrypt_pii(address.recipient_name_encrypted) if address.recipient_name_encrypted else None,
-        company_name=decrypt_pii(address.company_name_encrypted) if address.company_name_encrypted else None,
-        phone=decrypt_pii(address.phone_encrypted) if address.phone_encrypted else None,
-        email=decrypt_pii(address.email_encrypted) if address.email_encrypted else None,
+        recipient_name=pii.recipient_name,
+        company_name=pii.company_name,
+        phone=pii.phone,
+        email=pii.email,
         residential=address.residential,
     )
 
@@ -145,6 +145,11 @@ class Settings(BaseSettings):
     RATE_LIMIT_DEFAULT: str = "100/minute"
     RATE_LIMIT_AUTH: str = "5/minute"
     RATE_LIMIT_CHECKOUT: str = "10/minute"
+    # PERF-043: Limits of at least this many hits per window are counted
+    # locally and synced to Redis in the background; smaller ones are exact
+    RATE_LIMIT_BATCH_THRESHOLD: int = 100
+    RATE_LIMIT_SYNC_INTERVAL_MS: int = 25
+    RATE_LIMIT_LOCAL_MAX_KEYS: int = 10000
 
     # Cookie/CSRF Settings (P1-5)
     COOKIE_DOMAIN: str = ""  # Empty = auto-detect from request
@@ -210,6 +215,11 @@ class Settings(BaseSettings):
     # DSAR (GDPR/CCPA Compliance)
     DSAR_PROCESSING_DAYS: int = 30
     DSAR_DATA_RETENTION_DAYS: int = 7  # Keep exported data files for 7 days
+    # PERF-047: Streaming exports (ZIP of per-section NDJSON)
+    DSAR_EXPORT_STORAGE: str = "local"  # "local" (DSAR_EXPORT_DIR) or "s3"
+    DSAR_EXPORT_DIR: str = ""  # Empty = system temp dir
+    DSAR_EXPORT_PAGE_SIZE: int = 500  # Rows per keyset page
+    DSAR_EXPORT_CONCURRENCY: int = 3  # Sections (DB sessions) read at once
 
     # ===== OUTREACH SYSTEM v1.5.0 =====
 
@@ -254,6 +264,12 @@ class Settings(BaseSettings):
     PIPELINE_COMIC_ENRICHMENT_INTERVAL_MINUTES: int = 30
     PIPELINE_FUNKO_PRICE_CHECK_INTERVAL_MINUTES: int = 60
     PIPELINE_DLQ_RETRY_INTERVAL_MINUTES: int = 15
+    # v1.25.0: Work-aware scheduling - one leader replica, bounded concurrency
+    PIPELINE_MAX_CONCURRENT_JOBS: int = 4  # Global cap on budgeted jobs
+    PIPELINE_MAX_API_JOBS: int = 2  # External API / scraper jobs
+    PIPELINE_MAX_CPU_JOBS: int = 1  # Image hashing, browser automation
+    PIPELINE_MAX_DB_JOBS: int = 2  # Bulk import / cross-reference jobs
+    PIPELINE_LEADER_RETRY_SECONDS: int = 30  # Followers retry leadership this often
 
     # GCD (Grand Comics Database) Import - v1.8.0
     # SQLite dump path: local dev uses assets/, Railway uses mounted volume
@@ -276,6 +292,14 @@ class Settings(BaseSettings):
     SCRAPER_MIN_DELAY_SECONDS: float = 2.0  # Minimum delay between scrape requests
     SCRAPER_USER_AGENT: str = "MDMComicsBot/1.0 (+https://mdmcomics.com/bot)"
 
+    # Conditional-request HTTP cache for scraper / wiki adapters
+    HTTP_CACHE_ENABLED: bool = True
+    HTTP_CACHE_DIR: str = "/data/http_cache"  # Railway volume mount
+    HTTP_CACHE_MAX_BYTES: int = 2 * 1024 ** 3  # LRU eviction above this
+    HTTP_CACHE_DEFAULT_TTL_SECONDS: int = 0  # 0 = always revalidate (ETag/Last-Modified)
+    # Per-host freshness overrides "host=seconds,..." - win over Cache-Control
+    HTTP_CACHE_HOST_TTLS: str = "www.comics.org=604800,marvel.fandom.com=86400"
+
     # ===== THE RACK FACTOR v1.5.2 =====
     # Newsletter and Social Media Content Engine
     RACK_FACTOR_ENABLED: bool = True  # Master toggle for The Rack Factor
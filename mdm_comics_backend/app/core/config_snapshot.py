@@ -0,0 +1,293 @@
+"""
+Configuration Snapshot v1.0.0
+
+PERF-040: One immutable, versioned view of feature_flags and site_settings
+shared by every request in the process.
+
+- load_snapshot() reads both tables in one UNION ALL query and builds a
+  frozen ConfigSnapshot; the module-level reference is swapped in one
+  assignment, so readers never see a half-built view
+- Lookups (FeatureFlags.is_enabled, SiteSettingsService.get, branding
+  context) are plain dict reads on the current snapshot, with no lock and
+  no query once it is loaded
+- Statement-level triggers on both tables pg_notify('config_changed') on
+  every write (admin routes, brand assets, homepage sections, manual SQL);
+  config_listener_loop() holds a dedicated LISTEN connection and reloads
+  on each notification, so replicas pick up changes within milliseconds
+  instead of polling
+- Processes without a listener (ARQ workers, scripts) or with a dropped
+  listener connection fall back to reloading every CONFIG_SNAPSHOT_TTL
+  seconds, the old feature flag cache behaviour
+"""
+import asyncio
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Set
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import engine, get_db_session
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = "config_changed"
+
+# Reload interval when no listener is connected
+CONFIG_SNAPSHOT_TTL = int(os.getenv("CONFIG_SNAPSHOT_TTL", "30"))
+# Safety reload while listening, in case a notification is ever lost
+CONFIG_SNAPSHOT_MAX_AGE = int(os.getenv("CONFIG_SNAPSHOT_MAX_AGE", "600"))
+LISTENER_RETRY_SECONDS = 5
+
+SCHEMA_DDL = [
+    f"""
+    CREATE OR REPLACE FUNCTION notify_config_changed() RETURNS trigger AS $$
+    BEGIN
+        -- Delivered on commit; identical payloads in one transaction collapse
+        PERFORM pg_notify('{NOTIFY_CHANNEL}', TG_TABLE_NAME);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+]
+for _table in ("feature_flags", "site_settings"):
+    SCHEMA_DDL += [
+        f"DROP TRIGGER IF EXISTS trg_{_table}_notify_config ON {_table}",
+        f"CREATE TRIGGER trg_{_table}_notify_config "
+        f"AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {_table} "
+        f"FOR EACH STATEMENT EXECUTE FUNCTION notify_config_changed()",
+    ]
+
+SNAPSHOT_QUERY = """
+    SELECT 'flag' AS kind, module || ':' || feature AS key, module, feature,
+           is_enabled, config_json::text AS value, NULL::varchar AS category
+    FROM feature_flags
+    UNION ALL
+    SELECT 'setting', key, NULL, NULL, NULL, value, category
+    FROM site_settings
+"""
+
+
+@dataclass(frozen=True)
+class FlagState:
+    """Read-only copy of a FeatureFlag row."""
+    module: str
+    feature: str
+    is_enabled: bool
+    config_json: Mapping[str, Any] = field(default_factory=dict)
+
+    @property
+    def flag_key(self) -> str:
+        return f"{self.module}:{self.feature}"
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    version: int
+    loaded_at: float
+    flags: Mapping[str, FlagState]
+    settings: Mapping[str, str]
+    categories: Mapping[str, str]
+
+    def setting(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """Non-empty setting value, else default."""
+        return self.settings.get(key) or default
+
+    def settings_in(self, category: str) -> Dict[str, str]:
+        """Non-empty settings of one category."""
+        return {
+            key: value for key, value in self.settings.items()
+            if value and self.categories.get(key) == category
+        }
+
+
+EMPTY_SNAPSHOT = ConfigSnapshot(0, 0.0, MappingProxyType({}), MappingProxyType({}), MappingProxyType({}))
+
+_snapshot: ConfigSnapshot = EMPTY_SNAPSHOT
+_stale = True
+_listening = False
+_reload_lock: Optional[asyncio.Lock] = None
+_stats = {"reloads": 0, "notifications": 0, "errors": 0}
+# Reloads started by notifications; held so they are not collected mid-run
+_reload_tasks: Set[asyncio.Task] = set()
+
+
+def _build(rows, version: int) -> ConfigSnapshot:
+    flags: Dict[str, FlagState] = {}
+    values: Dict[str, str] = {}
+    categories: Dict[str, str] = {}
+    for row in rows:
+        if row.kind == "flag":
+            config = json.loads(row.value) if row.value else {}
+            # config_json is free-form JSON; only an object is a flag config
+            if not isinstance(config, dict):
+                config = {}
+            flags[row.key] = FlagState(
+                row.module, row.feature, bool(row.is_enabled), MappingProxyType(config),
+            )
+        else:
+            values[row.key] = row.value
+            categories[row.key] = row.category
+    return ConfigSnapshot(
+        version=version,
+        loaded_at=time.time(),
+        flags=MappingProxyType(flags),
+        settings=MappingProxyType(values),
+        categories=MappingProxyType(categories),
+    )
+
+
+async def load_snapshot(db: AsyncSession) -> ConfigSnapshot:
+    """Read both tables in one query into a new snapshot (not installed)."""
+    result = await db.execute(text(SNAPSHOT_QUERY))
+    return _build(result.fetchall(), _snapshot.version + 1)
+
+
+def current() -> ConfigSnapshot:
+    """The installed snapshot, possibly empty or stale; never blocks."""
+    return _snapshot
+
+
+def invalidate() -> None:
+    """Reload on next access (the writer's own read-your-writes path)."""
+    global _stale
+    _stale = True
+
+
+def _needs_reload() -> bool:
+    age = time.time() - _snapshot.loaded_at
+    return _stale or age > (CONFIG_SNAPSHOT_MAX_AGE if _listening else CONFIG_SNAPSHOT_TTL)
+
+
+async def reload(db: Optional[AsyncSession] = None) -> ConfigSnapshot:
+    """Load and install a new snapshot. Keeps the old one on failure."""
+    global _snapshot, _stale, _reload_lock
+    if _reload_lock is None:
+        _reload_lock = asyncio.Lock()
+    async with _reload_lock:
+        # Another caller may have reloaded while we waited
+        if not _needs_reload():
+            return _snapshot
+        _stale = False
+        try:
+            if db is not None:
+                snapshot = await load_snapshot(db)
+            else:
+                async with get_db_session() as session:
+                    snapshot = await load_snapshot(session)
+        except Exception as e:
+            _stale = True
+            _stats["errors"] += 1
+            logger.error(f"Failed to load configuration snapshot: {e}")
+            if _snapshot is EMPTY_SNAPSHOT:
+                raise
+            return _snapshot
+        _snapshot = snapshot
+        _stats["reloads"] += 1
+        logger.debug(
+            f"Configuration snapshot v{snapshot.version}: "
+            f"{len(snapshot.flags)} flags, {len(snapshot.settings)} settings"
+        )
+        return snapshot
+
+
+async def get_snapshot(db: Optional[AsyncSession] = None) -> ConfigSnapshot:
+    """Current snapshot, reloading first only if it is stale."""
+    if _needs_reload():
+        return await reload(db)
+    return _snapshot
+
+
+# ----- Change notifications -----
+
+async def install_config_notify(db: AsyncSession) -> None:
+    """Create or replace the notify function and triggers."""
+    for statement in SCHEMA_DDL:
+        await db.execute(text(statement))
+    await db.commit()
+    logger.info("Config change NOTIFY triggers installed")
+
+
+async def ensure_config_notify(db: AsyncSession) -> None:
+    """Startup hook: install the notify triggers if either is missing."""
+    try:
+        installed = (await db.execute(text("""
+            SELECT COUNT(*) FROM pg_trigger
+            WHERE tgname IN ('trg_feature_flags_notify_config', 'trg_site_settings_notify_config')
+        """))).scalar()
+        if installed != 2:
+            await install_config_notify(db)
+    except Exception as e:
+        logger.warning(f"Config notify trigger installation failed: {e}")
+        await db.rollback()
+
+
+def _on_notify(connection, pid, channel, payload) -> None:
+    _stats["notifications"] += 1
+    invalidate()
+    task = asyncio.get_running_loop().create_task(_reload_quietly())
+    _reload_tasks.add(task)
+    task.add_done_callback(_reload_tasks.discard)
+
+
+async def _reload_quietly() -> None:
+    try:
+        await reload()
+    except Exception as e:
+        logger.warning(f"Config snapshot reload after notification failed: {e}")
+
+
+async def config_listener_loop() -> None:
+    """
+    Background task: LISTEN for config changes on a dedicated connection.
+
+    The connection is detached from the pool so it doesn't hold a slot.
+    After every (re)connect the snapshot is reloaded, covering
+    notifications sent while disconnected.
+    """
+    global _listening
+    while True:
+        conn = None
+        try:
+            conn = await engine.connect()
+            raw = await conn.get_raw_connection()
+            driver = raw.driver_connection
+            # Closing a detached connection closes it instead of pooling it
+            raw.detach()
+
+            await driver.add_listener(NOTIFY_CHANNEL, _on_notify)
+            _listening = True
+            invalidate()
+            await reload()
+            logger.info("Config snapshot listener connected")
+            while not driver.is_closed():
+                await asyncio.sleep(LISTENER_RETRY_SECONDS)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            _stats["errors"] += 1
+            logger.warning(f"Config snapshot listener error: {e}")
+        finally:
+            _listening = False
+            if conn is not None:
+                try:
+                    await conn.close()
+                except Exception:
+                    pass
+        await asyncio.sleep(LISTENER_RETRY_SECONDS)
+
+
+def get_config_snapshot_stats() -> Dict[str, Any]:
+    snapshot = _snapshot
+    return {
+        **_stats,
+        "version": snapshot.version,
+        "age_seconds": round(time.time() - snapshot.loaded_at, 1) if snapshot.loaded_at else None,
+        "flags": len(snapshot.flags),
+        "settings": len(snapshot.settings),
+        "listening": _listening,
+    }
@@ -1,11 +1,15 @@
 """
-Feature Flags Service v1.0.0
+Feature Flags Service v1.1.0
 
 Per 20251216_shipping_compartmentalization_proposal.json:
 - 30-second cache TTL for performance
 - Carrier-level toggles via database
 - No deployment required for toggling
 
+PERF-040: Flags are read from the shared configuration snapshot
+(app.core.config_snapshot), reloaded on LISTEN/NOTIFY rather than every
+30 seconds; the 30-second TTL remains only as the no-listener fallback.
+
 Usage:
     # Check if a specific carrier is enabled
     if await FeatureFlags.is_carrier_enabled(CarrierCode.UPS):
@@ -17,91 +21,17 @@ Usage:
     # Get carrier-specific config
     config = await FeatureFlags.get_carrier_config(CarrierCode.UPS)
 """
-import time
 import logging
-from typing import Dict, List, Optional
-from sqlalchemy import select
+from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db_session
-from app.models.feature_flag import FeatureFlag
+from app.core import config_snapshot
+from app.core.config_snapshot import FlagState
 from app.models.carrier import CarrierCode
 
 logger = logging.getLogger(__name__)
 
 
-class FeatureFlagCache:
-    """
-    In-memory cache for feature flags with TTL.
-
-    Cache is refreshed when stale (> cache_ttl seconds since last refresh).
-    Thread-safe for async usage.
-    """
-
-    def __init__(self, cache_ttl: int = 30):
-        self._cache: Dict[str, FeatureFlag] = {}
-        self._cache_ttl = cache_ttl  # seconds
-        self._last_refresh: float = 0
-
-    @property
-    def is_stale(self) -> bool:
-        """Check if cache needs refresh."""
-        return time.time() - self._last_refresh > self._cache_ttl
-
-    async def refresh(self, db: Optional[AsyncSession] = None) -> None:
-        """
-        Refresh the cache from database.
-
-        Uses provided session or creates new one.
-        """
-        try:
-            if db:
-                await self._load_flags(db)
-            else:
-                async with get_db_session() as session:
-                    await self._load_flags(session)
-
-            self._last_refresh = time.time()
-            logger.debug(f"Feature flags cache refreshed: {len(self._cache)} flags loaded")
-
-        except Exception as e:
-            logger.error(f"Failed to refresh feature flags cache: {e}")
-            # Keep stale cache on failure rather than clearing
-            if not self._cache:
-                raise
-
-    async def _load_flags(self, db: AsyncSession) -> None:
-        """Load all flags from database into cache."""
-        result = await db.execute(select(FeatureFlag))
-        flags = result.scalars().all()
-
-        new_cache: Dict[str, FeatureFlag] = {}
-        for flag in flags:
-            new_cache[flag.flag_key] = flag
-
-        self._cache = new_cache
-
-    def get(self, key: str) -> Optional[FeatureFlag]:
-        """Get a flag from cache by key (module:feature)."""
-        return self._cache.get(key)
-
-    def get_by_module(self, module: str) -> List[FeatureFlag]:
-        """Get all flags for a module."""
-        return [
-            flag for flag in self._cache.values()
-            if flag.module == module
-        ]
-
-    def clear(self) -> None:
-        """Clear the cache (forces refresh on next access)."""
-        self._cache.clear()
-        self._last_refresh = 0
-
-
-# Global cache instance
-_flag_cache = FeatureFlagCache(cache_ttl=30)
-
-
 class FeatureFlags:
     """
     Static methods for checking feature flags.
@@ -117,9 +47,8 @@ class FeatureFlags:
 
     @classmethod
     async def _ensure_cache_fresh(cls, db: Optional[AsyncSession] = None) -> None:
-        """Refresh cache if stale."""
-        if _flag_cache.is_stale:
-            await _flag_cache.refresh(db)
+        """Reload the configuration snapshot if stale."""
+        await config_snapshot.get_snapshot(db)
 
     @classmethod
     async def is_enabled(cls, module: str, feature: str, db: Optional[AsyncSession] = None) -> bool:
@@ -137,7 +66,7 @@ class FeatureFlags:
         await cls._ensure_cache_fresh(db)
 
         key = f"{module}:{feature}"
-        flag = _flag_cache.get(key)
+        flag = config_snapshot.current().flags.get(key)
 
         return flag.is_enabled if flag else False
 
@@ -166,7 +95,7 @@ class FeatureFlags:
         await cls._ensure_cache_fresh(db)
 
         enabled = []
-        for flag in _flag_cache.get_by_module("shipping"):
+        for flag in cls._module_flags("shipping"):
             if flag.is_enabled:
                 try:
                     carrier = CarrierCode(flag.feature.upper())
@@ -194,9 +123,9 @@ class FeatureFlags:
         await cls._ensure_cache_fresh(db)
 
         key = f"{module}:{feature}"
-        flag = _flag_cache.get(key)
+        flag = config_snapshot.current().flags.get(key)
 
-        return flag.config_json if flag else {}
+        return dict(flag.config_json) if flag else {}
 
     @classmethod
     async def get_carrier_config(cls, carrier_code: CarrierCode, db: Optional[AsyncSession] = None) -> dict:
@@ -212,33 +141,33 @@ class FeatureFlags:
         return await cls.get_config("shipping", carrier_code.value.lower(), db)
 
     @classmethod
-    async def get_flag(cls, module: str, feature: str, db: Optional[AsyncSession] = None) -> Optional[FeatureFlag]:
+    async def get_flag(cls, module: str, feature: str, db: Optional[AsyncSession] = None) -> Optional[FlagState]:
         """
-        Get the full FeatureFlag object.
+        Get the flag's snapshot state.
 
         Args:
             module: Module name
             feature: Feature name
 
         Returns:
-            FeatureFlag or None
+            FlagState or None
         """
         await cls._ensure_cache_fresh(db)
-        return _flag_cache.get(f"{module}:{feature}")
+        return config_snapshot.current().flags.get(f"{module}:{feature}")
 
     @classmethod
-    async def get_all_flags(cls, db: Optional[AsyncSession] = None) -> List[FeatureFlag]:
+    async def get_all_flags(cls, db: Optional[AsyncSession] = None) -> List[FlagState]:
         """
         Get all feature flags.
 
         Returns:
-            List of all FeatureFlag objects
+            List of all FlagState objects
         """
         await cls._ensure_cache_fresh(db)
-        return list(_flag_cache._cache.values())
+        return list(config_snapshot.current().flags.values())
 
     @classmethod
-    async def get_module_flags(cls, module: str, db: Optional[AsyncSession] = None) -> List[FeatureFlag]:
+    async def get_module_flags(cls, module: str, db: Optional[AsyncSession] = None) -> List[FlagState]:
         """
         Get all flags for a specific module.
 
@@ -246,17 +175,22 @@ class FeatureFlags:
             module: Module name (e.g., 'shipping')
 
         Returns:
-            List of FeatureFlag objects for that module
+            List of FlagState objects for that module
         """
         await cls._ensure_cache_fresh(db)
-        return _flag_cache.get_by_module(module)
+        return cls._module_flags(module)
+
+    @staticmethod
+    def _module_flags(module: str) -> List[FlagState]:
+        return [flag for flag in config_snapshot.current().flags.values() if flag.module == module]
 
     @classmethod
     def invalidate_cache(cls) -> None:
         """
         Invalidate the cache (forces refresh on next access).
 
-        Call this after updating flags in the database.
+        Other processes are told by the feature_flags NOTIFY trigger; this
+        makes the writing process itself reload before its next read.
         """
-        _flag_cache.clear()
+        config_snapshot.invalidate()
         logger.info("Feature flags cache invalidated")
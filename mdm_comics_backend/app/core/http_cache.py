@@ -0,0 +1,440 @@
+"""
+Persistent Conditional-Request HTTP Cache v1.0.0
+
+Disk cache for the scraper / wiki adapters (Fandom, Marvel Fandom,
+ComicBookRealm, MyComicShop, GCD) so enrichment jobs that revisit an
+issue or series spend their rate-limit budget on new pages instead of
+re-downloading pages that have not changed.
+
+- Bodies are stored zlib-compressed and content-addressed (sha256 of the
+  body), so identical pages reached through different URLs share a blob
+- A SQLite index maps request keys (method + full URL incl. params) to
+  blob, status, ETag / Last-Modified and freshness deadline
+- Fresh entries are served without touching the network
+- Stale entries are revalidated with If-None-Match / If-Modified-Since;
+  a 304 refreshes the entry and serves the cached body
+- Freshness comes from Cache-Control max-age, overridden per host by
+  HTTP_CACHE_HOST_TTLS (an operator override wins over the server)
+- Per-host hit / revalidation / miss counts and bytes saved are kept in
+  the index and exposed on /api/admin/data-health/pipeline/http-cache
+
+All SQLite and file I/O runs in a worker thread; a threading lock
+serializes access to the single index connection.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Response headers worth replaying from cache. The body is stored decoded,
+# so Content-Encoding / Content-Length are deliberately not kept.
+STORED_HEADERS = ("content-type", "etag", "last-modified", "cache-control", "date")
+
+# Prune at most once per this many stores
+PRUNE_EVERY_STORES = 500
+
+_MAX_AGE_RE = re.compile(r"max-age\s*=\s*(\d+)", re.IGNORECASE)
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS entries (
+        key TEXT PRIMARY KEY,
+        url TEXT NOT NULL,
+        host TEXT NOT NULL,
+        status INTEGER NOT NULL,
+        headers TEXT NOT NULL,
+        blob TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        etag TEXT,
+        last_modified TEXT,
+        stored_at REAL NOT NULL,
+        fresh_until REAL NOT NULL,
+        last_access REAL NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_entries_blob ON entries (blob)",
+    "CREATE INDEX IF NOT EXISTS ix_entries_last_access ON entries (last_access)",
+    """
+    CREATE TABLE IF NOT EXISTS host_stats (
+        host TEXT PRIMARY KEY,
+        hits INTEGER NOT NULL DEFAULT 0,
+        revalidated INTEGER NOT NULL DEFAULT 0,
+        misses INTEGER NOT NULL DEFAULT 0,
+        stored INTEGER NOT NULL DEFAULT 0,
+        bytes_saved INTEGER NOT NULL DEFAULT 0,
+        bytes_fetched INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+)
+
+
+def parse_host_ttls(value: Optional[str]) -> Dict[str, int]:
+    """Parse "host=seconds,host=seconds" into a dict, skipping bad pairs."""
+    ttls: Dict[str, int] = {}
+    for pair in (value or "").split(","):
+        host, sep, seconds = pair.partition("=")
+        if not sep:
+            continue
+        try:
+            ttls[host.strip().lower()] = int(seconds.strip())
+        except ValueError:
+            logger.warning(f"[HTTP_CACHE] Ignoring invalid host TTL: {pair!r}")
+    return ttls
+
+
+def cache_key(method: str, url: str, params: Any = None) -> str:
+    """Request key: method plus the fully-resolved URL (query params included)."""
+    full_url = str(httpx.URL(url, params=params)) if params else str(httpx.URL(url))
+    return hashlib.sha256(f"{method.upper()} {full_url}".encode()).hexdigest()
+
+
+@dataclass
+class CachedEntry:
+    """One indexed response."""
+    key: str
+    url: str
+    host: str
+    status: int
+    headers: Dict[str, str]
+    blob: str
+    size: int
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fresh_until: float
+    body: bytes = b""
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.fresh_until
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self, method: str, cache_status: str) -> httpx.Response:
+        headers = dict(self.headers)
+        headers["X-Cache"] = cache_status
+        return httpx.Response(
+            status_code=self.status,
+            headers=headers,
+            content=self.body,
+            request=httpx.Request(method, self.url),
+        )
+
+
+class HTTPCache:
+    """
+    Content-addressed response cache with a SQLite index.
+
+    Only successful (200) GET responses are stored. Entries that are
+    neither fresh for any time nor revalidatable are not worth keeping
+    and are skipped.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        default_ttl_seconds: int = 0,
+        host_ttls: Optional[Dict[str, int]] = None,
+        max_bytes: int = 2 * 1024 ** 3,
+    ):
+        self.directory = directory
+        self.default_ttl_seconds = default_ttl_seconds
+        self.host_ttls = {k.lower(): v for k, v in (host_ttls or {}).items()}
+        self.max_bytes = max_bytes
+        self._blob_dir = os.path.join(directory, "blobs")
+        os.makedirs(self._blob_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            os.path.join(directory, "index.sqlite3"),
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        for statement in _SCHEMA:
+            self._db.execute(statement)
+        self._stores_since_prune = 0
+
+    # ----------------------------------------------------------------- public
+
+    async def lookup(self, method: str, url: str, params: Any = None) -> Optional[CachedEntry]:
+        """Return the indexed entry (with body) for a request, or None."""
+        return await asyncio.to_thread(self._lookup, cache_key(method, url, params))
+
+    async def store(
+        self, method: str, url: str, params: Any, host: str, response: httpx.Response
+    ) -> bool:
+        """Index a fresh 200 response. Returns False if it was not cacheable."""
+        if response.status_code != 200:
+            return False
+        fresh_until = self.freshness_deadline(host, response.headers)
+        if fresh_until is None:
+            return False
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if fresh_until <= time.time() and not (etag or last_modified):
+            return False
+        stored = await asyncio.to_thread(
+            self._store, cache_key(method, url, params), url, host, response,
+            etag, last_modified, fresh_until,
+        )
+        if stored:
+            self._stores_since_prune += 1
+            if self._stores_since_prune >= PRUNE_EVERY_STORES:
+                self._stores_since_prune = 0
+                await self.prune()
+        return stored
+
+    async def refresh(self, entry: CachedEntry, response: httpx.Response) -> None:
+        """Apply a 304: extend freshness and pick up updated validators."""
+        headers = dict(entry.headers)
+        for name in STORED_HEADERS:
+            if name in response.headers:
+                headers[name] = response.headers[name]
+        fresh_until = self.freshness_deadline(entry.host, response.headers)
+        entry.headers = headers
+        entry.etag = headers.get("etag")
+        entry.last_modified = headers.get("last-modified")
+        entry.fresh_until = fresh_until if fresh_until is not None else time.time()
+        await asyncio.to_thread(self._refresh, entry)
+
+    async def record(self, host: str, outcome: str, nbytes: int = 0) -> None:
+        """Count a hit / revalidated / miss for a host."""
+        await asyncio.to_thread(self._record, host, outcome, nbytes)
+
+    async def prune(self, max_bytes: Optional[int] = None) -> int:
+        """Evict least-recently-used entries until under max_bytes. Returns evictions."""
+        return await asyncio.to_thread(self._prune, max_bytes or self.max_bytes)
+
+    async def stats(self) -> Dict[str, Any]:
+        return await asyncio.to_thread(self._stats)
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def freshness_deadline(self, host: str, headers: httpx.Headers) -> Optional[float]:
+        """
+        Absolute time until which a response may be served without
+        revalidation, or None if it must not be stored at all.
+        """
+        now = time.time()
+        override = self.host_ttls.get(host.lower())
+        if override is not None:
+            return now + override
+
+        cache_control = (headers.get("cache-control") or "").lower()
+        if "no-store" in cache_control:
+            return None
+        if "no-cache" in cache_control:
+            return now
+        match = _MAX_AGE_RE.search(cache_control)
+        if match:
+            return now + int(match.group(1))
+        return now + self.default_ttl_seconds
+
+    # --------------------------------------------------------------- internal
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self._blob_dir, digest[:2], digest)
+
+    def _lookup(self, key: str) -> Optional[CachedEntry]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT key, url, host, status, headers, blob, size, etag, last_modified, fresh_until "
+                "FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        entry = CachedEntry(
+            key=row[0], url=row[1], host=row[2], status=row[3], headers=json.loads(row[4]),
+            blob=row[5], size=row[6], etag=row[7], last_modified=row[8], fresh_until=row[9],
+        )
+        try:
+            with open(self._blob_path(entry.blob), "rb") as f:
+                entry.body = zlib.decompress(f.read())
+        except (OSError, zlib.error) as e:
+            logger.warning(f"[HTTP_CACHE] Dropping entry with unreadable blob {entry.blob}: {e}")
+            with self._lock:
+                self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            return None
+        return entry
+
+    def _store(self, key, url, host, response, etag, last_modified, fresh_until) -> bool:
+        body = response.content
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._blob_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(zlib.compress(body, 6))
+            os.replace(tmp, path)
+
+        headers = {k: response.headers[k] for k in STORED_HEADERS if k in response.headers}
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                """
+                INSERT INTO entries (key, url, host, status, headers, blob, size, etag,
+                                     last_modified, stored_at, fresh_until, last_access)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (key) DO UPDATE SET
+                    url = excluded.url, status = excluded.status, headers = excluded.headers,
+                    blob = excluded.blob, size = excluded.size, etag = excluded.etag,
+                    last_modified = excluded.last_modified, stored_at = excluded.stored_at,
+                    fresh_until = excluded.fresh_until, last_access = excluded.last_access
+                """,
+                (key, url, host, response.status_code, json.dumps(headers), digest, len(body),
+                 etag, last_modified, now, fresh_until, now),
+            )
+            self._bump(host, "stored", 0)
+        return True
+
+    def _refresh(self, entry: CachedEntry) -> None:
+        with self._lock:
+            self._db.execute(
+                "UPDATE entries SET headers = ?, etag = ?, last_modified = ?, fresh_until = ?, "
+                "last_access = ? WHERE key = ?",
+                (json.dumps(entry.headers), entry.etag, entry.last_modified,
+                 entry.fresh_until, time.time(), entry.key),
+            )
+
+    def _record(self, host: str, outcome: str, nbytes: int) -> None:
+        with self._lock:
+            self._bump(host, outcome, nbytes)
+
+    def _bump(self, host: str, outcome: str, nbytes: int) -> None:
+        # outcome is one of our own column names, never user input
+        bytes_column = "bytes_fetched" if outcome == "misses" else "bytes_saved"
+        self._db.execute(
+            f"""
+            INSERT INTO host_stats (host, {outcome}, {bytes_column}) VALUES (?, 1, ?)
+            ON CONFLICT (host) DO UPDATE SET
+                {outcome} = {outcome} + 1,
+                {bytes_column} = {bytes_column} + excluded.{bytes_column}
+            """,
+            (host, nbytes),
+        )
+
+    def _prune(self, max_bytes: int) -> int:
+        with self._lock:
+            total = self._db.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM (SELECT DISTINCT blob, size FROM entries)"
+            ).fetchone()[0]
+            evicted = 0
+            if total > max_bytes:
+                rows = self._db.execute(
+                    "SELECT key, blob, size FROM entries ORDER BY last_access"
+                ).fetchall()
+                refs: Dict[str, int] = {}
+                for _, blob, _ in rows:
+                    refs[blob] = refs.get(blob, 0) + 1
+                doomed = []
+                for key, blob, size in rows:
+                    if total <= max_bytes:
+                        break
+                    doomed.append((key,))
+                    refs[blob] -= 1
+                    if refs[blob] == 0:
+                        # Shared blobs only free space with their last entry
+                        total -= size
+                self._db.executemany("DELETE FROM entries WHERE key = ?", doomed)
+                evicted = len(doomed)
+            referenced = {row[0] for row in self._db.execute("SELECT DISTINCT blob FROM entries")}
+
+        for shard in os.listdir(self._blob_dir):
+            shard_dir = os.path.join(self._blob_dir, shard)
+            for name in os.listdir(shard_dir):
+                if name not in referenced:
+                    try:
+                        os.remove(os.path.join(shard_dir, name))
+                    except OSError:
+                        pass
+        if evicted:
+            logger.info(f"[HTTP_CACHE] Evicted {evicted} entries")
+        return evicted
+
+    def _stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries, size = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+            rows = self._db.execute(
+                "SELECT host, hits, revalidated, misses, stored, bytes_saved, bytes_fetched "
+                "FROM host_stats ORDER BY host"
+            ).fetchall()
+
+        hosts = {}
+        for host, hits, revalidated, misses, stored, saved, fetched in rows:
+            requests = hits + revalidated + misses
+            hosts[host] = {
+                "hits": hits,
+                "revalidated": revalidated,
+                "misses": misses,
+                "stored": stored,
+                "hit_ratio": round((hits + revalidated) / requests, 4) if requests else 0.0,
+                "bytes_saved": saved,
+                "bytes_fetched": fetched,
+            }
+        return {
+            "directory": self.directory,
+            "entries": entries,
+            "indexed_bytes": size,
+            "max_bytes": self.max_bytes,
+            "default_ttl_seconds": self.default_ttl_seconds,
+            "host_ttls": self.host_ttls,
+            "hosts": hosts,
+        }
+
+
+_http_cache: Optional[HTTPCache] = None
+_http_cache_failed = False
+
+
+def get_http_cache() -> Optional[HTTPCache]:
+    """
+    Shared cache for scraper clients, built from settings on first use.
+
+    Returns None when disabled or when the cache directory is unusable,
+    in which case clients simply go to the network.
+    """
+    global _http_cache, _http_cache_failed
+    if _http_cache is not None or _http_cache_failed:
+        return _http_cache
+
+    from app.core.config import settings
+    if not settings.HTTP_CACHE_ENABLED:
+        _http_cache_failed = True
+        return None
+    try:
+        _http_cache = HTTPCache(
+            settings.HTTP_CACHE_DIR,
+            default_ttl_seconds=settings.HTTP_CACHE_DEFAULT_TTL_SECONDS,
+            host_ttls=parse_host_ttls(settings.HTTP_CACHE_HOST_TTLS),
+            max_bytes=settings.HTTP_CACHE_MAX_BYTES,
+        )
+        logger.info(f"[HTTP_CACHE] Using {settings.HTTP_CACHE_DIR}")
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"[HTTP_CACHE] Disabled, cannot open {settings.HTTP_CACHE_DIR}: {e}")
+        _http_cache_failed = True
+    return _http_cache
@@ -15,6 +15,11 @@ v2.0.0 (2024-12-18): Per-host request serialization to fix race condition
 - HostLockManager ensures only ONE request per host at a time
 - Pre-flight block check before queuing requests
 - RateLimitExceeded exception for fail-fast on long waits
+
+v2.1.0: Optional persistent conditional-request cache (app.core.http_cache)
+- GETs are served from disk while fresh, revalidated with
+  If-None-Match / If-Modified-Since when stale
+- Cache hits skip rate limiting, the host lock and the circuit breaker
 """
 import asyncio
 import logging
@@ -28,6 +33,8 @@ from typing import Any, Dict, Optional, Callable
 
 import httpx
 
+from app.core.http_cache import HTTPCache, get_http_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -139,6 +146,7 @@ class ResilientHTTPClient:
     - 429 Retry-After header respect
     - Circuit breaker pattern
     - Request deduplication (optional)
+    - Conditional-request disk cache for GETs (optional, v2.1.0)
     
     Usage:
         async with ResilientHTTPClient() as client:
@@ -152,12 +160,14 @@ class ResilientHTTPClient:
         circuit_config: Optional[CircuitBreakerConfig] = None,
         timeout: float = 30.0,
         default_headers: Optional[Dict[str, str]] = None,
+        cache: Optional[HTTPCache] = None,
     ):
         self.rate_limit_config = rate_limit_config or RateLimitConfig()
         self.retry_config = retry_config or RetryConfig()
         self.circuit_config = circuit_config or CircuitBreakerConfig()
         self.timeout = timeout
         self.default_headers = default_headers or {}
+        self.cache = cache
         
         self._client: Optional[httpx.AsyncClient] = None
         self._host_states: Dict[str, HostState] = {}
@@ -454,6 +464,53 @@ class ResilientHTTPClient:
         if not self._client:
             await self.init()
 
+        if self.cache is not None and method.upper() == "GET":
+            return await self._cached_get(url, **kwargs)
+
+        return await self._send(method, url, **kwargs)
+
+    async def _cached_get(self, url: str, **kwargs) -> httpx.Response:
+        """
+        v2.1.0: GET through the conditional-request cache.
+
+        Fresh entries never reach the network. Stale entries are sent with
+        their validators; a 304 serves the cached body (status 200, with
+        X-Cache: REVALIDATED) and extends freshness.
+        """
+        host = self._get_host(url)
+        params = kwargs.get("params")
+
+        try:
+            entry = await self.cache.lookup("GET", url, params)
+        except Exception as e:
+            logger.warning(f"[HTTP_CACHE] {host}: lookup failed, bypassing cache: {e}")
+            return await self._send("GET", url, **kwargs)
+
+        if entry is not None and entry.is_fresh:
+            await self.cache.record(host, "hits", entry.size)
+            return entry.to_response("GET", "HIT")
+
+        if entry is not None:
+            headers = dict(kwargs.pop("headers", None) or {})
+            headers.update(entry.conditional_headers())
+            kwargs["headers"] = headers
+
+        response = await self._send("GET", url, **kwargs)
+
+        try:
+            if response.status_code == 304 and entry is not None:
+                await self.cache.refresh(entry, response)
+                await self.cache.record(host, "revalidated", entry.size)
+                return entry.to_response("GET", "REVALIDATED")
+
+            await self.cache.record(host, "misses", len(response.content))
+            await self.cache.store("GET", url, params, host, response)
+        except Exception as e:
+            logger.warning(f"[HTTP_CACHE] {host}: failed to update cache: {e}")
+        return response
+
+    async def _send(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Pre-flight, circuit breaker and per-host serialization around the retry loop."""
         host = self._get_host(url)
         cfg = self.retry_config
 
@@ -674,6 +731,7 @@ def get_gcd_client() -> ResilientHTTPClient:
     Get client configured for Grand Comics Database API.
     
     GCD is a free/open service - be extra respectful.
+    v2.1.0: Issue pages go through the shared conditional-request cache.
     """
     return ResilientHTTPClient(
         rate_limit_config=RateLimitConfig(
@@ -687,4 +745,5 @@ def get_gcd_client() -> ResilientHTTPClient:
             max_delay=60.0,
         ),
         timeout=30.0,
+        cache=get_http_cache(),
     )
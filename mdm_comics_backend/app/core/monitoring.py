@@ -10,14 +10,23 @@ P2-5: Application monitoring with metrics collection
 Uses Prometheus-style metrics that can be scraped by monitoring systems.
 """
 import asyncio
+import json
 import logging
+import os
+import socket
 import time
-from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Optional, Callable, List
+from typing import Dict, Optional, Callable, List, Tuple
 from threading import Lock
 
+from app.core.quantile_sketch import (
+    DEFAULT_EXPORT_BOUNDS,
+    QuantileSketch,
+    WindowedSketch,
+    sketch_stats,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,6 +40,14 @@ class MetricBucket:
     max_val: Optional[float] = None
 
 
+# PERF-026: Histogram windows are split into 30-second sketch slices
+HISTOGRAM_SLICE_SECONDS = 30
+
+# Redis hash (one per worker) holding serialized sketches for cluster merge
+SKETCH_REDIS_PREFIX = "metrics:sketch:"
+SKETCH_REDIS_TTL_SECONDS = 120
+
+
 class MetricsCollector:
     """
     In-memory metrics collector with rolling windows.
@@ -40,17 +57,32 @@ class MetricsCollector:
     - Gauges (point-in-time values)
     - Histograms (distribution of values)
 
+    PERF-026: Histograms are fixed-memory quantile sketches (see
+    app/core/quantile_sketch.py) rotated on time slices, so windowed
+    p50/p95/p99/p999 reads no longer copy and sort raw observations.
+    Every observation is also rolled up under the bare metric name so
+    unlabeled lookups (alerts, /metrics/json) see all label sets.
+
     For production, export to Prometheus, DataDog, or CloudWatch.
     """
 
     def __init__(self, window_minutes: int = 60):
         self._counters: Dict[str, int] = {}
         self._gauges: Dict[str, float] = {}
-        self._histograms: Dict[str, deque] = {}  # Rolling window of values
+        self._histograms: Dict[str, WindowedSketch] = {}
+        self._histogram_labels: Dict[str, Tuple[str, Dict[str, str]]] = {}
+        self._histogram_rollups: Dict[str, WindowedSketch] = {}
         self._window_minutes = window_minutes
         self._lock = Lock()
         self._start_time = datetime.now(timezone.utc)
 
+    def _new_window(self) -> WindowedSketch:
+        window_seconds = self._window_minutes * 60
+        return WindowedSketch(
+            window_seconds=window_seconds,
+            slices=max(1, window_seconds // HISTOGRAM_SLICE_SECONDS),
+        )
+
     def increment(self, name: str, value: int = 1, labels: Dict[str, str] = None) -> None:
         """Increment a counter metric."""
         key = self._make_key(name, labels)
@@ -66,11 +98,17 @@ class MetricsCollector:
     def observe(self, name: str, value: float, labels: Dict[str, str] = None) -> None:
         """Record a histogram observation (e.g., latency)."""
         key = self._make_key(name, labels)
-        now = datetime.now(timezone.utc)
         with self._lock:
-            if key not in self._histograms:
-                self._histograms[key] = deque(maxlen=10000)  # Keep last 10k observations
-            self._histograms[key].append((now, value))
+            sketch = self._histograms.get(key)
+            if sketch is None:
+                sketch = self._histograms[key] = self._new_window()
+                self._histogram_labels[key] = (name, dict(labels or {}))
+            sketch.add(value)
+
+            rollup = self._histogram_rollups.get(name)
+            if rollup is None:
+                rollup = self._histogram_rollups[name] = self._new_window()
+            rollup.add(value)
 
     def _make_key(self, name: str, labels: Optional[Dict[str, str]]) -> str:
         """Create metric key from name and labels."""
@@ -89,31 +127,44 @@ class MetricsCollector:
         key = self._make_key(name, labels)
         return self._gauges.get(key)
 
+    def get_histogram_sketch(self, name: str, labels: Dict[str, str] = None,
+                             window_seconds: int = 300) -> QuantileSketch:
+        """Merged sketch for the window (labels=None returns the name rollup)."""
+        with self._lock:
+            if labels:
+                windowed = self._histograms.get(self._make_key(name, labels))
+            else:
+                windowed = self._histogram_rollups.get(name)
+            if windowed is None:
+                return QuantileSketch()
+            return windowed.window(window_seconds)
+
     def get_histogram_stats(self, name: str, labels: Dict[str, str] = None,
                            window_seconds: int = 300) -> Dict:
-        """Get histogram statistics for time window."""
-        key = self._make_key(name, labels)
-        cutoff = datetime.now(timezone.utc) - timedelta(seconds=window_seconds)
+        """Get histogram statistics (count/avg/min/max/p50/p95/p99/p999) for time window."""
+        return sketch_stats(self.get_histogram_sketch(name, labels, window_seconds))
 
+    def iter_histograms(self) -> List[Tuple[str, Dict[str, str], QuantileSketch]]:
+        """Snapshot of cumulative sketches per label set, for export."""
         with self._lock:
-            if key not in self._histograms:
-                return {"count": 0, "avg": 0, "min": 0, "max": 0, "p95": 0}
+            return [
+                (self._histogram_labels[key][0], self._histogram_labels[key][1], windowed.total.copy())
+                for key, windowed in self._histograms.items()
+            ]
 
-            values = [v for ts, v in self._histograms[key] if ts > cutoff]
-
-        if not values:
-            return {"count": 0, "avg": 0, "min": 0, "max": 0, "p95": 0}
-
-        values.sort()
-        p95_idx = int(len(values) * 0.95)
-
-        return {
-            "count": len(values),
-            "avg": sum(values) / len(values),
-            "min": values[0],
-            "max": values[-1],
-            "p95": values[p95_idx] if p95_idx < len(values) else values[-1],
-        }
+    def export_sketches(self, window_seconds: int = 300) -> Dict[str, Dict]:
+        """Serialize windowed and cumulative sketches for cross-worker merging."""
+        with self._lock:
+            exported = {}
+            for key, windowed in self._histograms.items():
+                name, labels = self._histogram_labels[key]
+                exported[key] = {
+                    "name": name,
+                    "labels": labels,
+                    "window": windowed.window(window_seconds).to_dict(),
+                    "total": windowed.total.to_dict(),
+                }
+            return exported
 
     def get_all_metrics(self) -> Dict:
         """Get all metrics for export/display."""
@@ -134,15 +185,10 @@ class MetricsCollector:
         }
 
     def cleanup_old_data(self, max_age_minutes: int = 60) -> None:
-        """Remove histogram data older than max_age_minutes."""
-        cutoff = datetime.now(timezone.utc) - timedelta(minutes=max_age_minutes)
+        """Reset sketch slices that have aged out of their window."""
         with self._lock:
-            for key in self._histograms:
-                # Filter to keep only recent data
-                self._histograms[key] = deque(
-                    [(ts, v) for ts, v in self._histograms[key] if ts > cutoff],
-                    maxlen=10000
-                )
+            for windowed in list(self._histograms.values()) + list(self._histogram_rollups.values()):
+                windowed.reset_stale()
 
 
 # Global metrics collector
@@ -414,12 +460,116 @@ def get_prometheus_metrics() -> str:
         safe_key = key.replace("{", "_").replace("}", "_").replace(",", "_").replace("=", "_")
         lines.append(f"{safe_key} {value:.4f}")
 
-    # Request latency histogram summary
+    # PERF-026: Histograms exported as real Prometheus histograms from sketches
+    by_name: Dict[str, List[Tuple[Dict[str, str], QuantileSketch]]] = {}
+    for name, labels, sketch in metrics.iter_histograms():
+        by_name.setdefault(name, []).append((labels, sketch))
+
+    for name in sorted(by_name):
+        lines.append(f"# HELP {name} Distribution of {name}")
+        lines.append(f"# TYPE {name} histogram")
+        for labels, sketch in by_name[name]:
+            for bound, cumulative in sketch.cumulative_counts(DEFAULT_EXPORT_BOUNDS):
+                lines.append(f"{name}_bucket{_prometheus_labels(labels, le=f'{bound:g}')} {cumulative}")
+            lines.append(f"{name}_bucket{_prometheus_labels(labels, le='+Inf')} {sketch.count}")
+            lines.append(f"{name}_sum{_prometheus_labels(labels)} {sketch.sum:.6f}")
+            lines.append(f"{name}_count{_prometheus_labels(labels)} {sketch.count}")
+
+    # Windowed quantiles across all label sets (5-minute window)
     req = all_metrics["request_latency"]
     if req["count"] > 0:
-        lines.append(f"# HELP http_request_duration_seconds HTTP request latency")
-        lines.append(f"http_request_duration_seconds_count {req['count']}")
-        lines.append(f"http_request_duration_seconds_avg {req['avg']:.4f}")
-        lines.append(f"http_request_duration_seconds_p95 {req['p95']:.4f}")
+        lines.append("# HELP http_request_duration_window_seconds HTTP request latency quantiles (5m window)")
+        lines.append("# TYPE http_request_duration_window_seconds gauge")
+        for quantile in ("p50", "p95", "p99", "p999"):
+            q_label = "0." + quantile[1:]
+            lines.append(f'http_request_duration_window_seconds{{quantile="{q_label}"}} {req[quantile]:.6f}')
 
     return "\n".join(lines)
+
+
+def _prometheus_labels(labels: Dict[str, str], **extra: str) -> str:
+    """Render a Prometheus label set (escaping quotes and backslashes)."""
+    merged = {**labels, **extra}
+    if not merged:
+        return ""
+    parts = []
+    for k, v in sorted(merged.items()):
+        escaped = str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        parts.append(f'{k}="{escaped}"')
+    return "{" + ",".join(parts) + "}"
+
+
+# ============== Cross-Worker Sketch Merge (PERF-026) ==============
+
+def _worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+async def publish_sketches_to_redis(window_seconds: int = 300) -> bool:
+    """
+    Publish this worker's histogram sketches to Redis.
+
+    Each worker writes one hash with a short TTL; workers that stop
+    publishing drop out of the cluster view once the TTL lapses.
+    Returns False when Redis is unavailable.
+    """
+    from app.core.redis_client import get_redis
+
+    client = await get_redis()
+    if not client:
+        return False
+
+    exported = metrics.export_sketches(window_seconds)
+    if not exported:
+        return True
+
+    key = f"{SKETCH_REDIS_PREFIX}{_worker_id()}"
+    try:
+        await client.hset(key, mapping={k: json.dumps(v) for k, v in exported.items()})
+        await client.expire(key, SKETCH_REDIS_TTL_SECONDS)
+        return True
+    except Exception as e:
+        logger.debug(f"Failed to publish metric sketches: {e}")
+        return False
+
+
+async def get_cluster_histogram_stats(name: str, labels: Dict[str, str] = None) -> Optional[Dict]:
+    """
+    Windowed histogram stats merged across every worker that published recently.
+
+    labels=None merges all label sets of the metric. Returns None when Redis
+    is unavailable so callers can fall back to the local collector.
+    """
+    from app.core.redis_client import get_redis
+
+    client = await get_redis()
+    if not client:
+        return None
+
+    merged = QuantileSketch()
+    try:
+        async for worker_key in client.scan_iter(match=f"{SKETCH_REDIS_PREFIX}*"):
+            entries = await client.hgetall(worker_key)
+            for raw in entries.values():
+                entry = json.loads(raw)
+                if entry["name"] != name:
+                    continue
+                if labels and entry["labels"] != labels:
+                    continue
+                merged.merge(QuantileSketch.from_dict(entry["window"]))
+    except Exception as e:
+        logger.debug(f"Failed to merge cluster metric sketches: {e}")
+        return None
+
+    return sketch_stats(merged)
+
+
+async def metrics_sync_loop(interval_seconds: int = 15) -> None:
+    """Background task: rotate stale sketch slices and publish to Redis."""
+    while True:
+        try:
+            metrics.cleanup_old_data()
+            await publish_sketches_to_redis()
+        except Exception as e:
+            logger.debug(f"Metrics sync error: {e}")
+        await asyncio.sleep(interval_seconds)
@@ -0,0 +1,312 @@
+"""
+Keyset Pagination v1.1.0
+
+Shared pagination for catalog and admin listing endpoints.
+
+- KeysetOrder: a named sort order (price_asc, newest, featured, ...) as a
+  list of sort keys with the primary key as tiebreaker. Every key in an
+  order runs in the same direction, so "after this row" is a row-value
+  comparison that can walk an index instead of OFFSET scanning.
+- NULLs sort as PostgreSQL sorts them by default: above every value, so
+  last ascending and first descending. Keys are plain columns, so a plain
+  (key, id) btree index serves both directions.
+- Opaque cursors: base64url JSON of the last row's sort values, tagged
+  with the order name. A cursor from one sort order is rejected for another.
+- Totals: cached per filter signature for COUNT_CACHE_TTL_SECONDS. When
+  the planner expects at least ESTIMATE_THRESHOLD rows, its estimate is
+  returned instead of an exact count (total_is_estimate=True).
+- has_more: fetch limit + 1 rows; no count needed.
+
+Page-number / offset clients keep working: without a cursor, endpoints
+page with OFFSET as before, and also return next_cursor so a client can
+switch to keyset paging from any page.
+
+v1.1.0: Sort keys are no longer COALESCEd (which hid them from their
+indexes and sorted NULLs last under DESC); cursors carry NULLs as-is.
+"""
+import base64
+import binascii
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, bindparam, false, func, or_, select, text, tuple_
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from app.core.search_cache import SearchCache
+
+logger = logging.getLogger(__name__)
+
+# v2: sort values are raw column values (v1 cursors held COALESCE defaults)
+CURSOR_VERSION = 2
+
+# Totals are cached this long per filter signature
+COUNT_CACHE_TTL_SECONDS = 30
+
+# Above this many (planner-estimated) rows, serve the estimate
+ESTIMATE_THRESHOLD = 50_000
+
+count_cache = SearchCache(ttl_seconds=COUNT_CACHE_TTL_SECONDS, max_size=2000)
+
+# (key, id) btree indexes for the product listing orders; default
+# ASC NULLS LAST, so scanned backwards they give DESC NULLS FIRST
+LISTING_INDEX_DDL = (
+    "CREATE INDEX IF NOT EXISTS ix_products_price_id ON products (price, id)",
+    "CREATE INDEX IF NOT EXISTS ix_products_rating_id ON products (rating, id)",
+    "CREATE INDEX IF NOT EXISTS ix_products_created_at_id ON products (created_at, id)",
+    "CREATE INDEX IF NOT EXISTS ix_products_updated_at_id ON products (updated_at, id)",
+    "CREATE INDEX IF NOT EXISTS ix_products_featured_created_at_id ON products (featured, created_at, id)",
+)
+
+
+class InvalidCursor(ValueError):
+    """Cursor is malformed or belongs to a different sort order."""
+
+
+# ----------------------------------------------------------------------------
+# Cursors
+# ----------------------------------------------------------------------------
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"$dec": str(value)}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "$dt" in value:
+            return datetime.fromisoformat(value["$dt"])
+        if "$dec" in value:
+            return Decimal(value["$dec"])
+        raise InvalidCursor("Unknown cursor value")
+    return value
+
+
+def encode_cursor(order_name: str, values: Sequence[Any]) -> str:
+    payload = {"v": CURSOR_VERSION, "o": order_name, "k": [_encode_value(v) for v in values]}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, order_name: str, length: int) -> List[Any]:
+    """Decode a cursor for order_name; raises InvalidCursor on any mismatch."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        values = [_decode_value(v) for v in payload["k"]]
+    except (binascii.Error, ValueError, KeyError, TypeError) as e:
+        raise InvalidCursor("Malformed cursor") from e
+    if payload.get("v") != CURSOR_VERSION or payload.get("o") != order_name:
+        raise InvalidCursor("Cursor does not match this sort order")
+    if len(values) != length:
+        raise InvalidCursor("Malformed cursor")
+    return values
+
+
+# ----------------------------------------------------------------------------
+# Sort orders
+# ----------------------------------------------------------------------------
+
+@dataclass
+class KeysetOrder:
+    """
+    A named sort order over a model.
+
+    keys are attribute names; the last one should be the primary key.
+    Nullable columns get NULLS LAST ascending / NULLS FIRST descending
+    spelled out, and after() places NULL values accordingly.
+    """
+    name: str
+    model: Any
+    keys: Sequence[str]
+    descending: bool = False
+
+    def _columns(self) -> List[Tuple[Any, bool]]:
+        """(column, nullable) per key."""
+        columns = []
+        for attr in self.keys:
+            column = getattr(self.model, attr)
+            columns.append((column, bool(getattr(column.expression, "nullable", True))))
+        return columns
+
+    def order_by(self) -> List[Any]:
+        clauses = []
+        for column, nullable in self._columns():
+            if self.descending:
+                clauses.append(column.desc().nulls_first() if nullable else column.desc())
+            else:
+                clauses.append(column.asc().nulls_last() if nullable else column.asc())
+        return clauses
+
+    def after(self, values: Sequence[Any]) -> Any:
+        """WHERE clause for rows strictly after the cursor position."""
+        return self._after(self._columns(), list(values))
+
+    def _after(self, columns: List[Tuple[Any, bool]], values: List[Any]) -> Any:
+        # Row-value comparison is exact when no NULL can take part: NULL
+        # keys make it NULL (false), which is right for the rows NULLs put
+        # before a non-NULL cursor (descending) but drops rows they put
+        # after it (ascending).
+        if len(columns) > 1 and None not in values and (self.descending or not any(n for _, n in columns)):
+            exprs = [c for c, _ in columns]
+            bound = [bindparam(None, v, type_=e.type) for e, v in zip(exprs, values)]
+            row, cursor = tuple_(*exprs), tuple_(*bound)
+            return row < cursor if self.descending else row > cursor
+
+        (column, nullable), value = columns[0], values[0]
+        if value is None:
+            # Cursor is in the NULL group: non-NULL rows follow it descending
+            beyond = column.isnot(None) if self.descending else false()
+            same = column.is_(None)
+        else:
+            param = bindparam(None, value, type_=column.type)
+            beyond = column < param if self.descending else column > param
+            if nullable and not self.descending:
+                beyond = or_(beyond, column.is_(None))
+            same = column == param
+        if len(columns) == 1:
+            return beyond
+        return or_(beyond, and_(same, self._after(columns[1:], values[1:])))
+
+    def values_for(self, obj: Any) -> List[Any]:
+        return [getattr(obj, attr) for attr in self.keys]
+
+    def cursor_for(self, obj: Any) -> str:
+        return encode_cursor(self.name, self.values_for(obj))
+
+
+@dataclass
+class Page:
+    items: List[Any]
+    has_more: bool
+    next_cursor: Optional[str]
+
+
+async def fetch_page(
+    db: AsyncSession,
+    query: Select,
+    order: KeysetOrder,
+    limit: int,
+    cursor: Optional[str] = None,
+    offset: int = 0,
+    unique: bool = False,
+) -> Page:
+    """
+    Run one page of an ORM select.
+
+    With a cursor, pages by keyset (offset is ignored); otherwise by offset.
+    Either way limit + 1 rows are read to set has_more without a count.
+    """
+    query = query.order_by(*order.order_by())
+    if cursor:
+        values = decode_cursor(cursor, order.name, len(order.keys))
+        query = query.where(order.after(values))
+    elif offset:
+        query = query.offset(offset)
+
+    result = await db.execute(query.limit(limit + 1))
+    scalars = result.scalars()
+    rows = list(scalars.unique().all() if unique else scalars.all())
+
+    has_more = len(rows) > limit
+    items = rows[:limit]
+    next_cursor = order.cursor_for(items[-1]) if has_more and items else None
+    return Page(items=items, has_more=has_more, next_cursor=next_cursor)
+
+
+async def ensure_listing_indexes(db: AsyncSession) -> None:
+    """Startup hook: the (key, id) indexes product listing cursors walk."""
+    try:
+        for statement in LISTING_INDEX_DDL:
+            await db.execute(text(statement))
+        await db.commit()
+    except Exception as e:
+        logger.warning(f"Listing index setup failed: {e}")
+        await db.rollback()
+
+
+# ----------------------------------------------------------------------------
+# Totals
+# ----------------------------------------------------------------------------
+
+def filter_signature(scope: str, **filters: Any) -> str:
+    """Stable, case-preserving key for a scope plus its filter values."""
+    parts = [scope] + [f"{k}={v!r}" for k, v in sorted(filters.items()) if v is not None]
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+
+async def planner_estimate(db: AsyncSession, sql: str, params: Optional[Dict[str, Any]] = None) -> Optional[int]:
+    """Row estimate from EXPLAIN; None if the plan can't be produced."""
+    try:
+        # Savepoint so a failed EXPLAIN doesn't abort the request transaction
+        async with db.begin_nested():
+            result = await db.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"), params or {})
+            plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except Exception as e:
+        logger.debug(f"[PAGINATION] Planner estimate unavailable: {e}")
+        return None
+
+
+def _select_sql(query: Select) -> Optional[str]:
+    """Render a filter-only select with inline literals for EXPLAIN."""
+    try:
+        sql = str(query.order_by(None).compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        ))
+    except Exception:
+        return None
+    # text() would treat ":word" inside literals as bind parameters
+    return sql.replace(":", r"\:")
+
+
+async def cached_total(
+    signature: str,
+    exact: Callable[[], Awaitable[int]],
+    estimate: Optional[Callable[[], Awaitable[Optional[int]]]] = None,
+    estimate_threshold: int = ESTIMATE_THRESHOLD,
+) -> Tuple[int, bool]:
+    """
+    (total, is_estimate) for a filter signature, cached briefly.
+
+    Large result sets (by planner estimate) skip the exact count.
+    """
+    cached = count_cache.get(signature)
+    if cached is not None:
+        return cached
+
+    result = None
+    if estimate is not None:
+        rows = await estimate()
+        if rows is not None and rows >= estimate_threshold:
+            result = (rows, True)
+    if result is None:
+        result = (int(await exact() or 0), False)
+
+    count_cache.set(signature, result)
+    return result
+
+
+async def count_total(db: AsyncSession, query: Select, signature: str) -> Tuple[int, bool]:
+    """cached_total for an ORM select (ordering and paging are stripped)."""
+    base = query.order_by(None)
+
+    async def exact() -> int:
+        return await db.scalar(select(func.count()).select_from(base.subquery()))
+
+    async def estimate() -> Optional[int]:
+        sql = _select_sql(base)
+        return await planner_estimate(db, sql) if sql else None
+
+    return await cached_total(signature, exact, estimate)
@@ -0,0 +1,267 @@
+"""
+Mergeable quantile sketches for latency metrics
+
+PERF-026: Fixed-memory replacement for the raw observation deques that
+MetricsCollector used to keep per label set.
+
+- QuantileSketch: DDSketch-style log-bucketed histogram with bounded
+  relative error. Sketches with the same accuracy merge by adding bin
+  counts, so per-worker sketches can be combined through Redis.
+- WindowedSketch: ring of sketches rotated on fixed time slices, giving
+  windowed quantiles whose read cost depends on the slice count rather
+  than the number of observations.
+"""
+import math
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# 1% relative accuracy keeps ~2k bins for 1µs..1h of latency values
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_MAX_BINS = 2048
+
+# Values at or below this are counted in the zero bucket
+MIN_INDEXABLE_VALUE = 1e-9
+
+# Prometheus-style bucket bounds (seconds) used for histogram export
+DEFAULT_EXPORT_BOUNDS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75,
+    1.0, 2.5, 5.0, 7.5, 10.0,
+)
+
+
+class QuantileSketch:
+    """
+    DDSketch-style quantile sketch for non-negative values.
+
+    Each positive value v lands in bin ceil(log_gamma(v)), so any quantile
+    read from the sketch is within `relative_accuracy` of the true value.
+    When more than `max_bins` bins are in use the lowest bins are collapsed,
+    which only degrades accuracy for the smallest values.
+    """
+
+    __slots__ = (
+        "relative_accuracy", "max_bins", "_gamma", "_log_gamma",
+        "bins", "zero_count", "count", "sum", "min", "max",
+    )
+
+    def __init__(
+        self,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        max_bins: int = DEFAULT_MAX_BINS,
+    ):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def _index(self, value: float) -> int:
+        return int(math.ceil(math.log(value) / self._log_gamma))
+
+    def _bin_value(self, index: int) -> float:
+        """Representative value for a bin (midpoint in relative terms)."""
+        return 2 * self._gamma ** index / (1 + self._gamma)
+
+    def _bin_upper(self, index: int) -> float:
+        return self._gamma ** index
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Record `count` observations of `value`."""
+        if value < 0:
+            value = 0.0
+        if value <= MIN_INDEXABLE_VALUE:
+            self.zero_count += count
+        else:
+            idx = self._index(value)
+            self.bins[idx] = self.bins.get(idx, 0) + count
+            if len(self.bins) > self.max_bins:
+                self._collapse()
+        self.count += count
+        self.sum += value * count
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def _collapse(self) -> None:
+        """Fold the lowest bins together until we are within max_bins."""
+        keys = sorted(self.bins)
+        excess = len(keys) - self.max_bins
+        if excess <= 0:
+            return
+        target = keys[excess]
+        folded = sum(self.bins.pop(k) for k in keys[:excess])
+        self.bins[target] += folded
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Merge another sketch into this one (in place)."""
+        if other.count == 0:
+            return
+        if abs(other._gamma - self._gamma) > 1e-12:
+            raise ValueError("Cannot merge sketches with different accuracy")
+        for idx, cnt in other.bins.items():
+            self.bins[idx] = self.bins.get(idx, 0) + cnt
+        if len(self.bins) > self.max_bins:
+            self._collapse()
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+        if other.max is not None:
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def copy(self) -> "QuantileSketch":
+        clone = QuantileSketch(self.relative_accuracy, self.max_bins)
+        clone.merge(self)
+        return clone
+
+    def quantile(self, q: float) -> float:
+        """Approximate value at quantile q (0..1). Returns 0 when empty."""
+        if self.count == 0:
+            return 0.0
+        if q <= 0:
+            return self.min or 0.0
+        if q >= 1:
+            return self.max or 0.0
+
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for idx in sorted(self.bins):
+            seen += self.bins[idx]
+            if rank < seen:
+                value = self._bin_value(idx)
+                # Clamp to observed range so tiny samples stay sensible
+                return min(max(value, self.min), self.max)
+        return self.max or 0.0
+
+    def cumulative_counts(self, bounds: Iterable[float]) -> List[Tuple[float, int]]:
+        """
+        Cumulative counts at each upper bound, for Prometheus `le` buckets.
+
+        A bin is counted under a bound when its upper edge is <= the bound,
+        so the export is exact to within the sketch's relative accuracy.
+        """
+        ordered = sorted(self.bins.items())
+        result = []
+        running = self.zero_count
+        pos = 0
+        for bound in sorted(bounds):
+            while pos < len(ordered) and self._bin_upper(ordered[pos][0]) <= bound * (1 + 1e-9):
+                running += ordered[pos][1]
+                pos += 1
+            result.append((bound, running))
+        return result
+
+    def to_dict(self) -> Dict:
+        """Serialize for cross-worker merging (JSON-safe)."""
+        return {
+            "a": self.relative_accuracy,
+            "b": {str(k): v for k, v in self.bins.items()},
+            "z": self.zero_count,
+            "n": self.count,
+            "s": self.sum,
+            "lo": self.min,
+            "hi": self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict, max_bins: int = DEFAULT_MAX_BINS) -> "QuantileSketch":
+        sketch = cls(data.get("a", DEFAULT_RELATIVE_ACCURACY), max_bins)
+        sketch.bins = {int(k): int(v) for k, v in data.get("b", {}).items()}
+        sketch.zero_count = int(data.get("z", 0))
+        sketch.count = int(data.get("n", 0))
+        sketch.sum = float(data.get("s", 0.0))
+        sketch.min = data.get("lo")
+        sketch.max = data.get("hi")
+        return sketch
+
+
+class WindowedSketch:
+    """
+    Rolling window of quantile sketches.
+
+    The window is split into `slices` fixed-length time slices; each
+    observation goes into the slice for the current time and slices older
+    than the window are reset on rotation. A cumulative sketch is kept
+    alongside for Prometheus histogram export.
+    """
+
+    def __init__(
+        self,
+        window_seconds: int = 300,
+        slices: int = 10,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        max_bins: int = DEFAULT_MAX_BINS,
+        clock=time.time,
+    ):
+        self.window_seconds = window_seconds
+        self.slices = slices
+        self.slice_seconds = max(1.0, window_seconds / slices)
+        self._relative_accuracy = relative_accuracy
+        self._max_bins = max_bins
+        self._clock = clock
+        self._ring: List[QuantileSketch] = [self._new() for _ in range(slices)]
+        self._ring_epoch: List[int] = [-1] * slices
+        self.total = self._new()
+
+    def _new(self) -> QuantileSketch:
+        return QuantileSketch(self._relative_accuracy, self._max_bins)
+
+    def _epoch(self, now: float) -> int:
+        return int(now // self.slice_seconds)
+
+    def _slot(self, epoch: int) -> QuantileSketch:
+        pos = epoch % self.slices
+        if self._ring_epoch[pos] != epoch:
+            self._ring[pos] = self._new()
+            self._ring_epoch[pos] = epoch
+        return self._ring[pos]
+
+    def add(self, value: float) -> None:
+        self._slot(self._epoch(self._clock())).add(value)
+        self.total.add(value)
+
+    def window(self, window_seconds: Optional[int] = None) -> QuantileSketch:
+        """Merged sketch covering the last `window_seconds` (whole slices)."""
+        span = window_seconds or self.window_seconds
+        wanted = min(self.slices, max(1, int(math.ceil(span / self.slice_seconds))))
+        current = self._epoch(self._clock())
+        merged = self._new()
+        for epoch in range(current - wanted + 1, current + 1):
+            pos = epoch % self.slices
+            if self._ring_epoch[pos] == epoch:
+                merged.merge(self._ring[pos])
+        return merged
+
+    def reset_stale(self) -> None:
+        """Drop slices that have fallen out of the window."""
+        oldest = self._epoch(self._clock()) - self.slices + 1
+        for pos, epoch in enumerate(self._ring_epoch):
+            if epoch != -1 and epoch < oldest:
+                self._ring[pos] = self._new()
+                self._ring_epoch[pos] = -1
+
+
+def sketch_stats(sketch: QuantileSketch) -> Dict:
+    """Summary dict in the shape MetricsCollector has always returned."""
+    if sketch.count == 0:
+        return {"count": 0, "avg": 0, "min": 0, "max": 0,
+                "p50": 0, "p95": 0, "p99": 0, "p999": 0}
+    return {
+        "count": sketch.count,
+        "avg": sketch.sum / sketch.count,
+        "min": sketch.min,
+        "max": sketch.max,
+        "p50": sketch.quantile(0.50),
+        "p95": sketch.quantile(0.95),
+        "p99": sketch.quantile(0.99),
+        "p999": sketch.quantile(0.999),
+    }
@@ -1,8 +1,14 @@
 """
 P1-3: Rate Limiting Configuration
 
-Uses SlowAPI for in-memory rate limiting (production should use Redis).
+Uses SlowAPI with the sliding window counter strategy.
 Configurable via environment variables.
+
+PERF-043: Counters live in HybridRedisStorage (app/core/rate_limit_storage.py),
+shared across replicas through Redis: auth/checkout-sized limits are exact,
+high-volume defaults are pre-aggregated locally, and everything falls back
+to bounded local counters without Redis. Default limits are applied to
+undecorated routes by SlowAPIMiddleware (see main.py).
 """
 import logging
 from slowapi import Limiter
@@ -12,6 +18,7 @@ from starlette.requests import Request
 from starlette.responses import JSONResponse
 
 from app.core.config import settings
+from app.core.rate_limit_storage import STORAGE_SCHEME, HybridRedisStorage
 
 logger = logging.getLogger(__name__)
 
@@ -29,16 +36,32 @@ def get_client_ip(request: Request) -> str:
 
 
 # Create limiter instance
-# Uses in-memory storage by default (suitable for single-instance)
-# For multi-instance deployments, configure Redis:
-# limiter = Limiter(key_func=get_client_ip, storage_uri="redis://localhost:6379")
+# Keys are per client IP and route function ("endpoint"), so per-route
+# counters and metrics don't multiply with path parameters
 limiter = Limiter(
     key_func=get_client_ip,
     enabled=settings.RATE_LIMIT_ENABLED,
     default_limits=[settings.RATE_LIMIT_DEFAULT],
+    strategy="sliding-window-counter",
+    storage_uri=f"{STORAGE_SCHEME}://",
+    storage_options={
+        "redis_url": settings.REDIS_URL,
+        "batch_threshold": settings.RATE_LIMIT_BATCH_THRESHOLD,
+        "sync_interval_ms": settings.RATE_LIMIT_SYNC_INTERVAL_MS,
+        "max_local_keys": settings.RATE_LIMIT_LOCAL_MAX_KEYS,
+    },
+    key_style="endpoint",
 )
 
 
+def get_rate_limit_stats() -> dict:
+    """Per-route allowed/limited counts and Redis sync state for this process."""
+    storage = limiter._storage
+    if isinstance(storage, HybridRedisStorage):
+        return storage.stats()
+    return {}
+
+
 def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded) -> JSONResponse:
     """
     Custom handler for rate limit exceeded errors.
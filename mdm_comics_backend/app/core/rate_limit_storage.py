@@ -0,0 +1,376 @@
+"""
+Rate Limit Storage v1.0.0
+
+PERF-043: Sliding-window-counter storage for SlowAPI, shared by every
+replica through Redis.
+
+- Exact limits (amount below RATE_LIMIT_BATCH_THRESHOLD per window: auth,
+  checkout, contact) run one Lua script per request that reads both
+  windows, decides and increments atomically in Redis
+- High-volume limits (the default per-route limit on catalog browsing) are
+  decided in process against the last synced global count plus local
+  hits; a background thread pushes the deltas every
+  RATE_LIMIT_SYNC_INTERVAL_MS through the same script and pulls back the
+  global counts. No Redis round trip on the request path; a key can
+  overshoot by at most what other replicas admit within one interval
+- Without Redis (no REDIS_URL, or errors) every limit falls back to local
+  counters for RATE_LIMIT_RETRY_SECONDS, then Redis is tried again
+- Local counters live in an LRU capped at RATE_LIMIT_LOCAL_MAX_KEYS
+- stats() reports allowed/limited per route and which path decided them
+
+SlowAPI evaluates limits synchronously, so this uses the sync redis client
+(short socket timeouts) and a thread rather than the app's asyncio client.
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from math import floor
+from typing import Any, Dict, List, Optional, Tuple
+
+from limits.storage import Storage
+from limits.storage.base import SlidingWindowCounterSupport
+
+logger = logging.getLogger(__name__)
+
+STORAGE_SCHEME = "mdm-redis"
+KEY_PREFIX = "rl:"
+
+DEFAULT_BATCH_THRESHOLD = 100
+DEFAULT_SYNC_INTERVAL_MS = 25
+DEFAULT_MAX_LOCAL_KEYS = 10_000
+RETRY_SECONDS = 5.0
+SOCKET_TIMEOUT_SECONDS = 0.25
+
+# KEYS: current window, previous window
+# ARGV: limit (0 = add unconditionally), expiry, amount, previous window weight
+SLIDING_WINDOW_LUA = """
+local limit = tonumber(ARGV[1])
+local expiry = tonumber(ARGV[2])
+local amount = tonumber(ARGV[3])
+local weight = tonumber(ARGV[4])
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+if limit > 0 and math.floor(previous * weight) + current + amount > limit then
+    return {0, previous, current}
+end
+if amount > 0 then
+    current = redis.call('INCRBY', KEYS[1], amount)
+    if current == amount then
+        redis.call('EXPIRE', KEYS[1], expiry * 2)
+    end
+end
+return {1, previous, current}
+"""
+
+
+def window_position(expiry: int, now: float) -> Tuple[int, float]:
+    """(window index, weight of the previous window) at now."""
+    window = int(now // expiry)
+    elapsed = now - window * expiry
+    return window, (expiry - elapsed) / expiry
+
+
+def route_of(key: str) -> str:
+    """Route scope of a SlowAPI limit key: LIMITER/<client>/<scope>/<amount>/<multiples>/<unit>."""
+    parts = key.split("/")
+    return parts[2] if len(parts) >= 6 else key
+
+
+class _Counter:
+    """Local view of one key: previous and current window counts."""
+    __slots__ = ("window", "previous", "current")
+
+    def __init__(self, window: int):
+        self.window = window
+        self.previous = 0
+        self.current = 0
+
+    def roll(self, window: int) -> None:
+        if window == self.window:
+            return
+        self.previous = self.current if window == self.window + 1 else 0
+        self.current = 0
+        self.window = window
+
+
+class HybridRedisStorage(Storage, SlidingWindowCounterSupport):
+    """limits storage: exact limits in Redis, high-volume limits pre-aggregated locally."""
+
+    STORAGE_SCHEME = [STORAGE_SCHEME]
+
+    def __init__(
+        self,
+        uri: Optional[str] = None,
+        wrap_exceptions: bool = False,
+        redis_url: str = "",
+        batch_threshold: int = DEFAULT_BATCH_THRESHOLD,
+        sync_interval_ms: int = DEFAULT_SYNC_INTERVAL_MS,
+        max_local_keys: int = DEFAULT_MAX_LOCAL_KEYS,
+        retry_seconds: float = RETRY_SECONDS,
+        **options: Any,
+    ):
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        self.redis_url = redis_url
+        self.batch_threshold = int(batch_threshold)
+        self.sync_interval = int(sync_interval_ms) / 1000.0
+        self.max_local_keys = int(max_local_keys)
+        self.retry_seconds = float(retry_seconds)
+
+        self._lock = threading.Lock()
+        self._counters: "OrderedDict[str, _Counter]" = OrderedDict()
+        # (key, window) -> [unsynced hits, expiry]
+        self._pending: Dict[Tuple[str, int], List[int]] = {}
+        self._client = None
+        self._script = None
+        self._down_until = 0.0
+        self._flusher: Optional[threading.Thread] = None
+        self._wake = threading.Event()
+        self._routes: Dict[str, Dict[str, Any]] = {}
+        self._stats = {"flushes": 0, "keys_synced": 0, "redis_errors": 0, "evictions": 0}
+
+    @property
+    def base_exceptions(self):
+        return (ConnectionError, TimeoutError, OSError)
+
+    # ----- Redis -----
+
+    def _redis(self):
+        """Sync client, or None while Redis is unconfigured or backing off."""
+        if not self.redis_url or time.time() < self._down_until:
+            return None
+        if self._client is None:
+            import redis
+
+            self._client = redis.Redis.from_url(
+                self.redis_url,
+                decode_responses=True,
+                socket_timeout=SOCKET_TIMEOUT_SECONDS,
+                socket_connect_timeout=SOCKET_TIMEOUT_SECONDS,
+            )
+            self._script = self._client.register_script(SLIDING_WINDOW_LUA)
+        return self._client
+
+    def _redis_failed(self, error: Exception) -> None:
+        self._stats["redis_errors"] += 1
+        if time.time() >= self._down_until:
+            logger.warning(f"[RATE_LIMIT] Redis unavailable, using local limits: {error}")
+        self._down_until = time.time() + self.retry_seconds
+
+    @staticmethod
+    def _redis_keys(key: str, window: int) -> List[str]:
+        return [f"{KEY_PREFIX}{key}:{window}", f"{KEY_PREFIX}{key}:{window - 1}"]
+
+    # ----- Local counters -----
+
+    def _counter(self, key: str, window: int) -> _Counter:
+        counter = self._counters.get(key)
+        if counter is None:
+            counter = self._counters[key] = _Counter(window)
+            if len(self._counters) > self.max_local_keys:
+                self._counters.popitem(last=False)
+                self._stats["evictions"] += 1
+        else:
+            self._counters.move_to_end(key)
+            counter.roll(window)
+        return counter
+
+    def _acquire_local(self, key: str, limit: int, expiry: int, amount: int, sync: bool) -> bool:
+        window, weight = window_position(expiry, time.time())
+        with self._lock:
+            counter = self._counter(key, window)
+            if floor(counter.previous * weight) + counter.current + amount > limit:
+                return False
+            counter.current += amount
+            if sync:
+                pending = self._pending.setdefault((key, window), [0, expiry])
+                pending[0] += amount
+        return True
+
+    def _acquire_exact(self, key: str, limit: int, expiry: int, amount: int) -> Optional[bool]:
+        client = self._redis()
+        if client is None:
+            return None
+        window, weight = window_position(expiry, time.time())
+        try:
+            allowed, _, _ = self._script(keys=self._redis_keys(key, window), args=[limit, expiry, amount, weight])
+        except Exception as e:
+            self._redis_failed(e)
+            return None
+        return bool(allowed)
+
+    # ----- Background sync -----
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher is None or not self._flusher.is_alive():
+            self._flusher = threading.Thread(target=self._flush_loop, name="rate-limit-sync", daemon=True)
+            self._flusher.start()
+
+    def _flush_loop(self) -> None:
+        while True:
+            self._wake.wait(self.sync_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:  # never let the sync thread die
+                logger.debug(f"[RATE_LIMIT] Sync failed: {e}")
+
+    def flush(self) -> int:
+        """Push unsynced hits to Redis and refresh local counts. Returns keys synced."""
+        with self._lock:
+            if not self._pending:
+                return 0
+            batch, self._pending = self._pending, {}
+        client = self._redis()
+        if client is None:
+            return 0  # local counts already hold these hits
+
+        now = time.time()
+        items = list(batch.items())
+        try:
+            pipe = client.pipeline(transaction=False)
+            for (key, window), (delta, expiry) in items:
+                self._script(keys=self._redis_keys(key, window), args=[0, expiry, delta, 0], client=pipe)
+            replies = pipe.execute()
+        except Exception as e:
+            self._redis_failed(e)
+            return 0
+
+        with self._lock:
+            for ((key, window), (_, expiry)), (_, previous, current) in zip(items, replies):
+                counter = self._counters.get(key)
+                if counter is None or counter.window != window:
+                    continue
+                unsynced = self._pending.get((key, window), (0,))[0]
+                counter.previous = max(counter.previous, int(previous))
+                counter.current = int(current) + unsynced
+        self._stats["flushes"] += 1
+        self._stats["keys_synced"] += len(items)
+        logger.debug(f"[RATE_LIMIT] Synced {len(items)} keys in {(time.time() - now) * 1000:.1f} ms")
+        return len(items)
+
+    # ----- Metrics -----
+
+    def _record(self, key: str, limit: int, expiry: int, mode: str, allowed: bool) -> None:
+        route = route_of(key)
+        with self._lock:
+            entry = self._routes.get(route)
+            if entry is None:
+                entry = self._routes[route] = {
+                    "limit": f"{limit}/{expiry}s", "mode": mode, "allowed": 0, "limited": 0, "local": 0,
+                }
+            if mode == "local":
+                entry["local"] += 1
+            else:
+                entry["mode"] = mode
+            entry["allowed" if allowed else "limited"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            pending = len(self._pending)
+            local_keys = len(self._counters)
+            routes = {route: dict(entry) for route, entry in sorted(self._routes.items())}
+        return {
+            **self._stats,
+            "redis_configured": bool(self.redis_url),
+            "redis_available": bool(self.redis_url) and time.time() >= self._down_until,
+            "batch_threshold": self.batch_threshold,
+            "sync_interval_ms": int(self.sync_interval * 1000),
+            "local_keys": local_keys,
+            "pending_keys": pending,
+            "routes": routes,
+        }
+
+    # ----- SlidingWindowCounterSupport -----
+
+    def acquire_sliding_window_entry(self, key: str, limit: int, expiry: int, amount: int = 1) -> bool:
+        if amount > limit:
+            return False
+        if limit < self.batch_threshold:
+            allowed = self._acquire_exact(key, limit, expiry, amount)
+            if allowed is not None:
+                self._record(key, limit, expiry, "exact", allowed)
+                return allowed
+            allowed = self._acquire_local(key, limit, expiry, amount, sync=False)
+            self._record(key, limit, expiry, "local", allowed)
+            return allowed
+
+        sync = self._redis() is not None
+        allowed = self._acquire_local(key, limit, expiry, amount, sync=sync)
+        if sync:
+            self._ensure_flusher()
+        self._record(key, limit, expiry, "batched" if sync else "local", allowed)
+        return allowed
+
+    def get_sliding_window(self, key: str, expiry: int) -> Tuple[int, float, int, float]:
+        now = time.time()
+        window, weight = window_position(expiry, now)
+        previous = current = 0
+        client = self._redis()
+        if client is not None:
+            try:
+                values = client.mget(self._redis_keys(key, window))
+                current, previous = (int(v or 0) for v in values)
+            except Exception as e:
+                self._redis_failed(e)
+                client = None
+        if client is None:
+            with self._lock:
+                counter = self._counters.get(key)
+                if counter is not None:
+                    counter.roll(window)
+                    previous, current = counter.previous, counter.current
+        previous_ttl = weight * expiry
+        return previous, previous_ttl, current, previous_ttl + expiry
+
+    def clear_sliding_window(self, key: str, expiry: int) -> None:
+        window, _ = window_position(expiry, time.time())
+        with self._lock:
+            self._counters.pop(key, None)
+            for pending_key in [k for k in self._pending if k[0] == key]:
+                del self._pending[pending_key]
+        client = self._redis()
+        if client is not None:
+            try:
+                client.delete(*self._redis_keys(key, window))
+            except Exception as e:
+                self._redis_failed(e)
+
+    # ----- Storage (fixed-window API, unused by the sliding window strategy) -----
+
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        window, _ = window_position(expiry, time.time())
+        with self._lock:
+            counter = self._counter(key, window)
+            counter.current += amount
+            return counter.current
+
+    def get(self, key: str) -> int:
+        with self._lock:
+            counter = self._counters.get(key)
+            return counter.current if counter else 0
+
+    def get_expiry(self, key: str) -> float:
+        return time.time()
+
+    def check(self) -> bool:
+        client = self._redis()
+        if client is None:
+            return not self.redis_url
+        try:
+            return bool(client.ping())
+        except Exception as e:
+            self._redis_failed(e)
+            return False
+
+    def reset(self) -> Optional[int]:
+        with self._lock:
+            count = len(self._counters)
+            self._counters.clear()
+            self._pending.clear()
+            self._routes.clear()
+        return count
+
+    def clear(self, key: str) -> None:
+        with self._lock:
+            self._counters.pop(key, None)
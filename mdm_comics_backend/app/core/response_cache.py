@@ -0,0 +1,311 @@
+"""
+Public Response Cache v1.0.0
+
+PERF-039: Shared cache of serialized JSON responses for public catalog
+GET endpoints (products, funkos, bundles, homepage, comic issues).
+
+- Routes opt in with dependencies=[Depends(cached_response(ttl, tags))]
+- ResponseCacheMiddleware keys entries on route path plus the route's own
+  declared query parameters (sorted, blanks and unknown params such as
+  cache-busters dropped), so equivalent URLs share one entry
+- Entries are the exact response bytes plus a strong ETag, stored in
+  Redis and shared by every replica; a hit costs one Redis GET and no
+  database query or serialization
+- If-None-Match is answered with 304 on hits and misses alike
+- Admin write paths drop entries by tag (product:<id>, products,
+  bundles, homepage ...) through invalidate_tags() / invalidates()
+
+Without Redis nothing is stored, but responses still carry ETags and
+conditional requests still get 304s.
+"""
+import hashlib
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from starlette.routing import Match
+
+from app.core.redis_client import get_redis
+
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse
+except ImportError:  # optional: falls back to stdlib json serialization
+    orjson = None
+    ORJSONResponse = None
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "rc:v1:"
+TAG_PREFIX = "rc:tag:"
+# Tag sets outlive every entry they point at
+MAX_TTL_SECONDS = 3600
+TAG_TTL_SECONDS = MAX_TTL_SECONDS * 2
+# Larger bodies are served normally but not stored
+MAX_BODY_BYTES = 1024 * 1024
+
+CACHE_CONTROL = "public, no-cache"
+SCOPE_KEY = "response_cache"
+
+# Response class for cached routes: orjson when installed
+CachedJSONResponse = ORJSONResponse or JSONResponse
+
+_stats = {"hits": 0, "misses": 0, "not_modified": 0, "stores": 0, "invalidations": 0, "errors": 0}
+
+
+# ----- Route opt-in -----
+
+def cached_response(ttl: int, tags: Iterable[str] = ()) -> Callable:
+    """
+    Route dependency marking a GET endpoint cacheable.
+
+    tags are format strings over path and query parameters, e.g.
+    "product:{product_id}"; a tag whose fields
+    are missing from the request is skipped.
+    """
+    ttl = min(ttl, MAX_TTL_SECONDS)
+    templates = tuple(tags)
+
+    async def dependency(request: Request) -> None:
+        values = {**request.query_params, **request.path_params}
+        resolved = []
+        for template in templates:
+            try:
+                resolved.append(template.format(**values))
+            except (KeyError, IndexError):
+                continue
+        request.scope[SCOPE_KEY] = (ttl, resolved)
+
+    dependency.response_cache_ttl = ttl
+    return dependency
+
+
+def invalidates(*tags: str) -> Callable:
+    """
+    Route dependency that drops tagged entries after a successful write.
+
+    Tags may use path parameters ("bundle:{bundle_id}"). Nothing is
+    dropped if the endpoint raises.
+    """
+    async def dependency(request: Request):
+        yield
+        if request.method not in ("GET", "HEAD", "OPTIONS"):
+            resolved = []
+            for template in tags:
+                try:
+                    resolved.append(template.format(**request.path_params))
+                except (KeyError, IndexError):
+                    continue
+            await invalidate_tags(*resolved)
+
+    return dependency
+
+
+# ----- Keys, ETags -----
+
+def normalize_query(query_string: str, allowed: Iterable[str]) -> str:
+    """Sorted declared query params with blank values dropped."""
+    allowed = set(allowed)
+    pairs = [(k, v) for k, v in parse_qsl(query_string, keep_blank_values=False) if k in allowed]
+    return urlencode(sorted(pairs))
+
+
+def cache_key(path: str, query: str) -> str:
+    digest = hashlib.sha1(f"{path}?{query}".encode()).hexdigest()
+    return f"{KEY_PREFIX}{digest}"
+
+
+def make_etag(body: bytes) -> str:
+    """Strong validator for the exact response bytes."""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match check (weak comparison, as RFC 9110 requires for GET)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
+
+# ----- Storage -----
+
+async def _load(key: str) -> Optional[Tuple[str, bytes]]:
+    client = await get_redis()
+    if not client:
+        return None
+    try:
+        value = await client.get(key)
+    except Exception as e:
+        _stats["errors"] += 1
+        logger.debug(f"[RESPONSE_CACHE] Read failed: {e}")
+        return None
+    if not value:
+        return None
+    etag, _, body = value.partition("\n")
+    return etag, body.encode("utf-8")
+
+
+async def _store(key: str, etag: str, body: bytes, ttl: int, tags: List[str]) -> None:
+    client = await get_redis()
+    if not client:
+        return
+    try:
+        pipe = client.pipeline(transaction=False)
+        pipe.set(key, f"{etag}\n{body.decode('utf-8')}", ex=ttl)
+        for tag in tags:
+            pipe.sadd(f"{TAG_PREFIX}{tag}", key)
+            pipe.expire(f"{TAG_PREFIX}{tag}", TAG_TTL_SECONDS)
+        await pipe.execute()
+        _stats["stores"] += 1
+    except Exception as e:
+        _stats["errors"] += 1
+        logger.debug(f"[RESPONSE_CACHE] Write failed: {e}")
+
+
+async def invalidate_tags(*tags: str) -> int:
+    """Drop every cached response carrying any of these tags."""
+    client = await get_redis()
+    if not client or not tags:
+        return 0
+    try:
+        tag_keys = [f"{TAG_PREFIX}{tag}" for tag in tags]
+        pipe = client.pipeline(transaction=False)
+        for tag_key in tag_keys:
+            pipe.smembers(tag_key)
+        members = set()
+        for keys in await pipe.execute():
+            members.update(keys or ())
+        await client.delete(*members, *tag_keys)
+        _stats["invalidations"] += 1
+        return len(members)
+    except Exception as e:
+        _stats["errors"] += 1
+        logger.warning(f"[RESPONSE_CACHE] Invalidation of {tags} failed: {e}")
+        return 0
+
+
+def get_response_cache_stats() -> Dict[str, Any]:
+    """Per-process hit/miss/304 counters."""
+    served = _stats["hits"] + _stats["misses"]
+    return {**_stats, "hit_rate": round(_stats["hits"] / served, 4) if served else 0.0}
+
+
+# ----- Middleware -----
+
+def _is_cached_route(route: Any) -> bool:
+    dependant = getattr(route, "dependant", None)
+    if dependant is None:
+        return False
+    return any(hasattr(dep.call, "response_cache_ttl") for dep in dependant.dependencies)
+
+
+class ResponseCacheMiddleware:
+    """
+    Serve and fill the response cache for routes using cached_response().
+
+    Pure ASGI: only GET requests whose path matches a cached route are
+    buffered; everything else passes straight through.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._routes: Optional[List[Any]] = None
+        self._cached_routes: List[Any] = []
+
+    def _match(self, scope) -> Optional[Any]:
+        """The route Starlette would dispatch to, if it is a cached one."""
+        if self._routes is None:
+            self._routes = list(scope["app"].router.routes)
+            self._cached_routes = [r for r in self._routes if _is_cached_route(r)]
+        if not any(r.path_regex.match(scope["path"]) for r in self._cached_routes):
+            return None
+        for route in self._routes:
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return route if _is_cached_route(route) else None
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET" or "app" not in scope:
+            return await self.app(scope, receive, send)
+        route = self._match(scope)
+        if route is None:
+            return await self.app(scope, receive, send)
+
+        allowed = [param.alias for param in route.dependant.query_params]
+        key = cache_key(scope["path"], normalize_query(scope.get("query_string", b"").decode("latin-1"), allowed))
+        if_none_match = None
+        for name, value in scope.get("headers", []):
+            if name == b"if-none-match":
+                if_none_match = value.decode("latin-1")
+
+        entry = await _load(key)
+        if entry is not None:
+            etag, body = entry
+            _stats["hits"] += 1
+            if etag_matches(if_none_match, etag):
+                _stats["not_modified"] += 1
+                return await self._send(send, 304, etag, b"", "HIT")
+            return await self._send(send, 200, etag, body, "HIT", content_type=b"application/json")
+
+        _stats["misses"] += 1
+        start_message: Dict[str, Any] = {}
+        chunks: List[bytes] = []
+
+        async def capture(message):
+            if message["type"] == "http.response.start":
+                start_message.update(message)
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self.app(scope, receive, capture)
+
+        status = start_message.get("status", 500)
+        headers = list(start_message.get("headers", []))
+        body = b"".join(chunks)
+        if status != 200 or any(name == b"set-cookie" for name, _ in headers):
+            await send(start_message)
+            return await send({"type": "http.response.body", "body": body})
+
+        etag = make_etag(body)
+        policy = scope.get(SCOPE_KEY)
+        if policy is not None and len(body) <= MAX_BODY_BYTES:
+            ttl, tags = policy
+            await _store(key, etag, body, ttl, tags)
+
+        if etag_matches(if_none_match, etag):
+            _stats["not_modified"] += 1
+            return await self._send(send, 304, etag, b"", "MISS")
+        headers = [(n, v) for n, v in headers if n not in (b"etag", b"cache-control", b"content-length")]
+        headers += [
+            (b"etag", etag.encode()),
+            (b"cache-control", CACHE_CONTROL.encode()),
+            (b"x-cache", b"MISS"),
+            (b"content-length", str(len(body)).encode()),
+        ]
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+    @staticmethod
+    async def _send(send, status: int, etag: str, body: bytes, cache: str, content_type: bytes = None):
+        headers = [
+            (b"etag", etag.encode()),
+            (b"cache-control", CACHE_CONTROL.encode()),
+            (b"x-cache", cache.encode()),
+        ]
+        if content_type:
+            headers.append((b"content-type", content_type))
+        if status != 304:
+            headers.append((b"content-length", str(len(body)).encode()))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
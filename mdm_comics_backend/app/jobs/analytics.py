@@ -2,6 +2,7 @@
 Analytics Jobs
 
 v1.5.0: Outreach System - Price changelog sync and reporting
+v1.6.0: PERF-038 - Changelog sync consumes the price CDC event stream
 """
 import logging
 from datetime import timedelta
@@ -12,146 +13,86 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db_session
 from app.core.utils import utcnow
-from app.models.price_changelog import PriceChangelog
 from app.services.price_analytics import PriceAnalyticsService
+from app.services.price_events import EVENT_RANGE, drain_price_events, price_cdc_installed
+from app.services.price_guide_sync import CHANGE_PCT_EXPR
 
 logger = logging.getLogger(__name__)
 
+CHANGELOG_CONSUMER = "price_changelog"
+
+# A writer's own changelog row for the same new value within this window
+# means the change is already logged
+CHANGELOG_DEDUPE_MINUTES = 60
+
 
 async def sync_price_changelog(ctx: dict) -> dict:
     """
-    Sync price changes from funko/comic tables to changelog.
+    Record price changes captured since the last run to price_changelog.
 
-    Compares current prices against last recorded values.
-    Records changes to price_changelog for analytics.
+    v1.6.0: PERF-038 - Drains the price_change_events CDC stream (trigger
+    captured on funkos/comic_issues) in one INSERT ... SELECT, instead of
+    diffing every entity against its latest changelog row. Work is
+    proportional to the changes since the last run, not the history.
     """
     async with get_db_session() as db:
-        changes_recorded = 0
+        if not await price_cdc_installed(db):
+            logger.warning("Price sync skipped: price CDC not installed (run create_price_cdc migration)")
+            return {"status": "skipped", "funko_changes": 0, "comic_changes": 0, "total": 0}
 
-        # Sync funko prices
-        funko_changes = await _sync_funko_prices(db)
-        changes_recorded += funko_changes
-
-        # Sync comic prices
-        comic_changes = await _sync_comic_prices(db)
-        changes_recorded += comic_changes
+        result = await drain_price_events(db, CHANGELOG_CONSUMER, _record_changelog)
+        funko_changes = result.get("funko", 0)
+        comic_changes = result.get("comic", 0)
 
         logger.info(
             f"Price sync complete: {funko_changes} funko, "
-            f"{comic_changes} comic changes"
+            f"{comic_changes} comic changes ({result.get('events', 0)} events)"
         )
 
         return {
-            "status": "complete",
+            "status": result["status"],
+            "events": result.get("events", 0),
             "funko_changes": funko_changes,
             "comic_changes": comic_changes,
-            "total": changes_recorded,
+            "total": funko_changes + comic_changes,
         }
 
 
-async def _sync_funko_prices(db: AsyncSession) -> int:
-    """Sync funko price changes."""
-    changes = 0
-
-    # Get funkos with price changes since last sync
-    # Compare against most recent changelog entry
-    query = text("""
-        WITH last_prices AS (
-            SELECT DISTINCT ON (entity_id)
-                entity_id,
-                new_value as last_price
-            FROM price_changelog
-            WHERE entity_type = 'funko'
-            ORDER BY entity_id, changed_at DESC
-        )
-        SELECT
-            f.id,
-            f.title,
-            f.price_new,
-            lp.last_price
-        FROM funkos f
-        LEFT JOIN last_prices lp ON lp.entity_id = f.id
-        WHERE f.price_new IS NOT NULL
-          AND (lp.last_price IS NULL OR f.price_new != lp.last_price)
-    """)
-
-    result = await db.execute(query)
-
-    for row in result.fetchall():
-        funko_id, title, current_price, last_price = row
-
-        if last_price is None:
-            # First record - skip, we only want changes
-            continue
-
-        changelog = PriceChangelog(
-            entity_type="funko",
-            entity_id=funko_id,
-            entity_name=title,
-            field_name="price_new",
-            old_value=float(last_price),
-            new_value=float(current_price),
-            changed_at=utcnow(),
-        )
-        db.add(changelog)
-        changes += 1
-
-    # CRIT-002: Explicit commit to prevent data loss
-    if changes > 0:
-        await db.commit()
-
-    return changes
-
-
-async def _sync_comic_prices(db: AsyncSession) -> int:
-    """Sync comic issue price changes."""
-    changes = 0
+async def _record_changelog(db: AsyncSession, params: dict) -> dict:
+    """
+    Insert drained events as changelog rows, per entity type.
 
-    query = text("""
-        WITH last_prices AS (
-            SELECT DISTINCT ON (entity_id)
-                entity_id,
-                new_value as last_price
-            FROM price_changelog
-            WHERE entity_type = 'comic'
-            ORDER BY entity_id, changed_at DESC
-        )
-        SELECT
-            ci.id,
-            ci.issue_name,
-            ci.price_new,
-            lp.last_price
-        FROM comic_issues ci
-        LEFT JOIN last_prices lp ON lp.entity_id = ci.id
-        WHERE ci.price_new IS NOT NULL
-          AND (lp.last_price IS NULL OR ci.price_new != lp.last_price)
-    """)
-
-    result = await db.execute(query)
-
-    for row in result.fetchall():
-        issue_id, issue_name, current_price, last_price = row
-
-        if last_price is None:
-            continue
-
-        changelog = PriceChangelog(
-            entity_type="comic",
-            entity_id=issue_id,
-            entity_name=issue_name,
-            field_name="price_new",
-            old_value=float(last_price),
-            new_value=float(current_price),
-            changed_at=utcnow(),
+    First prices (no old value) and cleared prices are not changes.
+    Writers that log their own changelog row in the same transaction
+    (PriceCharting jobs, price guide sync) are not logged twice.
+    """
+    result = await db.execute(text(f"""
+        WITH inserted AS (
+            INSERT INTO price_changelog
+                (entity_type, entity_id, entity_name, field_name, old_value, new_value,
+                 change_pct, data_source, reason, changed_at)
+            SELECT v.entity_type, v.entity_id, LEFT(COALESCE(f.title, ci.issue_name), 500),
+                   v.field_name, v.old_value, v.new_value, {CHANGE_PCT_EXPR},
+                   'pricecharting', 'daily_sync', v.changed_at
+            FROM price_change_events v
+            LEFT JOIN funkos f ON v.entity_type = 'funko' AND f.id = v.entity_id
+            LEFT JOIN comic_issues ci ON v.entity_type = 'comic' AND ci.id = v.entity_id
+            WHERE {EVENT_RANGE}
+              AND v.old_value IS NOT NULL
+              AND v.new_value IS NOT NULL
+              AND NOT EXISTS (
+                  SELECT 1 FROM price_changelog pc
+                  WHERE pc.entity_type = v.entity_type
+                    AND pc.entity_id = v.entity_id
+                    AND pc.field_name = v.field_name
+                    AND pc.new_value = v.new_value
+                    AND pc.changed_at >= v.changed_at - make_interval(mins => :dedupe_minutes)
+              )
+            RETURNING entity_type
         )
-        db.add(changelog)
-        changes += 1
-
-    # CRIT-002: Explicit commit to prevent data loss
-    if changes > 0:
-        await db.commit()
-
-    return changes
+        SELECT entity_type, COUNT(*) FROM inserted GROUP BY entity_type
+    """), {**params, "dedupe_minutes": CHANGELOG_DEDUPE_MINUTES})
+    return {row[0]: int(row[1]) for row in result.fetchall()}
 
 
 async def generate_weekly_report(ctx: dict) -> dict:
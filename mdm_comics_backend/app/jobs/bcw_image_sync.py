@@ -5,14 +5,41 @@ Fetches product images from BCW product pages and uploads to S3.
 Reads product catalog from Excel file and scrapes images for each product.
 
 Per 20251216_mdm_comics_bcw_catalog.xlsx
+
+v2.0.0 (PERF-045): Staged pipeline. Products flow through bounded stages
+that overlap across products instead of running in gather-then-sleep
+batches:
+
+- page: fetch pool, with a minimum interval between page requests to
+  stay polite to bcwsupplies.com
+- parse: BeautifulSoup runs in worker threads, off the event loop
+- download: image download pool
+- dedup: every image keeps its per-SKU key
+  (bcw-products/<MDM-SKU>/<NN>_<bcw-sku>.<ext>), which the catalog import,
+  the admin image listing and bcw_populate_images all read. An object S3
+  already holds with the same content (sha256 object metadata) is skipped;
+  content already stored this run under another SKU's key is server-side
+  copied (copy_object), so the bytes are uploaded once per run
+- upload: concurrent uploads through boto3's managed transfer (multipart
+  above a size threshold), in worker threads
+- write: one writer task, one bulk UPDATE products (image_url + images
+  gallery) + one bulk INSERT product_images per db_batch_size products.
+  Earlier versions wrote a cover_image_url column that products does not
+  have, so no image ever reached the catalog
+
+Every stage is sized by ImageSyncConfig and reports StageMetrics.
 """
 import asyncio
+import hashlib
+import json
 import logging
 import re
 import os
+import time
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass
+from typing import Any, List, Dict, Optional, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
 import httpx
@@ -33,6 +60,22 @@ CATALOG_PATH = Path(__file__).parent.parent.parent / "data" / "bcw_catalog.xlsx"
 PREFERRED_CACHE_ID = "e421e1a1fb9352138824a73060698151"  # Large images
 FALLBACK_CACHE_ID = "018cb6c939f4384972ea386d6d6280e0"   # Thumbnails
 
+IMAGE_EXTENSIONS = ('jpg', 'jpeg', 'png', 'gif', 'webp')
+
+
+@dataclass
+class ImageSyncConfig:
+    """Stage sizes for the image sync pipeline."""
+    products_in_flight: int = 16        # products between page fetch and write
+    page_concurrency: int = 4
+    page_interval_seconds: float = 0.2  # min gap between page request starts
+    parse_workers: int = 2
+    download_concurrency: int = 8
+    upload_concurrency: int = 8
+    multipart_threshold_mb: int = 8
+    multipart_chunk_mb: int = 8
+    db_batch_size: int = 50
+
 
 @dataclass
 class ImageResult:
@@ -43,6 +86,8 @@ class ImageResult:
     images_uploaded: int
     primary_image_url: Optional[str]
     error: Optional[str] = None
+    images_reused: int = 0  # already in S3, or copied there from another key
+    image_urls: List[str] = field(default_factory=list)
 
 
 @dataclass
@@ -54,6 +99,51 @@ class SyncResult:
     total_images_uploaded: int
     errors: List[str]
     duration_ms: int
+    total_images_reused: int = 0
+    stages: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+
+class StageMetrics:
+    """Concurrency-bounded pipeline stage with throughput counters."""
+
+    def __init__(self, name: str, concurrency: int):
+        self.name = name
+        self.concurrency = concurrency
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self.completed = 0
+        self.failed = 0
+        self.bytes = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.busy_seconds = 0.0
+        self.wait_seconds = 0.0
+
+    @asynccontextmanager
+    async def slot(self):
+        """Hold one of the stage's slots for the duration of one item."""
+        queued = time.monotonic()
+        async with self._semaphore:
+            started = time.monotonic()
+            self.wait_seconds += started - queued
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            try:
+                yield
+            finally:
+                self.in_flight -= 1
+                self.completed += 1
+                self.busy_seconds += time.monotonic() - started
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "concurrency": self.concurrency,
+            "completed": self.completed,
+            "failed": self.failed,
+            "bytes": self.bytes,
+            "peak_in_flight": self.peak_in_flight,
+            "avg_ms": round(self.busy_seconds / self.completed * 1000, 1) if self.completed else 0.0,
+            "avg_wait_ms": round(self.wait_seconds / self.completed * 1000, 1) if self.completed else 0.0,
+        }
 
 
 async def fetch_product_page(client: httpx.AsyncClient, url: str) -> Optional[str]:
@@ -68,7 +158,7 @@ async def fetch_product_page(client: httpx.AsyncClient, url: str) -> Optional[st
 
 
 def extract_image_urls(html: str, bcw_sku: str) -> List[str]:
-    """Extract product image URLs from BCW product page HTML."""
+    """Extract product image URLs from BCW product page HTML (CPU-bound)."""
     soup = BeautifulSoup(html, 'html.parser')
     image_urls = set()
 
@@ -147,122 +237,264 @@ async def download_image(client: httpx.AsyncClient, url: str) -> Optional[bytes]
         return None
 
 
-async def process_product(
-    client: httpx.AsyncClient,
-    storage: StorageService,
-    db: AsyncSession,
-    bcw_sku: str,
-    mdm_sku: str,
-    product_url: str,
-    product_name: str,
-) -> ImageResult:
-    """Process a single product - fetch page, extract images, upload to S3."""
-    result = ImageResult(
-        bcw_sku=bcw_sku,
-        mdm_sku=mdm_sku,
-        images_found=0,
-        images_uploaded=0,
-        primary_image_url=None,
-    )
+def image_extension(url: str) -> str:
+    """File extension of an image URL (query stripped), jpg if unknown."""
+    ext = url.split('.')[-1].split('?')[0].lower()
+    return ext if ext in IMAGE_EXTENSIONS else 'jpg'
 
-    # Fetch product page
-    html = await fetch_product_page(client, product_url)
-    if not html:
-        result.error = "Failed to fetch product page"
-        return result
 
-    # Extract image URLs
-    image_urls = extract_image_urls(html, bcw_sku)
-    result.images_found = len(image_urls)
+def image_key(mdm_sku: str, bcw_sku: str, position: int, ext: str) -> str:
+    """Per-SKU key; consumers list bcw-products/<MDM-SKU>/ and sort by the NN_ prefix."""
+    return f"bcw-products/{mdm_sku}/{position:02d}_{bcw_sku.lower()}.{ext}"
 
-    if not image_urls:
-        result.error = "No images found on page"
-        return result
 
-    logger.info(f"[{bcw_sku}] Found {len(image_urls)} images")
-
-    # Download and upload each image
-    uploaded_urls = []
-    for i, img_url in enumerate(image_urls):
-        image_data = await download_image(client, img_url)
-        if not image_data:
+def bulk_image_rows(results: List[ImageResult]) -> Tuple[Dict[str, List], Dict[str, List]]:
+    """
+    Array parameters for the batch write: primary image and gallery (JSON
+    list of the other images) per SKU, and every (sku, url, position) once.
+    """
+    products = {"skus": [], "urls": [], "galleries": []}
+    images = {"skus": [], "urls": [], "positions": []}
+    for result in results:
+        if not result.primary_image_url:
             continue
+        unique = list(dict.fromkeys(result.image_urls))
+        products["skus"].append(result.mdm_sku)
+        products["urls"].append(result.primary_image_url)
+        products["galleries"].append(json.dumps([u for u in unique if u != result.primary_image_url]))
+        for position, url in enumerate(unique):
+            images["skus"].append(result.mdm_sku)
+            images["urls"].append(url)
+            images["positions"].append(position)
+    return products, images
+
+
+UPDATE_PRODUCTS_SQL = text("""
+    UPDATE products p
+    SET image_url = v.url,
+        images = CAST(v.gallery AS JSON),
+        updated_at = NOW()
+    FROM unnest(CAST(:skus AS TEXT[]), CAST(:urls AS TEXT[]), CAST(:galleries AS TEXT[]))
+        AS v(sku, url, gallery)
+    WHERE p.sku = v.sku
+""")
+
+INSERT_IMAGES_SQL = text("""
+    INSERT INTO product_images (product_sku, image_url, position, source, created_at)
+    SELECT v.sku, v.url, v.position, 'bcw', NOW()
+    FROM unnest(CAST(:skus AS TEXT[]), CAST(:urls AS TEXT[]), CAST(:positions AS INTEGER[]))
+        AS v(sku, url, position)
+    ON CONFLICT (product_sku, image_url) DO UPDATE SET
+        position = EXCLUDED.position,
+        updated_at = NOW()
+""")
+
+
+async def write_image_batch(db: AsyncSession, results: List[ImageResult]) -> int:
+    """One bulk write for a batch of products; returns products updated."""
+    products, images = bulk_image_rows(results)
+    if not products["skus"]:
+        return 0
+    updated = (await db.execute(UPDATE_PRODUCTS_SQL, products)).rowcount or 0
+    try:
+        # product_images is optional; keep the product updates without it
+        async with db.begin_nested():
+            await db.execute(INSERT_IMAGES_SQL, images)
+    except Exception as e:
+        logger.debug(f"Could not write product_images: {e}")
+    await db.commit()
+    return updated
 
-        # Generate S3 key
-        ext = img_url.split('.')[-1].split('?')[0]  # Get extension, strip query params
-        if ext not in ('jpg', 'jpeg', 'png', 'gif', 'webp'):
-            ext = 'jpg'
-
-        s3_key = f"bcw-products/{mdm_sku}/{i:02d}_{bcw_sku.lower()}.{ext}"
 
-        # Upload to S3
-        try:
-            s3_url = await storage.upload_bytes(
-                image_data,
-                s3_key,
-                content_type=f"image/{ext}",
-            )
-            if s3_url:
-                uploaded_urls.append(s3_url)
-                result.images_uploaded += 1
+class BCWImagePipeline:
+    """
+    Page -> parse -> download -> dedup -> upload stages per product; the
+    caller's writer drains finished products. Holds no DB session, so
+    products run concurrently without sharing one.
+    """
 
-                if i == 0:
-                    result.primary_image_url = s3_url
+    def __init__(self, client: httpx.AsyncClient, storage: StorageService, config: ImageSyncConfig):
+        self.client = client
+        self.storage = storage
+        self.config = config
+        self.stages = {
+            "page": StageMetrics("page", config.page_concurrency),
+            "parse": StageMetrics("parse", config.parse_workers),
+            "download": StageMetrics("download", config.download_concurrency),
+            "dedup": StageMetrics("dedup", config.upload_concurrency),
+            "upload": StageMetrics("upload", config.upload_concurrency),
+            "write": StageMetrics("write", 1),
+        }
+        self.dedup_hits = {"run": 0, "s3": 0}
+        self.bytes_skipped = 0
+        self._next_page_at = 0.0
+        self._page_lock = asyncio.Lock()
+        # sha256 -> future of the first key holding that content this run
+        self._sources: Dict[str, asyncio.Future] = {}
+
+    async def _pace_page_request(self) -> None:
+        async with self._page_lock:
+            now = time.monotonic()
+            wait = self._next_page_at - now
+            self._next_page_at = max(now, self._next_page_at) + self.config.page_interval_seconds
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def process(self, bcw_sku: str, mdm_sku: str, product_url: str) -> ImageResult:
+        """Run one product through every stage but the write."""
+        result = ImageResult(
+            bcw_sku=bcw_sku,
+            mdm_sku=mdm_sku,
+            images_found=0,
+            images_uploaded=0,
+            primary_image_url=None,
+        )
 
-                logger.info(f"[{bcw_sku}] Uploaded image {i+1}: {s3_key}")
-        except Exception as e:
-            logger.error(f"[{bcw_sku}] Failed to upload image {i}: {e}")
+        page = self.stages["page"]
+        async with page.slot():
+            await self._pace_page_request()
+            html = await fetch_product_page(self.client, product_url)
+        if not html:
+            page.failed += 1
+            result.error = "Failed to fetch product page"
+            return result
+        page.bytes += len(html)
+
+        async with self.stages["parse"].slot():
+            image_urls = await asyncio.to_thread(extract_image_urls, html, bcw_sku)
+        result.images_found = len(image_urls)
+        if not image_urls:
+            result.error = "No images found on page"
+            return result
+
+        logger.info(f"[{bcw_sku}] Found {len(image_urls)} images")
+
+        stored = await asyncio.gather(*(
+            self._store_image(mdm_sku, bcw_sku, i, url) for i, url in enumerate(image_urls)
+        ))
+        for i, outcome in enumerate(stored):
+            if outcome is None:
+                continue
+            url, uploaded = outcome
+            result.image_urls.append(url)
+            if uploaded:
+                result.images_uploaded += 1
+            else:
+                result.images_reused += 1
+            if i == 0:
+                result.primary_image_url = url
+        return result
 
-    # Update product record with primary image
-    if result.primary_image_url:
+    async def _store_image(self, mdm_sku: str, bcw_sku: str, position: int, url: str) -> Optional[Tuple[str, bool]]:
+        """Download one image and make sure S3 has it; (s3 url, uploaded) or None."""
+        download = self.stages["download"]
+        async with download.slot():
+            data = await download_image(self.client, url)
+        if not data:
+            download.failed += 1
+            return None
+        download.bytes += len(data)
+
+        ext = image_extension(url)
+        content_hash = hashlib.sha256(data).hexdigest()
+        key = image_key(mdm_sku, bcw_sku, position, ext)
+
+        dedup = self.stages["dedup"]
+        async with dedup.slot():
+            existing = await self.storage.get_object_metadata(key)
+        if existing is not None and existing.get("sha256") == content_hash:
+            self.dedup_hits["s3"] += 1
+            self.bytes_skipped += len(data)
+            self._offer_source(content_hash, key)
+            return self.storage.get_public_url(key), False
+
+        source = self._sources.get(content_hash)
+        if source is not None:
+            source_key = await source
+            if source_key:
+                s3_url = await self._copy_object(source_key, key, ext, content_hash)
+                if s3_url:
+                    self.dedup_hits["run"] += 1
+                    self.bytes_skipped += len(data)
+                    return s3_url, False
+
+        # Later products with this content wait for (and copy) this upload
+        claim = None
+        if content_hash not in self._sources:
+            claim = self._sources[content_hash] = asyncio.get_running_loop().create_future()
         try:
-            await db.execute(text("""
-                UPDATE products
-                SET cover_image_url = :image_url,
-                    updated_at = NOW()
-                WHERE sku = :mdm_sku
-            """), {
-                "image_url": result.primary_image_url,
-                "mdm_sku": mdm_sku,
-            })
-
-            # Also store all images in product_images table if it exists
-            for i, s3_url in enumerate(uploaded_urls):
-                await db.execute(text("""
-                    INSERT INTO product_images (product_sku, image_url, position, source, created_at)
-                    VALUES (:sku, :url, :position, 'bcw', NOW())
-                    ON CONFLICT (product_sku, image_url) DO UPDATE SET
-                        position = :position,
-                        updated_at = NOW()
-                """), {
-                    "sku": mdm_sku,
-                    "url": s3_url,
-                    "position": i,
-                })
+            outcome = await self._upload_object(key, data, ext, content_hash)
         except Exception as e:
-            # Table might not exist, that's ok
-            logger.debug(f"[{bcw_sku}] Could not update product record: {e}")
+            logger.error(f"[{bcw_sku}] Failed to store image {position}: {e}")
+            outcome = None
+        if outcome is not None:
+            self._offer_source(content_hash, key)
+        elif claim is not None and not claim.done():
+            # let a waiting product upload it itself
+            del self._sources[content_hash]
+            claim.set_result(None)
+        return outcome
+
+    def _offer_source(self, content_hash: str, key: str) -> None:
+        """Remember key as the copy source for this content (first one wins)."""
+        source = self._sources.get(content_hash)
+        if source is None:
+            source = self._sources[content_hash] = asyncio.get_running_loop().create_future()
+        if not source.done():
+            source.set_result(key)
+
+    async def _copy_object(self, source_key: str, key: str, ext: str, content_hash: str) -> Optional[str]:
+        upload = self.stages["upload"]
+        async with upload.slot():
+            s3_url = await self.storage.copy_object_threaded(
+                source_key, key, content_type=f"image/{ext}", metadata={"sha256": content_hash},
+            )
+        if s3_url:
+            logger.info(f"Copied image: {source_key} -> {key}")
+        return s3_url
+
+    async def _upload_object(self, key: str, data: bytes, ext: str, content_hash: str) -> Optional[Tuple[str, bool]]:
+        upload = self.stages["upload"]
+        async with upload.slot():
+            s3_url = await self.storage.upload_bytes_threaded(
+                data,
+                key,
+                content_type=f"image/{ext}",
+                metadata={"sha256": content_hash},
+                multipart_threshold=self.config.multipart_threshold_mb * 1024 * 1024,
+                multipart_chunksize=self.config.multipart_chunk_mb * 1024 * 1024,
+            )
+        if not s3_url:
+            upload.failed += 1
+            return None
+        upload.bytes += len(data)
+        logger.info(f"Uploaded image: {key}")
+        return s3_url, True
 
-    return result
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            **{name: stage.snapshot() for name, stage in self.stages.items()},
+            "dedup_hits": dict(self.dedup_hits),
+            "bytes_skipped": self.bytes_skipped,
+        }
 
 
 async def run_bcw_image_sync_job(
     catalog_path: Path = CATALOG_PATH,
-    batch_size: int = 5,
-    delay_between_requests: float = 1.0,
+    config: Optional[ImageSyncConfig] = None,
 ) -> SyncResult:
     """
     Main job to sync BCW product images.
 
     Args:
         catalog_path: Path to the BCW catalog Excel file
-        batch_size: Number of concurrent requests
-        delay_between_requests: Delay in seconds between batches
+        config: Stage sizes (ImageSyncConfig defaults if omitted)
 
     Returns:
-        SyncResult with statistics
+        SyncResult with statistics and per-stage metrics
     """
     job_name = "bcw_image_sync"
+    config = config or ImageSyncConfig()
     start_time = datetime.now(timezone.utc)
     logger.info(f"[{job_name}] Starting BCW image sync")
 
@@ -286,95 +518,118 @@ async def run_bcw_image_sync_job(
         )
 
     total_products = len(products)
-    products_processed = 0
-    products_with_images = 0
-    total_images = 0
-
-    async with AsyncSessionLocal() as db:
-        storage = StorageService()
-
-        if not storage.is_configured():
-            logger.error(f"[{job_name}] S3 storage not configured")
-            return SyncResult(
-                total_products=total_products,
-                products_processed=0,
-                products_with_images=0,
-                total_images_uploaded=0,
-                errors=["S3 storage not configured"],
-                duration_ms=0,
-            )
+    storage = StorageService()
 
-        # Process products in batches
-        async with httpx.AsyncClient(
-            timeout=30.0,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            }
-        ) as client:
-
-            for i in range(0, len(products), batch_size):
-                batch = products[i:i + batch_size]
-
-                tasks = [
-                    process_product(
-                        client=client,
-                        storage=storage,
-                        db=db,
-                        bcw_sku=p['BCW-SKU'],
-                        mdm_sku=p['MDM-SKU'],
-                        product_url=p['URL'],
-                        product_name=p['BCW-NAME'],
-                    )
-                    for p in batch
-                ]
-
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                for result in results:
-                    if isinstance(result, Exception):
-                        errors.append(str(result))
-                        continue
-
-                    products_processed += 1
-                    if result.images_uploaded > 0:
-                        products_with_images += 1
-                        total_images += result.images_uploaded
-
-                    if result.error:
-                        errors.append(f"{result.bcw_sku}: {result.error}")
+    if not storage.is_configured():
+        logger.error(f"[{job_name}] S3 storage not configured")
+        return SyncResult(
+            total_products=total_products,
+            products_processed=0,
+            products_with_images=0,
+            total_images_uploaded=0,
+            errors=["S3 storage not configured"],
+            duration_ms=0,
+        )
 
+    totals = {"processed": 0, "with_images": 0, "uploaded": 0, "reused": 0}
+    pending_products: asyncio.Queue = asyncio.Queue()
+    for product in products:
+        pending_products.put_nowait(product)
+    finished: asyncio.Queue = asyncio.Queue(maxsize=config.products_in_flight)
+
+    limits = httpx.Limits(max_connections=config.page_concurrency + config.download_concurrency)
+    async with httpx.AsyncClient(
+        timeout=30.0,
+        limits=limits,
+        headers={
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+        }
+    ) as client:
+        pipeline = BCWImagePipeline(client, storage, config)
+
+        async def product_worker() -> None:
+            while True:
+                try:
+                    p = pending_products.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    result = await pipeline.process(p['BCW-SKU'], p['MDM-SKU'], p['URL'])
+                except Exception as e:
+                    result = e
+                await finished.put(result)
+
+        async def writer() -> None:
+            batch: List[ImageResult] = []
+
+            async def flush() -> None:
+                if not batch:
+                    return
+                write = pipeline.stages["write"]
+                async with write.slot():
+                    try:
+                        async with AsyncSessionLocal() as db:
+                            await write_image_batch(db, batch)
+                    except Exception as e:
+                        write.failed += 1
+                        errors.append(f"write batch: {e}")
+                batch.clear()
                 logger.info(
-                    f"[{job_name}] Progress: {products_processed}/{total_products} "
-                    f"({products_with_images} with images, {total_images} total images)"
+                    f"[{job_name}] Progress: {totals['processed']}/{total_products} "
+                    f"({totals['with_images']} with images, {totals['uploaded']} uploaded, "
+                    f"{totals['reused']} reused)"
                 )
 
-                # Commit after each batch
-                await db.commit()
-
-                # Rate limiting
-                if i + batch_size < len(products):
-                    await asyncio.sleep(delay_between_requests)
+            for _ in range(total_products):
+                result = await finished.get()
+                if isinstance(result, Exception):
+                    errors.append(str(result))
+                    continue
+                totals["processed"] += 1
+                if result.image_urls:
+                    totals["with_images"] += 1
+                totals["uploaded"] += result.images_uploaded
+                totals["reused"] += result.images_reused
+                if result.error:
+                    errors.append(f"{result.bcw_sku}: {result.error}")
+                batch.append(result)
+                if len(batch) >= config.db_batch_size:
+                    await flush()
+            await flush()
+
+        workers = [
+            asyncio.create_task(product_worker())
+            for _ in range(max(1, min(config.products_in_flight, total_products)))
+        ]
+        await asyncio.gather(writer(), *workers)
 
     duration_ms = int((datetime.now(timezone.utc) - start_time).total_seconds() * 1000)
+    stages = pipeline.metrics()
 
     logger.info(
-        f"[{job_name}] Complete: {products_processed}/{total_products} products, "
-        f"{products_with_images} with images, {total_images} images uploaded, "
-        f"{len(errors)} errors, {duration_ms}ms"
+        f"[{job_name}] Complete: {totals['processed']}/{total_products} products, "
+        f"{totals['with_images']} with images, {totals['uploaded']} images uploaded, "
+        f"{totals['reused']} reused, {len(errors)} errors, {duration_ms}ms"
     )
+    logger.info(f"[{job_name}] Stages: {stages}")
 
     return SyncResult(
         total_products=total_products,
-        products_processed=products_processed,
-        products_with_images=products_with_images,
-        total_images_uploaded=total_images,
+        products_processed=totals["processed"],
+        products_with_images=totals["with_images"],
+        total_images_uploaded=totals["uploaded"],
         errors=errors[:20],  # Limit error list
         duration_ms=duration_ms,
+        total_images_reused=totals["reused"],
+        stages=stages,
     )
 
 
 # CLI entry point
 if __name__ == "__main__":
+    import argparse
+    import dataclasses
+    import json
     import sys
 
     logging.basicConfig(
@@ -382,7 +637,20 @@ if __name__ == "__main__":
         format="%(asctime)s [%(levelname)s] %(message)s",
     )
 
-    result = asyncio.run(run_bcw_image_sync_job())
+    parser = argparse.ArgumentParser(description="Sync BCW product images to S3")
+    parser.add_argument("--catalog", type=Path, default=CATALOG_PATH)
+    for config_field in dataclasses.fields(ImageSyncConfig):
+        parser.add_argument(
+            f"--{config_field.name.replace('_', '-')}",
+            type=type(config_field.default),
+            default=config_field.default,
+        )
+    args = parser.parse_args()
+    sync_config = ImageSyncConfig(**{
+        f.name: getattr(args, f.name) for f in dataclasses.fields(ImageSyncConfig)
+    })
+
+    result = asyncio.run(run_bcw_image_sync_job(args.catalog, sync_config))
 
     print("\n" + "=" * 50)
     print("BCW IMAGE SYNC COMPLETE")
@@ -391,8 +659,11 @@ if __name__ == "__main__":
     print(f"Products processed:  {result.products_processed}")
     print(f"Products with images: {result.products_with_images}")
     print(f"Total images uploaded: {result.total_images_uploaded}")
+    print(f"Images reused:       {result.total_images_reused}")
     print(f"Errors:              {len(result.errors)}")
     print(f"Duration:            {result.duration_ms}ms")
+    print("\nStages:")
+    print(json.dumps(result.stages, indent=2))
 
     if result.errors:
         print("\nErrors:")
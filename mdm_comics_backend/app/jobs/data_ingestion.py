@@ -1,11 +1,16 @@
 """
-Data Ingestion Jobs v1.0.0
+Data Ingestion Jobs v1.1.0
 
 Background jobs for data ingestion operations using arq.
 
 These jobs wrap the DataIngestionService for async execution,
 providing progress tracking, checkpointing, and error handling.
 
+v1.1.0 (PERF-041): CSV/JSON jobs are resumable. The source position is
+saved to pipeline_checkpoints.state_data with every committed batch,
+keyed by the file's path, size and mtime; re-running the job on the same
+unchanged file continues after the last committed batch.
+
 Usage:
     # Queue a job via API
     POST /api/admin/ingest-data
@@ -20,9 +25,11 @@ Usage:
     await run_csv_ingestion_job(ctx, source="pricecharting", file_path="...", table="comic_issues")
 """
 
+import json
 import logging
+import os
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 from sqlalchemy import text
 
@@ -55,6 +62,8 @@ async def run_csv_ingestion_job(
     skip_existing: bool = True,
     update_existing: bool = False,
     field_mapping: Optional[Dict[str, str]] = None,
+    conflict_columns: Optional[List[str]] = None,
+    resume: bool = True,
 ) -> Dict[str, Any]:
     """
     Background job for CSV ingestion.
@@ -68,6 +77,8 @@ async def run_csv_ingestion_job(
         skip_existing: Skip duplicate records
         update_existing: Update existing records on conflict
         field_mapping: Source-to-DB field mapping
+        conflict_columns: Upsert key (default: table's first unique key in the data)
+        resume: Continue after the last committed batch of an interrupted run
 
     Returns:
         Dict with job results
@@ -88,7 +99,9 @@ async def run_csv_ingestion_job(
                 skip_existing=skip_existing,
                 update_existing=update_existing,
                 field_mapping=field_mapping or {},
+                conflict_columns=conflict_columns or [],
             )
+            await _configure_resume(db, job_name, file_path, options, resume)
 
             # Add common transformers based on source
             options.transformers = _get_source_transformers(source)
@@ -111,6 +124,8 @@ async def run_csv_ingestion_job(
                 total_updated=stats.inserted + stats.updated,
                 total_errors=stats.errors,
             )
+            if stats.errors < options.error_threshold:
+                await _clear_resume_position(db, job_name)
 
             result = {
                 "status": "completed",
@@ -123,6 +138,7 @@ async def run_csv_ingestion_job(
 
         except Exception as e:
             logger.error(f"[{job_name}] Job failed: {e}")
+            await db.rollback()
 
             # Update checkpoint with error
             await _update_checkpoint(
@@ -154,6 +170,8 @@ async def run_json_ingestion_job(
     skip_existing: bool = True,
     update_existing: bool = False,
     field_mapping: Optional[Dict[str, str]] = None,
+    conflict_columns: Optional[List[str]] = None,
+    resume: bool = True,
 ) -> Dict[str, Any]:
     """
     Background job for JSON ingestion.
@@ -168,6 +186,8 @@ async def run_json_ingestion_job(
         skip_existing: Skip duplicate records
         update_existing: Update existing records on conflict
         field_mapping: Source-to-DB field mapping
+        conflict_columns: Upsert key (default: table's first unique key in the data)
+        resume: Continue after the last committed batch of an interrupted run
 
     Returns:
         Dict with job results
@@ -185,8 +205,10 @@ async def run_json_ingestion_job(
                 skip_existing=skip_existing,
                 update_existing=update_existing,
                 field_mapping=field_mapping or {},
+                conflict_columns=conflict_columns or [],
             )
             options.transformers = _get_source_transformers(source)
+            await _configure_resume(db, job_name, file_path, options, resume)
 
             service = DataIngestionService(db)
             stats = await service.ingest_json(
@@ -205,6 +227,8 @@ async def run_json_ingestion_job(
                 total_updated=stats.inserted + stats.updated,
                 total_errors=stats.errors,
             )
+            if stats.errors < options.error_threshold:
+                await _clear_resume_position(db, job_name)
 
             result = {
                 "status": "completed",
@@ -217,6 +241,7 @@ async def run_json_ingestion_job(
 
         except Exception as e:
             logger.error(f"[{job_name}] Job failed: {e}")
+            await db.rollback()
 
             await _update_checkpoint(
                 db,
@@ -242,6 +267,7 @@ async def run_cover_folder_ingestion_job(
     folder_path: str,
     user_id: int,
     limit: Optional[int] = None,
+    bulk: bool = True,
 ) -> Dict[str, Any]:
     """
     Background job for cover folder ingestion.
@@ -254,6 +280,7 @@ async def run_cover_folder_ingestion_job(
         folder_path: Path to folder containing cover images
         user_id: User ID performing ingestion
         limit: Max files to process (for testing)
+        bulk: Use CoverIngestionService.ingest_folder_bulk (default)
 
     Returns:
         Dict with job results
@@ -270,7 +297,8 @@ async def run_cover_folder_ingestion_job(
             from app.services.cover_ingestion import CoverIngestionService
 
             service = CoverIngestionService(db)
-            result = await service.ingest_folder(
+            ingest = service.ingest_folder_bulk if bulk else service.ingest_folder
+            result = await ingest(
                 folder_path=folder_path,
                 user_id=user_id,
                 limit=limit,
@@ -364,6 +392,53 @@ async def _update_checkpoint(
     await db.commit()
 
 
+def _file_signature(file_path: str) -> Dict[str, Any]:
+    """Identifies one version of a source file for resume."""
+    st = os.stat(file_path)
+    return {"file": os.path.abspath(file_path), "size": st.st_size, "mtime": int(st.st_mtime)}
+
+
+async def _load_resume_position(db, job_name: str, signature: Dict[str, Any]) -> int:
+    """Source position committed by an interrupted run on this same file."""
+    result = await db.execute(
+        text("SELECT state_data FROM pipeline_checkpoints WHERE job_name = :job_name"),
+        {"job_name": job_name},
+    )
+    row = result.fetchone()
+    state = row.state_data if row and isinstance(row.state_data, dict) else {}
+    if all(state.get(key) == value for key, value in signature.items()):
+        return int(state.get("position") or 0)
+    return 0
+
+
+def _resume_position_saver(db, job_name: str, signature: Dict[str, Any]) -> Callable[[int], Awaitable[None]]:
+    """Checkpoint callback: runs inside each batch's transaction (no commit)."""
+    async def save(position: int) -> None:
+        await db.execute(text("""
+            UPDATE pipeline_checkpoints
+            SET state_data = CAST(:state AS json), updated_at = NOW()
+            WHERE job_name = :job_name
+        """), {"job_name": job_name, "state": json.dumps({**signature, "position": position})})
+    return save
+
+
+async def _configure_resume(db, job_name: str, file_path: str, options: IngestionOptions, resume: bool) -> None:
+    signature = _file_signature(file_path)
+    if resume:
+        options.resume_from = await _load_resume_position(db, job_name, signature)
+        if options.resume_from:
+            logger.info(f"[{job_name}] Resuming after record {options.resume_from}")
+    options.checkpoint_callback = _resume_position_saver(db, job_name, signature)
+
+
+async def _clear_resume_position(db, job_name: str) -> None:
+    await db.execute(
+        text("UPDATE pipeline_checkpoints SET state_data = NULL WHERE job_name = :job_name"),
+        {"job_name": job_name},
+    )
+    await db.commit()
+
+
 def _get_source_transformers(source: str) -> Dict[str, Any]:
     """Get field transformers for a specific data source."""
     transformers = {
@@ -8,6 +8,9 @@ Classification: TIER_0
 Enforces 90-day retention policy for pipeline metrics:
 - Deletes expired records from pipeline_batch_metrics
 - Deletes expired records from api_call_metrics
+- Prunes stat_counter_hourly buckets past their 35-day window
+- Prunes drained price_change_events past their 7-day window
+- Prunes barcode_scan_receipts past their 30-day retry window
 - Logs purge proof for audit compliance
 - Runs daily via cron
 
@@ -24,6 +27,10 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import AsyncSessionLocal
+from app.services.barcode_matcher import prune_scan_receipts
+from app.services.price_events import prune_price_events
+from app.services.series_resolution import prune_series_resolutions
+from app.services.stat_counters import prune_hourly_counters
 
 logger = logging.getLogger(__name__)
 
@@ -189,6 +196,8 @@ async def run_metrics_retention_job(
         "retention_days": RETENTION_DAYS,
         "batch_metrics_purged": 0,
         "api_metrics_purged": 0,
+        "stat_counter_buckets_purged": 0,
+        "series_resolutions_purged": 0,
         "total_purged": 0,
         "purge_logged": False,
         "errors": []
@@ -226,6 +235,34 @@ async def run_metrics_retention_job(
             logger.error(f"[MetricsRetention] {error_msg}")
             summary["errors"].append(error_msg)
 
+        # Stat counter hourly buckets (short operational retention, not audited)
+        try:
+            summary["stat_counter_buckets_purged"] = await prune_hourly_counters(session)
+        except Exception as e:
+            await session.rollback()
+            logger.warning(f"[MetricsRetention] Failed to prune stat counter buckets (non-fatal): {e}")
+
+        # Expired series resolutions (cache rows, never served past their TTL)
+        try:
+            summary["series_resolutions_purged"] = await prune_series_resolutions(session)
+        except Exception as e:
+            await session.rollback()
+            logger.warning(f"[MetricsRetention] Failed to prune series resolutions (non-fatal): {e}")
+
+        # Price change events every consumer has drained
+        try:
+            summary["price_events_purged"] = await prune_price_events(session)
+        except Exception as e:
+            await session.rollback()
+            logger.warning(f"[MetricsRetention] Failed to prune price change events (non-fatal): {e}")
+
+        # Barcode scan idempotency keys no scanner will retry any more
+        try:
+            summary["scan_receipts_purged"] = await prune_scan_receipts(session)
+        except Exception as e:
+            await session.rollback()
+            logger.warning(f"[MetricsRetention] Failed to prune barcode scan receipts (non-fatal): {e}")
+
         summary["total_purged"] = summary["batch_metrics_purged"] + summary["api_metrics_purged"]
         summary["purge_logged"] = summary["total_purged"] > 0
 
@@ -1,5 +1,5 @@
 """
-Pipeline Job Scheduler v1.24.0
+Pipeline Job Scheduler v1.25.0
 
 Automated data acquisition jobs that ACTUALLY RUN.
 
@@ -36,10 +36,20 @@ Pipeline Instrumentation (v1.24.0):
 - Records API call performance per source
 - Uses adaptive stall thresholds from P95 percentiles
 - 90-day retention per governance requirements
+
+Work-Aware Scheduling (v1.25.0):
+- Single leader replica elected via Postgres advisory lock (see app.jobs.scheduling)
+- Backlog jobs re-run while their last run processed records, back off
+  exponentially while idle; periodic jobs keep their fixed interval
+- Global + per-resource (api/cpu/db) concurrency budget
+- Next-run and backlog state exposed on /api/admin/data-health/pipeline/scheduler
 """
 import asyncio
 import json
 import logging
+import os
+import socket
+import time
 import traceback
 from datetime import datetime, timedelta, date
 from decimal import Decimal
@@ -92,6 +102,11 @@ from app.jobs.pricecharting_jobs import (
 # v1.24.0: Pipeline Instrumentation (Stall Detection & Metrics)
 from app.jobs.stall_detector import run_stall_detection_job
 from app.jobs.metrics_retention import run_metrics_retention_job
+from app.jobs.scheduling import (
+    JobSpec, JobState, ConcurrencyBudget, LeaderLease,
+    RESOURCE_API, RESOURCE_CPU, RESOURCE_DB, RESOURCE_LIGHT, OUTCOME_BLOCKED,
+    classify_result, next_delay_seconds, utc_after,
+)
 from app.jobs.conventions_refresh import run_convention_refresh_job
 
 logger = logging.getLogger(__name__)
@@ -113,6 +128,10 @@ SELF_HEAL_MAX_AUTO_RESTARTS = 5  # Max auto-restarts before giving up (per 24h p
 # v1.23.0: Auto-unpause threshold (Autonomous Resilience System)
 SELF_HEAL_STALE_PAUSE_THRESHOLD_MINUTES = 30  # Auto-unpause jobs paused longer than this
 
+# v1.25.0: Leader publishes scheduler state here for the data-health endpoints
+SCHEDULER_STATE_KEY = "pipeline_scheduler:state"
+SCHEDULER_STATE_TTL_SECONDS = 300
+
 
 async def clear_stale_checkpoints(db: AsyncSession) -> int:
     """
@@ -575,6 +594,9 @@ async def run_gcd_import_job():
             await update_checkpoint(db, job_name, is_running=False)
             logger.info(f"[{job_name}] Job finished. Stats: {stats}")
 
+    # v1.25.0: Per-phase processed counts let the scheduler see remaining backlog
+    return {"status": "completed", "batch_id": batch_id, "stats": stats}
+
 
 
 async def run_funko_price_check_job():
@@ -861,6 +883,7 @@ async def run_comprehensive_enrichment_job(batch_size: int = 50, max_records: in
                 result = await db.execute(text("""
                     SELECT id, metron_id, comicvine_id, pricecharting_id,
                            issue_name, number, upc, isbn,
+                           series_name, publisher_name, series_year_began,
                            image, description, price
                     FROM comic_issues
                     WHERE (
@@ -908,6 +931,14 @@ async def run_comprehensive_enrichment_job(batch_size: int = 50, max_records: in
                                 try:
                                     if comic.metron_id:
                                         data = await adapters["metron"].fetch_by_id(str(comic.metron_id))
+                                    elif comic.series_name and comic.number:
+                                        # PERF-035: series ID comes from the series resolution store
+                                        result = await adapters["metron"].search_issues(
+                                            series_name=comic.series_name,
+                                            number=str(comic.number),
+                                            publisher_name=comic.publisher_name,
+                                        )
+                                        data = result.records[0] if result.success and result.records else None
                                     else:
                                         result = await adapters["metron"].fetch_page(q=search_query[:100])
                                         data = result.records[0] if result.success and result.records else None
@@ -921,9 +952,22 @@ async def run_comprehensive_enrichment_job(batch_size: int = 50, max_records: in
                         if "comicvine" in adapters:
                             async def query_comicvine():
                                 try:
+                                    data = None
                                     if comic.comicvine_id:
                                         data = await adapters["comicvine"].fetch_by_id(str(comic.comicvine_id))
-                                    else:
+                                    elif comic.series_name and comic.number:
+                                        # PERF-035: known volume -> exact volume + issue lookup
+                                        volume_ids = await adapters["comicvine"].resolve_volume_ids(
+                                            comic.series_name, comic.publisher_name, comic.series_year_began
+                                        )
+                                        if volume_ids:
+                                            result = await adapters["comicvine"].fetch_page(
+                                                page_size=5,
+                                                volume_id="|".join(str(v) for v in volume_ids),
+                                                issue_number=str(comic.number),
+                                            )
+                                            data = result.records[0] if result.success and result.records else None
+                                    if data is None and not comic.comicvine_id:
                                         result = await adapters["comicvine"].fetch_page(q=search_query[:100])
                                         data = result.records[0] if result.success and result.records else None
                                     return adapters["comicvine"].normalize(data) if data else {}
@@ -3672,28 +3716,162 @@ async def run_cover_date_backfill_job(batch_size: int = 5000, max_records: int =
 # MAIN SCHEDULER
 # =============================================================================
 
+def build_job_specs() -> List[JobSpec]:
+    """
+    Scheduled jobs with their resource class and scheduling mode.
+
+    v1.25.0: adaptive=True jobs work through a backlog - they re-run shortly
+    after a run that processed records and back off exponentially from
+    interval_minutes while idle. Other jobs keep a fixed interval.
+    """
+    return [
+        JobSpec("funko_price_check", run_funko_price_check_job, 60, resource=RESOURCE_API),
+        JobSpec("dlq_retry", run_dlq_retry_job, 15, resource=RESOURCE_LIGHT),
+        # v1.7.0: Daily price snapshot for AI/ML training (runs once per day at startup, then every 24h)
+        JobSpec("daily_snapshot", run_daily_snapshot_job, 1440, resource=RESOURCE_DB,
+                description="AI/ML data"),
+        # v1.8.0: HIGH-005 - Cross-reference job for GCD-to-Metron/Primary linking
+        JobSpec("cross_reference", run_cross_reference_job, 60, resource=RESOURCE_DB, adaptive=True,
+                description="GCD-Primary linking"),
+        # v1.9.0: Self-healing job - detects and restarts stalled jobs automatically
+        JobSpec("self_healing", run_self_healing_job, SELF_HEAL_CHECK_INTERVAL_MINUTES, resource=RESOURCE_LIGHT,
+                description="auto-restart stalled jobs"),
+        # v1.9.3: DEPRECATED - Use independent jobs instead (v1.23.0+)
+        # PC-ANALYSIS-2025-12-18: Removed run_full_price_sync_job (replaced by funko_price_sync + comic_price_sync)
+        # PC-ANALYSIS-2025-12-18: Removed run_pricecharting_matching_job (replaced by funko_pricecharting_match + comic_pricecharting_match)
+        # v1.10.3: Comprehensive enrichment - ALL sources, ALL fields, PARALLEL
+        JobSpec("comprehensive_enrichment", run_comprehensive_enrichment_job, 30, resource=RESOURCE_API, adaptive=True,
+                description="ALL sources, parallel"),
+        # v1.10.4: GCD Import - runs until complete
+        JobSpec("gcd_import", run_gcd_import_job, 60, resource=RESOURCE_DB, adaptive=True,
+                description="GCD dump import"),
+        # v1.10.5: Phase 3 Cover Enrichment - Covers + Creators from ComicVine
+        JobSpec("cover_enrichment", run_cover_enrichment_job, 60, resource=RESOURCE_API, adaptive=True,
+                description="Phase 3: covers + creators from ComicVine"),
+        # v1.10.8: Marvel Fandom Enrichment - Story-level credits
+        JobSpec("marvel_fandom", run_marvel_fandom_job, 60, resource=RESOURCE_API, adaptive=True,
+                description="Story-level credits from Marvel Database"),
+        # v1.12.0: UPC Backfill - Recover missing UPCs from Metron/CBR
+        JobSpec("upc_backfill", run_upc_backfill_job, 60, resource=RESOURCE_API, adaptive=True,
+                description="Multi-source UPC recovery"),
+        # v1.25.0: Convention refresh (GalaxyCon Columbus pages -> ML features)
+        JobSpec("convention_refresh", run_convention_refresh_job, 1440, initial_delay_minutes=30,
+                resource=RESOURCE_API, description="GalaxyCon pages -> ML features"),
+        # v1.13.0: Sequential Exhaustive Enrichment - ONE row at a time, ALL sources exhausted
+        JobSpec("sequential_enrichment", run_sequential_exhaustive_enrichment_job, 30, resource=RESOURCE_API,
+                adaptive=True, description="ONE row, ALL sources exhausted"),
+        # v1.21.0: Inbound cover processor - watches Inbound folder, queues to Match Review
+        JobSpec("inbound_processor", run_inbound_processor, 5, resource=RESOURCE_CPU, adaptive=True,
+                description="watch Inbound folder, queue to Match Review"),
+        # v1.21.2: Image acquisition - download external cover URLs to S3
+        JobSpec("image_acquisition", run_image_acquisition_job, 30, resource=RESOURCE_CPU, adaptive=True,
+                description="download external cover URLs to S3"),
+        # v1.22.0: BCW Dropship Integration - inventory and order sync
+        JobSpec("bcw_inventory_sync", run_bcw_inventory_sync_job, 60, resource=RESOURCE_CPU,
+                description="hot items inventory sync"),
+        JobSpec("bcw_full_inventory_sync", run_bcw_full_inventory_sync_job, 1440, resource=RESOURCE_CPU,
+                description="full inventory sync"),
+        JobSpec("bcw_order_status_sync", run_bcw_order_status_sync_job, 30, resource=RESOURCE_CPU,
+                description="poll order status"),
+        JobSpec("bcw_email_processing", run_bcw_email_processing_job, 15, resource=RESOURCE_LIGHT,
+                description="parse BCW emails"),
+        JobSpec("bcw_quote_cleanup", run_bcw_quote_cleanup_job, 60, resource=RESOURCE_LIGHT,
+                description="cleanup expired quotes"),
+        JobSpec("bcw_selector_health", run_bcw_selector_health_job, 1440, resource=RESOURCE_CPU,
+                description="validate DOM selectors"),
+        # v1.23.0: PriceCharting Independent Jobs (Autonomous Resilience System)
+        # v1.24.0: Staggered starts (15-min offsets) to prevent combined rate limit pressure
+        # Pattern: funko_match(0) -> comic_match(15) -> funko_sync(30) -> comic_sync(45)
+        JobSpec("funko_pricecharting_match", run_funko_pricecharting_match_job, 60, initial_delay_minutes=0,
+                resource=RESOURCE_API, adaptive=True, description="match Funkos to PC IDs"),
+        JobSpec("comic_pricecharting_match", run_comic_pricecharting_match_job, 60, initial_delay_minutes=15,
+                resource=RESOURCE_API, adaptive=True, description="match Comics to PC IDs"),
+        JobSpec("funko_price_sync", run_funko_price_sync_job, 60, initial_delay_minutes=30,
+                resource=RESOURCE_API, description="sync Funko prices from PC"),
+        JobSpec("comic_price_sync", run_comic_price_sync_job, 1440, initial_delay_minutes=45,
+                resource=RESOURCE_API, description="sync Comic prices from PC"),
+        # v1.24.0: Pipeline Instrumentation (Stall Detection & Metrics Retention)
+        # Stall detection runs every 2 minutes for responsive stall recovery
+        JobSpec("stall_detection", run_stall_detection_job, 2, resource=RESOURCE_LIGHT,
+                description="adaptive stall detection & self-healing"),
+        # Metrics retention runs daily at 3 AM (1440 min = 24h, delay ensures staggered start)
+        JobSpec("metrics_retention", run_metrics_retention_job, 1440, initial_delay_minutes=180,
+                resource=RESOURCE_LIGHT, description="90-day retention cleanup"),
+    ]
+
+
 class PipelineScheduler:
     """
     Main scheduler that runs all pipeline jobs.
 
     Call start() to begin background scheduling.
+
+    v1.25.0: Work-aware scheduling
+    - Only the replica holding the scheduler advisory lock runs job loops;
+      the others retry leadership every PIPELINE_LEADER_RETRY_SECONDS
+    - Backlog jobs re-run while they find work, back off while idle
+    - Jobs share a global + per-resource concurrency budget
+    - get_state() / Redis snapshot feed the data-health endpoints
     """
 
     def __init__(self):
         self._tasks = []
         self._running = False
+        self._leader_task: Optional[asyncio.Task] = None
+        self._lease: Optional[LeaderLease] = None
+        self._specs: Dict[str, JobSpec] = {}
+        self._states: Dict[str, JobState] = {}
+        self._budget: Optional[ConcurrencyBudget] = None
+        self.instance_id = f"{socket.gethostname()}:{os.getpid()}"
+
+    @property
+    def is_leader(self) -> bool:
+        return bool(self._lease and self._lease.held)
 
     async def start(self):
-        """Start all scheduled jobs."""
+        """Start leader election; job loops start once this replica leads."""
         if self._running:
             print("[SCHEDULER] Pipeline scheduler already running")
             return
 
+        from app.core.config import settings
+        from app.core.database import engine
+
         self._running = True
+        self._lease = LeaderLease(engine)
+        self._budget = ConcurrencyBudget(
+            settings.PIPELINE_MAX_CONCURRENT_JOBS,
+            {
+                RESOURCE_API: settings.PIPELINE_MAX_API_JOBS,
+                RESOURCE_CPU: settings.PIPELINE_MAX_CPU_JOBS,
+                RESOURCE_DB: settings.PIPELINE_MAX_DB_JOBS,
+            },
+        )
+        self._specs = {spec.name: spec for spec in build_job_specs()}
+        self._states = {name: JobState() for name in self._specs}
+        self._leader_task = asyncio.create_task(self._leadership_loop(settings.PIPELINE_LEADER_RETRY_SECONDS))
+
         print("=" * 60)
-        print("[SCHEDULER] PIPELINE SCHEDULER STARTED")
+        print(f"[SCHEDULER] PIPELINE SCHEDULER STARTED ({self.instance_id})")
         print("=" * 60)
 
+    async def _leadership_loop(self, retry_seconds: int):
+        """Acquire the leader lease, run job loops while it is held."""
+        while self._running:
+            try:
+                if not self._lease.held:
+                    if await self._lease.try_acquire():
+                        print(f"[SCHEDULER] {self.instance_id} elected scheduler leader")
+                        await self._start_job_loops()
+                elif not await self._lease.verify():
+                    print(f"[SCHEDULER] {self.instance_id} lost scheduler leadership")
+                    await self._stop_job_loops()
+                await self._publish_state()
+            except Exception as e:
+                logger.warning(f"[SCHEDULER] Leader election error: {e}")
+            await asyncio.sleep(retry_seconds)
+
+    async def _start_job_loops(self):
         # Clear any stale checkpoints from crashed runs
         print("[SCHEDULER] Checking for stale checkpoints...")
         try:
@@ -3706,91 +3884,19 @@ class PipelineScheduler:
         except Exception as e:
             print(f"[SCHEDULER] Warning: Could not check stale checkpoints: {e}")
 
-        # Start job loops
-        self._tasks = [
-            asyncio.create_task(self._run_job_loop("funko_price_check", run_funko_price_check_job, interval_minutes=60)),
-            asyncio.create_task(self._run_job_loop("dlq_retry", run_dlq_retry_job, interval_minutes=15)),
-            # v1.7.0: Daily price snapshot for AI/ML training (runs once per day at startup, then every 24h)
-            asyncio.create_task(self._run_job_loop("daily_snapshot", run_daily_snapshot_job, interval_minutes=1440)),
-            # v1.8.0: HIGH-005 - Cross-reference job for GCD-to-Metron/Primary linking
-            asyncio.create_task(self._run_job_loop("cross_reference", run_cross_reference_job, interval_minutes=60)),
-            # v1.9.0: Self-healing job - detects and restarts stalled jobs automatically
-            asyncio.create_task(self._run_job_loop("self_healing", run_self_healing_job, interval_minutes=SELF_HEAL_CHECK_INTERVAL_MINUTES)),
-            # v1.9.3: DEPRECATED - Use independent jobs instead (v1.23.0+)
-            # PC-ANALYSIS-2025-12-18: Removed run_full_price_sync_job (replaced by funko_price_sync + comic_price_sync)
-            # PC-ANALYSIS-2025-12-18: Removed run_pricecharting_matching_job (replaced by funko_pricecharting_match + comic_pricecharting_match)
-            # v1.10.3: Comprehensive enrichment - ALL sources, ALL fields, PARALLEL
-            asyncio.create_task(self._run_job_loop("comprehensive_enrichment", run_comprehensive_enrichment_job, interval_minutes=30)),
-            # v1.10.4: GCD Import - runs every 60 min until complete (~170k remaining)
-            asyncio.create_task(self._run_job_loop("gcd_import", run_gcd_import_job, interval_minutes=60)),
-            # v1.10.5: Phase 3 Cover Enrichment - Covers + Creators from ComicVine
-            asyncio.create_task(self._run_job_loop("cover_enrichment", run_cover_enrichment_job, interval_minutes=60)),
-            # v1.10.8: Marvel Fandom Enrichment - Story-level credits
-            asyncio.create_task(self._run_job_loop("marvel_fandom", run_marvel_fandom_job, interval_minutes=60)),
-            # v1.12.0: UPC Backfill - Recover missing UPCs from Metron/CBR
-            asyncio.create_task(self._run_job_loop("upc_backfill", run_upc_backfill_job, interval_minutes=60)),
-            # v1.25.0: Convention refresh (GalaxyCon Columbus pages -> ML features)
-            asyncio.create_task(self._run_job_loop("convention_refresh", run_convention_refresh_job, interval_minutes=1440, initial_delay_minutes=30)),
-            # v1.13.0: Sequential Exhaustive Enrichment - ONE row at a time, ALL sources exhausted
-            asyncio.create_task(self._run_job_loop("sequential_enrichment", run_sequential_exhaustive_enrichment_job, interval_minutes=30)),
-            # v1.21.0: Inbound cover processor - watches Inbound folder, queues to Match Review
-            asyncio.create_task(self._run_job_loop("inbound_processor", run_inbound_processor, interval_minutes=5)),
-            # v1.21.2: Image acquisition - download external cover URLs to S3
-            asyncio.create_task(self._run_job_loop("image_acquisition", run_image_acquisition_job, interval_minutes=30)),
-            # v1.22.0: BCW Dropship Integration - inventory and order sync
-            asyncio.create_task(self._run_job_loop("bcw_inventory_sync", run_bcw_inventory_sync_job, interval_minutes=60)),
-            asyncio.create_task(self._run_job_loop("bcw_full_inventory_sync", run_bcw_full_inventory_sync_job, interval_minutes=1440)),
-            asyncio.create_task(self._run_job_loop("bcw_order_status_sync", run_bcw_order_status_sync_job, interval_minutes=30)),
-            asyncio.create_task(self._run_job_loop("bcw_email_processing", run_bcw_email_processing_job, interval_minutes=15)),
-            asyncio.create_task(self._run_job_loop("bcw_quote_cleanup", run_bcw_quote_cleanup_job, interval_minutes=60)),
-            asyncio.create_task(self._run_job_loop("bcw_selector_health", run_bcw_selector_health_job, interval_minutes=1440)),
-            # v1.23.0: PriceCharting Independent Jobs (Autonomous Resilience System)
-            # v1.24.0: Staggered starts (15-min offsets) to prevent combined rate limit pressure
-            # Pattern: funko_match(0) -> comic_match(15) -> funko_sync(30) -> comic_sync(45)
-            asyncio.create_task(self._run_job_loop("funko_pricecharting_match", run_funko_pricecharting_match_job, interval_minutes=60, initial_delay_minutes=0)),
-            asyncio.create_task(self._run_job_loop("comic_pricecharting_match", run_comic_pricecharting_match_job, interval_minutes=60, initial_delay_minutes=15)),
-            asyncio.create_task(self._run_job_loop("funko_price_sync", run_funko_price_sync_job, interval_minutes=60, initial_delay_minutes=30)),
-            asyncio.create_task(self._run_job_loop("comic_price_sync", run_comic_price_sync_job, interval_minutes=1440, initial_delay_minutes=45)),
-            # v1.24.0: Pipeline Instrumentation (Stall Detection & Metrics Retention)
-            # Stall detection runs every 2 minutes for responsive stall recovery
-            asyncio.create_task(self._run_job_loop("stall_detection", run_stall_detection_job, interval_minutes=2)),
-            # Metrics retention runs daily at 3 AM (1440 min = 24h, delay ensures staggered start)
-            asyncio.create_task(self._run_job_loop("metrics_retention", run_metrics_retention_job, interval_minutes=1440, initial_delay_minutes=180)),
-        ]
+        self._tasks = [asyncio.create_task(self._run_job_loop(spec)) for spec in self._specs.values()]
 
         print("[SCHEDULER] Scheduled jobs:")
-        print("[SCHEDULER]   - comic_enrichment: every 30 minutes")
-        print("[SCHEDULER]   - funko_price_check: every 60 minutes")
-        print("[SCHEDULER]   - dlq_retry: every 15 minutes")
-        print("[SCHEDULER]   - daily_snapshot: every 24 hours (AI/ML data)")
-        print("[SCHEDULER]   - cross_reference: every 60 minutes (GCD-Primary linking)")
-        print(f"[SCHEDULER]   - self_healing: every {SELF_HEAL_CHECK_INTERVAL_MINUTES} minutes (auto-restart stalled jobs)")
-        # PC-ANALYSIS-2025-12-18: Removed deprecated jobs (replaced by independent v1.23.0 jobs)
-        print("[SCHEDULER]   - comprehensive_enrichment: every 30 minutes (ALL sources, parallel)")
-        print("[SCHEDULER]   - gcd_import: every 60 minutes (finish remaining ~170k records)")
-        print("[SCHEDULER]   - cover_enrichment: every 60 minutes (Phase 3: covers + creators from ComicVine)")
-        print("[SCHEDULER]   - marvel_fandom: every 60 minutes (Story-level credits from Marvel Database)")
-        print("[SCHEDULER]   - sequential_enrichment: every 30 minutes (ONE row, ALL sources exhausted)")
-        print("[SCHEDULER]   - inbound_processor: every 5 minutes (watch Inbound folder, queue to Match Review)")
-        print("[SCHEDULER]   - image_acquisition: every 30 minutes (download external cover URLs to S3)")
-        print("[SCHEDULER]   - bcw_inventory_sync: every 60 minutes (hot items inventory sync)")
-        print("[SCHEDULER]   - bcw_full_inventory_sync: every 24 hours (full inventory sync)")
-        print("[SCHEDULER]   - bcw_order_status_sync: every 30 minutes (poll order status)")
-        print("[SCHEDULER]   - bcw_email_processing: every 15 minutes (parse BCW emails)")
-        print("[SCHEDULER]   - bcw_quote_cleanup: every 60 minutes (cleanup expired quotes)")
-        print("[SCHEDULER]   - bcw_selector_health: every 24 hours (validate DOM selectors)")
-        print("[SCHEDULER]   - convention_refresh: every 24 hours, delay=30min (GalaxyCon pages -> ML features)")
-        print("[SCHEDULER]   - funko_pricecharting_match: every 60 minutes, delay=0min (match Funkos to PC IDs)")
-        print("[SCHEDULER]   - comic_pricecharting_match: every 60 minutes, delay=15min (match Comics to PC IDs)")
-        print("[SCHEDULER]   - funko_price_sync: every 60 minutes, delay=30min (sync Funko prices from PC)")
-        print("[SCHEDULER]   - comic_price_sync: every 24 hours, delay=45min (sync Comic prices from PC)")
-        print("[SCHEDULER]   - stall_detection: every 2 minutes (adaptive stall detection & self-healing)")
-        print("[SCHEDULER]   - metrics_retention: every 24 hours, delay=3h (90-day retention cleanup)")
+        for spec in self._specs.values():
+            every = f"every {spec.interval_minutes} minutes"
+            if spec.adaptive:
+                every = f"backlog-driven, idle base {spec.interval_minutes} minutes"
+            delay = f", delay={spec.initial_delay_minutes}min" if spec.initial_delay_minutes else ""
+            note = f" ({spec.description})" if spec.description else ""
+            print(f"[SCHEDULER]   - {spec.name}: {every}{delay} [{spec.resource}]{note}")
         print("[SCHEDULER] Jobs will start after 5 second delay...")
 
-    async def stop(self):
-        """Stop all scheduled jobs."""
-        self._running = False
+    async def _stop_job_loops(self):
         for task in self._tasks:
             task.cancel()
             try:
@@ -3798,39 +3904,122 @@ class PipelineScheduler:
             except asyncio.CancelledError:
                 pass
         self._tasks = []
+        for state in self._states.values():
+            state.status = "scheduled"
+            state.next_run_at = None
+
+    async def stop(self):
+        """Stop all scheduled jobs and give up leadership."""
+        self._running = False
+        if self._leader_task:
+            self._leader_task.cancel()
+            try:
+                await self._leader_task
+            except asyncio.CancelledError:
+                pass
+            self._leader_task = None
+        await self._stop_job_loops()
+        if self._lease:
+            await self._lease.release()
         logger.info("Pipeline scheduler stopped")
 
-    async def _run_job_loop(self, name: str, job_func, interval_minutes: int, initial_delay_minutes: int = 0):
+    async def _run_job_loop(self, spec: JobSpec):
         """
-        Run a job on a schedule.
+        Run a job until the scheduler stops.
 
         v1.24.0: Added initial_delay_minutes for job staggering to prevent
         simultaneous API calls from multiple jobs hitting the same rate limiter.
-
-        Args:
-            name: Job name for logging
-            job_func: Async function to call
-            interval_minutes: Time between runs
-            initial_delay_minutes: Initial delay before first run (for staggering)
+        v1.25.0: Delay between runs comes from the run's outcome
+        (see next_delay_seconds); each run holds a concurrency budget slot.
         """
-        interval_seconds = interval_minutes * 60
+        name = spec.name
+        state = self._states[name]
 
         # Initial delay to stagger job starts (v1.24.0: configurable per-job)
-        initial_delay_seconds = 5 + (initial_delay_minutes * 60)
-        if initial_delay_minutes > 0:
-            logger.info(f"[SCHEDULER] {name} will start after {initial_delay_minutes}min delay")
+        initial_delay_seconds = 5 + (spec.initial_delay_minutes * 60)
+        if spec.initial_delay_minutes > 0:
+            logger.info(f"[SCHEDULER] {name} will start after {spec.initial_delay_minutes}min delay")
+        state.next_run_at = utc_after(initial_delay_seconds)
         await asyncio.sleep(initial_delay_seconds)
 
         while self._running:
+            state.status = "waiting_budget"
+            async with self._budget.slot(spec.resource, name):
+                state.status = "running"
+                state.last_started_at = utcnow()
+                started = time.monotonic()
+                try:
+                    print(f"[SCHEDULER] Running {name}...")
+                    result = await spec.func()
+                    outcome, processed = classify_result(result)
+                    state.last_error = None
+                    print(f"[SCHEDULER] Job {name} completed ({outcome}, processed={processed})")
+                except Exception as e:
+                    outcome, processed = OUTCOME_BLOCKED, None
+                    state.last_error = str(e)[:500]
+                    print(f"[SCHEDULER] Job {name} failed: {e}")
+
+            state.runs += 1
+            state.last_finished_at = utcnow()
+            state.last_duration_seconds = round(time.monotonic() - started, 3)
+            state.last_outcome = outcome
+            state.last_processed = processed
+            delay = next_delay_seconds(spec, state, outcome)
+            state.status = "scheduled"
+            state.next_run_at = utc_after(delay)
+            await self._publish_state()
+
+            print(f"[SCHEDULER] Next {name} run in {delay / 60:.1f} minutes")
+            await asyncio.sleep(delay)
+
+    def get_state(self) -> Dict[str, Any]:
+        """Scheduler state for the data-health endpoints."""
+        return {
+            "instance_id": self.instance_id,
+            "is_leader": self.is_leader,
+            "running": self._running,
+            "updated_at": utcnow().isoformat(),
+            "budget": self._budget.to_dict() if self._budget else None,
+            "jobs": {
+                name: {
+                    "resource": spec.resource,
+                    "adaptive": spec.adaptive,
+                    "interval_minutes": spec.interval_minutes,
+                    **self._states[name].to_dict(),
+                }
+                for name, spec in self._specs.items()
+            },
+        }
+
+    async def _publish_state(self):
+        """Leader shares its state so any replica can serve it."""
+        if not self.is_leader:
+            return
+        from app.core.redis_client import get_redis
+
+        client = await get_redis()
+        if not client:
+            return
+        try:
+            await client.set(SCHEDULER_STATE_KEY, json.dumps(self.get_state()), ex=SCHEDULER_STATE_TTL_SECONDS)
+        except Exception as e:
+            logger.debug(f"[SCHEDULER] Failed to publish state: {e}")
+
+    async def get_cluster_state(self) -> Dict[str, Any]:
+        """State from the leader: local if we lead, else the leader's Redis snapshot."""
+        if self.is_leader:
+            return self.get_state()
+        from app.core.redis_client import get_redis
+
+        client = await get_redis()
+        if client:
             try:
-                print(f"[SCHEDULER] Running {name}...")
-                await job_func()
-                print(f"[SCHEDULER] Job {name} completed")
+                raw = await client.get(SCHEDULER_STATE_KEY)
+                if raw:
+                    return json.loads(raw)
             except Exception as e:
-                print(f"[SCHEDULER] Job {name} failed: {e}")
-
-            print(f"[SCHEDULER] Next {name} run in {interval_minutes} minutes")
-            await asyncio.sleep(interval_seconds)
+                logger.debug(f"[SCHEDULER] Failed to read leader state: {e}")
+        return {**self.get_state(), "jobs": {}, "leader_state_unavailable": True}
 
     async def run_job_now(self, job_name: str, **kwargs):
         """
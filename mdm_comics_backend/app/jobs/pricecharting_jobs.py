@@ -1,5 +1,5 @@
 """
-PriceCharting Independent Jobs v1.3.0
+PriceCharting Independent Jobs v1.4.0
 
 Document ID: IMPL-PC-2025-12-17
 Status: APPROVED
@@ -19,6 +19,12 @@ Architecture:
 - Checkpoints are persisted per job
 - Self-healer can auto-resume paused jobs
 
+v1.4.0 Changes:
+- Price-guide diff sync mode (PRICECHARTING_SYNC_MODE=bulk): the price sync
+  jobs first diff PriceCharting's bulk price-guide CSV against current prices
+  in one set-based pass (app.services.price_guide_sync), then fall back to
+  per-item API calls only for matched items the guide did not cover
+
 v1.3.0 Changes (PC-OPT-2024-001 Phase 5):
 - Per-job circuit breaker isolation - one job failing won't affect others
 - Job-specific circuit breaker configuration (match vs sync)
@@ -64,6 +70,7 @@ from app.core.job_circuit_breaker import (
 )
 from app.core.search_cache import pricecharting_search_cache
 from app.services.match_scoring import find_best_match, MATCH_THRESHOLD
+from app.services.price_guide_sync import sync_from_price_guide
 from app.services.pipeline_metrics import (
     pipeline_metrics,
     PipelineType,
@@ -96,10 +103,21 @@ PC_PRICE_ALERT_THRESHOLD = float(os.getenv("PRICECHARTING_PRICE_ALERT_PCT", "20.
 # PHASE 2 (IMPL-2025-12-21-PC-REFACTOR): Force sync bypasses staleness check
 PC_FORCE_SYNC = os.getenv("PRICECHARTING_FORCE_SYNC", "false").lower() in ("true", "1", "yes")
 
+# v1.4.0: Price sync mode - "api" (one request per item) or "bulk" (price-guide
+# CSV diff, per-item API only for items missing from the guide)
+PC_SYNC_MODE = os.getenv("PRICECHARTING_SYNC_MODE", "api").lower()
+
+# v1.4.0: Price-guide source per entity - a local CSV path or a PriceCharting
+# category to download
+PC_PRICE_GUIDE_SOURCES = {
+    "funko": os.getenv("PRICECHARTING_FUNKO_PRICE_GUIDE", "funko-pops"),
+    "comic": os.getenv("PRICECHARTING_COMIC_PRICE_GUIDE", "comic-books"),
+}
+
 logger.info(
     f"[pricecharting_jobs] Config loaded: batch_size={PC_BATCH_SIZE}, "
     f"staleness_hours={PC_STALENESS_HOURS}, daily_quota={PC_DAILY_QUOTA_LIMIT}, "
-    f"force_sync={PC_FORCE_SYNC}"
+    f"force_sync={PC_FORCE_SYNC}, sync_mode={PC_SYNC_MODE}"
 )
 
 
@@ -168,6 +186,48 @@ class APIQuotaTracker:
 pc_quota_tracker = APIQuotaTracker(PC_DAILY_QUOTA_LIMIT)
 
 
+async def run_price_guide_pass(
+    db: AsyncSession,
+    job_name: str,
+    entity: str,
+    batch_id: str,
+    pc_token: str,
+    stats: dict,
+) -> bool:
+    """
+    v1.4.0: Bulk price-guide diff ahead of the per-item loop.
+
+    Folds the guide counts into the job stats. Rows the guide refreshed are
+    marked synced, so the per-item loop that follows only sees the rest.
+    A failed guide pass is logged and left to the per-item fallback
+    (returns False).
+    """
+    try:
+        guide = await sync_from_price_guide(
+            db,
+            entity,
+            batch_id,
+            source=PC_PRICE_GUIDE_SOURCES[entity],
+            token=pc_token,
+            force=PC_FORCE_SYNC,
+            staleness_hours=PC_STALENESS_HOURS,
+            alert_pct=PC_PRICE_ALERT_THRESHOLD,
+        )
+    except Exception as e:
+        logger.warning(f"[{job_name}] Price-guide pass failed, using per-item sync: {e}")
+        stats["price_guide"] = {"error": str(e)}
+        return False
+
+    if guide["downloaded"]:
+        pc_quota_tracker.record_call(job_name)
+    stats["price_guide"] = guide
+    stats["processed"] += guide["matched"]
+    stats["updated"] += guide["updated"]
+    stats["changelog_recorded"] = stats.get("changelog_recorded", 0) + guide["changelog_recorded"]
+    stats["significant_changes"] = stats.get("significant_changes", 0) + guide["significant_changes"]
+    return True
+
+
 # =============================================================================
 # CACHED SEARCH HELPER (v1.1.0 - PC-OPT-2024-001 Phase 1)
 # =============================================================================
@@ -1030,16 +1090,20 @@ async def run_comic_pricecharting_match_job(
 
 async def run_funko_price_sync_job(
     batch_size: int = None,  # Uses PC_BATCH_SIZE if not specified
-    max_records: int = 0
+    max_records: int = 0,
+    mode: str = None,  # Uses PC_SYNC_MODE if not specified
 ) -> dict:
     """
     Independent job to sync prices for Funkos with pricecharting_id.
 
     Fetches current prices from PriceCharting API and updates the database.
+    v1.4.0: In "bulk" mode the price-guide CSV is diffed first and the
+    per-item API loop only handles items the guide did not refresh.
 
     Args:
         batch_size: Records per batch
         max_records: Limit (0 = unlimited)
+        mode: "api" or "bulk"
 
     Returns:
         Job result statistics
@@ -1158,6 +1222,13 @@ async def run_funko_price_sync_job(
             state_data = checkpoint.get("state_data", {})
             last_id = state_data.get("last_id", 0) if isinstance(state_data, dict) else 0
 
+            # v1.4.0: Guide pass first; it marks refreshed rows synced, so the
+            # per-item loop must honour staleness even under FORCE_SYNC
+            force_sync = PC_FORCE_SYNC
+            if (mode or PC_SYNC_MODE) == "bulk":
+                if await run_price_guide_pass(db, job_name, "funko", batch_id, pc_token, stats):
+                    force_sync = False
+
             async with get_pricecharting_client() as client:
                 while True:
                     # v1.3.0: Job-isolated circuit breaker check
@@ -1181,7 +1252,7 @@ async def run_funko_price_sync_job(
                     # v1.1.0: Incremental sync - only fetch stale records
                     # Phase 2: Use configurable staleness threshold (PC_STALENESS_HOURS)
                     # IMPL-2025-12-21-PC-REFACTOR: PRICECHARTING_FORCE_SYNC bypasses staleness
-                    if PC_FORCE_SYNC:
+                    if force_sync:
                         result = await db.execute(text("""
                             SELECT
                               f.id,
@@ -1233,7 +1304,7 @@ async def run_funko_price_sync_job(
                     funkos = result.fetchall()
 
                     if not funkos:
-                        logger.info(f"[{job_name}] No {'Funkos' if PC_FORCE_SYNC else 'stale Funkos'} to sync (Force Mode: {PC_FORCE_SYNC}), cycle complete")
+                        logger.info(f"[{job_name}] No {'Funkos' if force_sync else 'stale Funkos'} to sync (Force Mode: {force_sync}), cycle complete")
                         last_id = 0  # Reset for next run
                         break
 
@@ -1488,16 +1559,20 @@ async def run_funko_price_sync_job(
 
 async def run_comic_price_sync_job(
     batch_size: int = None,  # Uses PC_BATCH_SIZE if not specified
-    max_records: int = 0
+    max_records: int = 0,
+    mode: str = None,  # Uses PC_SYNC_MODE if not specified
 ) -> dict:
     """
     Independent job to sync prices for Comics with pricecharting_id.
 
     Fetches current prices from PriceCharting API and updates the database.
+    v1.4.0: In "bulk" mode the price-guide CSV is diffed first and the
+    per-item API loop only handles items the guide did not refresh.
 
     Args:
         batch_size: Records per batch
         max_records: Limit (0 = unlimited)
+        mode: "api" or "bulk"
 
     Returns:
         Job result statistics
@@ -1557,6 +1632,13 @@ async def run_comic_price_sync_job(
             state_data = checkpoint.get("state_data", {})
             last_id = state_data.get("last_id", 0) if isinstance(state_data, dict) else 0
 
+            # v1.4.0: Guide pass first; it marks refreshed rows synced, so the
+            # per-item loop must honour staleness even under FORCE_SYNC
+            force_sync = PC_FORCE_SYNC
+            if (mode or PC_SYNC_MODE) == "bulk":
+                if await run_price_guide_pass(db, job_name, "comic", batch_id, pc_token, stats):
+                    force_sync = False
+
             async with get_pricecharting_client() as client:
                 while True:
                     # v1.3.0: Job-isolated circuit breaker check
@@ -1579,7 +1661,7 @@ async def run_comic_price_sync_job(
                     # v1.1.0: Incremental sync - only fetch stale records
                     # Phase 2: Use configurable staleness threshold (PC_STALENESS_HOURS)
                     # IMPL-2025-12-21-PC-REFACTOR PHASE 2: Force sync bypasses staleness check
-                    if PC_FORCE_SYNC:
+                    if force_sync:
                         result = await db.execute(text("""
                             SELECT id, pricecharting_id, price_guide_value
                             FROM comic_issues
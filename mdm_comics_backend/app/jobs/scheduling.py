@@ -0,0 +1,304 @@
+"""
+Pipeline Scheduling Primitives v1.0.0
+
+Building blocks for the work-aware PipelineScheduler:
+
+- JobSpec / JobState: static job definition and live scheduling state
+- classify_result / next_delay_seconds: turn a job's own result dict
+  (status + stats.processed) into the delay before its next run.
+  Backlog jobs re-run almost immediately while they keep finding work
+  and back off exponentially while idle; periodic jobs keep a fixed interval.
+- ConcurrencyBudget: global + per-resource-class slots so API-heavy and
+  CPU-heavy jobs cannot pile up on each other
+- LeaderLease: Postgres session advisory lock so only one replica runs
+  the scheduler loops
+"""
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+# Delay before re-running a job whose last run still found work
+BUSY_DELAY_SECONDS = 10
+# Idle backoff never exceeds this, whatever the job's factor
+MAX_BACKOFF_SECONDS = 24 * 60 * 60
+
+# Resource classes. "light" jobs (stall detection, cleanups) bypass the
+# budget so health checks still run when every slot is taken.
+RESOURCE_API = "api"
+RESOURCE_CPU = "cpu"
+RESOURCE_DB = "db"
+RESOURCE_LIGHT = "light"
+
+# Run outcomes
+OUTCOME_BUSY = "busy"          # processed > 0, more work likely
+OUTCOME_IDLE = "idle"          # processed == 0, nothing to do
+OUTCOME_BLOCKED = "blocked"    # error / circuit open, back off
+OUTCOME_HELD = "held"          # skipped, paused, stopped (someone else owns it)
+OUTCOME_DISABLED = "disabled"  # turned off by configuration
+OUTCOME_UNKNOWN = "unknown"    # job returned no usable signal
+
+HELD_STATUSES = {"skipped", "paused", "stopped"}
+ERROR_STATUSES = {"error", "failed"}
+
+# Fixed key for pg_advisory_lock (ASCII "MDMSCHED")
+SCHEDULER_LOCK_KEY = 0x4D444D5343484544
+
+
+@dataclass
+class JobSpec:
+    """Static definition of a scheduled job."""
+    name: str
+    func: Callable[[], Awaitable[Any]]
+    interval_minutes: int
+    initial_delay_minutes: int = 0
+    resource: str = RESOURCE_DB
+    adaptive: bool = False
+    max_backoff_factor: int = 8
+    description: str = ""
+
+
+@dataclass
+class JobState:
+    """Live scheduling state for one job (exposed on data-health)."""
+    status: str = "scheduled"  # scheduled | waiting_budget | running
+    next_run_at: Optional[datetime] = None
+    last_started_at: Optional[datetime] = None
+    last_finished_at: Optional[datetime] = None
+    last_duration_seconds: Optional[float] = None
+    last_outcome: Optional[str] = None
+    last_processed: Optional[int] = None
+    last_error: Optional[str] = None
+    idle_streak: int = 0
+    runs: int = 0
+
+    @property
+    def has_backlog(self) -> bool:
+        return self.last_outcome in (OUTCOME_BUSY, OUTCOME_BLOCKED)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "next_run_at": self.next_run_at.isoformat() if self.next_run_at else None,
+            "last_started_at": self.last_started_at.isoformat() if self.last_started_at else None,
+            "last_finished_at": self.last_finished_at.isoformat() if self.last_finished_at else None,
+            "last_duration_seconds": self.last_duration_seconds,
+            "last_outcome": self.last_outcome,
+            "last_processed": self.last_processed,
+            "last_error": self.last_error,
+            "idle_streak": self.idle_streak,
+            "has_backlog": self.has_backlog,
+            "runs": self.runs,
+        }
+
+
+def extract_processed(result: Any) -> Optional[int]:
+    """
+    Pull the records-processed count out of a job result.
+
+    Jobs report it as result["processed"], result["stats"]["processed"],
+    or per phase as result["stats"][phase]["processed"] (GCD import).
+    """
+    if not isinstance(result, dict):
+        return None
+    stats = result.get("stats")
+    for source in (result, stats):
+        if isinstance(source, dict) and isinstance(source.get("processed"), int):
+            return source["processed"]
+    if isinstance(stats, dict):
+        phases = [
+            v["processed"] for v in stats.values()
+            if isinstance(v, dict) and isinstance(v.get("processed"), int)
+        ]
+        if phases:
+            return sum(phases)
+    return None
+
+
+def classify_result(result: Any) -> Tuple[str, Optional[int]]:
+    """Map a job's return value to (outcome, processed)."""
+    processed = extract_processed(result)
+    status = result.get("status") if isinstance(result, dict) else None
+
+    if status == "disabled":
+        return OUTCOME_DISABLED, processed
+    if status in HELD_STATUSES:
+        return OUTCOME_HELD, processed
+    circuit_opens = result.get("circuit_opens", 0) if isinstance(result, dict) else 0
+    if status in ERROR_STATUSES or circuit_opens:
+        return OUTCOME_BLOCKED, processed
+    if processed is None:
+        return OUTCOME_UNKNOWN, None
+    return (OUTCOME_BUSY if processed > 0 else OUTCOME_IDLE), processed
+
+
+def next_delay_seconds(spec: JobSpec, state: JobState, outcome: str) -> float:
+    """
+    Seconds until the next run; updates state.idle_streak.
+
+    Periodic jobs always wait interval_minutes. Adaptive jobs re-run after
+    BUSY_DELAY_SECONDS while busy and double their wait (from the base
+    interval up to max_backoff_factor x interval) while idle or blocked.
+    """
+    interval = spec.interval_minutes * 60
+    max_delay = min(interval * spec.max_backoff_factor, MAX_BACKOFF_SECONDS)
+
+    if outcome == OUTCOME_BUSY:
+        state.idle_streak = 0
+    elif outcome in (OUTCOME_IDLE, OUTCOME_BLOCKED):
+        state.idle_streak += 1
+
+    if not spec.adaptive:
+        return interval
+    if outcome == OUTCOME_BUSY:
+        return BUSY_DELAY_SECONDS
+    if outcome == OUTCOME_DISABLED:
+        return max_delay
+    if outcome in (OUTCOME_IDLE, OUTCOME_BLOCKED):
+        return min(interval * 2 ** (state.idle_streak - 1), max_delay)
+    return interval
+
+
+class ConcurrencyBudget:
+    """
+    Global and per-resource-class concurrency limits.
+
+    A job first takes a slot in its class, then a global slot, so jobs
+    waiting on a saturated class never hold global capacity.
+    """
+
+    def __init__(self, total: int, per_resource: Dict[str, int]):
+        self.total = total
+        self.per_resource = dict(per_resource)
+        self._global = asyncio.Semaphore(total)
+        self._classes = {name: asyncio.Semaphore(limit) for name, limit in per_resource.items()}
+        self.running: Dict[str, Set[str]] = {}
+
+    @asynccontextmanager
+    async def slot(self, resource: str, job_name: str):
+        if resource == RESOURCE_LIGHT:
+            self.running.setdefault(resource, set()).add(job_name)
+            try:
+                yield
+            finally:
+                self.running[resource].discard(job_name)
+            return
+
+        class_sem = self._classes.get(resource)
+        if class_sem:
+            await class_sem.acquire()
+        try:
+            await self._global.acquire()
+            try:
+                self.running.setdefault(resource, set()).add(job_name)
+                try:
+                    yield
+                finally:
+                    self.running[resource].discard(job_name)
+            finally:
+                self._global.release()
+        finally:
+            if class_sem:
+                class_sem.release()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total": self.total,
+            "limits": self.per_resource,
+            "running": {k: sorted(v) for k, v in self.running.items() if v},
+        }
+
+
+class LeaderLease:
+    """
+    Scheduler leadership via a session-level Postgres advisory lock.
+
+    The lock lives on one dedicated connection held for as long as we lead;
+    if that connection dies Postgres releases the lock and another replica
+    takes over on its next attempt.
+    """
+
+    def __init__(self, engine: AsyncEngine, key: int = SCHEDULER_LOCK_KEY):
+        self._engine = engine
+        self._key = key
+        self._conn: Optional[AsyncConnection] = None
+        self.acquired_at: Optional[float] = None
+
+    @property
+    def held(self) -> bool:
+        return self._conn is not None
+
+    async def try_acquire(self) -> bool:
+        if self._conn is not None:
+            return True
+        conn = await self._engine.connect()
+        try:
+            got = (await conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": self._key})).scalar()
+            # Session lock outlives the transaction; don't sit idle in one
+            await conn.commit()
+        except Exception:
+            # The lock may have been taken before the failure
+            await conn.invalidate()
+            raise
+        if not got:
+            await conn.close()
+            return False
+        self._conn = conn
+        self.acquired_at = time.time()
+        return True
+
+    async def verify(self) -> bool:
+        """Check the lock connection is alive. Drops the lease if not."""
+        if self._conn is None:
+            return False
+        try:
+            await self._conn.execute(text("SELECT 1"))
+            await self._conn.commit()
+            return True
+        except Exception as e:
+            logger.warning(f"[SCHEDULER] Leader lease connection lost: {e}")
+            await self._discard()
+            return False
+
+    async def release(self) -> None:
+        if self._conn is None:
+            return
+        unlocked = False
+        try:
+            unlocked = bool((await self._conn.execute(
+                text("SELECT pg_advisory_unlock(:key)"), {"key": self._key}
+            )).scalar())
+            await self._conn.commit()
+        except Exception as e:
+            logger.warning(f"[SCHEDULER] Failed to release leader lock: {e}")
+        await self._discard(unlocked)
+
+    async def _discard(self, unlocked: bool = False) -> None:
+        """
+        Drop the lease connection. Unless the lock is known released, the
+        connection is invalidated rather than returned to the pool: the
+        pool rolls back on return but does not unlock, so a pooled
+        connection would keep leadership until it was recycled.
+        """
+        conn, self._conn = self._conn, None
+        self.acquired_at = None
+        if conn is not None:
+            try:
+                if unlocked:
+                    await conn.close()
+                else:
+                    await conn.invalidate()
+            except Exception:
+                pass
+
+
+def utc_after(seconds: float) -> datetime:
+    return datetime.now(timezone.utc) + timedelta(seconds=seconds)
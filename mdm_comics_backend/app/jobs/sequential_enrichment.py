@@ -58,7 +58,8 @@ v2.0.0 Changes (PERFORMANCE OPTIMIZATION):
 - PARALLEL source queries within each comic (Phase 1: all sources, Phase 2: PriceCharting with UPC)
 - PARALLEL comic processing with semaphore (5 concurrent comics)
 - Batch database writes (every 50 comics)
-- Series cache for repeated lookups
+- Series cache for repeated lookups (PERF-035: now the shared series resolution store)
+- PERF-037: Series/title normalizers are memoized (fuzzy_scoring.memoized)
 - Publisher pre-filtering for Fandom sources (skip before calling)
 - Increased batch_size default: 10 -> 100
 - Increased checkpoint interval: 10 -> 50
@@ -133,6 +134,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import AsyncSessionLocal
 from app.core.utils import utcnow
 from app.core.http_client import RateLimitExceeded
+from app.services.fuzzy_scoring import memoized
+from app.services.series_resolution import get_series_resolution_store, names_match
 
 # v2.3.0: Track enrichment attempts for re-query logic
 try:
@@ -484,6 +487,7 @@ def build_fuzzy_match_query(
     )
 
 
+@memoized
 def normalize_for_comparison(text: str) -> str:
     """
     Normalize text for fuzzy comparison.
@@ -1105,16 +1109,6 @@ async def _LEGACY_query_metron_reference(
             
             # PRIORITY 2: Fuzzy match by series + issue (fallback)
             if not found_by_upc and comic.get("series_name") and comic.get("number"):
-                # v2.2.1: Check series cache first (REC-009)
-                series_cache = get_series_cache()
-                cached_metron_series = series_cache.get(
-                    comic.get("series_name"),
-                    "metron",
-                    comic.get("publisher_name")
-                )
-                if cached_metron_series:
-                    logger.debug(f"[metron] Cache HIT: {comic.get('series_name')} series_id={cached_metron_series}")
-
                 search_result = await adapter.search_issues(
                     series_name=comic["series_name"],
                     number=str(comic["number"]),
@@ -1130,17 +1124,6 @@ async def _LEGACY_query_metron_reference(
                         # Store metron_id for future lookups
                         if best.get("id"):
                             updates["metron_id"] = best["id"]
-                            
-                            # v2.2.1: Store series in cache (REC-009)
-                            if best.get("series", {}).get("id"):
-                                series_cache = get_series_cache()
-                                series_cache.set(
-                                    comic.get("series_name"),
-                                    "metron",
-                                    best["series"]["id"],
-                                    comic.get("publisher_name")
-                                )
-                                logger.debug(f"[metron] Cache SET: {comic.get('series_name')} series_id={best['series']['id']}")
 
                             # Fetch full details
                             data = await adapter.fetch_by_id(str(best["id"]), endpoint="issue")
@@ -1255,37 +1238,59 @@ async def query_comicvine(
             else:
                 # Search using agnostic fuzzy matching (v1.19.3)
                 if comic.get("series_name") and comic.get("number"):
-                    # v2.2.1: Check series cache first (REC-009)
-                    series_cache = get_series_cache()
-                    cached_cv_id = series_cache.get(
-                        comic.get("series_name"),
+                    # PERF-035: A volume already resolved (by any job) turns
+                    # the fuzzy search into an exact volume + issue lookup
+                    series_store = get_series_resolution_store()
+                    resolution = await series_store.get(
                         "comicvine",
-                        comic.get("publisher_name")
+                        comic["series_name"],
+                        comic.get("publisher_name"),
+                        comic.get("series_year_began"),
                     )
-                    if cached_cv_id:
-                        logger.debug(f"[comicvine] Cache HIT: {comic.get('series_name')} -> CV series")
-                        # Use cached series ID to narrow search
-                        # (Cache stores series, we still need to find exact issue)
-                    # Use the standard fuzzy match query builder
-                    match_data = build_fuzzy_match_query(comic)
-                    query = match_data.query
+                    async def fuzzy_search():
+                        # Use the standard fuzzy match query builder
+                        match_data = build_fuzzy_match_query(comic)
+                        query = match_data.query
 
-                    logger.debug(
-                        f"[comicvine] Searching: {query} "
-                        f"(year={match_data.year}, vol={match_data.volume})"
-                    )
+                        logger.debug(
+                            f"[comicvine] Searching: {query} "
+                            f"(year={match_data.year}, vol={match_data.volume})"
+                        )
 
-                    response = await client.get(
-                        "https://comicvine.gamespot.com/api/search/",
-                        params={
-                            "api_key": api_key,
-                            "format": "json",
-                            "query": query,
-                            "resources": "issue",
-                            "limit": 5,
-                        },
-                        headers={"User-Agent": "MDM Comics Enrichment/1.0"}
-                    )
+                        return await client.get(
+                            "https://comicvine.gamespot.com/api/search/",
+                            params={
+                                "api_key": api_key,
+                                "format": "json",
+                                "query": query,
+                                "resources": "issue",
+                                "limit": 5,
+                            },
+                            headers={"User-Agent": "MDM Comics Enrichment/1.0"}
+                        )
+
+                    if resolution and resolution.found:
+                        logger.debug(f"[comicvine] Series HIT: {comic.get('series_name')} -> {resolution.series_ids}")
+                        response = await client.get(
+                            "https://comicvine.gamespot.com/api/issues/",
+                            params={
+                                "api_key": api_key,
+                                "format": "json",
+                                "filter": (
+                                    f"volume:{'|'.join(str(v) for v in resolution.series_ids)},"
+                                    f"issue_number:{comic['number']}"
+                                ),
+                                "limit": 5,
+                            },
+                            headers={"User-Agent": "MDM Comics Enrichment/1.0"}
+                        )
+                        if response.status_code == 200 and not response.json().get("results"):
+                            # Issue isn't in the resolved volume(s); fall back to search
+                            if not await rate_mgr.wait_for_source(source):
+                                return updates
+                            response = await fuzzy_search()
+                    else:
+                        response = await fuzzy_search()
 
                     rate_mgr.get_limiter(source).update_from_headers(
                         {k.lower(): v for k, v in response.headers.items()}
@@ -1313,6 +1318,19 @@ async def query_comicvine(
                             )
                             updates["comicvine_id"] = best["id"]
 
+                            volume = best.get("volume") or {}
+                            if not (resolution and resolution.found) and volume.get("id") and names_match(
+                                comic["series_name"], volume.get("name")
+                            ):
+                                await series_store.put(
+                                    "comicvine",
+                                    comic["series_name"],
+                                    [volume["id"]],
+                                    confidence=1.0,
+                                    publisher=comic.get("publisher_name"),
+                                    start_year=comic.get("series_year_began"),
+                                )
+
                             # Fetch full details
                             if not await rate_mgr.wait_for_source(source):
                                 return updates  # Return what we have
@@ -1971,6 +1989,7 @@ async def query_mycomicshop(
 # MATCHING HELPERS
 # =============================================================================
 
+@memoized
 def _normalize_series_name(name: str) -> str:
     """
     Normalize series name for comparison by removing punctuation and extra whitespace.
@@ -2000,6 +2019,7 @@ def _find_best_match(
 
     best = None
     best_score = 0
+    our_series = _normalize_series_name(comic.get("series_name", ""))
 
     for candidate in candidates[:10]:  # Limit to top 10
         score = 0
@@ -2010,7 +2030,6 @@ def _find_best_match(
         else:
             cand_series = candidate.get("series_name", "") or candidate.get("series", {}).get("name", "")
 
-        our_series = _normalize_series_name(comic.get("series_name", ""))
         cand_series_norm = _normalize_series_name(cand_series)
 
         if our_series and cand_series_norm:
@@ -2130,70 +2149,6 @@ def get_relevant_sources_for_comic(
     return relevant
 
 
-# =============================================================================
-# v2.0.0: SERIES CACHE
-# =============================================================================
-
-class SeriesCache:
-    """
-    Cache series -> source ID mappings to avoid repeated searches.
-
-    When we search for "Amazing Spider-Man" on Metron and find series_id=123,
-    we cache it. Subsequent issues of "Amazing Spider-Man" can skip the search
-    and use the cached ID directly.
-    """
-
-    def __init__(self, max_size: int = 10000):
-        self._cache: Dict[str, Dict[str, Any]] = {}
-        self._max_size = max_size
-
-    def _make_key(self, series_name: str, publisher: Optional[str] = None) -> str:
-        """Create cache key from series name and optional publisher."""
-        key = series_name.lower().strip()
-        if publisher:
-            key = f"{publisher.lower().strip()}:{key}"
-        return key
-
-    def get(self, series_name: str, source: str, publisher: Optional[str] = None) -> Optional[Any]:
-        """Get cached source ID for a series."""
-        key = self._make_key(series_name, publisher)
-        if key in self._cache:
-            return self._cache[key].get(f"{source}_id")
-        return None
-
-    def set(self, series_name: str, source: str, source_id: Any, publisher: Optional[str] = None):
-        """Cache a source ID for a series."""
-        if len(self._cache) >= self._max_size:
-            # Simple eviction: clear half the cache
-            keys = list(self._cache.keys())[:self._max_size // 2]
-            for k in keys:
-                del self._cache[k]
-
-        key = self._make_key(series_name, publisher)
-        if key not in self._cache:
-            self._cache[key] = {}
-        self._cache[key][f"{source}_id"] = source_id
-
-    def get_stats(self) -> Dict[str, int]:
-        """Get cache statistics."""
-        return {
-            "entries": len(self._cache),
-            "max_size": self._max_size,
-        }
-
-
-# Global series cache
-_series_cache: Optional[SeriesCache] = None
-
-
-def get_series_cache() -> SeriesCache:
-    """Get or create the global series cache."""
-    global _series_cache
-    if _series_cache is None:
-        _series_cache = SeriesCache()
-    return _series_cache
-
-
 # =============================================================================
 # v2.3.0: ENRICHMENT ATTEMPT TRACKING
 # =============================================================================
@@ -2384,9 +2339,12 @@ async def run_sequential_exhaustive_enrichment_job(
         "by_source": {s[0]: 0 for s in ALL_SOURCES},
         "fully_enriched": 0,
         "errors": 0,
-        "cache_hits": 0,  # v2.0.0: Track series cache effectiveness
+        "cache_hits": 0,  # PERF-035: series resolution store hits during this run
     }
 
+    start_series_stats = get_series_resolution_store().get_stats()
+    series_hits_at_start = start_series_stats["memory_hits"] + start_series_stats["db_hits"]
+
     # Rate limit manager (persists across rows)
     rate_mgr = RateLimitManager()
 
@@ -2800,7 +2758,7 @@ async def run_sequential_exhaustive_enrichment_job(
                     # Fetch batch of comics
                     result = await db.execute(text("""
                         SELECT id, metron_id, comicvine_id, gcd_id, pricecharting_id,
-                               series_name, number, issue_name, publisher_name,
+                               series_name, number, issue_name, publisher_name, series_year_began,
                                cover_date, store_date, description, page_count, price,
                                upc, isbn, isbn_normalized, image,
                                price_loose, price_graded
@@ -2830,6 +2788,7 @@ async def run_sequential_exhaustive_enrichment_job(
                             "number": comic_row.number,
                             "issue_name": comic_row.issue_name,
                             "publisher_name": comic_row.publisher_name,
+                            "series_year_began": comic_row.series_year_began,
                             "cover_date": comic_row.cover_date,
                             "store_date": comic_row.store_date,
                             "description": comic_row.description,
@@ -2965,11 +2924,15 @@ async def run_sequential_exhaustive_enrichment_job(
         await cleanup_http_pool()
         logger.info(f"[{job_name}] HTTP connection pool cleaned up")
 
+    series_stats = get_series_resolution_store().get_stats()
+    stats["cache_hits"] = series_stats["memory_hits"] + series_stats["db_hits"] - series_hits_at_start
+
     # v2.0.0: Enhanced completion logging
     logger.info(
         f"[{job_name}] v2.0.0 Complete! "
         f"processed={stats['processed']}, enriched={stats['enriched']}, "
         f"fields_filled={stats['fields_filled']}, fully_enriched={stats['fully_enriched']}, "
-        f"errors={stats['errors']}"
+        f"errors={stats['errors']}, series_cache_hits={stats['cache_hits']} "
+        f"(hit_rate={series_stats['hit_rate']})"
     )
     return stats
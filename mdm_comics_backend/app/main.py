@@ -30,6 +30,7 @@ from starlette.responses import JSONResponse
 from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
+from slowapi.middleware import SlowAPIMiddleware
 from sqlalchemy import select, func, text
 
 from app.api.routes import products, users, auth, cart, orders, grading, comics, checkout, funkos, analytics, coupons, admin, contact
@@ -109,9 +110,24 @@ from app.core.database import AsyncSessionLocal, engine
 from app.core.rate_limit import limiter, rate_limit_exceeded_handler
 from app.core.error_handler import ErrorSanitizationMiddleware
 from app.core.security_headers import SecurityHeadersMiddleware
-from app.core.monitoring import RequestMetricsMiddleware, metrics, record_db_metrics, get_prometheus_metrics
+from app.core.response_cache import ResponseCacheMiddleware
+from app.core.config_snapshot import ensure_config_notify, config_listener_loop
+from app.core.monitoring import (
+    RequestMetricsMiddleware, metrics, record_db_metrics, get_prometheus_metrics,
+    metrics_sync_loop, get_cluster_histogram_stats,
+)
 from app.core.backup import get_backup_status, get_restore_instructions
+from app.services.stat_counters import ensure_stat_counters
+from app.services.series_resolution import ensure_series_resolution_table
+from app.services.price_events import ensure_price_cdc
+from app.services.batched_purge import ensure_purge_cursors
+from app.services.dsar_export import ensure_dsar_export_progress
+from app.services.abandonment_service import ensure_abandonment_detection
+from app.services.barcode_matcher import ensure_barcode_scan_receipts
+from app.services.bundle_service import ensure_bundle_item_overrides
+from app.core.pagination import ensure_listing_indexes
 from app.services.metron import metron_service
+from app.services.comic_cache import cover_hash_queue
 
 # Import models to register them with SQLAlchemy
 from app.models import (
@@ -125,6 +141,10 @@ logger = logging.getLogger(__name__)
 
 # P0-1: Background task references
 _stock_cleanup_task: Optional[asyncio.Task] = None
+# PERF-026: Publishes histogram sketches to Redis for cross-worker merge
+_metrics_sync_task: Optional[asyncio.Task] = None
+# PERF-040: LISTENs for feature flag / site setting changes
+_config_listener_task: Optional[asyncio.Task] = None
 _cleanup_heartbeat: dict = {
     "last_run": None,
     "last_success": None,
@@ -158,6 +178,36 @@ async def ensure_schema_migrations():
             logger.warning(f"Schema migration for upc column failed: {e}")
             await db.rollback()
 
+        # Dashboard stat counters (tables + triggers, first boot only)
+        await ensure_stat_counters(db)
+
+        # PERF-035: Shared series -> source series ID resolutions
+        await ensure_series_resolution_table(db)
+
+        # PERF-038: Price change capture (event queue + latest_prices triggers)
+        await ensure_price_cdc(db)
+
+        # PERF-040: NOTIFY on feature_flags / site_settings writes
+        await ensure_config_notify(db)
+
+        # PERF-044: Resumable cursors for batched retention purges
+        await ensure_purge_cursors(db)
+
+        # PERF-047: Progress of streaming DSAR exports
+        await ensure_dsar_export_progress(db)
+
+        # PERF-048: Watermark and indexes for incremental abandoned-cart detection
+        await ensure_abandonment_detection(db)
+
+        # PERF-049: Idempotency keys for batch barcode scanning
+        await ensure_barcode_scan_receipts(db)
+
+        # PERF-050: Admin price/cost overrides survive bulk bundle repricing
+        await ensure_bundle_item_overrides(db)
+
+        # PERF-034: (sort key, id) indexes for keyset-paged product listings
+        await ensure_listing_indexes(db)
+
 
 async def import_funkos_if_needed():
     """
@@ -314,7 +364,7 @@ async def lifespan(app: FastAPI):
     P3-14: Funko scraper code removed (blocked by Funko.com)
     v1.7.0: Auto-create price_snapshots table for ML/AI training
     """
-    global _stock_cleanup_task
+    global _stock_cleanup_task, _metrics_sync_task, _config_listener_task
 
     # Run schema migrations first (adds missing columns like upc)
     await ensure_schema_migrations()
@@ -333,6 +383,12 @@ async def lifespan(app: FastAPI):
     else:
         logger.info("Stock cleanup scheduler DISABLED via config")
 
+    # PERF-026: Rotate latency sketches and share them with other workers
+    _metrics_sync_task = asyncio.create_task(metrics_sync_loop())
+
+    # PERF-040: Reload the config snapshot when flags/settings change
+    _config_listener_task = asyncio.create_task(config_listener_loop())
+
     # v1.6.0: Start pipeline scheduler for automated data acquisition
     if PIPELINE_SCHEDULER_AVAILABLE and settings.PIPELINE_SCHEDULER_ENABLED:
         await pipeline_scheduler.start()
@@ -358,6 +414,20 @@ async def lifespan(app: FastAPI):
         except asyncio.CancelledError:
             logger.info("Stock cleanup scheduler cancelled")
 
+    if _metrics_sync_task and not _metrics_sync_task.done():
+        _metrics_sync_task.cancel()
+        try:
+            await _metrics_sync_task
+        except asyncio.CancelledError:
+            pass
+
+    if _config_listener_task and not _config_listener_task.done():
+        _config_listener_task.cancel()
+        try:
+            await _config_listener_task
+        except asyncio.CancelledError:
+            pass
+
     # v1.6.0: Stop pipeline scheduler
     if PIPELINE_SCHEDULER_AVAILABLE and pipeline_scheduler:
         await pipeline_scheduler.stop()
@@ -365,6 +435,7 @@ async def lifespan(app: FastAPI):
 
     # P2-11: Close HTTP clients to prevent connection leaks
     await metron_service.close()
+    await cover_hash_queue.stop()
     await stop_metron_worker()
     logger.info("Metron HTTP client closed")
 
@@ -454,6 +525,14 @@ class RequestSizeLimitMiddleware(BaseHTTPMiddleware):
         return await call_next(request)
 
 
+# PERF-039: Shared response cache for public catalog GETs (innermost, so
+# cached hits still get metrics, security headers and CORS)
+app.add_middleware(ResponseCacheMiddleware)
+
+# P1-3 / PERF-043: Default rate limits for routes without their own
+# @limiter.limit (decorated routes are checked by the decorator)
+app.add_middleware(SlowAPIMiddleware)
+
 app.add_middleware(RequestSizeLimitMiddleware)
 
 # P2-5: Request metrics collection
@@ -672,7 +751,10 @@ async def json_metrics():
     # Update DB pool metrics
     await record_db_metrics(engine.pool)
 
-    return metrics.get_all_metrics()
+    data = metrics.get_all_metrics()
+    # PERF-026: Latency merged across all workers (None without Redis)
+    data["cluster_request_latency"] = await get_cluster_histogram_stats("http_request_duration_seconds")
+    return data
 
 
 @app.get("/health/backup", tags=["Health"])
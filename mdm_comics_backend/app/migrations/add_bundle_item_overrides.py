@@ -0,0 +1,59 @@
+"""
+Migration: Add price_override/cost_override to bundle_items
+
+Classification: TIER_0
+
+Marks admin-set item prices and costs so bulk bundle repricing keeps
+them. Existing items that no longer match their product are marked as
+overrides, since stale snapshots look the same as admin-set prices.
+Review them once afterwards; POST /api/admin/bundles/reprice with
+reset_overrides=true returns the selected products' items to product
+pricing.
+
+Safe to re-run: skipped once the columns exist.
+
+v1.0.0 - Initial implementation
+"""
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.services.bundle_service import ensure_bundle_item_overrides
+
+
+async def run_migration():
+    """Add the bundle item override flags"""
+
+    database_url = os.environ.get("DATABASE_URL")
+    if not database_url:
+        print("ERROR: DATABASE_URL environment variable not set")
+        return False
+
+    if database_url.startswith("postgresql://"):
+        database_url = database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+    engine = create_async_engine(database_url, echo=False)
+    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with async_session() as session:
+        print("Adding bundle_items override flags...")
+        print("-" * 60)
+
+        await ensure_bundle_item_overrides(session)
+        print("  bundle_items override flags: ready (OK)")
+
+        print("-" * 60)
+        print("Migration complete: bundle_items override flags")
+
+    await engine.dispose()
+    return True
+
+
+if __name__ == "__main__":
+    success = asyncio.run(run_migration())
+    sys.exit(0 if success else 1)
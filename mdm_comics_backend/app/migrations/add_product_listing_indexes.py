@@ -0,0 +1,57 @@
+"""
+Migration: Add (sort key, id) indexes for product listings
+
+Classification: TIER_0
+
+PERF-034: Keyset-paged product listings order by price, rating,
+created_at, updated_at or featured + created_at, each with id as the
+tiebreaker. A plain (key, id) btree serves both directions (scanned
+backwards it yields DESC NULLS FIRST), so cursors seek instead of sort.
+
+Safe to re-run: CREATE INDEX IF NOT EXISTS.
+
+v1.0.0 - Initial implementation
+"""
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.core.pagination import LISTING_INDEX_DDL, ensure_listing_indexes
+
+
+async def run_migration():
+    """Add the product listing indexes"""
+
+    database_url = os.environ.get("DATABASE_URL")
+    if not database_url:
+        print("ERROR: DATABASE_URL environment variable not set")
+        return False
+
+    if database_url.startswith("postgresql://"):
+        database_url = database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+    engine = create_async_engine(database_url, echo=False)
+    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with async_session() as session:
+        print("Adding product listing indexes...")
+        print("-" * 60)
+
+        await ensure_listing_indexes(session)
+        print(f"  products listing indexes ({len(LISTING_INDEX_DDL)}): ready (OK)")
+
+        print("-" * 60)
+        print("Migration complete: product listing indexes")
+
+    await engine.dispose()
+    return True
+
+
+if __name__ == "__main__":
+    success = asyncio.run(run_migration())
+    sys.exit(0 if success else 1)
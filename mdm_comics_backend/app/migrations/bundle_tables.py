@@ -134,6 +134,8 @@ async def migrate_bundle_tables(engine):
                 unit_cost NUMERIC(12, 2),
                 line_price NUMERIC(12, 2),
                 line_cost NUMERIC(12, 2),
+                price_override BOOLEAN NOT NULL DEFAULT FALSE,
+                cost_override BOOLEAN NOT NULL DEFAULT FALSE,
 
                 -- Display
                 display_order INTEGER DEFAULT 0,
@@ -0,0 +1,56 @@
+"""
+Migration: Create configuration change NOTIFY triggers
+
+Classification: TIER_0
+
+Statement-level triggers on feature_flags and site_settings send
+pg_notify('config_changed') on every write, so each API process reloads
+its configuration snapshot instead of polling.
+
+Safe to re-run: the function and triggers are replaced.
+
+v1.0.0 - Initial implementation
+"""
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config_snapshot import install_config_notify
+
+
+async def run_migration():
+    """Install the config change NOTIFY triggers"""
+
+    database_url = os.environ.get("DATABASE_URL")
+    if not database_url:
+        print("ERROR: DATABASE_URL environment variable not set")
+        return False
+
+    if database_url.startswith("postgresql://"):
+        database_url = database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+    engine = create_async_engine(database_url, echo=False)
+    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with async_session() as session:
+        print("Installing config change notifications...")
+        print("-" * 60)
+
+        await install_config_notify(session)
+        print("  Triggers on feature_flags, site_settings: installed (OK)")
+
+        print("-" * 60)
+        print("Migration complete: config_changed NOTIFY")
+
+    await engine.dispose()
+    return True
+
+
+if __name__ == "__main__":
+    success = asyncio.run(run_migration())
+    sys.exit(0 if success else 1)
@@ -0,0 +1,62 @@
+"""
+Migration: Create price change capture tables and triggers
+
+Classification: TIER_0
+Retention: price_change_events 7 days after every consumer drained them
+           (operational, no PII)
+
+Statement-level triggers on funkos and comic_issues queue every price
+column change into price_change_events and keep latest_prices current.
+sync_price_changelog drains the queue instead of diffing full tables.
+
+Safe to re-run: tables are created IF NOT EXISTS, triggers are replaced,
+and latest_prices is reseeded from the source tables.
+
+v1.0.0 - Initial implementation
+"""
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.services.price_events import install_price_cdc
+
+
+async def run_migration():
+    """Install price CDC tables and triggers, then seed latest_prices"""
+
+    database_url = os.environ.get("DATABASE_URL")
+    if not database_url:
+        print("ERROR: DATABASE_URL environment variable not set")
+        return False
+
+    if database_url.startswith("postgresql://"):
+        database_url = database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+    engine = create_async_engine(database_url, echo=False)
+    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with async_session() as session:
+        print("Installing price change capture...")
+        print("-" * 60)
+
+        result = await install_price_cdc(session)
+        for table in result["installed"]:
+            print(f"  Triggers on {table}: installed (OK)")
+        for table in result["skipped"]:
+            print(f"  Table {table} missing (SKIP)")
+
+        print("-" * 60)
+        print("Migration complete: price_change_events / latest_prices")
+
+    await engine.dispose()
+    return True
+
+
+if __name__ == "__main__":
+    success = asyncio.run(run_migration())
+    sys.exit(0 if success else 1)
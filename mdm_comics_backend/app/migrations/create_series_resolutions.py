@@ -0,0 +1,58 @@
+"""
+Migration: Create series_resolutions
+
+Classification: TIER_0
+Retention: rows expire after SERIES_RESOLUTION_TTL_DAYS (cache, no PII)
+
+Persistent series -> source series ID store shared by all enrichment jobs,
+so a series resolved on Metron or ComicVine yesterday isn't searched again.
+
+Safe to re-run: table and index are created IF NOT EXISTS.
+
+v1.0.0 - Initial implementation
+"""
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.services.series_resolution import SCHEMA_DDL
+
+
+async def run_migration():
+    """Create the series_resolutions table"""
+
+    database_url = os.environ.get("DATABASE_URL")
+    if not database_url:
+        print("ERROR: DATABASE_URL environment variable not set")
+        return False
+
+    if database_url.startswith("postgresql://"):
+        database_url = database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+    engine = create_async_engine(database_url, echo=False)
+    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with async_session() as session:
+        print("Creating series_resolutions...")
+        print("-" * 60)
+
+        for statement in SCHEMA_DDL:
+            await session.execute(text(statement))
+        await session.commit()
+
+        print("-" * 60)
+        print("Migration complete: series_resolutions")
+
+    await engine.dispose()
+    return True
+
+
+if __name__ == "__main__":
+    success = asyncio.run(run_migration())
+    sys.exit(0 if success else 1)
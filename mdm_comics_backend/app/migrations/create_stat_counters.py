@@ -0,0 +1,61 @@
+"""
+Migration: Create stat_counters / stat_counter_hourly and their triggers
+
+Classification: TIER_0
+Retention: stat_counter_hourly 35 days (operational, no PII)
+
+Dashboard counters maintained by statement-level triggers so admin
+dashboards read a handful of rows instead of scanning products, orders,
+comic_issues and the pipeline tables.
+
+Safe to re-run: tables are created IF NOT EXISTS, triggers are replaced,
+and counters are recounted from the source tables.
+
+v1.0.0 - Initial implementation
+"""
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.services.stat_counters import install_stat_counters
+
+
+async def run_migration():
+    """Install stat counter tables and triggers, then rebuild counts"""
+
+    database_url = os.environ.get("DATABASE_URL")
+    if not database_url:
+        print("ERROR: DATABASE_URL environment variable not set")
+        return False
+
+    if database_url.startswith("postgresql://"):
+        database_url = database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+    engine = create_async_engine(database_url, echo=False)
+    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with async_session() as session:
+        print("Installing stat counters...")
+        print("-" * 60)
+
+        result = await install_stat_counters(session)
+        for table in result["installed"]:
+            print(f"  Triggers on {table}: installed (OK)")
+        for table in result["skipped"]:
+            print(f"  Table {table} missing (SKIP)")
+
+        print("-" * 60)
+        print("Migration complete: stat_counters")
+
+    await engine.dispose()
+    return True
+
+
+if __name__ == "__main__":
+    success = asyncio.run(run_migration())
+    sys.exit(0 if success else 1)
@@ -167,6 +167,10 @@ class BundleItem(Base):
     line_price = Column(Numeric(12, 2), nullable=True)  # unit_price * quantity
     line_cost = Column(Numeric(12, 2), nullable=True)   # unit_cost * quantity
 
+    # Set when an admin chose the unit price/cost; bulk repricing leaves these alone
+    price_override = Column(Boolean, default=False, nullable=False, server_default="false")
+    cost_override = Column(Boolean, default=False, nullable=False, server_default="false")
+
     # Display
     display_order = Column(Integer, default=0)  # Order in bundle listing
     is_featured = Column(Boolean, default=False)  # Highlight this item
@@ -141,6 +141,12 @@ class Product(Base):
     __table_args__ = (
         Index("ix_products_upc_isbn", upc, isbn),
         Index("ix_products_active", id, postgresql_where=(deleted_at.is_(None))),
+        # PERF-034: keyset pagination walks these for the listing sort orders
+        Index("ix_products_price_id", price, id),
+        Index("ix_products_rating_id", rating, id),
+        Index("ix_products_created_at_id", created_at, id),
+        Index("ix_products_updated_at_id", updated_at, id),
+        Index("ix_products_featured_created_at_id", featured, created_at, id),
         # DB-006: Check constraints for data integrity
         CheckConstraint('stock >= 0', name='check_stock_non_negative'),
         CheckConstraint('price > 0', name='check_price_positive'),
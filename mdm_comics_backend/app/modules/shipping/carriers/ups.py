@@ -32,7 +32,7 @@ from app.services.ups_client import (
     UPSPackage,
     UPSAPIError,
 )
-from app.services.encryption import decrypt_pii
+from app.services.pii_access import carrier_credentials
 
 logger = logging.getLogger(__name__)
 
@@ -104,11 +104,14 @@ class UPSCarrier(BaseCarrier):
             return self._ups_client
 
         if self._config:
-            # Use credentials from Carrier model
+            # Use credentials from Carrier model (PERF-046: sealed cache)
+            client_id, client_secret, account_number = carrier_credentials(
+                self._config, "client_id", "client_secret", "account_number",
+            )
             credentials = UPSCredentials(
-                client_id=decrypt_pii(self._config.client_id_encrypted) if self._config.client_id_encrypted else "",
-                client_secret=decrypt_pii(self._config.client_secret_encrypted) if self._config.client_secret_encrypted else "",
-                account_number=decrypt_pii(self._config.account_number_encrypted) if self._config.account_number_encrypted else "",
+                client_id=client_id,
+                client_secret=client_secret,
+                account_number=account_number,
                 use_sandbox=self._config.use_sandbox or False,
             )
         else:
@@ -44,7 +44,7 @@ class BundleItemCreate(BundleItemBase):
 
 
 class BundleItemUpdate(BaseModel):
-    """Schema for updating a bundle item."""
+    """Schema for updating a bundle item. A null unit_price/unit_cost reverts to the product's."""
     quantity: Optional[int] = Field(None, ge=1, le=100)
     unit_price: Optional[Decimal] = Field(None, ge=0)
     unit_cost: Optional[Decimal] = Field(None, ge=0)
@@ -64,6 +64,8 @@ class BundleItemResponse(BaseModel):
     unit_cost: Optional[Decimal] = None
     line_price: Optional[Decimal] = None
     line_cost: Optional[Decimal] = None
+    price_override: bool = False
+    cost_override: bool = False
     display_order: int
     is_featured: bool
     custom_label: Optional[str] = None
@@ -389,6 +391,22 @@ class BundlePricingResponse(BaseModel):
     margin_warning: Optional[str] = None
 
 
+class BundleRepriceRequest(BaseModel):
+    """Products whose price/cost changed; omit to reprice every bundle."""
+    product_ids: Optional[List[int]] = Field(None, max_length=50000)
+    reset_overrides: bool = Field(
+        False, description="Drop admin price/cost overrides on the selected items first"
+    )
+
+
+class BundleRepriceResponse(BaseModel):
+    """Result of a bulk bundle repricing pass."""
+    bundles_checked: int
+    items_refreshed: int
+    bundles_repriced: int
+    bundle_ids: List[int]
+
+
 # ==================== Cart Integration Schemas ====================
 
 class BundleCartItemCreate(BaseModel):
@@ -175,3 +175,7 @@ class ProductList(BaseModel):
     total: int
     page: int
     per_page: int
+    # Keyset pagination: pass next_cursor back as ?cursor= for the next page
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+    total_is_estimate: bool = False
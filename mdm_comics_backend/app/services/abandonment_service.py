@@ -2,6 +2,14 @@
 Cart Abandonment Detection & Recovery Service
 
 Identifies abandoned carts and queues them for recovery campaigns.
+
+v1.1.0 (PERF-048): Detection is incremental. Each run examines only carts
+whose last activity crossed the abandonment threshold since the previous
+run (a watermark in abandonment_watermarks), read through a partial index
+of open carts with items. The latest snapshot per cart is picked with
+DISTINCT ON, and queueing is one INSERT ... SELECT ... ON CONFLICT DO
+NOTHING against a unique index of active queue entries, so run time
+follows new cart activity rather than the size of the lookback window.
 """
 
 import logging
@@ -9,16 +17,110 @@ from datetime import datetime, timezone, timedelta
 from typing import List, Optional
 from decimal import Decimal
 
-from sqlalchemy import select, and_, or_
+from sqlalchemy import select, and_, or_, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.analytics import CartSnapshot, CartEvent, AnalyticsSession, CartAbandonmentQueue
+from app.models.analytics import CartEvent, AnalyticsSession, CartAbandonmentQueue
 from app.models.user import User
 from app.models.coupon import Coupon, CouponCampaign
 from app.services.coupon_service import get_coupon_service
 
 logger = logging.getLogger(__name__)
 
+WATERMARK_NAME = "cart_abandonment"
+# Queue states that still count as "being recovered" (one per cart)
+ACTIVE_RECOVERY_STATUSES = ("pending", "email_sent")
+
+SCHEMA_DDL = (
+    """
+    CREATE TABLE IF NOT EXISTS abandonment_watermarks (
+        name VARCHAR(100) PRIMARY KEY,
+        watermark TIMESTAMPTZ,
+        carts_queued BIGINT NOT NULL DEFAULT 0,
+        updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+    )
+    """,
+    # Snapshots that can start an abandonment, in activity order
+    """
+    CREATE INDEX IF NOT EXISTS ix_cart_snapshots_open_activity
+    ON cart_snapshots (snapshot_at, cart_id)
+    WHERE order_id IS NULL AND item_count > 0
+      AND snapshot_type IN ('updated', 'checkout_started')
+    """,
+    # Lets NOT EXISTS (newer snapshot) probe one cart's latest activity
+    """
+    CREATE INDEX IF NOT EXISTS ix_cart_snapshots_cart_activity
+    ON cart_snapshots (cart_id, snapshot_at)
+    """,
+    # Keep the newest active entry per cart before enforcing uniqueness
+    """
+    UPDATE cart_abandonment_queue q SET recovery_status = 'superseded', updated_at = NOW()
+    WHERE q.recovery_status IN ('pending', 'email_sent')
+      AND EXISTS (
+          SELECT 1 FROM cart_abandonment_queue newer
+          WHERE newer.cart_id = q.cart_id
+            AND newer.recovery_status IN ('pending', 'email_sent')
+            AND newer.id > q.id
+      )
+    """,
+    """
+    CREATE UNIQUE INDEX IF NOT EXISTS uq_cart_abandonment_queue_active_cart
+    ON cart_abandonment_queue (cart_id)
+    WHERE recovery_status IN ('pending', 'email_sent')
+    """,
+)
+
+# Carts whose latest snapshot falls in (since, cutoff] and is an open cart
+# with items; one queue row each, skipping carts already being recovered
+QUEUE_ABANDONED_SQL = text("""
+    WITH latest AS (
+        SELECT DISTINCT ON (s.cart_id)
+               s.cart_id, s.session_id, s.user_id, s.snapshot_type,
+               s.items, s.item_count, s.subtotal, s.snapshot_at
+        FROM cart_snapshots s
+        WHERE s.snapshot_at > :since AND s.snapshot_at <= :cutoff
+          AND s.order_id IS NULL AND s.item_count > 0
+          AND s.snapshot_type IN ('updated', 'checkout_started')
+        ORDER BY s.cart_id, s.snapshot_at DESC
+    )
+    INSERT INTO cart_abandonment_queue (
+        cart_id, session_id, user_id, user_email, user_name,
+        cart_snapshot, cart_value, item_count, last_activity_at,
+        checkout_step_reached, recovery_priority, recovery_status,
+        expires_at, created_at, updated_at
+    )
+    SELECT
+        l.cart_id, l.session_id, l.user_id, u.email, u.name,
+        l.items, l.subtotal, l.item_count, l.snapshot_at,
+        CASE WHEN l.snapshot_type = 'checkout_started' THEN 'checkout' END,
+        CASE
+            WHEN l.subtotal >= :high_value THEN 'high'
+            WHEN l.subtotal >= :medium_value THEN 'medium'
+            ELSE 'low'
+        END,
+        'pending', :expires_at, NOW(), NOW()
+    FROM latest l
+    JOIN users u ON u.id = l.user_id
+    WHERE u.email IS NOT NULL AND u.email <> ''
+      AND NOT EXISTS (
+          SELECT 1 FROM cart_snapshots newer
+          WHERE newer.cart_id = l.cart_id AND newer.snapshot_at > l.snapshot_at
+      )
+    ON CONFLICT (cart_id) WHERE recovery_status IN ('pending', 'email_sent') DO NOTHING
+    RETURNING id
+""")
+
+
+async def ensure_abandonment_detection(db: AsyncSession) -> None:
+    """Startup hook: watermark table and the detection indexes."""
+    try:
+        for statement in SCHEMA_DDL:
+            await db.execute(text(statement))
+        await db.commit()
+    except Exception as e:
+        logger.warning(f"Abandonment detection setup failed: {e}")
+        await db.rollback()
+
 
 class AbandonmentService:
     """
@@ -34,6 +136,7 @@ class AbandonmentService:
     # Default thresholds
     ABANDONMENT_THRESHOLD_HOURS = 2  # Consider abandoned after 2 hours
     HIGH_VALUE_THRESHOLD = Decimal("100")  # High priority if over $100
+    MEDIUM_VALUE_THRESHOLD = Decimal("50")
     RECOVERY_WINDOW_HOURS = 72  # Stop trying after 72 hours
 
     async def detect_abandoned_carts(
@@ -42,104 +145,64 @@ class AbandonmentService:
         threshold_hours: int = None,
     ) -> List[CartAbandonmentQueue]:
         """
-        Scan for abandoned carts and add to recovery queue.
+        Queue carts that went quiet since the last run.
+
+        A cart is abandoned once its latest snapshot is an open cart with
+        items (updated or checkout_started, no order) older than the
+        threshold, and its user has an email to recover with. Only carts
+        whose latest activity is newer than the stored watermark are
+        examined; the watermark advances in the caller's transaction, so
+        a rolled-back run is repeated. The first run looks back
+        RECOVERY_WINDOW_HOURS. A concurrent run returns nothing.
 
         Returns list of newly queued abandonments.
         """
         threshold = threshold_hours or self.ABANDONMENT_THRESHOLD_HOURS
-        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=threshold)
-        recovery_expiry = datetime.now(timezone.utc) + timedelta(hours=self.RECOVERY_WINDOW_HOURS)
+        now = datetime.now(timezone.utc)
+        cutoff_time = now - timedelta(hours=threshold)
+        recovery_expiry = now + timedelta(hours=self.RECOVERY_WINDOW_HOURS)
 
-        # Find carts that haven't been updated since cutoff
-        # and haven't converted
-        # and aren't already in queue
-
-        # Get recent cart snapshots that haven't converted
-        result = await db.execute(
-            select(CartSnapshot)
-            .where(
-                CartSnapshot.snapshot_type.in_(["updated", "checkout_started"]),
-                CartSnapshot.snapshot_at < cutoff_time,
-                CartSnapshot.order_id == None,
-                CartSnapshot.item_count > 0,
-            )
-            .order_by(CartSnapshot.snapshot_at.desc())
+        await db.execute(
+            text("INSERT INTO abandonment_watermarks (name) VALUES (:name) ON CONFLICT (name) DO NOTHING"),
+            {"name": WATERMARK_NAME},
         )
-        snapshots = result.scalars().all()
-
-        # Deduplicate by cart_id (take most recent)
-        seen_carts = set()
-        unique_snapshots = []
-        for snap in snapshots:
-            if snap.cart_id not in seen_carts:
-                seen_carts.add(snap.cart_id)
-                unique_snapshots.append(snap)
-
-        queued = []
-
-        for snapshot in unique_snapshots:
-            # Check if already in queue
-            existing = await db.execute(
-                select(CartAbandonmentQueue).where(
-                    CartAbandonmentQueue.cart_id == snapshot.cart_id,
-                    CartAbandonmentQueue.recovery_status.in_(["pending", "email_sent"]),
-                )
-            )
-            if existing.scalar_one_or_none():
-                continue
-
-            # Get user info if available
-            user_email = None
-            user_name = None
-
-            if snapshot.user_id:
-                user_result = await db.execute(
-                    select(User).where(User.id == snapshot.user_id)
-                )
-                user = user_result.scalar_one_or_none()
-                if user:
-                    user_email = user.email
-                    user_name = user.name
-
-            # Skip if no email (can't recover)
-            if not user_email:
-                continue
-
-            # Calculate priority
-            priority = self._calculate_priority(snapshot)
-
-            # Create queue entry
-            abandonment = CartAbandonmentQueue(
-                cart_id=snapshot.cart_id,
-                session_id=snapshot.session_id,
-                user_id=snapshot.user_id,
-                user_email=user_email,
-                user_name=user_name,
-                cart_snapshot=snapshot.items,
-                cart_value=snapshot.subtotal,
-                item_count=snapshot.item_count,
-                last_activity_at=snapshot.snapshot_at,
-                checkout_step_reached="checkout" if snapshot.snapshot_type == "checkout_started" else None,
-                recovery_priority=priority,
-                expires_at=recovery_expiry,
-            )
-
-            db.add(abandonment)
-            queued.append(abandonment)
+        row = (await db.execute(
+            text("SELECT watermark FROM abandonment_watermarks WHERE name = :name FOR UPDATE SKIP LOCKED"),
+            {"name": WATERMARK_NAME},
+        )).fetchone()
+        if row is None:
+            logger.info("Abandonment detection already running; skipped")
+            return []
+
+        since = row.watermark or cutoff_time - timedelta(hours=self.RECOVERY_WINDOW_HOURS)
+        queued_ids: List[int] = []
+        if cutoff_time > since:
+            result = await db.execute(QUEUE_ABANDONED_SQL, {
+                "since": since,
+                "cutoff": cutoff_time,
+                "high_value": self.HIGH_VALUE_THRESHOLD,
+                "medium_value": self.MEDIUM_VALUE_THRESHOLD,
+                "expires_at": recovery_expiry,
+            })
+            queued_ids = [r.id for r in result.fetchall()]
+
+            await db.execute(text("""
+                UPDATE abandonment_watermarks
+                SET watermark = :cutoff, carts_queued = carts_queued + :queued, updated_at = NOW()
+                WHERE name = :name
+            """), {"cutoff": cutoff_time, "queued": len(queued_ids), "name": WATERMARK_NAME})
 
         await db.flush()
 
-        logger.info(f"Detected {len(queued)} abandoned carts")
-        return queued
+        queued: List[CartAbandonmentQueue] = []
+        if queued_ids:
+            result = await db.execute(
+                select(CartAbandonmentQueue).where(CartAbandonmentQueue.id.in_(queued_ids))
+            )
+            queued = list(result.scalars().all())
 
-    def _calculate_priority(self, snapshot: CartSnapshot) -> str:
-        """Calculate recovery priority based on cart value and context."""
-        if snapshot.subtotal >= self.HIGH_VALUE_THRESHOLD:
-            return "high"
-        elif snapshot.subtotal >= Decimal("50"):
-            return "medium"
-        else:
-            return "low"
+        logger.info(f"Detected {len(queued)} abandoned carts (activity {since.isoformat()} .. {cutoff_time.isoformat()})")
+        return queued
 
     async def get_pending_recoveries(
         self,
@@ -5,10 +5,24 @@ Handles matching scanned barcodes to existing products, comic issues, or PriceCh
 Implements BLOCK-003 fix: atomic stock increment to prevent race conditions.
 
 Per constitution_db.json Section 5: Track change provenance (who, when, reason).
+
+v1.1.0 (PERF-049): Throughput mode for warehouse scanning sessions.
+- resolve_barcodes() matches a whole list of codes with one query per
+  identifier type (products.upc, products.isbn, comic_issues.upc)
+- scan_barcodes() then claims, counts and applies every product match in
+  one statement: one stock UPDATE per product (locked in id order) and
+  one stock_movements row per scan, inserted together
+- Each scan carries an idempotency key; a key already recorded in
+  barcode_scan_receipts is reported as a duplicate and never counted
+  twice, so a scanner can resend a batch after a timeout
+- process_barcode_queue_batch() does the same for queue items, claiming
+  them by status so a retried or concurrent batch skips them
 """
 import logging
+import uuid
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
@@ -18,6 +32,21 @@ from app.models.comic_data import ComicIssue
 
 logger = logging.getLogger(__name__)
 
+# Receipts only need to outlive client retries of a batch
+SCAN_RECEIPT_RETENTION_DAYS = 30
+
+SCHEMA_DDL = (
+    """
+    CREATE TABLE IF NOT EXISTS barcode_scan_receipts (
+        scan_key VARCHAR(100) PRIMARY KEY,
+        product_id INTEGER,
+        user_id INTEGER,
+        created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_barcode_scan_receipts_created ON barcode_scan_receipts (created_at)",
+)
+
 
 class BarcodeMatchResult:
     """Result of barcode matching attempt"""
@@ -31,7 +60,9 @@ class BarcodeMatchResult:
         confidence: int = 0,
         message: str = "",
         stock_incremented: bool = False,
-        new_stock: Optional[int] = None
+        new_stock: Optional[int] = None,
+        scan_id: Optional[str] = None,
+        duplicate: bool = False
     ):
         self.matched = matched
         self.match_type = match_type  # existing_product, comic_issue, funko, pricecharting
@@ -42,6 +73,8 @@ class BarcodeMatchResult:
         self.message = message
         self.stock_incremented = stock_incremented
         self.new_stock = new_stock
+        self.scan_id = scan_id  # PERF-049: batch scans only
+        self.duplicate = duplicate  # scan_id was already counted
 
 
 async def match_barcode(
@@ -376,3 +409,318 @@ async def process_barcode_queue_item(
         }
 
     return {"status": "error", "message": "Invalid action or missing data"}
+
+
+# ============================================================
+# PERF-049: Batch scanning
+# ============================================================
+
+@dataclass(frozen=True)
+class BarcodeScan:
+    """One scan in a batch; scan_id is the client's idempotency key."""
+    barcode: str
+    barcode_type: str = "UPC"
+    scan_id: Optional[str] = None
+
+
+def normalize_isbn(isbn: str) -> str:
+    return isbn.replace("-", "").replace(" ", "")
+
+
+def _apply_claimed_sql(claim: str) -> str:
+    """
+    Count claimed scans into stock in one statement.
+
+    claim is a data-modifying query returning (key, product_id, ord,
+    reference_id) for each scan that should count; only those rows move
+    stock. Products are locked in id order so concurrent batches sharing
+    SKUs cannot deadlock; each scan gets its own movement row, numbered
+    within its product by ord.
+    """
+    return f"""
+        WITH claimed AS (
+            {claim}
+        ),
+        counts AS (
+            SELECT product_id, COUNT(*) AS n FROM claimed GROUP BY product_id
+        ),
+        locked AS (
+            SELECT p.id FROM products p
+            WHERE p.id IN (SELECT product_id FROM counts) AND p.deleted_at IS NULL
+            ORDER BY p.id
+            FOR UPDATE
+        ),
+        bumped AS (
+            UPDATE products p
+            SET stock = p.stock + c.n, updated_at = NOW()
+            FROM counts c
+            WHERE p.id = c.product_id AND p.id IN (SELECT id FROM locked)
+            RETURNING p.id, p.name, p.stock - c.n AS previous_stock
+        ),
+        ranked AS (
+            SELECT claimed.*, ROW_NUMBER() OVER (PARTITION BY product_id ORDER BY ord) AS rn
+            FROM claimed
+        ),
+        moved AS (
+            INSERT INTO stock_movements (
+                product_id, movement_type, quantity, previous_stock, new_stock,
+                reason, reference_type, reference_id, user_id, created_at
+            )
+            SELECT r.product_id, 'received', 1, b.previous_stock + r.rn - 1, b.previous_stock + r.rn,
+                   :reason, 'scan_queue', r.reference_id, :user_id, NOW()
+            FROM ranked r JOIN bumped b ON b.id = r.product_id
+        )
+        SELECT r.key, r.product_id, b.name, b.previous_stock + r.rn AS new_stock
+        FROM ranked r JOIN bumped b ON b.id = r.product_id
+    """
+
+
+# Scans claim their idempotency key; keys seen before do nothing
+CLAIM_SCANS_SQL = text(_apply_claimed_sql("""
+            INSERT INTO barcode_scan_receipts (scan_key, product_id, user_id)
+            SELECT s.key, s.product_id, :user_id
+            FROM unnest(CAST(:keys AS TEXT[]), CAST(:product_ids AS INTEGER[])) AS s(key, product_id)
+            ORDER BY s.key
+            ON CONFLICT (scan_key) DO NOTHING
+            RETURNING scan_key AS key, product_id,
+                      array_position(CAST(:keys AS TEXT[]), scan_key) AS ord,
+                      NULL::INTEGER AS reference_id
+"""))
+
+# Queue items claim themselves by leaving the pending/matched states
+CLAIM_QUEUE_SQL = text(_apply_claimed_sql("""
+            UPDATE barcode_queue q
+            SET status = 'processed', processed_at = NOW(), processed_by = :user_id
+            FROM products p
+            WHERE q.id = ANY(CAST(:queue_ids AS INTEGER[]))
+              AND q.status NOT IN ('processed', 'skipped')
+              AND p.id = q.matched_product_id AND p.deleted_at IS NULL
+            RETURNING q.id::TEXT AS key, q.matched_product_id AS product_id,
+                      q.id AS ord, q.id AS reference_id
+"""))
+
+
+async def resolve_barcodes(
+    db: AsyncSession,
+    scans: Sequence[BarcodeScan],
+) -> List[BarcodeMatchResult]:
+    """
+    match_barcode() for a list of scans without touching stock.
+
+    Same priority (products by UPC/EAN or ISBN, then comic_issues by UPC
+    for UPC and ISBN scans), but one query per identifier type. Where
+    several rows share a code, the lowest id wins. Results follow the
+    input order.
+    """
+    upcs = sorted({s.barcode for s in scans if s.barcode_type in ("UPC", "EAN")})
+    isbns = sorted({normalize_isbn(s.barcode) for s in scans if s.barcode_type == "ISBN"})
+
+    by_upc: Dict[str, Tuple[int, str]] = {}
+    by_isbn: Dict[str, Tuple[int, str]] = {}
+    if upcs:
+        rows = await db.execute(text("""
+            SELECT DISTINCT ON (upc) upc, id, name FROM products
+            WHERE upc = ANY(CAST(:codes AS TEXT[])) AND deleted_at IS NULL
+            ORDER BY upc, id
+        """), {"codes": upcs})
+        by_upc = {r.upc: (r.id, r.name) for r in rows.fetchall()}
+    if isbns:
+        rows = await db.execute(text("""
+            SELECT DISTINCT ON (isbn) isbn, id, name FROM products
+            WHERE isbn = ANY(CAST(:codes AS TEXT[])) AND deleted_at IS NULL
+            ORDER BY isbn, id
+        """), {"codes": isbns})
+        by_isbn = {r.isbn: (r.id, r.name) for r in rows.fetchall()}
+
+    def product_for(scan: BarcodeScan) -> Optional[Tuple[int, str]]:
+        if scan.barcode_type in ("UPC", "EAN"):
+            return by_upc.get(scan.barcode)
+        if scan.barcode_type == "ISBN":
+            return by_isbn.get(normalize_isbn(scan.barcode))
+        return None
+
+    comic_codes = sorted({
+        s.barcode for s in scans
+        if s.barcode_type in ("UPC", "ISBN") and product_for(s) is None
+    })
+    by_comic: Dict[str, Tuple[int, str]] = {}
+    if comic_codes:
+        rows = await db.execute(text("""
+            SELECT DISTINCT ON (upc) upc, id, issue_name FROM comic_issues
+            WHERE upc = ANY(CAST(:codes AS TEXT[]))
+            ORDER BY upc, id
+        """), {"codes": comic_codes})
+        by_comic = {r.upc: (r.id, r.issue_name) for r in rows.fetchall()}
+
+    results = []
+    for scan in scans:
+        product = product_for(scan)
+        comic = by_comic.get(scan.barcode) if product is None and scan.barcode_type in ("UPC", "ISBN") else None
+        if product:
+            result = BarcodeMatchResult(
+                matched=True,
+                match_type="existing_product",
+                product_id=product[0],
+                confidence=100,
+                message=f"Found existing product: {product[1]}",
+            )
+        elif comic:
+            result = BarcodeMatchResult(
+                matched=True,
+                match_type="comic_issue",
+                comic_id=comic[0],
+                confidence=95,
+                message=f"Matched comic: {comic[1]}",
+            )
+        else:
+            result = BarcodeMatchResult(
+                matched=False,
+                message=f"No match found for {scan.barcode_type} {scan.barcode}",
+            )
+        result.scan_id = scan.scan_id
+        results.append(result)
+    return results
+
+
+async def scan_barcodes(
+    db: AsyncSession,
+    scans: Sequence[BarcodeScan],
+    user_id: int,
+    auto_increment_stock: bool = True,
+) -> List[BarcodeMatchResult]:
+    """
+    Throughput mode: resolve a batch of scans and count product matches.
+
+    Every scan matching a product adds one unit, unless its scan_id was
+    counted before (duplicate=True). Scans without a scan_id get a fresh
+    key and always count. The caller commits; until then the product rows
+    of the batch stay locked.
+    """
+    results = await resolve_barcodes(db, scans)
+    if not auto_increment_stock:
+        return results
+
+    keys, product_ids, positions = [], [], {}
+    for i, (scan, result) in enumerate(zip(scans, results)):
+        if result.match_type != "existing_product":
+            continue
+        key = scan.scan_id or f"auto-{uuid.uuid4()}"
+        if key in positions:
+            # Same key twice in one batch: the first one counts
+            result.duplicate = True
+            result.message = f"Scan {key} was already counted"
+            continue
+        positions[key] = i
+        keys.append(key)
+        product_ids.append(result.product_id)
+
+    applied = {}
+    if keys:
+        rows = await db.execute(CLAIM_SCANS_SQL, {
+            "keys": keys,
+            "product_ids": product_ids,
+            "user_id": user_id,
+            "reason": "Barcode scan - stock increment",
+        })
+        applied = {r.key: r for r in rows.fetchall()}
+
+    for key, i in positions.items():
+        result = results[i]
+        row = applied.get(key)
+        if row is not None:
+            result.stock_incremented = True
+            result.new_stock = row.new_stock
+            result.message = f"Incremented stock for {row.name}"
+        else:
+            result.duplicate = True
+            result.message = f"Scan {key} was already counted"
+
+    counted = len(applied)
+    logger.info(f"Batch scan: {len(scans)} scans, {counted} counted into stock, {len(keys) - counted} already counted")
+    return results
+
+
+async def process_barcode_queue_batch(
+    db: AsyncSession,
+    queue_ids: Sequence[int],
+    action: str,
+    user_id: int,
+) -> Dict[str, object]:
+    """
+    process_barcode_queue_item() for many items in one statement.
+
+    add_to_existing counts every matched item into its product's stock
+    (one UPDATE per product, one movement row per item); skip marks the
+    items skipped. Items already processed or skipped, unknown ids and
+    items without an available matched product are reported, not
+    retried. The caller commits.
+    """
+    ids = sorted(set(queue_ids))
+    if action == "skip":
+        rows = await db.execute(text("""
+            UPDATE barcode_queue
+            SET status = 'skipped', processed_at = NOW(), processed_by = :user_id
+            WHERE id = ANY(CAST(:queue_ids AS INTEGER[])) AND status NOT IN ('processed', 'skipped')
+            RETURNING id
+        """), {"queue_ids": ids, "user_id": user_id})
+        done = {r.id: {"status": "skipped", "queue_id": r.id} for r in rows.fetchall()}
+    elif action == "add_to_existing":
+        rows = await db.execute(CLAIM_QUEUE_SQL, {
+            "queue_ids": ids,
+            "user_id": user_id,
+            "reason": "Processed from scan queue",
+        })
+        done = {
+            int(r.key): {"status": "processed", "queue_id": int(r.key), "product_id": r.product_id, "new_stock": r.new_stock}
+            for r in rows.fetchall()
+        }
+    else:
+        raise ValueError(f"Unsupported batch action: {action}")
+
+    errors = []
+    missing = [i for i in ids if i not in done]
+    if missing:
+        rows = await db.execute(text("""
+            SELECT id, status, matched_product_id FROM barcode_queue
+            WHERE id = ANY(CAST(:queue_ids AS INTEGER[]))
+        """), {"queue_ids": missing})
+        found = {r.id: r for r in rows.fetchall()}
+        for queue_id in missing:
+            item = found.get(queue_id)
+            if item is None:
+                message = "Queue item not found"
+            elif item.status in ("processed", "skipped"):
+                message = f"Item already {item.status}"
+            elif not item.matched_product_id:
+                message = "No matched product"
+            else:
+                message = "Matched product is no longer available"
+            errors.append({"status": "error", "queue_id": queue_id, "message": message})
+
+    return {
+        "processed": len(done),
+        "errors": len(errors),
+        "results": [done[i] for i in ids if i in done],
+        "failures": errors,
+    }
+
+
+async def ensure_barcode_scan_receipts(db: AsyncSession) -> None:
+    """Startup hook: create barcode_scan_receipts if missing."""
+    try:
+        for statement in SCHEMA_DDL:
+            await db.execute(text(statement))
+        await db.commit()
+    except Exception as e:
+        logger.warning(f"barcode_scan_receipts table setup failed: {e}")
+        await db.rollback()
+
+
+async def prune_scan_receipts(db: AsyncSession, days: int = SCAN_RECEIPT_RETENTION_DAYS) -> int:
+    """Forget idempotency keys older than any client would retry."""
+    result = await db.execute(
+        text("DELETE FROM barcode_scan_receipts WHERE created_at < NOW() - make_interval(days => :days)"),
+        {"days": days},
+    )
+    await db.commit()
+    return result.rowcount or 0
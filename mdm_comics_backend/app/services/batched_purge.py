@@ -0,0 +1,301 @@
+"""
+Batched Purge v1.0.0
+
+PERF-044: Retention deletes and bulk revokes in bounded primary-key
+batches instead of one statement over the whole table.
+
+- Each batch locks up to batch_size matching rows above the cursor
+  (FOR UPDATE SKIP LOCKED, key order) within a window of at most
+  scan_factor x batch_size keys, deletes or updates them in the same
+  statement and commits. No transaction holds more than one batch of row
+  locks, rows a live request is touching are skipped rather than waited
+  on, and autovacuum can reclaim space between batches
+- The cursor is saved to purge_cursors in each batch's transaction, so a
+  run that crashes or hits max_seconds resumes where it stopped
+- Batch size adapts toward target_batch_ms; after every batch the purge
+  sleeps pause_ratio x the batch's duration, and waits while any standby
+  replays more than max_replica_lag_seconds behind
+- estimate_rows() answers "how many would this touch" from the planner
+  (EXPLAIN, which sums partition statistics) instead of a COUNT(*) scan
+
+Batches walk the primary key rather than ctid: an UPDATE purge moves the
+tuples it touches, so a ctid cursor would revisit them.
+"""
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 2000
+MIN_BATCH_SIZE = 100
+MAX_BATCH_SIZE = 20000
+DEFAULT_TARGET_BATCH_MS = 250.0
+DEFAULT_PAUSE_RATIO = 0.5
+DEFAULT_MAX_REPLICA_LAG_SECONDS = 10.0
+REPLICA_LAG_POLL_SECONDS = 1.0
+# Keys examined per batch, as a multiple of the batch size; bounds the
+# index range a batch reads when few rows in it match
+SCAN_FACTOR = 4
+
+SCHEMA_DDL = (
+    """
+    CREATE TABLE IF NOT EXISTS purge_cursors (
+        name VARCHAR(100) PRIMARY KEY,
+        last_key BIGINT,
+        max_key BIGINT,
+        rows_purged BIGINT NOT NULL DEFAULT 0,
+        batches INTEGER NOT NULL DEFAULT 0,
+        started_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+        updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+        completed_at TIMESTAMPTZ
+    )
+    """,
+)
+
+REPLICA_LAG_SQL = text("""
+    SELECT COALESCE(MAX(EXTRACT(EPOCH FROM replay_lag)), 0) FROM pg_stat_replication
+""")
+
+
+@dataclass(frozen=True)
+class PurgeSpec:
+    """
+    One purge: rows of table matching where (bind parameters allowed).
+
+    Rows are deleted, or updated with set_clause when given (columns of the
+    target row are referenced as t.<column>). key must be an integer,
+    indexed, unique column.
+    """
+    name: str
+    table: str
+    where: str
+    key: str = "id"
+    set_clause: Optional[str] = None
+
+
+def batch_sql(spec: PurgeSpec) -> str:
+    """One batch: lock, purge and report the window covered."""
+    if spec.set_clause:
+        change = f"""
+            UPDATE {spec.table} t SET {spec.set_clause}
+            FROM batch b WHERE t.{spec.key} = b.{spec.key}
+            RETURNING t.{spec.key}
+        """
+    else:
+        change = f"""
+            DELETE FROM {spec.table} t USING batch b
+            WHERE t.{spec.key} = b.{spec.key}
+            RETURNING t.{spec.key}
+        """
+    return f"""
+        WITH bound AS (
+            SELECT LEAST(COALESCE(
+                (SELECT {spec.key} FROM {spec.table} WHERE {spec.key} > :after
+                 ORDER BY {spec.key} OFFSET :scan_rows LIMIT 1),
+                :max_key
+            ), :max_key) AS range_end
+        ),
+        batch AS (
+            SELECT {spec.key} FROM {spec.table}
+            WHERE {spec.key} > :after
+              AND {spec.key} <= (SELECT range_end FROM bound)
+              AND ({spec.where})
+            ORDER BY {spec.key}
+            LIMIT :batch_size
+            FOR UPDATE SKIP LOCKED
+        ),
+        changed AS ({change})
+        SELECT
+            (SELECT COUNT(*) FROM batch) AS selected,
+            (SELECT COUNT(*) FROM changed) AS purged,
+            (SELECT MAX({spec.key}) FROM batch) AS last_key,
+            (SELECT range_end FROM bound) AS range_end
+    """
+
+
+def next_batch_size(current: int, elapsed_ms: float, target_ms: float) -> int:
+    """Scale toward target_ms, at most doubling or halving per batch."""
+    if elapsed_ms <= 0:
+        return min(current * 2, MAX_BATCH_SIZE)
+    scaled = current * max(0.5, min(2.0, target_ms / elapsed_ms))
+    return int(max(MIN_BATCH_SIZE, min(MAX_BATCH_SIZE, scaled)))
+
+
+async def ensure_purge_cursors(db: AsyncSession) -> None:
+    """Startup hook: create purge_cursors if missing."""
+    try:
+        for statement in SCHEMA_DDL:
+            await db.execute(text(statement))
+        await db.commit()
+    except Exception as e:
+        logger.warning(f"purge_cursors table setup failed: {e}")
+        await db.rollback()
+
+
+async def replica_lag_seconds(db: AsyncSession) -> float:
+    """Worst replay lag across connected standbys (0 with none, or no access)."""
+    try:
+        return float((await db.execute(REPLICA_LAG_SQL)).scalar() or 0)
+    except Exception as e:
+        logger.debug(f"Replica lag check failed: {e}")
+        await db.rollback()
+        return 0.0
+
+
+async def estimate_rows(db: AsyncSession, table: str, where: str = "TRUE", params: Optional[Mapping[str, Any]] = None) -> int:
+    """Planner estimate of rows in table matching where; no table scan."""
+    plan = (await db.execute(
+        text(f"EXPLAIN (FORMAT JSON) SELECT 1 FROM {table} WHERE {where}"), dict(params or {}),
+    )).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def _start(db: AsyncSession, spec: PurgeSpec, resume: bool) -> Dict[str, Any]:
+    """Resume an unfinished cursor, or start a fresh pass over the key range."""
+    if resume:
+        row = (await db.execute(
+            text("""
+                SELECT last_key, max_key, rows_purged, batches FROM purge_cursors
+                WHERE name = :name AND completed_at IS NULL AND last_key IS NOT NULL
+            """),
+            {"name": spec.name},
+        )).fetchone()
+        if row:
+            return {"after": row.last_key, "max_key": row.max_key, "rows": row.rows_purged,
+                    "batches": row.batches, "resumed_from": row.last_key}
+
+    bounds = (await db.execute(
+        text(f"SELECT MIN({spec.key}) AS min_key, MAX({spec.key}) AS max_key FROM {spec.table}")
+    )).fetchone()
+    after = (bounds.min_key - 1) if bounds.min_key is not None else 0
+    max_key = bounds.max_key if bounds.max_key is not None else 0
+    await db.execute(
+        text("""
+            INSERT INTO purge_cursors (name, last_key, max_key, rows_purged, batches, started_at, updated_at)
+            VALUES (:name, :after, :max_key, 0, 0, NOW(), NOW())
+            ON CONFLICT (name) DO UPDATE SET
+                last_key = EXCLUDED.last_key, max_key = EXCLUDED.max_key,
+                rows_purged = 0, batches = 0, started_at = NOW(), updated_at = NOW(),
+                completed_at = NULL
+        """),
+        {"name": spec.name, "after": after, "max_key": max_key},
+    )
+    await db.commit()
+    return {"after": after, "max_key": max_key, "rows": 0, "batches": 0, "resumed_from": None}
+
+
+async def run_purge(
+    db: AsyncSession,
+    spec: PurgeSpec,
+    params: Optional[Mapping[str, Any]] = None,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_seconds: Optional[float] = None,
+    target_batch_ms: float = DEFAULT_TARGET_BATCH_MS,
+    pause_ratio: float = DEFAULT_PAUSE_RATIO,
+    max_replica_lag_seconds: float = DEFAULT_MAX_REPLICA_LAG_SECONDS,
+    resume: bool = True,
+) -> Dict[str, Any]:
+    """
+    Purge every row matching spec in committed batches.
+
+    Commits after each batch (and discards anything pending on db first).
+    Returns rows purged across the pass, including batches from the run
+    being resumed, and status "complete", or "partial" when max_seconds
+    ran out; the next call then resumes from the saved cursor.
+    """
+    await db.commit()
+    started = time.monotonic()
+    deadline = started + max_seconds if max_seconds is not None else None
+    state = await _start(db, spec, resume)
+    statement = text(batch_sql(spec))
+    after, max_key = state["after"], state["max_key"]
+    status = "complete"
+
+    def out_of_time() -> bool:
+        return deadline is not None and time.monotonic() >= deadline
+
+    while after < max_key:
+        while not out_of_time() and await replica_lag_seconds(db) > max_replica_lag_seconds:
+            state["lag_waits"] = state.get("lag_waits", 0) + 1
+            await asyncio.sleep(REPLICA_LAG_POLL_SECONDS)
+        if out_of_time():
+            status = "partial"
+            break
+
+        batch_started = time.monotonic()
+        row = (await db.execute(statement, {
+            **(params or {}),
+            "after": after,
+            "max_key": max_key,
+            "batch_size": batch_size,
+            "scan_rows": batch_size * SCAN_FACTOR,
+        })).fetchone()
+        # A full batch may have stopped inside the window; otherwise the
+        # whole window was covered (rows skipped as locked wait for next run)
+        after = row.last_key if row.selected >= batch_size else row.range_end
+        state["rows"] += row.purged
+        state["batches"] += 1
+        await db.execute(
+            text("""
+                UPDATE purge_cursors
+                SET last_key = :after, rows_purged = rows_purged + :purged,
+                    batches = batches + 1, updated_at = NOW()
+                WHERE name = :name
+            """),
+            {"name": spec.name, "after": after, "purged": row.purged},
+        )
+        await db.commit()
+
+        elapsed = time.monotonic() - batch_started
+        batch_size = next_batch_size(batch_size, elapsed * 1000.0, target_batch_ms)
+        if pause_ratio > 0:
+            await asyncio.sleep(elapsed * pause_ratio)
+
+    if status == "complete":
+        await db.execute(
+            text("UPDATE purge_cursors SET completed_at = NOW(), updated_at = NOW() WHERE name = :name"),
+            {"name": spec.name},
+        )
+        await db.commit()
+
+    result = {
+        "name": spec.name,
+        "rows": state["rows"],
+        "batches": state["batches"],
+        "status": status,
+        "resumed_from": state["resumed_from"],
+        "replica_lag_waits": state.get("lag_waits", 0),
+        "seconds": round(time.monotonic() - started, 3),
+    }
+    logger.info(f"[PURGE] {spec.name}: {result['rows']} rows in {result['batches']} batches ({status})")
+    return result
+
+
+async def get_purge_cursors(db: AsyncSession) -> Dict[str, Dict[str, Any]]:
+    """Progress of every purge, last run first."""
+    rows = (await db.execute(text("""
+        SELECT name, last_key, max_key, rows_purged, batches, started_at, updated_at, completed_at
+        FROM purge_cursors ORDER BY updated_at DESC
+    """))).fetchall()
+    return {
+        row.name: {
+            "last_key": row.last_key,
+            "max_key": row.max_key,
+            "rows_purged": row.rows_purged,
+            "batches": row.batches,
+            "started_at": row.started_at.isoformat() if row.started_at else None,
+            "updated_at": row.updated_at.isoformat() if row.updated_at else None,
+            "completed_at": row.completed_at.isoformat() if row.completed_at else None,
+        }
+        for row in rows
+    }
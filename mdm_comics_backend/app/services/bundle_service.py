@@ -1,8 +1,15 @@
 """
-Bundle Service v1.0.0
+Bundle Service v1.1.0
 
 Core business logic for bundle CRUD operations.
 
+v1.1.0 (PERF-050): reprice_for_products() refreshes the item snapshots of
+every bundle containing a changed product and recomputes cost,
+compare-at, savings and margin in one statement, so bulk price changes
+reach storefront bundles without loading them one by one. Items whose
+price or cost an admin set (price_override/cost_override) keep it
+unless the caller asks to reset those flags.
+
 Per constitution_db.json:
 - DB-005: Track change provenance (who, when)
 - Section 5: Critical tables track change provenance
@@ -14,10 +21,10 @@ import re
 import logging
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Sequence, Tuple
 from uuid import uuid4
 
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import select, func, and_, or_, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -38,6 +45,102 @@ WARNING_MARGIN_PERCENT = Decimal("25.0")
 TARGET_MARGIN_PERCENT = Decimal("40.0")
 
 
+# PERF-050: Set-based repricing. Items of changed products take the
+# product's current price/cost (the same values add_item() snapshots)
+# unless that value is an admin override; other items keep their snapshot. Bundles are locked in id order so
+# overlapping repricing runs cannot deadlock. Only rows whose values
+# actually change are written. Percents are clamped to Numeric(5,2) so
+# one wildly mispriced bundle cannot fail the whole batch.
+REPRICE_BUNDLES_SQL = text("""
+    WITH locked AS (
+        SELECT b.id FROM bundles b
+        WHERE b.status <> 'ARCHIVED'
+          AND EXISTS (
+              SELECT 1 FROM bundle_items bi
+              WHERE bi.bundle_id = b.id
+                AND (CAST(:product_ids AS INTEGER[]) IS NULL OR bi.product_id = ANY(CAST(:product_ids AS INTEGER[])))
+          )
+        ORDER BY b.id
+        FOR UPDATE OF b
+    ),
+    fresh AS (
+        SELECT bi.id, bi.bundle_id, bi.quantity,
+               CASE WHEN NOT bi.price_override
+                         AND (CAST(:product_ids AS INTEGER[]) IS NULL OR bi.product_id = ANY(CAST(:product_ids AS INTEGER[])))
+                    THEN COALESCE(p.price, bi.unit_price) ELSE bi.unit_price END AS unit_price,
+               CASE WHEN NOT bi.cost_override
+                         AND (CAST(:product_ids AS INTEGER[]) IS NULL OR bi.product_id = ANY(CAST(:product_ids AS INTEGER[])))
+                    THEN COALESCE(p.original_price, bi.unit_cost) ELSE bi.unit_cost END AS unit_cost
+        FROM bundle_items bi
+        JOIN locked l ON l.id = bi.bundle_id
+        JOIN products p ON p.id = bi.product_id
+    ),
+    items AS (
+        UPDATE bundle_items bi
+        SET unit_price = f.unit_price,
+            unit_cost = f.unit_cost,
+            line_price = f.unit_price * f.quantity,
+            line_cost = f.unit_cost * f.quantity,
+            updated_at = NOW()
+        FROM fresh f
+        WHERE bi.id = f.id
+          AND (bi.unit_price, bi.unit_cost, bi.line_price, bi.line_cost)
+              IS DISTINCT FROM (f.unit_price, f.unit_cost, f.unit_price * f.quantity, f.unit_cost * f.quantity)
+        RETURNING bi.id
+    ),
+    totals AS (
+        SELECT l.id AS bundle_id,
+               COALESCE(SUM(f.unit_cost * f.quantity), 0) AS cost,
+               COALESCE(SUM(f.unit_price * f.quantity), 0) AS compare_at
+        FROM locked l LEFT JOIN fresh f ON f.bundle_id = l.id
+        GROUP BY l.id
+    ),
+    priced AS (
+        SELECT t.bundle_id, t.cost, t.compare_at,
+               CASE WHEN t.compare_at > 0 THEN t.compare_at - b.bundle_price ELSE 0 END AS savings_amount,
+               CASE WHEN t.compare_at > 0
+                    THEN GREATEST(-999.99, LEAST(999.99, ROUND((t.compare_at - b.bundle_price) / t.compare_at * 100, 2)))
+                    ELSE 0 END AS savings_percent,
+               CASE WHEN b.bundle_price > 0
+                    THEN GREATEST(-999.99, LEAST(999.99, ROUND((b.bundle_price - t.cost) / b.bundle_price * 100, 2)))
+                    ELSE 0 END AS margin_percent
+        FROM totals t JOIN bundles b ON b.id = t.bundle_id
+    ),
+    repriced AS (
+        UPDATE bundles b
+        SET cost = p.cost,
+            compare_at_price = p.compare_at,
+            savings_amount = p.savings_amount,
+            savings_percent = p.savings_percent,
+            margin_percent = p.margin_percent,
+            updated_at = NOW()
+        FROM priced p
+        WHERE b.id = p.bundle_id
+          AND (b.cost, b.compare_at_price, b.savings_amount, b.savings_percent, b.margin_percent)
+              IS DISTINCT FROM (p.cost, p.compare_at, p.savings_amount, p.savings_percent, p.margin_percent)
+        RETURNING b.id
+    )
+    SELECT (SELECT COUNT(*) FROM locked) AS bundles_checked,
+           (SELECT COUNT(*) FROM items) AS items_refreshed,
+           ARRAY(SELECT id FROM repriced ORDER BY id) AS repriced_ids
+""")
+
+# PERF-050: Drops the override flags of the items reprice_for_products()
+# would refresh, so the following reprice pass takes the product values.
+# This is how items flagged by the one-time backfill get released.
+CLEAR_ITEM_OVERRIDES_SQL = text("""
+    UPDATE bundle_items bi
+    SET price_override = FALSE,
+        cost_override = FALSE,
+        updated_at = NOW()
+    FROM bundles b
+    WHERE b.id = bi.bundle_id
+      AND b.status <> 'ARCHIVED'
+      AND (bi.price_override OR bi.cost_override)
+      AND (CAST(:product_ids AS INTEGER[]) IS NULL OR bi.product_id = ANY(CAST(:product_ids AS INTEGER[])))
+""")
+
+
 # ==================== Bundle Service ====================
 
 class BundleService:
@@ -338,6 +441,8 @@ class BundleService:
             quantity=data.quantity,
             unit_price=data.unit_price or product.price,
             unit_cost=data.unit_cost or product.original_price,
+            price_override=bool(data.unit_price),
+            cost_override=bool(data.unit_cost),
             display_order=data.display_order,
             is_featured=data.is_featured,
             custom_label=data.custom_label,
@@ -371,6 +476,20 @@ class BundleService:
         for field, value in update_data.items():
             setattr(item, field, value)
 
+        # An explicit price/cost is an override; null reverts to the product's
+        if "unit_price" in update_data or "unit_cost" in update_data:
+            product = (await db.execute(
+                select(Product.price, Product.original_price).where(Product.id == item.product_id)
+            )).one()
+            if "unit_price" in update_data:
+                item.price_override = update_data["unit_price"] is not None
+                if not item.price_override:
+                    item.unit_price = product.price
+            if "unit_cost" in update_data:
+                item.cost_override = update_data["unit_cost"] is not None
+                if not item.cost_override:
+                    item.unit_cost = product.original_price
+
         item.calculate_line_totals()
         item.updated_at = datetime.now(timezone.utc)
 
@@ -491,6 +610,8 @@ class BundleService:
                 unit_cost=item.unit_cost,
                 line_price=item.line_price,
                 line_cost=item.line_cost,
+                price_override=item.price_override,
+                cost_override=item.cost_override,
                 display_order=item.display_order,
                 is_featured=item.is_featured,
                 custom_label=item.custom_label,
@@ -541,6 +662,51 @@ class BundleService:
         else:
             bundle.margin_percent = Decimal("0")
 
+    @staticmethod
+    async def reprice_for_products(
+        db: AsyncSession,
+        product_ids: Optional[Sequence[int]] = None,
+        reset_overrides: bool = False
+    ) -> Dict[str, object]:
+        """
+        Refresh bundle pricing after product price/cost changes.
+
+        Items of the given products take the product's current price and
+        original_price, except where price_override/cost_override marks an
+        admin-set value; every non-archived bundle containing one of them
+        gets cost, compare-at, savings and margin recomputed as
+        _recalculate_bundle() would. product_ids=None reprices every
+        item of every non-archived bundle. reset_overrides=True first
+        clears the override flags of those items, so admin-set values
+        revert to the product's. The caller commits.
+
+        Returns counts and the ids of bundles whose pricing changed.
+        """
+        if product_ids is not None:
+            product_ids = sorted({int(pid) for pid in product_ids})
+            if not product_ids:
+                return {"bundles_checked": 0, "items_refreshed": 0, "bundles_repriced": 0, "bundle_ids": []}
+
+        if reset_overrides:
+            cleared = await db.execute(CLEAR_ITEM_OVERRIDES_SQL, {"product_ids": product_ids})
+            logger.info(f"Cleared override flags on {cleared.rowcount} bundle items")
+
+        result = await db.execute(REPRICE_BUNDLES_SQL, {"product_ids": product_ids})
+        row = result.fetchone()
+        bundle_ids = list(row.repriced_ids or [])
+
+        if bundle_ids:
+            logger.info(
+                f"Repriced {len(bundle_ids)} bundles ({row.items_refreshed} items refreshed) "
+                f"for {'all' if product_ids is None else len(product_ids)} products"
+            )
+        return {
+            "bundles_checked": row.bundles_checked,
+            "items_refreshed": row.items_refreshed,
+            "bundles_repriced": len(bundle_ids),
+            "bundle_ids": bundle_ids,
+        }
+
     @staticmethod
     def calculate_pricing(data: BundlePricingRequest) -> BundlePricingResponse:
         """Calculate pricing preview for proposed bundle items."""
@@ -581,3 +747,41 @@ class BundleService:
             is_margin_healthy=is_healthy,
             margin_warning=warning,
         )
+
+
+# ==================== Schema ====================
+
+# PERF-050: Existing items are marked as overrides where they no longer
+# match their product; stale snapshots cannot be told apart from
+# admin-set prices, so the safe reading keeps them. This is a one-time
+# review list: once checked, POST /api/admin/bundles/reprice with
+# reset_overrides=true releases the stale ones to their product values.
+ITEM_OVERRIDE_DDL = (
+    "ALTER TABLE bundle_items ADD COLUMN price_override BOOLEAN NOT NULL DEFAULT FALSE",
+    "ALTER TABLE bundle_items ADD COLUMN cost_override BOOLEAN NOT NULL DEFAULT FALSE",
+    """
+    UPDATE bundle_items bi
+    SET price_override = bi.unit_price IS NOT NULL AND bi.unit_price IS DISTINCT FROM p.price,
+        cost_override = bi.unit_cost IS NOT NULL AND bi.unit_cost IS DISTINCT FROM p.original_price
+    FROM products p
+    WHERE p.id = bi.product_id
+    """,
+)
+
+
+async def ensure_bundle_item_overrides(db: AsyncSession) -> None:
+    """Startup hook: add the override flags to bundle_items once, backfilled."""
+    try:
+        exists = await db.execute(text("""
+            SELECT 1 FROM information_schema.columns
+            WHERE table_name = 'bundle_items' AND column_name = 'price_override'
+        """))
+        if exists.fetchone():
+            return
+        for statement in ITEM_OVERRIDE_DDL:
+            await db.execute(text(statement))
+        await db.commit()
+        logger.info("Added price/cost override flags to bundle_items")
+    except Exception as e:
+        logger.warning(f"bundle_items override flags setup failed: {e}")
+        await db.rollback()
@@ -14,14 +14,19 @@ This fixes:
 - BE-001: Now checks local cache before hitting Metron API
 - BE-002: All writes batched into single transaction (removed individual commits)
 - BE-004: Auto-generate cover_hash from image URLs for image search
+
+v1.1.0: Write-through no longer blocks the response on cover downloads.
+One multi-row upsert per table per Metron response; cover hashes are
+computed by a deduplicated background queue (cover_hash_queue).
 """
+import asyncio
 import time
 import logging
 import io
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any, List, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, case
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import selectinload
 
@@ -44,10 +49,36 @@ logger = logging.getLogger(__name__)
 # COVER HASH GENERATION (BE-004)
 # =============================================================================
 
-async def generate_cover_hash_from_url(image_url: str) -> Tuple[Optional[str], Optional[str], Optional[bytes]]:
+def _phash_image_bytes(content: bytes) -> Tuple[Optional[str], Optional[str], Optional[bytes]]:
+    """Perceptual hash of raw image bytes (CPU-bound; run in a thread)."""
+    from PIL import Image
+    import imagehash
+
+    img = Image.open(io.BytesIO(content))
+    phash = imagehash.phash(img)
+
+    # Convert to storage formats
+    hash_hex = str(phash)  # 16-char hex string
+    hash_prefix = hash_hex[:8] if len(hash_hex) >= 8 else None
+    hash_bytes = None
+    if len(hash_hex) == 16:
+        try:
+            hash_bytes = bytes.fromhex(hash_hex)
+        except ValueError:
+            pass
+    return hash_hex, hash_prefix, hash_bytes
+
+
+async def generate_cover_hash_from_url(
+    image_url: str,
+    client=None,
+) -> Tuple[Optional[str], Optional[str], Optional[bytes]]:
     """
     Download cover image and generate perceptual hash.
 
+    v1.1.0: Accepts a shared httpx client (pooled connections) and hashes
+    off the event loop.
+
     Returns:
         Tuple of (cover_hash, cover_hash_prefix, cover_hash_bytes) or (None, None, None) on failure
     """
@@ -56,38 +87,27 @@ async def generate_cover_hash_from_url(image_url: str) -> Tuple[Optional[str], O
 
     try:
         import httpx
-        from PIL import Image
-        import imagehash
 
         # Download image with timeout
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        if client is None:
+            async with httpx.AsyncClient(timeout=10.0) as own_client:
+                response = await own_client.get(image_url, follow_redirects=True)
+        else:
             response = await client.get(image_url, follow_redirects=True)
-            if response.status_code != 200:
-                logger.debug(f"[COVER_HASH] Failed to download {image_url}: HTTP {response.status_code}")
-                return None, None, None
-
-            # Verify it's an image
-            content_type = response.headers.get('content-type', '')
-            if not content_type.startswith('image/'):
-                logger.debug(f"[COVER_HASH] Not an image: {content_type}")
-                return None, None, None
-
-            # Open image and compute hash
-            img = Image.open(io.BytesIO(response.content))
-            phash = imagehash.phash(img)
-
-            # Convert to storage formats
-            hash_hex = str(phash)  # 16-char hex string
-            hash_prefix = hash_hex[:8] if len(hash_hex) >= 8 else None
-            hash_bytes = None
-            if len(hash_hex) == 16:
-                try:
-                    hash_bytes = bytes.fromhex(hash_hex)
-                except ValueError:
-                    pass
-
-            logger.debug(f"[COVER_HASH] Generated hash {hash_hex[:8]}... for {image_url[:50]}")
-            return hash_hex, hash_prefix, hash_bytes
+
+        if response.status_code != 200:
+            logger.debug(f"[COVER_HASH] Failed to download {image_url}: HTTP {response.status_code}")
+            return None, None, None
+
+        # Verify it's an image
+        content_type = response.headers.get('content-type', '')
+        if not content_type.startswith('image/'):
+            logger.debug(f"[COVER_HASH] Not an image: {content_type}")
+            return None, None, None
+
+        hash_hex, hash_prefix, hash_bytes = await asyncio.to_thread(_phash_image_bytes, response.content)
+        logger.debug(f"[COVER_HASH] Generated hash {hash_hex[:8]}... for {image_url[:50]}")
+        return hash_hex, hash_prefix, hash_bytes
 
     except ImportError as e:
         logger.warning(f"[COVER_HASH] Missing dependency: {e}. Install imagehash and Pillow.")
@@ -96,6 +116,161 @@ async def generate_cover_hash_from_url(image_url: str) -> Tuple[Optional[str], O
         logger.debug(f"[COVER_HASH] Error generating hash for {image_url[:50]}: {e}")
         return None, None, None
 
+
+# Cover hash queue sizing
+COVER_HASH_QUEUE_SIZE = 2000
+COVER_HASH_WORKERS = 4
+COVER_HASH_FLUSH_SIZE = 25
+
+
+class CoverHashQueue:
+    """
+    Deduplicated background queue for BE-004 cover hashing.
+
+    v1.1.0: Cache writes enqueue (metron_id, image_url) instead of
+    downloading covers inline. A small pool of workers shares one httpx
+    client, hashes in threads, and writes hashes back in batches. A hash is
+    only stored if the issue still points at the image that was hashed.
+
+    Pending work is in-process only; anything lost on restart is picked
+    up by the cover_hash_backfill job.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = COVER_HASH_QUEUE_SIZE,
+        workers: int = COVER_HASH_WORKERS,
+        flush_size: int = COVER_HASH_FLUSH_SIZE,
+    ):
+        self._maxsize = maxsize
+        self._worker_count = workers
+        self._flush_size = flush_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._pending: Dict[int, str] = {}
+        self._workers: List[asyncio.Task] = []
+        self._client = None
+        self._results: List[Dict[str, Any]] = []
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self.stats = {"enqueued": 0, "deduplicated": 0, "dropped": 0, "hashed": 0, "failed": 0}
+
+    def enqueue(self, metron_id: int, image_url: str) -> bool:
+        """Queue a cover for hashing. Returns False if deduplicated or dropped."""
+        if not metron_id or not image_url:
+            return False
+        current = self._pending.get(metron_id)
+        if current is not None:
+            # Already queued: the queued slot hashes the latest URL
+            self._pending[metron_id] = image_url
+            self.stats["deduplicated"] += 1
+            return False
+        self._ensure_workers()
+        try:
+            self._queue.put_nowait(metron_id)
+        except asyncio.QueueFull:
+            self.stats["dropped"] += 1
+            return False
+        self._pending[metron_id] = image_url
+        self.stats["enqueued"] += 1
+        return True
+
+    @property
+    def depth(self) -> int:
+        return len(self._pending)
+
+    def _ensure_workers(self) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self._maxsize)
+            self._flush_lock = asyncio.Lock()
+        self._workers = [w for w in self._workers if not w.done()]
+        while len(self._workers) < self._worker_count:
+            self._workers.append(asyncio.create_task(self._worker()))
+
+    def _get_client(self):
+        if self._client is None:
+            import httpx
+            self._client = httpx.AsyncClient(
+                timeout=10.0,
+                limits=httpx.Limits(max_connections=self._worker_count * 2,
+                                    max_keepalive_connections=self._worker_count),
+            )
+        return self._client
+
+    async def _worker(self) -> None:
+        while True:
+            metron_id = await self._queue.get()
+            try:
+                image_url = self._pending.pop(metron_id, None)
+                if image_url is None:
+                    continue
+                cover_hash, prefix, hash_bytes = await generate_cover_hash_from_url(
+                    image_url, client=self._get_client()
+                )
+                if not cover_hash:
+                    self.stats["failed"] += 1
+                    continue
+                self._results.append({
+                    "metron_id": metron_id, "image": image_url,
+                    "hash": cover_hash, "prefix": prefix, "bytes": hash_bytes,
+                })
+                if len(self._results) >= self._flush_size or self._queue.empty():
+                    await self.flush()
+            except Exception as e:
+                logger.warning(f"[COVER_HASH] Worker error for issue {metron_id}: {e}")
+            finally:
+                self._queue.task_done()
+
+    async def flush(self) -> int:
+        """Write buffered hashes back in one executemany."""
+        async with self._flush_lock:
+            batch, self._results = self._results, []
+            if not batch:
+                return 0
+            from sqlalchemy import text
+            from app.core.database import AsyncSessionLocal
+
+            try:
+                async with AsyncSessionLocal() as db:
+                    await db.execute(text("""
+                        UPDATE comic_issues
+                        SET cover_hash = :hash,
+                            cover_hash_prefix = :prefix,
+                            cover_hash_bytes = :bytes,
+                            updated_at = NOW()
+                        WHERE metron_id = :metron_id AND image = :image
+                    """), batch)
+                    await db.commit()
+                self.stats["hashed"] += len(batch)
+            except Exception as e:
+                self.stats["failed"] += len(batch)
+                logger.warning(f"[COVER_HASH] Failed to store {len(batch)} cover hashes: {e}")
+            return len(batch)
+
+    async def join(self) -> None:
+        """Wait until everything queued so far is hashed and stored."""
+        if self._queue is not None:
+            await self._queue.join()
+            await self.flush()
+
+    async def stop(self) -> None:
+        """Cancel workers and close the shared client (app shutdown)."""
+        for worker in self._workers:
+            worker.cancel()
+        for worker in self._workers:
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+        self._workers = []
+        if self._results:
+            await self.flush()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+cover_hash_queue = CoverHashQueue()
+
+
 # Cache staleness threshold in hours
 CACHE_STALENESS_HOURS = 24
 
@@ -285,61 +460,78 @@ class ComicCacheService:
     # PRIVATE: BATCH CACHE METHODS (no individual commits!)
     # ==========================================================================
 
-    async def _cache_publisher_batch(self, db: AsyncSession, publisher_data: Dict) -> Optional[ComicPublisher]:
-        """Cache publisher WITHOUT committing - caller manages transaction."""
-        if not publisher_data or not publisher_data.get('id'):
+    # v1.1.0: Publishers, series and issues from one Metron response are
+    # upserted with one multi-row statement per table. Rows are deduplicated
+    # by metron_id first (ON CONFLICT cannot touch the same row twice).
+
+    @staticmethod
+    def _parse_date(value: Any):
+        if not value:
+            return None
+        try:
+            return datetime.strptime(value, '%Y-%m-%d').date()
+        except (ValueError, TypeError):
             return None
 
-        stmt = insert(ComicPublisher).values(
-            metron_id=publisher_data['id'],
-            name=publisher_data.get('name', 'Unknown'),
-            founded=publisher_data.get('founded'),
-            image=publisher_data.get('image'),
-            raw_data=publisher_data,
-            updated_at=utcnow()
-        ).on_conflict_do_update(
-            index_elements=['metron_id'],
-            set_={
-                'name': publisher_data.get('name', 'Unknown'),
-                'founded': publisher_data.get('founded'),
-                'image': publisher_data.get('image'),
-                'raw_data': publisher_data,
-                'updated_at': utcnow()
+    @staticmethod
+    def _normalize_cover_hash(cover_hash: Optional[str]) -> Tuple[Optional[str], Optional[str], Optional[bytes]]:
+        """BE-003: Use a source-provided hash (for image search optimization)."""
+        if not cover_hash:
+            return None, None, None
+        normalized_hash = cover_hash.strip().lower()
+        prefix = normalized_hash[:8] if len(normalized_hash) >= 8 else None
+        hash_bytes = None
+        if len(normalized_hash) == 16:
+            try:
+                hash_bytes = bytes.fromhex(normalized_hash)
+            except ValueError:
+                hash_bytes = None
+        return normalized_hash, prefix, hash_bytes
+
+    async def _upsert_publishers(self, db: AsyncSession, publishers: List[Dict]) -> Dict[int, int]:
+        """Upsert publishers in one statement. Returns {metron_id: id}."""
+        now = utcnow()
+        rows = {
+            p['id']: {
+                'metron_id': p['id'],
+                'name': p.get('name', 'Unknown'),
+                'founded': p.get('founded'),
+                'image': p.get('image'),
+                'raw_data': p,
+                'updated_at': now,
             }
-        ).returning(ComicPublisher)
+            for p in publishers if p and p.get('id')
+        }
+        if not rows:
+            return {}
+
+        stmt = insert(ComicPublisher).values(list(rows.values()))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['metron_id'],
+            set_={col: stmt.excluded[col] for col in ('name', 'founded', 'image', 'raw_data', 'updated_at')}
+        ).returning(ComicPublisher.metron_id, ComicPublisher.id)
 
         result = await db.execute(stmt)
         # NO COMMIT HERE - batched
-        return result.scalar_one_or_none()
+        return {row[0]: row[1] for row in result.fetchall()}
 
-    async def _cache_series_batch(self, db: AsyncSession, series_data: Dict) -> Optional[ComicSeries]:
-        """Cache series WITHOUT committing."""
-        if not series_data or not series_data.get('id'):
-            return None
+    async def _upsert_series(self, db: AsyncSession, series_list: List[Dict]) -> Dict[int, int]:
+        """Upsert series (and their publishers) in one statement each. Returns {metron_id: id}."""
+        series_list = [s for s in series_list if s and s.get('id')]
+        if not series_list:
+            return {}
 
-        publisher_id = None
-        if series_data.get('publisher'):
-            publisher = await self._cache_publisher_batch(db, series_data['publisher'])
-            if publisher:
-                publisher_id = publisher.id
-
-        stmt = insert(ComicSeries).values(
-            metron_id=series_data['id'],
-            name=series_data.get('name', 'Unknown'),
-            sort_name=series_data.get('sort_name'),
-            volume=series_data.get('volume'),
-            year_began=series_data.get('year_began'),
-            year_ended=series_data.get('year_ended'),
-            issue_count=series_data.get('issue_count'),
-            image=series_data.get('image'),
-            publisher_id=publisher_id,
-            description=series_data.get('desc'),
-            series_type=series_data.get('series_type', {}).get('name') if isinstance(series_data.get('series_type'), dict) else series_data.get('series_type'),
-            raw_data=series_data,
-            updated_at=utcnow()
-        ).on_conflict_do_update(
-            index_elements=['metron_id'],
-            set_={
+        publisher_ids = await self._upsert_publishers(
+            db, [s['publisher'] for s in series_list if isinstance(s.get('publisher'), dict)]
+        )
+
+        now = utcnow()
+        rows = {}
+        for series_data in series_list:
+            publisher = series_data.get('publisher')
+            series_type = series_data.get('series_type')
+            rows[series_data['id']] = {
+                'metron_id': series_data['id'],
                 'name': series_data.get('name', 'Unknown'),
                 'sort_name': series_data.get('sort_name'),
                 'volume': series_data.get('volume'),
@@ -347,99 +539,59 @@ class ComicCacheService:
                 'year_ended': series_data.get('year_ended'),
                 'issue_count': series_data.get('issue_count'),
                 'image': series_data.get('image'),
-                'publisher_id': publisher_id,
+                'publisher_id': publisher_ids.get(publisher.get('id')) if isinstance(publisher, dict) else None,
                 'description': series_data.get('desc'),
+                'series_type': series_type.get('name') if isinstance(series_type, dict) else series_type,
                 'raw_data': series_data,
-                'updated_at': utcnow()
+                'updated_at': now,
+            }
+
+        stmt = insert(ComicSeries).values(list(rows.values()))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['metron_id'],
+            set_={
+                col: stmt.excluded[col]
+                for col in ('name', 'sort_name', 'volume', 'year_began', 'year_ended', 'issue_count',
+                            'image', 'publisher_id', 'description', 'raw_data', 'updated_at')
             }
-        ).returning(ComicSeries)
+        ).returning(ComicSeries.metron_id, ComicSeries.id)
 
         result = await db.execute(stmt)
         # NO COMMIT HERE - batched
-        return result.scalar_one_or_none()
-
-    async def _cache_issue_batch(self, db: AsyncSession, issue_data: Dict) -> Optional[ComicIssue]:
-        """Cache issue WITHOUT committing."""
-        if not issue_data or not issue_data.get('id'):
-            return None
+        return {row[0]: row[1] for row in result.fetchall()}
 
-        series_id = None
-        if issue_data.get('series'):
-            series = await self._cache_series_batch(db, issue_data['series'])
-            if series:
-                series_id = series.id
+    async def _upsert_issues(
+        self, db: AsyncSession, issues: List[Dict]
+    ) -> Tuple[Dict[int, int], List[Tuple[int, str]]]:
+        """
+        Upsert issues (with series and publishers) - three statements total.
 
-        cover_date = None
-        if issue_data.get('cover_date'):
-            try:
-                cover_date = datetime.strptime(issue_data['cover_date'], '%Y-%m-%d').date()
-            except (ValueError, TypeError):
-                pass
+        BE-004: Covers are no longer downloaded inline. An existing hash is
+        kept while the image URL is unchanged; issues still lacking a hash
+        are returned as (metron_id, image) for _queue_cover_hashes once the
+        caller has committed. Returns ({metron_id: id}, needs_hash).
+        """
+        issues = [i for i in issues if i and i.get('id')]
+        if not issues:
+            return {}, []
 
-        store_date = None
-        if issue_data.get('store_date'):
-            try:
-                store_date = datetime.strptime(issue_data['store_date'], '%Y-%m-%d').date()
-            except (ValueError, TypeError):
-                pass
+        series_ids = await self._upsert_series(
+            db, [i['series'] for i in issues if isinstance(i.get('series'), dict)]
+        )
 
-        # BE-003: Extract cover_hash from raw_data if present (for image search optimization)
-        # BE-004: If no hash but has image URL, generate hash from downloaded image
-        cover_hash = issue_data.get('cover_hash')
-        cover_hash_prefix = None
-        cover_hash_bytes = None
-
-        if cover_hash:
-            # Use existing hash from data source
-            normalized_hash = cover_hash.strip().lower()
-            cover_hash = normalized_hash
-            if len(normalized_hash) >= 8:
-                cover_hash_prefix = normalized_hash[:8]
-            if len(normalized_hash) == 16:
-                try:
-                    cover_hash_bytes = bytes.fromhex(normalized_hash)
-                except ValueError:
-                    cover_hash_bytes = None
-        elif issue_data.get('image'):
-            # BE-004: No hash provided, generate from image URL
-            try:
-                cover_hash, cover_hash_prefix, cover_hash_bytes = await generate_cover_hash_from_url(
-                    issue_data['image']
-                )
-            except Exception as e:
-                logger.debug(f"[CACHE] Cover hash generation failed for issue {issue_data.get('id')}: {e}")
-
-        stmt = insert(ComicIssue).values(
-            metron_id=issue_data['id'],
-            series_id=series_id,
-            number=issue_data.get('number'),
-            issue_name=issue_data.get('name') or issue_data.get('issue_name'),
-            cover_date=cover_date,
-            store_date=store_date,
-            image=issue_data.get('image'),
-            price=issue_data.get('price'),
-            page_count=issue_data.get('page_count'),
-            upc=issue_data.get('upc'),
-            sku=issue_data.get('sku'),
-            isbn=issue_data.get('isbn'),
-            description=issue_data.get('desc'),
-            is_variant=issue_data.get('variant', False),
-            variant_name=issue_data.get('variant_name'),
-            rating=issue_data.get('rating', {}).get('name') if isinstance(issue_data.get('rating'), dict) else issue_data.get('rating'),
-            cover_hash=cover_hash,
-            cover_hash_prefix=cover_hash_prefix,
-            cover_hash_bytes=cover_hash_bytes,
-            raw_data=issue_data,
-            updated_at=utcnow(),
-            last_fetched=utcnow()
-        ).on_conflict_do_update(
-            index_elements=['metron_id'],
-            set_={
-                'series_id': series_id,
+        now = utcnow()
+        rows = {}
+        for issue_data in issues:
+            series = issue_data.get('series')
+            rating = issue_data.get('rating')
+            cover_hash, cover_hash_prefix, cover_hash_bytes = self._normalize_cover_hash(issue_data.get('cover_hash'))
+            rows[issue_data['id']] = {
+                'metron_id': issue_data['id'],
+                'series_id': series_ids.get(series.get('id')) if isinstance(series, dict) else None,
                 'number': issue_data.get('number'),
                 'issue_name': issue_data.get('name') or issue_data.get('issue_name'),
-                'cover_date': cover_date,
-                'store_date': store_date,
+                'cover_date': self._parse_date(issue_data.get('cover_date')),
+                'store_date': self._parse_date(issue_data.get('store_date')),
                 'image': issue_data.get('image'),
                 'price': issue_data.get('price'),
                 'page_count': issue_data.get('page_count'),
@@ -449,18 +601,80 @@ class ComicCacheService:
                 'description': issue_data.get('desc'),
                 'is_variant': issue_data.get('variant', False),
                 'variant_name': issue_data.get('variant_name'),
+                'rating': rating.get('name') if isinstance(rating, dict) else rating,
                 'cover_hash': cover_hash,
                 'cover_hash_prefix': cover_hash_prefix,
                 'cover_hash_bytes': cover_hash_bytes,
                 'raw_data': issue_data,
-                'updated_at': utcnow(),
-                'last_fetched': utcnow()
+                'updated_at': now,
+                'last_fetched': now,
             }
-        ).returning(ComicIssue)
 
+        table = ComicIssue.__table__
+        stmt = insert(ComicIssue).values(list(rows.values()))
+        excluded = stmt.excluded
+
+        def keep_hash(col: str):
+            # New source hash wins; otherwise keep ours unless the image changed
+            return case(
+                (excluded[col].isnot(None), excluded[col]),
+                (table.c.image.isnot_distinct_from(excluded.image), table.c[col]),
+                else_=None,
+            )
+
+        set_ = {
+            col: excluded[col]
+            for col in ('series_id', 'number', 'issue_name', 'cover_date', 'store_date', 'image', 'price',
+                        'page_count', 'upc', 'sku', 'isbn', 'description', 'is_variant', 'variant_name',
+                        'raw_data', 'updated_at', 'last_fetched')
+        }
+        set_.update({col: keep_hash(col) for col in ('cover_hash', 'cover_hash_prefix', 'cover_hash_bytes')})
+
+        stmt = stmt.on_conflict_do_update(index_elements=['metron_id'], set_=set_).returning(
+            ComicIssue.metron_id, ComicIssue.id, ComicIssue.image, ComicIssue.cover_hash
+        )
         result = await db.execute(stmt)
         # NO COMMIT HERE - batched
-        return result.scalar_one_or_none()
+
+        ids, needs_hash = {}, []
+        for metron_id, issue_id, image, stored_hash in result.fetchall():
+            ids[metron_id] = issue_id
+            if image and not stored_hash:
+                needs_hash.append((metron_id, image))
+        return ids, needs_hash
+
+    @staticmethod
+    def _queue_cover_hashes(needs_hash: List[Tuple[int, str]]) -> None:
+        """Hand committed issues to the background cover hash workers."""
+        for metron_id, image in needs_hash:
+            cover_hash_queue.enqueue(metron_id, image)
+
+    async def _cache_publisher_batch(self, db: AsyncSession, publisher_data: Dict) -> Optional[ComicPublisher]:
+        """Cache publisher WITHOUT committing - caller manages transaction."""
+        ids = await self._upsert_publishers(db, [publisher_data])
+        if not ids:
+            return None
+        return await db.get(ComicPublisher, next(iter(ids.values())), populate_existing=True)
+
+    async def _cache_series_batch(self, db: AsyncSession, series_data: Dict) -> Optional[ComicSeries]:
+        """Cache series WITHOUT committing."""
+        ids = await self._upsert_series(db, [series_data])
+        if not ids:
+            return None
+        return await db.get(ComicSeries, next(iter(ids.values())), populate_existing=True)
+
+    async def _cache_issue_batch(self, db: AsyncSession, issue_data: Dict) -> Optional[ComicIssue]:
+        """
+        Cache issue WITHOUT committing.
+
+        The cover hash is queued immediately; if it lands before the caller
+        commits, the cover_hash_backfill job picks the issue up later.
+        """
+        ids, needs_hash = await self._upsert_issues(db, [issue_data])
+        if not ids:
+            return None
+        self._queue_cover_hashes(needs_hash)
+        return await db.get(ComicIssue, next(iter(ids.values())), populate_existing=True)
 
     async def _cache_character_batch(self, db: AsyncSession, char_data: Dict) -> Optional[ComicCharacter]:
         """Cache character WITHOUT committing."""
@@ -600,8 +814,8 @@ class ComicCacheService:
         duration_ms = int((time.time() - start_time) * 1000)
 
         # Step 3: Batch cache all results (SINGLE TRANSACTION)
-        for issue_data in result.get('results', []):
-            await self._cache_issue_batch(db, issue_data)
+        # v1.1.0: One multi-row upsert per table; cover hashing is queued
+        _, needs_hash = await self._upsert_issues(db, result.get('results', []))
 
         # Log API call (also batched)
         await self._log_api_call_batch(
@@ -624,6 +838,7 @@ class ComicCacheService:
 
         # SINGLE COMMIT for all operations
         await db.commit()
+        self._queue_cover_hashes(needs_hash)
 
         result["source"] = "metron"
         return result
@@ -663,7 +878,7 @@ class ComicCacheService:
         duration_ms = int((time.time() - start_time) * 1000)
 
         # Batch cache (single transaction)
-        await self._cache_issue_batch(db, result)
+        _, needs_hash = await self._upsert_issues(db, [result])
 
         # Cache characters and creators
         for char in result.get('characters', []):
@@ -686,6 +901,7 @@ class ComicCacheService:
 
         # SINGLE COMMIT
         await db.commit()
+        self._queue_cover_hashes(needs_hash)
 
         result["source"] = "metron"
         return result
@@ -733,8 +949,7 @@ class ComicCacheService:
         duration_ms = int((time.time() - start_time) * 1000)
 
         # Batch cache
-        for series_data in result.get('results', []):
-            await self._cache_series_batch(db, series_data)
+        await self._upsert_series(db, result.get('results', []))
 
         await self._log_api_call_batch(
             db=db,
@@ -791,8 +1006,7 @@ class ComicCacheService:
 
         duration_ms = int((time.time() - start_time) * 1000)
 
-        for pub_data in result.get('results', []):
-            await self._cache_publisher_batch(db, pub_data)
+        await self._upsert_publishers(db, result.get('results', []))
 
         await self._log_api_call_batch(
             db=db,
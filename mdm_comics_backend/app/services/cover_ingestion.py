@@ -9,28 +9,42 @@ v1.0.0: Local cover image ingestion pipeline
 - Products are only created after approval in Match Review screen
 - Supports incremental ingestion (tracks processed files)
 
+v1.1.0: Bulk ingestion mode (ingest_folder_bulk)
+- Series names preloaded once per run into an in-memory index
+- Each file is read once; hashing and thumbnails run in a process pool and
+  a file's bytes and thumbnail are dropped as soon as they are uploaded
+- S3 uploads run with bounded concurrency
+- Match Review rows written with multi-row INSERT ... ON CONFLICT DO NOTHING
+
 This service handles both:
 1. Bulk ingestion from local folders (15k books initially)
 2. Mobile scanning workflow (future)
 """
 
+import asyncio
+import bisect
+import io
 import logging
 import os
 import re
 import hashlib
-from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone, timedelta
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Tuple, Any
 from pathlib import Path
 
 from sqlalchemy import select, func, text, or_, and_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.product import Product
 from app.models.comic_data import ComicIssue, ComicSeries, ComicPublisher
 from app.models.match_review import MatchReviewQueue
 from app.services.storage import StorageService, UploadResult
-from app.services.match_review_service import MatchReviewService, MatchDisposition, route_match
+from app.services.match_review_service import (
+    ESCALATION_DAYS, MatchReviewService, MatchDisposition, route_match,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +63,48 @@ PUBLISHER_ALIASES = {
     'aftershock': ['after shock', 'aftershock', 'after shock comics', 'aftershock comics'],
 }
 
+SYSTEM_FILES = ('thumbs.db', '.ds_store', 'desktop.ini')
+
+CONTENT_TYPES = {
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.webp': 'image/webp',
+}
+
+# Bulk ingestion tuning (v1.1.0)
+BULK_HASH_CHUNK_SIZE = 256         # Files per round (one queue INSERT batch)
+BULK_UPLOAD_CONCURRENCY = 8        # Concurrent S3 PUTs
+BULK_QUEUE_INSERT_SIZE = 500       # Match Review rows per INSERT statement
+BULK_ISSUE_LOOKUP_CHUNK = 1000     # Series ids per comic_issues lookup
+THUMBNAIL_SIZE = (300, 450)
+
+
+def _hash_and_thumbnail(content: bytes) -> Tuple[str, Optional[bytes]]:
+    """
+    Hash a cover file's bytes and render a JPEG thumbnail.
+
+    Runs in a worker process during bulk ingestion, so it must stay a
+    picklable module-level function. Returns (md5, thumbnail).
+    """
+    file_hash = hashlib.md5(content).hexdigest()
+
+    thumbnail = None
+    try:
+        from PIL import Image
+
+        with Image.open(io.BytesIO(content)) as img:
+            img = img.convert("RGB")
+            img.thumbnail(THUMBNAIL_SIZE)
+            buf = io.BytesIO()
+            img.save(buf, format="JPEG", quality=80)
+            thumbnail = buf.getvalue()
+    except Exception:
+        # Thumbnail is a convenience for the review screen; hash is what matters
+        thumbnail = None
+
+    return file_hash, thumbnail
+
 
 @dataclass
 class CoverMetadata:
@@ -99,6 +155,166 @@ class BatchIngestionResult:
     error_details: List[str] = field(default_factory=list)
 
 
+@dataclass
+class SeriesCandidate:
+    """A comic_series row as held by SeriesNameIndex."""
+    series_id: int
+    name: str
+    volume: Optional[int]
+    publisher_name: str
+
+
+@dataclass
+class IssueCandidate:
+    """A comic_issues row as needed to build Match Review candidate data."""
+    id: int
+    series_id: int
+    number: str
+    publisher_name: Optional[str]
+    image: Optional[str]
+    price_loose: Optional[float]
+    price_cgc_98: Optional[float]
+    pricecharting_id: Optional[int]
+
+
+class SeriesNameIndex:
+    """
+    In-memory series resolver for bulk cover ingestion.
+
+    Loaded once per run from comic_series. resolve_series() selects the
+    series match_to_comic_issue's queries select: every series whose
+    lowercased name contains the (normalized, lowercased) folder name.
+    The ILIKE fallback there uses the same pattern, so it selects the same
+    series. Names are searched as one newline-joined string, so a lookup
+    is a C-level str.find scan, cached per distinct folder name.
+    Issues are loaded lazily per resolved series and kept by issue number.
+    """
+
+    def __init__(self, series: List[SeriesCandidate]):
+        self._series = series
+        self._starts: List[int] = []
+        names = []
+        offset = 0
+        for candidate in series:
+            name = candidate.name.lower().replace("\n", " ")
+            self._starts.append(offset)
+            names.append(name)
+            offset += len(name) + 1
+        self._haystack = "\n".join(names)
+        self._issues: Dict[Tuple[int, str], List[IssueCandidate]] = {}
+        self._loaded_series: set = set()
+        self._resolve_cache: Dict[str, List[SeriesCandidate]] = {}
+
+    @classmethod
+    async def load(cls, db: AsyncSession) -> "SeriesNameIndex":
+        result = await db.execute(
+            select(ComicSeries.id, ComicSeries.name, ComicSeries.volume, ComicPublisher.name)
+            .outerjoin(ComicPublisher, ComicSeries.publisher_id == ComicPublisher.id)
+            .order_by(ComicSeries.id)
+        )
+        series = [
+            SeriesCandidate(series_id=row[0], name=row[1] or "", volume=row[2], publisher_name=row[3] or "")
+            for row in result.all()
+        ]
+        logger.info(f"Loaded {len(series)} series into bulk ingestion index")
+        return cls(series)
+
+    def resolve_series(self, series_name: str) -> List[SeriesCandidate]:
+        """Series whose lowercased name contains series_name (already normalized)."""
+        needle = series_name.lower()
+        if needle in self._resolve_cache:
+            return self._resolve_cache[needle]
+
+        candidates: List[SeriesCandidate] = []
+        if needle and "\n" not in needle:
+            position = self._haystack.find(needle)
+            while position != -1:
+                i = bisect.bisect_right(self._starts, position) - 1
+                candidates.append(self._series[i])
+                if i + 1 == len(self._starts):
+                    break
+                position = self._haystack.find(needle, self._starts[i + 1])
+
+        self._resolve_cache[needle] = candidates
+        return candidates
+
+    async def load_issues(self, db: AsyncSession, series_ids: List[int]) -> None:
+        """Fetch issues for series not yet loaded (one query per chunk)."""
+        pending = [sid for sid in set(series_ids) if sid not in self._loaded_series]
+        for i in range(0, len(pending), BULK_ISSUE_LOOKUP_CHUNK):
+            chunk = pending[i:i + BULK_ISSUE_LOOKUP_CHUNK]
+            result = await db.execute(
+                select(
+                    ComicIssue.id, ComicIssue.series_id, ComicIssue.number,
+                    ComicIssue.publisher_name, ComicIssue.image,
+                    ComicIssue.price_loose, ComicIssue.price_cgc_98, ComicIssue.pricecharting_id,
+                ).where(ComicIssue.series_id.in_(chunk))
+            )
+            for row in result.all():
+                issue = IssueCandidate(
+                    id=row[0], series_id=row[1], number=row[2] or "",
+                    publisher_name=row[3], image=row[4],
+                    price_loose=float(row[5]) if row[5] is not None else None,
+                    price_cgc_98=float(row[6]) if row[6] is not None else None,
+                    pricecharting_id=row[7],
+                )
+                self._issues.setdefault((issue.series_id, issue.number), []).append(issue)
+            self._loaded_series.update(chunk)
+
+    def issues_for(self, candidates: List[SeriesCandidate], issue_number: str) -> List[Tuple[SeriesCandidate, IssueCandidate]]:
+        return [
+            (candidate, issue)
+            for candidate in candidates
+            for issue in self._issues.get((candidate.series_id, issue_number), [])
+        ]
+
+    def match(self, metadata: CoverMetadata, candidates: List[SeriesCandidate]
+              ) -> Tuple[Optional[Tuple[SeriesCandidate, IssueCandidate]], int, str]:
+        """
+        Score a cover against its resolved series.
+
+        Mirrors the strategy ladder and scores of match_to_comic_issue so
+        route_match dispositions are identical in both modes.
+        """
+        if not metadata.series or not metadata.issue_number:
+            return None, 0, "insufficient_data"
+
+        publisher = metadata.publisher.lower()
+
+        def by_publisher(pairs):
+            for pair in pairs:
+                if pair[1].publisher_name and publisher in pair[1].publisher_name.lower():
+                    return pair
+            return None
+
+        # Strategy 1: series + volume + issue
+        if metadata.volume:
+            pairs = self.issues_for(
+                [c for c in candidates if c.volume == metadata.volume], metadata.issue_number
+            )
+            if len(pairs) == 1:
+                return pairs[0], 9, "exact_series_volume_issue"
+            elif pairs:
+                preferred = by_publisher(pairs)
+                if preferred:
+                    return preferred, 8, "exact_series_volume_issue_publisher"
+                return pairs[0], 7, "exact_series_volume_issue_ambiguous"
+
+        # Strategy 2: series + issue
+        pairs = self.issues_for(candidates, metadata.issue_number)
+        if len(pairs) == 1:
+            return pairs[0], 8, "series_issue"
+        elif pairs:
+            preferred = by_publisher(pairs)
+            if preferred:
+                return preferred, 7, "series_issue_publisher"
+            return pairs[0], 5, "series_issue_ambiguous"
+
+        # Strategy 3 (ILIKE '%series%') selects these same series, so no
+        # fuzzy_series_issue match can exist when strategy 2 found none
+        return None, 0, "no_match"
+
+
 class CoverIngestionService:
     """
     Service for ingesting local cover images into the Match Review queue.
@@ -124,10 +340,12 @@ class CoverIngestionService:
         self.storage = storage or StorageService()
         self.review_service = MatchReviewService(db)
 
-    def parse_folder_path(self, file_path: str, base_path: str) -> CoverMetadata:
+    def parse_folder_path(self, file_path: str, base_path: str, compute_hash: bool = True) -> CoverMetadata:
         """
         Parse folder structure to extract metadata.
 
+        Bulk ingestion passes compute_hash=False and hashes in a process pool.
+
         Expected structure:
         base_path/publisher/series/[volume]/issue/filename.jpg
 
@@ -197,6 +415,9 @@ class CoverIngestionService:
         if cgc_match:
             metadata.cgc_grade = float(cgc_match.group(1))
 
+        if not compute_hash:
+            return metadata
+
         # Generate file hash for deduplication
         try:
             with open(file_path, 'rb') as f:
@@ -382,6 +603,47 @@ class CoverIngestionService:
 
         return " ".join(parts) if parts else "Unknown Comic"
 
+    def _build_candidate_data(
+        self,
+        metadata: CoverMetadata,
+        product_name: str,
+        s3_url: Optional[str],
+        s3_key: Optional[str],
+        comic_issue_data: Optional[Dict[str, Any]],
+        s3_thumb_url: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Match Review candidate_data payload for a cover."""
+        return {
+            # File info
+            "file_path": metadata.full_path,
+            "filename": metadata.filename,
+            "cover_type": metadata.cover_type,
+            # S3 URL for cover display (if uploaded)
+            "s3_url": s3_url,
+            "s3_key": s3_key,
+            "s3_thumb_url": s3_thumb_url,
+            # Parsed metadata
+            "publisher": metadata.publisher,
+            "series": metadata.series,
+            "volume": metadata.volume,
+            "issue_number": metadata.issue_number,
+            "variant_code": metadata.variant_code,
+            "cgc_grade": metadata.cgc_grade,
+            # Matched comic issue data
+            "matched_comic_issue": comic_issue_data,
+            # For product creation on approval
+            "product_template": {
+                "name": product_name,
+                "category": "comics",
+                "subcategory": metadata.publisher,
+                "publisher": metadata.publisher,
+                "issue_number": metadata.issue_number,
+                "cgc_grade": metadata.cgc_grade,
+                "is_graded": metadata.cgc_grade is not None,
+                "stock": 1,
+            }
+        }
+
     async def ingest_single_cover(
         self,
         file_path: str,
@@ -414,7 +676,7 @@ class CoverIngestionService:
 
         # Skip Thumbs.db and other system files
         filename = os.path.basename(file_path)
-        if filename.lower() in ('thumbs.db', '.ds_store', 'desktop.ini'):
+        if filename.lower() in SYSTEM_FILES:
             result.skipped = True
             result.skip_reason = "System file"
             return result
@@ -483,13 +745,7 @@ class CoverIngestionService:
 
                     # Determine content type from extension
                     ext = Path(file_path).suffix.lower()
-                    content_types = {
-                        '.jpg': 'image/jpeg',
-                        '.jpeg': 'image/jpeg',
-                        '.png': 'image/png',
-                        '.webp': 'image/webp',
-                    }
-                    content_type = content_types.get(ext, 'image/jpeg')
+                    content_type = CONTENT_TYPES.get(ext, 'image/jpeg')
 
                     # Upload to S3 under covers folder
                     upload_result = await storage.upload_product_image(
@@ -515,35 +771,9 @@ class CoverIngestionService:
                 candidate_source="local_folder",
                 candidate_id=metadata.file_hash or file_path,
                 candidate_name=product_name,
-                candidate_data={
-                    # File info
-                    "file_path": metadata.full_path,
-                    "filename": metadata.filename,
-                    "cover_type": metadata.cover_type,
-                    # S3 URL for cover display (if uploaded)
-                    "s3_url": s3_url,
-                    "s3_key": s3_key,
-                    # Parsed metadata
-                    "publisher": metadata.publisher,
-                    "series": metadata.series,
-                    "volume": metadata.volume,
-                    "issue_number": metadata.issue_number,
-                    "variant_code": metadata.variant_code,
-                    "cgc_grade": metadata.cgc_grade,
-                    # Matched comic issue data
-                    "matched_comic_issue": comic_issue_data,
-                    # For product creation on approval
-                    "product_template": {
-                        "name": product_name,
-                        "category": "comics",
-                        "subcategory": metadata.publisher,
-                        "publisher": metadata.publisher,
-                        "issue_number": metadata.issue_number,
-                        "cgc_grade": metadata.cgc_grade,
-                        "is_graded": metadata.cgc_grade is not None,
-                        "stock": 1,
-                    }
-                },
+                candidate_data=self._build_candidate_data(
+                    metadata, product_name, s3_url, s3_key, comic_issue_data
+                ),
                 match_method=method,
                 match_score=score,
                 match_details={
@@ -570,6 +800,20 @@ class CoverIngestionService:
             await self.db.rollback()
             return result
 
+    def _collect_image_files(self, folder_path: str) -> List[str]:
+        """Recursively list supported image files, skipping web-optimized folders."""
+        image_files = []
+        for root, dirs, files in os.walk(folder_path):
+            # Skip web-optimized subfolders
+            if 'web' in dirs:
+                dirs.remove('web')
+
+            for filename in files:
+                ext = os.path.splitext(filename)[1].lower()
+                if ext in self.SUPPORTED_EXTENSIONS:
+                    image_files.append(os.path.join(root, filename))
+        return image_files
+
     async def ingest_folder(
         self,
         folder_path: str,
@@ -593,18 +837,7 @@ class CoverIngestionService:
         """
         result = BatchIngestionResult()
 
-        # Collect all image files
-        image_files = []
-        for root, dirs, files in os.walk(folder_path):
-            # Skip web-optimized subfolders
-            if 'web' in dirs:
-                dirs.remove('web')
-
-            for filename in files:
-                ext = os.path.splitext(filename)[1].lower()
-                if ext in self.SUPPORTED_EXTENSIONS:
-                    image_files.append(os.path.join(root, filename))
-
+        image_files = self._collect_image_files(folder_path)
         result.total_files = len(image_files)
 
         if limit:
@@ -648,6 +881,240 @@ class CoverIngestionService:
 
         return result
 
+    async def ingest_folder_bulk(
+        self,
+        folder_path: str,
+        user_id: int,
+        limit: Optional[int] = None,
+        progress_callback: Optional[callable] = None,
+        max_workers: Optional[int] = None,
+        upload_concurrency: int = BULK_UPLOAD_CONCURRENCY,
+    ) -> BatchIngestionResult:
+        """
+        Bulk variant of ingest_folder for large folders (15k+ covers).
+
+        Same queue semantics as ingest_folder, but:
+        - series are resolved in memory against a SeriesNameIndex loaded once,
+          before any file is read (series, volume and issue come from paths)
+        - each file is read once: its bytes are hashed/thumbnailed in a
+          process pool and uploaded, then dropped, so memory is bounded by
+          the files in flight rather than the folder
+        - uploads run with bounded concurrency off the event loop
+        - Match Review rows are inserted in multi-row statements, with
+          duplicates (uq_match_candidate) dropped by ON CONFLICT DO NOTHING
+
+        Args:
+            folder_path: Root folder to scan
+            user_id: User performing ingestion
+            limit: Max files to process (for testing)
+            progress_callback: Callback(current, total) for progress updates
+            max_workers: Process pool size (defaults to CPU count)
+            upload_concurrency: Max concurrent S3 uploads
+
+        Returns:
+            BatchIngestionResult
+        """
+        result = BatchIngestionResult()
+
+        image_files = [
+            path for path in self._collect_image_files(folder_path)
+            if os.path.basename(path).lower() not in SYSTEM_FILES
+        ]
+        result.total_files = len(image_files)
+        if limit:
+            image_files = image_files[:limit]
+
+        # Stage 1: parse paths and resolve series in memory
+        index = await SeriesNameIndex.load(self.db)
+        items: List[Tuple[CoverMetadata, List[SeriesCandidate]]] = []
+        needed_series = set()
+        for path in image_files:
+            metadata = self.parse_folder_path(path, folder_path, compute_hash=False)
+            candidates = index.resolve_series(self._normalize_series_name(metadata.series))
+            items.append((metadata, candidates))
+            needed_series.update(c.series_id for c in candidates)
+        await index.load_issues(self.db, list(needed_series))
+
+        # Files already queued (or repeated within this run) are skipped
+        seen_hashes = await self._queued_cover_hashes()
+
+        # Stage 2: per file read -> hash/thumbnail -> upload -> queue row
+        expires_at = datetime.utcnow() + timedelta(days=ESCALATION_DAYS)
+        workers = max_workers or os.cpu_count() or 1
+        in_flight = asyncio.Semaphore(workers + upload_concurrency)
+        uploads = asyncio.Semaphore(upload_concurrency)
+        loop = asyncio.get_running_loop()
+
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+
+            async def ingest_one(metadata: CoverMetadata, candidates: List[SeriesCandidate]):
+                """Queue row for one file, None if already queued, or the exception."""
+                async with in_flight:
+                    try:
+                        content = await asyncio.to_thread(Path(metadata.full_path).read_bytes)
+                        file_hash, thumbnail = await loop.run_in_executor(pool, _hash_and_thumbnail, content)
+                    except Exception as e:
+                        return e
+                    if file_hash in seen_hashes:
+                        return None
+                    seen_hashes.add(file_hash)
+                    metadata.file_hash = file_hash
+                    async with uploads:
+                        s3_url, s3_key, thumb_url = await self._upload_cover_bulk(metadata, content, thumbnail)
+                return self._bulk_queue_row(index, metadata, candidates, s3_url, s3_key, thumb_url, expires_at)
+
+            for start in range(0, len(items), BULK_HASH_CHUNK_SIZE):
+                window = items[start:start + BULK_HASH_CHUNK_SIZE]
+                outcomes = await asyncio.gather(*(ingest_one(m, c) for m, c in window))
+                rows = []
+                for (metadata, _), outcome in zip(window, outcomes):
+                    result.processed += 1
+                    if isinstance(outcome, Exception):
+                        result.errors += 1
+                        result.error_details.append(f"{metadata.full_path}: {outcome}")
+                    elif outcome is None:
+                        result.skipped += 1
+                    else:
+                        rows.append(outcome)
+
+                await self._insert_queue_rows_bulk(rows, start, result)
+                if progress_callback:
+                    progress_callback(start + len(window), len(items))
+
+        logger.info(
+            f"Bulk ingestion complete: {result.queued_for_review} queued for review "
+            f"({result.high_confidence} high, {result.medium_confidence} medium, "
+            f"{result.low_confidence} low confidence), {result.skipped} skipped, "
+            f"{result.errors} errors"
+        )
+
+        return result
+
+    def _bulk_queue_row(
+        self,
+        index: SeriesNameIndex,
+        metadata: CoverMetadata,
+        candidates: List[SeriesCandidate],
+        s3_url: Optional[str],
+        s3_key: Optional[str],
+        thumb_url: Optional[str],
+        expires_at: datetime,
+    ) -> Dict[str, Any]:
+        """Match Review queue row for one hashed and uploaded cover."""
+        match, score, method = index.match(metadata, candidates)
+        comic_issue_data = None
+        if match:
+            series, issue = match
+            metadata.matched_issue_id = issue.id
+            comic_issue_data = {
+                "id": issue.id,
+                "series_name": series.name,
+                "number": issue.number,
+                "publisher_name": issue.publisher_name,
+                "image": issue.image,
+                "price_loose": issue.price_loose,
+                "price_cgc_98": issue.price_cgc_98,
+                "pricecharting_id": issue.pricecharting_id,
+            }
+        metadata.match_score = score
+        metadata.match_method = method
+        disposition = route_match(method, score, 1 if match else 0)
+        product_name = self._build_product_name(metadata)
+
+        return {
+            "entity_type": "cover_ingestion",
+            "entity_id": 0,  # No product yet - created on approval
+            "candidate_source": "local_folder",
+            "candidate_id": metadata.file_hash,
+            "candidate_name": product_name,
+            "candidate_data": self._build_candidate_data(
+                metadata, product_name, s3_url, s3_key, comic_issue_data, thumb_url
+            ),
+            "match_method": method,
+            "match_score": score,
+            "match_details": {
+                "matched_issue_id": metadata.matched_issue_id,
+                "disposition": disposition.value,
+            },
+            "status": "pending",
+            "expires_at": expires_at,
+        }
+
+    async def _insert_queue_rows_bulk(self, rows: List[Dict[str, Any]], offset: int, result: BatchIngestionResult) -> None:
+        """Multi-row queue INSERTs; rows dropped by uq_match_candidate count as skipped."""
+        for start in range(0, len(rows), BULK_QUEUE_INSERT_SIZE):
+            chunk = rows[start:start + BULK_QUEUE_INSERT_SIZE]
+            try:
+                inserted = await self.db.execute(
+                    pg_insert(MatchReviewQueue)
+                    .values(chunk)
+                    .on_conflict_do_nothing(constraint="uq_match_candidate")
+                    .returning(MatchReviewQueue.candidate_id)
+                )
+                inserted_ids = set(inserted.scalars().all())
+                await self.db.commit()
+            except Exception as e:
+                logger.error(f"Bulk queue insert failed at file {offset + start}: {e}")
+                await self.db.rollback()
+                result.errors += len(chunk)
+                result.error_details.append(f"queue insert files {offset + start}+ ({len(chunk)} rows): {e}")
+                continue
+
+            for row in chunk:
+                if row["candidate_id"] not in inserted_ids:
+                    result.skipped += 1
+                    continue
+                result.queued_for_review += 1
+                if row["match_score"] >= 8:
+                    result.high_confidence += 1
+                elif row["match_score"] >= 5:
+                    result.medium_confidence += 1
+                else:
+                    result.low_confidence += 1
+
+    async def _queued_cover_hashes(self) -> set:
+        """File hashes already present in the Match Review queue (one query per run)."""
+        found = await self.db.execute(
+            select(MatchReviewQueue.candidate_id).where(MatchReviewQueue.entity_type == "cover_ingestion")
+        )
+        return set(found.scalars().all())
+
+    async def _upload_cover_bulk(
+        self,
+        metadata: CoverMetadata,
+        content: bytes,
+        thumbnail: Optional[bytes],
+    ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """Upload a cover (already read) and its thumbnail; (s3_url, s3_key, thumb_url)."""
+        if not self.storage.is_configured():
+            return None, None, None
+
+        try:
+            content_type = CONTENT_TYPES.get(Path(metadata.full_path).suffix.lower(), 'image/jpeg')
+            upload = await self.storage.upload_product_image_threaded(
+                content=content,
+                filename=metadata.filename,
+                content_type=content_type,
+                product_type="covers",
+            )
+            if not upload.success:
+                logger.warning(f"S3 upload failed for {metadata.full_path}: {upload.error}")
+                return None, None, None
+
+            thumb_url = None
+            if thumbnail:
+                thumb = await self.storage.upload_product_image_threaded(
+                    content=thumbnail,
+                    filename=f"thumb_{Path(metadata.filename).stem}.jpg",
+                    content_type="image/jpeg",
+                    product_type="covers/thumbs",
+                )
+                thumb_url = thumb.url if thumb.success else None
+            return upload.url, upload.key, thumb_url
+        except Exception as e:
+            logger.warning(f"S3 upload error for {metadata.full_path}: {e}")
+            return None, None, None
+
     async def scan_folder_preview(
         self,
         folder_path: str,
@@ -674,7 +1141,7 @@ class CoverIngestionService:
                     continue
 
                 # Skip system files
-                if filename.lower() in ('thumbs.db', '.ds_store', 'desktop.ini'):
+                if filename.lower() in SYSTEM_FILES:
                     continue
 
                 file_path = os.path.join(root, filename)
@@ -1,5 +1,5 @@
 """
-Data Ingestion Service v1.0.0
+Data Ingestion Service v1.1.0
 
 Unified service for data ingestion operations with bulk processing.
 
@@ -14,6 +14,16 @@ Features:
 - Progress tracking and error handling
 - Integration with arq background jobs
 
+v1.1.0 (PERF-041): Streaming bulk engine
+- CSV and JSON sources are parsed incrementally (ijson when installed,
+  otherwise a stdlib array scanner); memory is bounded by batch_size
+- Each batch is COPYed into a TEXT staging table and merged with one
+  INSERT ... SELECT ... ON CONFLICT, cast to the target column types;
+  RETURNING (xmax = 0) gives real inserted vs updated counts
+- Resumable: options.checkpoint_callback records the source position in
+  the same transaction as each batch, and options.resume_from skips
+  records an earlier run already committed
+
 Usage:
     from app.services.data_ingestion import DataIngestionService
 
@@ -30,18 +40,30 @@ import csv
 import json
 import logging
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import date, datetime, time, timezone
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Type, Union
 
 from sqlalchemy import insert, select, text, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+try:
+    import ijson
+except ImportError:  # optional: stdlib scanner handles top-level arrays
+    ijson = None
+
 from app.core.utils import utcnow
 
 logger = logging.getLogger(__name__)
 
+# Per-merge staging table (session-local, dropped at commit at the latest)
+STAGING_TABLE = "_ingest_stage"
+
+# Read size for the stdlib JSON array scanner
+JSON_READ_CHUNK = 1024 * 1024
+
 
 # =============================================================================
 # DATA CLASSES
@@ -60,6 +82,9 @@ class IngestionStats:
     error_samples: List[str] = field(default_factory=list)
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
+    # Source records consumed through the last committed batch
+    position: int = 0
+    resumed_from: int = 0
 
     @property
     def duration_seconds(self) -> float:
@@ -84,6 +109,8 @@ class IngestionStats:
             "error_samples": self.error_samples[:10],  # Limit to 10
             "duration_seconds": round(self.duration_seconds, 2),
             "rows_per_second": round(self.rows_per_second, 2),
+            "position": self.position,
+            "resumed_from": self.resumed_from,
         }
 
 
@@ -103,6 +130,228 @@ class IngestionOptions:
     # Value transformers (field -> callable)
     transformers: Dict[str, Callable[[Any], Any]] = field(default_factory=dict)
 
+    # Upsert key for update_existing (default: first covered unique key)
+    conflict_columns: List[str] = field(default_factory=list)
+
+    # Skip the first N source records (committed by an earlier run)
+    resume_from: int = 0
+    # Awaited with the source position inside each batch's transaction
+    checkpoint_callback: Optional[Callable[[int], Awaitable[None]]] = None
+
+
+# =============================================================================
+# STREAMING READERS
+# =============================================================================
+
+
+def iter_csv_records(file_path: Union[str, Path]) -> Iterator[Dict[str, str]]:
+    """Yield CSV rows as dicts, reading the file once."""
+    with open(file_path, "r", encoding="utf-8-sig", newline="") as f:
+        yield from csv.DictReader(f)
+
+
+def iter_json_records(file_path: Union[str, Path], json_path: Optional[str] = None) -> Iterator[Any]:
+    """
+    Yield the records of a JSON array without loading the document.
+
+    json_path ("data.items") selects a nested array. With ijson any path
+    streams; the stdlib fallback streams top-level arrays and JSON Lines
+    and loads the document only for nested paths.
+    """
+    file_path = Path(file_path)
+    if file_path.suffix.lower() in (".jsonl", ".ndjson"):
+        with open(file_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        return
+
+    if ijson is not None:
+        prefix = f"{json_path}.item" if json_path else "item"
+        with open(file_path, "rb") as f:
+            yield from ijson.items(f, prefix, use_float=True)
+        return
+
+    with open(file_path, "r", encoding="utf-8-sig") as f:
+        if not json_path:
+            yield from _scan_json_array(f)
+            return
+        logger.warning(f"ijson not installed; loading {file_path.name} fully to reach '{json_path}'")
+        data = json.load(f)
+    for key in json_path.split("."):
+        data = data[key]
+    if not isinstance(data, list):
+        raise ValueError("JSON data must be an array of records")
+    yield from data
+
+
+def _scan_json_array(f, chunk_size: int = JSON_READ_CHUNK) -> Iterator[Any]:
+    """Decode the elements of a top-level JSON array from a text stream."""
+    decoder = json.JSONDecoder()
+    buf, pos, eof = "", 0, False
+
+    def fill() -> None:
+        nonlocal buf, pos, eof
+        more = f.read(chunk_size)
+        eof = not more
+        buf, pos = buf[pos:] + more, 0
+
+    def skip(chars: str) -> None:
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in chars:
+                pos += 1
+            if pos < len(buf) or eof:
+                return
+            fill()
+
+    fill()
+    skip(" \t\r\n")
+    if pos >= len(buf) or buf[pos] != "[":
+        raise ValueError("JSON data must be an array of records")
+    pos += 1
+    while True:
+        skip(" \t\r\n,")
+        if pos >= len(buf):
+            raise ValueError("Unterminated JSON array")
+        if buf[pos] == "]":
+            return
+        try:
+            record, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            fill()
+            continue
+        # A scalar ending exactly at the buffer edge may continue in the next chunk
+        if end == len(buf) and not eof:
+            fill()
+            continue
+        yield record
+        pos = end
+
+
+# =============================================================================
+# BULK MERGE HELPERS
+# =============================================================================
+
+
+def _copy_text(value: Any) -> Optional[str]:
+    """Render a value for the TEXT staging table (cast back in the merge)."""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    return str(value)
+
+
+@dataclass
+class _TableMeta:
+    """Column types and unique keys of an ingestion target table."""
+    name: str
+    types: Dict[str, str]
+    # Primary key first, then other full (non-partial) unique indexes
+    unique_keys: List[List[str]]
+    ignored: set = field(default_factory=set)
+
+    @classmethod
+    async def load(cls, db: AsyncSession, table_name: str) -> "_TableMeta":
+        oid = (await db.execute(text("SELECT to_regclass(:t)::oid"), {"t": table_name})).scalar()
+        if oid is None:
+            raise ValueError(f"Unknown table: {table_name}")
+        columns = await db.execute(text("""
+            SELECT attname, format_type(atttypid, atttypmod) AS type
+            FROM pg_attribute
+            WHERE attrelid = :oid AND attnum > 0 AND NOT attisdropped
+            ORDER BY attnum
+        """), {"oid": oid})
+        keys = await db.execute(text("""
+            SELECT array_agg(a.attname ORDER BY k.ord) AS columns
+            FROM pg_index i
+            CROSS JOIN LATERAL unnest(i.indkey) WITH ORDINALITY AS k(attnum, ord)
+            JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = k.attnum
+            WHERE i.indrelid = :oid AND i.indisunique
+              AND i.indpred IS NULL AND i.indexprs IS NULL
+            GROUP BY i.indexrelid, i.indisprimary
+            ORDER BY i.indisprimary DESC, i.indexrelid
+        """), {"oid": oid})
+        return cls(
+            name=table_name,
+            types={row.attname: row.type for row in columns},
+            unique_keys=[list(row.columns) for row in keys],
+        )
+
+    def columns_for(self, records: List[Dict[str, Any]]) -> List[str]:
+        """Table columns present in any record, in first-seen order."""
+        seen: Dict[str, None] = {}
+        for record in records:
+            for key in record:
+                if key in self.types:
+                    seen.setdefault(key, None)
+                elif key not in self.ignored:
+                    self.ignored.add(key)
+                    logger.warning(f"Ignoring field '{key}': not a column of {self.name}")
+        return list(seen)
+
+    def unique_key_within(self, columns: List[str]) -> Optional[List[str]]:
+        present = set(columns)
+        for key in self.unique_keys:
+            if set(key) <= present:
+                return key
+        return None
+
+    def _cast(self, column: str) -> str:
+        column_type = self.types[column]
+        if column_type.startswith(("text", "character", "citext")):
+            return f"s.{column}"
+        # Empty CSV cells mean NULL for typed columns
+        return f"NULLIF(s.{column}, '')::{column_type}"
+
+    def merge_sql(
+        self,
+        columns: List[str],
+        conflict_columns: Optional[List[str]],
+        update_columns: List[str],
+    ) -> str:
+        """One statement merging the staging table; yields inserted/updated counts."""
+        col_names = ", ".join(columns)
+        casts = ", ".join(f"{self._cast(c)} AS {c}" for c in columns)
+        source = f"SELECT _seq, {casts} FROM {STAGING_TABLE} s"
+
+        if conflict_columns:
+            key = ", ".join(conflict_columns)
+            keyed = " AND ".join(f"{c} IS NOT NULL" for c in conflict_columns)
+            # Last occurrence of a key in the batch wins; NULL keys never conflict
+            source = f"""
+                WITH src AS ({source})
+                (SELECT DISTINCT ON ({key}) * FROM src WHERE {keyed} ORDER BY {key}, _seq DESC)
+                UNION ALL
+                (SELECT * FROM src WHERE NOT ({keyed}))
+            """
+            if update_columns:
+                update_set = ", ".join(f"{c} = EXCLUDED.{c}" for c in update_columns)
+                on_conflict = f"ON CONFLICT ({key}) DO UPDATE SET {update_set}"
+            else:
+                on_conflict = f"ON CONFLICT ({key}) DO NOTHING"
+        else:
+            on_conflict = "ON CONFLICT DO NOTHING"
+
+        return f"""
+            WITH merged AS (
+                INSERT INTO {self.name} ({col_names})
+                SELECT {col_names} FROM ({source}) picked ORDER BY _seq
+                {on_conflict}
+                RETURNING (xmax = 0) AS inserted
+            )
+            SELECT COUNT(*) FILTER (WHERE inserted) AS inserted,
+                   COUNT(*) FILTER (WHERE NOT inserted) AS updated
+            FROM merged
+        """
+
 
 # =============================================================================
 # DATA INGESTION SERVICE
@@ -115,10 +364,16 @@ class DataIngestionService:
 
     Provides efficient bulk operations for importing data from various sources
     (CSV, JSON, API responses) into the database.
+
+    Records are streamed from the source in batches of options.batch_size;
+    each batch is COPYed into a temp staging table and merged with one
+    INSERT ... SELECT ... ON CONFLICT, so memory stays bounded by the batch
+    and a file of any size loads at COPY speed.
     """
 
     def __init__(self, db: AsyncSession):
         self.db = db
+        self._table_meta: Dict[str, "_TableMeta"] = {}
 
     async def ingest_csv(
         self,
@@ -130,6 +385,9 @@ class DataIngestionService:
         """
         Ingest data from a CSV file using bulk operations.
 
+        The file is read once, incrementally; total_rows is only known at
+        the end.
+
         Args:
             source: Data source identifier (for logging/tracking)
             file_path: Path to the CSV file
@@ -139,80 +397,12 @@ class DataIngestionService:
         Returns:
             IngestionStats with results
         """
-        options = options or IngestionOptions()
-        stats = IngestionStats(started_at=utcnow())
-
         file_path = Path(file_path)
         if not file_path.exists():
             raise FileNotFoundError(f"CSV file not found: {file_path}")
 
         logger.info(f"[{source}] Starting CSV ingestion from {file_path}")
-
-        try:
-            # Count total rows for progress
-            with open(file_path, 'r', encoding='utf-8-sig') as f:
-                stats.total_rows = sum(1 for _ in csv.DictReader(f))
-
-            # Process in batches
-            with open(file_path, 'r', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f)
-                batch = []
-
-                for row in reader:
-                    try:
-                        # Apply field mapping
-                        mapped_row = self._apply_field_mapping(row, options.field_mapping)
-
-                        # Apply transformers
-                        transformed_row = self._apply_transformers(mapped_row, options.transformers)
-
-                        batch.append(transformed_row)
-
-                        # Process batch when full
-                        if len(batch) >= options.batch_size:
-                            batch_stats = await self._process_batch(
-                                batch, table_name, options
-                            )
-                            stats.processed += len(batch)
-                            stats.inserted += batch_stats["inserted"]
-                            stats.updated += batch_stats["updated"]
-                            stats.skipped += batch_stats["skipped"]
-                            batch = []
-
-                            if options.progress_callback:
-                                options.progress_callback(stats.processed, stats.total_rows)
-
-                    except Exception as e:
-                        stats.errors += 1
-                        if len(stats.error_samples) < 10:
-                            stats.error_samples.append(f"Row {stats.processed}: {str(e)}")
-
-                        if stats.errors >= options.error_threshold:
-                            logger.error(f"[{source}] Error threshold reached, stopping")
-                            break
-
-                # Process remaining batch
-                if batch:
-                    batch_stats = await self._process_batch(batch, table_name, options)
-                    stats.processed += len(batch)
-                    stats.inserted += batch_stats["inserted"]
-                    stats.updated += batch_stats["updated"]
-                    stats.skipped += batch_stats["skipped"]
-
-        except Exception as e:
-            logger.error(f"[{source}] CSV ingestion failed: {e}")
-            raise
-
-        stats.completed_at = utcnow()
-
-        logger.info(
-            f"[{source}] CSV ingestion complete: "
-            f"{stats.processed} processed, {stats.inserted} inserted, "
-            f"{stats.updated} updated, {stats.errors} errors "
-            f"({stats.rows_per_second:.1f} rows/sec)"
-        )
-
-        return stats
+        return await self._ingest_stream(source, "CSV", iter_csv_records(file_path), table_name, options)
 
     async def ingest_json(
         self,
@@ -225,6 +415,9 @@ class DataIngestionService:
         """
         Ingest data from a JSON file using bulk operations.
 
+        The record array is parsed incrementally (see iter_json_records);
+        .jsonl / .ndjson files are read one record per line.
+
         Args:
             source: Data source identifier
             file_path: Path to the JSON file
@@ -235,71 +428,13 @@ class DataIngestionService:
         Returns:
             IngestionStats with results
         """
-        options = options or IngestionOptions()
-        stats = IngestionStats(started_at=utcnow())
-
         file_path = Path(file_path)
         if not file_path.exists():
             raise FileNotFoundError(f"JSON file not found: {file_path}")
 
         logger.info(f"[{source}] Starting JSON ingestion from {file_path}")
-
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            # Navigate to nested path if specified
-            if json_path:
-                for key in json_path.split('.'):
-                    data = data[key]
-
-            if not isinstance(data, list):
-                raise ValueError("JSON data must be an array of records")
-
-            stats.total_rows = len(data)
-
-            # Process in batches
-            for i in range(0, len(data), options.batch_size):
-                batch = data[i:i + options.batch_size]
-                processed_batch = []
-
-                for row in batch:
-                    try:
-                        mapped_row = self._apply_field_mapping(row, options.field_mapping)
-                        transformed_row = self._apply_transformers(mapped_row, options.transformers)
-                        processed_batch.append(transformed_row)
-                    except Exception as e:
-                        stats.errors += 1
-                        if len(stats.error_samples) < 10:
-                            stats.error_samples.append(f"Row {stats.processed + len(processed_batch)}: {str(e)}")
-
-                if processed_batch:
-                    batch_stats = await self._process_batch(processed_batch, table_name, options)
-                    stats.processed += len(processed_batch)
-                    stats.inserted += batch_stats["inserted"]
-                    stats.updated += batch_stats["updated"]
-                    stats.skipped += batch_stats["skipped"]
-
-                if options.progress_callback:
-                    options.progress_callback(stats.processed, stats.total_rows)
-
-                if stats.errors >= options.error_threshold:
-                    logger.error(f"[{source}] Error threshold reached, stopping")
-                    break
-
-        except Exception as e:
-            logger.error(f"[{source}] JSON ingestion failed: {e}")
-            raise
-
-        stats.completed_at = utcnow()
-
-        logger.info(
-            f"[{source}] JSON ingestion complete: "
-            f"{stats.processed} processed, {stats.inserted} inserted, "
-            f"{stats.updated} updated, {stats.errors} errors"
-        )
-
-        return stats
+        records = iter_json_records(file_path, json_path)
+        return await self._ingest_stream(source, "JSON", records, table_name, options)
 
     async def ingest_records(
         self,
@@ -320,54 +455,89 @@ class DataIngestionService:
         Returns:
             IngestionStats with results
         """
-        options = options or IngestionOptions()
-        stats = IngestionStats(started_at=utcnow(), total_rows=len(records))
-
         logger.info(f"[{source}] Starting bulk ingestion of {len(records)} records")
+        return await self._ingest_stream(source, "Bulk", iter(records), table_name, options, total_rows=len(records))
 
-        try:
-            for i in range(0, len(records), options.batch_size):
-                batch = records[i:i + options.batch_size]
-                processed_batch = []
-
-                for row in batch:
-                    try:
-                        mapped_row = self._apply_field_mapping(row, options.field_mapping)
-                        transformed_row = self._apply_transformers(mapped_row, options.transformers)
-                        processed_batch.append(transformed_row)
-                    except Exception as e:
-                        stats.errors += 1
-                        if len(stats.error_samples) < 10:
-                            stats.error_samples.append(f"Record {stats.processed}: {str(e)}")
-
-                if processed_batch:
-                    batch_stats = await self._process_batch(processed_batch, table_name, options)
-                    stats.processed += len(processed_batch)
-                    stats.inserted += batch_stats["inserted"]
-                    stats.updated += batch_stats["updated"]
-                    stats.skipped += batch_stats["skipped"]
+    async def _ingest_stream(
+        self,
+        source: str,
+        label: str,
+        records: Iterable[Dict[str, Any]],
+        table_name: str,
+        options: Optional[IngestionOptions],
+        total_rows: int = 0,
+    ) -> IngestionStats:
+        """Map, transform and merge a record stream batch by batch."""
+        options = options or IngestionOptions()
+        stats = IngestionStats(started_at=utcnow(), total_rows=total_rows, resumed_from=options.resume_from)
 
-                if options.progress_callback:
-                    options.progress_callback(stats.processed, stats.total_rows)
+        try:
+            batch: List[Dict[str, Any]] = []
+            position = options.resume_from
+            for position, row in enumerate(records, start=1):
+                # Rows up to the checkpoint were committed by an earlier run
+                if position <= options.resume_from:
+                    continue
+                try:
+                    mapped_row = self._apply_field_mapping(row, options.field_mapping)
+                    batch.append(self._apply_transformers(mapped_row, options.transformers))
+                except Exception as e:
+                    stats.errors += 1
+                    if len(stats.error_samples) < 10:
+                        stats.error_samples.append(f"Row {position}: {str(e)}")
+
+                if len(batch) >= options.batch_size or stats.errors >= options.error_threshold:
+                    await self._flush(batch, table_name, options, stats, position)
+                    batch = []
 
                 if stats.errors >= options.error_threshold:
                     logger.error(f"[{source}] Error threshold reached, stopping")
                     break
+            else:
+                # Process remaining batch
+                await self._flush(batch, table_name, options, stats, position)
+                stats.total_rows = max(stats.total_rows, position)
 
         except Exception as e:
-            logger.error(f"[{source}] Record ingestion failed: {e}")
+            logger.error(f"[{source}] {label} ingestion failed: {e}")
             raise
 
         stats.completed_at = utcnow()
 
         logger.info(
-            f"[{source}] Bulk ingestion complete: "
+            f"[{source}] {label} ingestion complete: "
             f"{stats.processed} processed, {stats.inserted} inserted, "
-            f"{stats.updated} updated, {stats.errors} errors"
+            f"{stats.updated} updated, {stats.errors} errors "
+            f"({stats.rows_per_second:.1f} rows/sec)"
         )
 
         return stats
 
+    async def _flush(
+        self,
+        batch: List[Dict[str, Any]],
+        table_name: str,
+        options: IngestionOptions,
+        stats: IngestionStats,
+        position: int,
+    ) -> None:
+        """Merge one batch, then checkpoint the source position with it."""
+        if batch:
+            batch_stats = await self._process_batch(batch, table_name, options, stats)
+            stats.processed += len(batch)
+            stats.inserted += batch_stats["inserted"]
+            stats.updated += batch_stats["updated"]
+            stats.skipped += batch_stats["skipped"]
+        stats.position = position
+
+        if options.checkpoint_callback and not options.dry_run:
+            # Same transaction as the batch: a crash resumes exactly here
+            await options.checkpoint_callback(position)
+        await self.db.commit()
+
+        if options.progress_callback:
+            options.progress_callback(stats.processed, stats.total_rows)
+
     async def bulk_upsert(
         self,
         table_name: str,
@@ -378,7 +548,9 @@ class DataIngestionService:
         """
         Perform efficient bulk upsert (INSERT ON CONFLICT UPDATE).
 
-        Uses PostgreSQL's INSERT ... ON CONFLICT for atomic upsert operations.
+        Records are COPYed into a staging table and merged with one
+        INSERT ... ON CONFLICT ... DO UPDATE; RETURNING (xmax = 0) tells
+        inserted rows from updated ones.
 
         Args:
             table_name: Target table name
@@ -392,79 +564,113 @@ class DataIngestionService:
         if not records:
             return {"inserted": 0, "updated": 0}
 
-        # Get columns from first record
-        columns = list(records[0].keys())
-
+        meta = await self._get_table_meta(table_name)
+        columns = meta.columns_for(records)
         if update_columns is None:
             update_columns = [c for c in columns if c not in conflict_columns]
 
-        # Build the ON CONFLICT clause
-        conflict_cols = ", ".join(conflict_columns)
-        update_set = ", ".join([f"{col} = EXCLUDED.{col}" for col in update_columns])
-
-        # Build parameterized insert
-        col_names = ", ".join(columns)
-        placeholders = ", ".join([f":{col}" for col in columns])
-
-        sql = f"""
-            INSERT INTO {table_name} ({col_names})
-            VALUES ({placeholders})
-            ON CONFLICT ({conflict_cols}) DO UPDATE SET {update_set}
-        """
-
-        inserted = 0
-        updated = 0
-
-        for record in records:
-            result = await self.db.execute(text(sql), record)
-            # PostgreSQL doesn't easily distinguish insert vs update
-            # We count all as processed
-            inserted += 1
-
+        async with self.db.begin_nested():
+            counts = await self._copy_merge(meta, columns, records, conflict_columns, update_columns)
         await self.db.commit()
 
-        return {"inserted": inserted, "updated": updated}
+        return {"inserted": counts["inserted"], "updated": counts["updated"]}
 
     async def _process_batch(
         self,
         batch: List[Dict[str, Any]],
         table_name: str,
         options: IngestionOptions,
+        stats: Optional[IngestionStats] = None,
     ) -> Dict[str, int]:
-        """Process a batch of records."""
+        """
+        Merge a batch into table_name (the caller commits).
+
+        Existing rows (by options.conflict_columns, else the table's first
+        unique key covered by the batch) are updated when
+        options.update_existing, otherwise skipped. A batch the database
+        rejects is bisected under savepoints until the offending rows are
+        isolated; those count as errors and the rest still load.
+        """
         if options.dry_run:
             return {"inserted": 0, "updated": 0, "skipped": len(batch)}
 
-        # For now, use simple insert with conflict handling
-        # Could be enhanced with bulk_upsert for specific tables
-        inserted = 0
-        updated = 0
-        skipped = 0
+        meta = await self._get_table_meta(table_name)
+        columns = meta.columns_for(batch)
+        if not columns:
+            raise ValueError(f"No columns of {table_name} present in records")
+
+        conflict_columns: Optional[List[str]] = None
+        update_columns: List[str] = []
+        if options.update_existing:
+            conflict_columns = options.conflict_columns or meta.unique_key_within(columns)
+            if not conflict_columns:
+                raise ValueError(
+                    f"update_existing needs conflict_columns: no unique key of {table_name} "
+                    f"is covered by columns {columns}"
+                )
+            update_columns = [c for c in columns if c not in conflict_columns]
 
-        for record in batch:
+        totals = {"inserted": 0, "updated": 0, "skipped": 0}
+        pending = [batch]
+        while pending:
+            rows = pending.pop()
             try:
-                # Simple insert - real implementation would use bulk operations
-                columns = list(record.keys())
-                col_names = ", ".join(columns)
-                placeholders = ", ".join([f":{col}" for col in columns])
-
-                sql = f"INSERT INTO {table_name} ({col_names}) VALUES ({placeholders})"
-                await self.db.execute(text(sql), record)
-                inserted += 1
-
-            except Exception as e:
-                if "duplicate key" in str(e).lower():
-                    if options.update_existing:
-                        # Update logic would go here
-                        updated += 1
-                    else:
-                        skipped += 1
-                else:
-                    raise
-
-        await self.db.commit()
+                async with self.db.begin_nested():
+                    counts = await self._copy_merge(meta, columns, rows, conflict_columns, update_columns)
+            except DBAPIError as e:
+                if len(rows) == 1:
+                    if stats is not None:
+                        stats.errors += 1
+                        if len(stats.error_samples) < 10:
+                            stats.error_samples.append(f"Row rejected: {str(e.orig)[:200]}")
+                    continue
+                mid = len(rows) // 2
+                # LIFO: left half merges first, keeping source order
+                pending += [rows[mid:], rows[:mid]]
+                continue
+            totals["inserted"] += counts["inserted"]
+            totals["updated"] += counts["updated"]
+            totals["skipped"] += len(rows) - counts["inserted"] - counts["updated"]
+
+        return totals
+
+    async def _copy_merge(
+        self,
+        meta: "_TableMeta",
+        columns: List[str],
+        rows: List[Dict[str, Any]],
+        conflict_columns: Optional[List[str]],
+        update_columns: List[str],
+    ) -> Dict[str, int]:
+        """COPY rows into the staging table and merge them in one statement."""
+        await self.db.execute(text(
+            f"CREATE TEMP TABLE {STAGING_TABLE} "
+            f"(_seq BIGINT, {', '.join(f'{c} TEXT' for c in columns)}) ON COMMIT DROP"
+        ))
+
+        conn = await self.db.connection()
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            STAGING_TABLE,
+            records=[
+                (seq, *[_copy_text(row.get(col)) for col in columns])
+                for seq, row in enumerate(rows)
+            ],
+            columns=["_seq", *columns],
+        )
 
-        return {"inserted": inserted, "updated": updated, "skipped": skipped}
+        result = await self.db.execute(text(meta.merge_sql(columns, conflict_columns, update_columns)))
+        row = result.fetchone()
+        # Staging is per merge (columns can differ between JSON batches)
+        await self.db.execute(text(f"DROP TABLE {STAGING_TABLE}"))
+        return {"inserted": row.inserted or 0, "updated": row.updated or 0}
+
+    async def _get_table_meta(self, table_name: str) -> "_TableMeta":
+        meta = self._table_meta.get(table_name)
+        if meta is None:
+            meta = await _TableMeta.load(self.db, table_name)
+            self._table_meta[table_name] = meta
+        return meta
 
     def _apply_field_mapping(
         self,
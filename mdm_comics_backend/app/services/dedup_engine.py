@@ -1,5 +1,5 @@
 """
-Fuzzy Matching and Deduplication Engine v1.0.0
+Fuzzy Matching and Deduplication Engine v1.1.0
 
 Per 20251207_MDM_COMICS_DATA_ACQUISITION_PIPELINE.json:
 - Multi-key fuzzy logic (title, series, issue #, upc, variant, date)
@@ -11,15 +11,17 @@ This engine handles:
 2. Confidence scoring for data quality
 3. Conflict resolution between sources
 4. Merge operations with field-level tracking
+
+v1.1.0: PERF-037 - Text and issue number normalization is memoized.
 """
 import logging
 import re
 from dataclasses import dataclass, field
 from datetime import datetime
-from difflib import SequenceMatcher
 from typing import Any, Dict, List, Optional, Tuple
 
 from app.core.utils import utcnow
+from app.services.fuzzy_scoring import memoized, similarity
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +56,56 @@ DEFAULT_SOURCE_WEIGHTS = {
 }
 
 
+@memoized
+def _normalize_text(text: Optional[str]) -> str:
+    """Normalize text for comparison."""
+    if not text:
+        return ""
+
+    # Lowercase
+    text = text.lower()
+
+    # Remove common prefixes/suffixes
+    prefixes = ["the ", "a ", "an "]
+    for prefix in prefixes:
+        if text.startswith(prefix):
+            text = text[len(prefix):]
+
+    # Remove special characters except alphanumeric and spaces
+    text = re.sub(r"[^a-z0-9\s]", "", text)
+
+    # Normalize whitespace
+    text = " ".join(text.split())
+
+    return text
+
+
+@memoized
+def _normalize_issue_number(number: Optional[str]) -> str:
+    """Normalize issue number for comparison."""
+    if not number:
+        return ""
+
+    number = str(number).lower().strip()
+
+    # Remove # prefix
+    number = number.lstrip("#")
+
+    # Handle common issue number formats
+    # "001" -> "1"
+    # "1A" -> "1a"
+    # "Annual 1" -> "annual 1"
+
+    # Try to extract numeric part
+    match = re.match(r"(\d+)", number)
+    if match:
+        num_part = str(int(match.group(1)))  # Remove leading zeros
+        rest = number[match.end():].strip()
+        return f"{num_part}{rest}"
+
+    return number
+
+
 class FuzzyMatcher:
     """
     Fuzzy matching engine for comic/collectible records.
@@ -81,58 +133,15 @@ class FuzzyMatcher:
 
     def normalize_text(self, text: Optional[str]) -> str:
         """Normalize text for comparison."""
-        if not text:
-            return ""
-
-        # Lowercase
-        text = text.lower()
-
-        # Remove common prefixes/suffixes
-        prefixes = ["the ", "a ", "an "]
-        for prefix in prefixes:
-            if text.startswith(prefix):
-                text = text[len(prefix):]
-
-        # Remove special characters except alphanumeric and spaces
-        text = re.sub(r"[^a-z0-9\s]", "", text)
-
-        # Normalize whitespace
-        text = " ".join(text.split())
-
-        return text
+        return _normalize_text(text)
 
     def normalize_issue_number(self, number: Optional[str]) -> str:
         """Normalize issue number for comparison."""
-        if not number:
-            return ""
-
-        number = str(number).lower().strip()
-
-        # Remove # prefix
-        number = number.lstrip("#")
-
-        # Handle common issue number formats
-        # "001" -> "1"
-        # "1A" -> "1a"
-        # "Annual 1" -> "annual 1"
-
-        # Try to extract numeric part
-        match = re.match(r"(\d+)", number)
-        if match:
-            num_part = str(int(match.group(1)))  # Remove leading zeros
-            rest = number[match.end():].strip()
-            return f"{num_part}{rest}"
-
-        return number
+        return _normalize_issue_number(number)
 
     def similarity_ratio(self, a: str, b: str) -> float:
         """Calculate similarity ratio between two strings."""
-        if not a and not b:
-            return 1.0
-        if not a or not b:
-            return 0.0
-
-        return SequenceMatcher(None, a, b).ratio()
+        return similarity(a, b)
 
     def match_comics(
         self,
@@ -0,0 +1,484 @@
+"""
+Streaming DSAR Export v1.0.0
+
+PERF-047: GDPR Article 15 exports written section by section instead of
+one nested dict built in memory and hashed at the end.
+
+- Each section (profile, orders, audit trail, sessions, ...) pages
+  through its table in primary-key order (key > :after LIMIT :page_size)
+  on its own session; up to `concurrency` sections are read at once
+- Rows are appended to a per-section NDJSON spool file as each page
+  arrives, with a running SHA-256 and row/byte counters per section
+- The spools are packed into one ZIP (<section>.ndjson entries plus a
+  manifest.json of per-section rows and hashes) that is kept under
+  DSAR_EXPORT_DIR or streamed to S3 as a multipart upload
+- The export hash is the SHA-256 of manifest.json, so it commits to
+  every section without rereading them
+- Progress is upserted into dsar_export_progress from a separate
+  session, so it is visible while the export transaction is still open
+
+Memory holds one page per running section whatever the history size.
+Where the server allows it, all sections read one exported snapshot
+(pg_export_snapshot), so concurrent sessions see the same instant.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import secrets
+import shutil
+import tempfile
+import time
+import zipfile
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.pii import pii_handler
+from app.services.pii_access import ADDRESS_PII_FIELDS, decrypt_many
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = "2.0.0"
+# Audit rows older than this are not part of the export (unchanged policy)
+AUDIT_TRAIL_DAYS = 365
+PROGRESS_INTERVAL_SECONDS = 1.0
+S3_PREFIX = "dsar-exports"
+
+SCHEMA_DDL = (
+    """
+    CREATE TABLE IF NOT EXISTS dsar_export_progress (
+        request_id INTEGER PRIMARY KEY REFERENCES dsar_requests(id) ON DELETE CASCADE,
+        status VARCHAR(20) NOT NULL,
+        sections JSONB NOT NULL DEFAULT '{}',
+        rows_written BIGINT NOT NULL DEFAULT 0,
+        bytes_written BIGINT NOT NULL DEFAULT 0,
+        storage VARCHAR(10),
+        location TEXT,
+        export_hash VARCHAR(64),
+        error TEXT,
+        started_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+        updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+        completed_at TIMESTAMPTZ
+    )
+    """,
+)
+
+UPSERT_PROGRESS_SQL = text("""
+    INSERT INTO dsar_export_progress (
+        request_id, status, sections, rows_written, bytes_written,
+        storage, location, export_hash, error, completed_at
+    )
+    VALUES (
+        :request_id, :status, CAST(:sections AS JSONB), :rows_written, :bytes_written,
+        :storage, :location, :export_hash, :error,
+        CASE WHEN :finished THEN NOW() END
+    )
+    ON CONFLICT (request_id) DO UPDATE SET
+        status = EXCLUDED.status,
+        sections = EXCLUDED.sections,
+        rows_written = EXCLUDED.rows_written,
+        bytes_written = EXCLUDED.bytes_written,
+        storage = EXCLUDED.storage,
+        location = EXCLUDED.location,
+        export_hash = EXCLUDED.export_hash,
+        error = EXCLUDED.error,
+        updated_at = NOW(),
+        completed_at = EXCLUDED.completed_at
+""")
+
+_SNAPSHOT_ID = re.compile(r"^[0-9A-F]+-[0-9A-F]+(-[0-9]+)?$")
+
+
+@dataclass(frozen=True)
+class ExportSection:
+    """
+    One section of the export: rows of source matching where, in key order.
+
+    columns are selected as written (alias them as they should appear in
+    the export); for each name in decrypt, the <name>_encrypted column is
+    replaced by its plaintext under <name>.
+    """
+    name: str
+    source: str
+    columns: str
+    where: str
+    key: str = "id"
+    decrypt: Tuple[str, ...] = ()
+
+    def page_sql(self) -> str:
+        return f"""
+            SELECT {self.key} AS _key, {self.columns}
+            FROM {self.source}
+            WHERE ({self.where}) AND {self.key} > :after
+            ORDER BY {self.key}
+            LIMIT :page_size
+        """
+
+
+EXPORT_SECTIONS: Tuple[ExportSection, ...] = (
+    ExportSection(
+        name="profile",
+        source="users",
+        columns="id, email, name, is_active, email_verified_at, created_at, updated_at, last_login_at",
+        where="id = :user_id",
+    ),
+    ExportSection(
+        name="addresses",
+        source="addresses",
+        columns=(
+            "id, address_type, " + ", ".join(f"{f}_encrypted" for f in ADDRESS_PII_FIELDS) +
+            ", city, state_province, postal_code, country_code, residential, created_at, deleted_at"
+        ),
+        where="user_id = :user_id",
+        decrypt=ADDRESS_PII_FIELDS,
+    ),
+    ExportSection(
+        name="orders",
+        source="orders",
+        columns=(
+            "id, order_number, status, subtotal, shipping_cost, tax, total, shipping_address, "
+            "shipping_method, tracking_number, payment_method, created_at, paid_at, shipped_at, delivered_at"
+        ),
+        where="user_id = :user_id",
+    ),
+    ExportSection(
+        name="order_items",
+        source="order_items oi JOIN orders o ON o.id = oi.order_id",
+        columns="oi.order_id, o.order_number, oi.product_name, oi.product_sku, oi.price, oi.quantity",
+        where="o.user_id = :user_id",
+        key="oi.id",
+    ),
+    ExportSection(
+        name="roles",
+        source="user_roles ur JOIN roles r ON r.id = ur.role_id",
+        columns="r.name AS role, ur.assigned_at, ur.expires_at",
+        where="ur.user_id = :user_id",
+        key="ur.id",
+    ),
+    ExportSection(
+        name="audit_trail",
+        source="user_audit_log",
+        columns="ts, action, resource_type, outcome",
+        where=(
+            "ts >= :audit_since AND (actor_id_hash = :user_hash"
+            " OR (resource_type = 'user' AND resource_id_hash = :user_hash))"
+        ),
+    ),
+    ExportSection(
+        name="sessions",
+        source="user_sessions",
+        columns="created_at, last_activity_at, expires_at, revoked_at, revoke_reason, device_type",
+        where="user_id = :user_id",
+    ),
+    ExportSection(
+        name="dsar_history",
+        source="dsar_requests",
+        columns="request_type AS type, status, requested_at, completed_at",
+        where="user_id = :user_id",
+    ),
+)
+
+
+@dataclass
+class SectionProgress:
+    rows: int = 0
+    bytes: int = 0
+    pages: int = 0
+    state: str = "pending"
+    sha256: Any = field(default_factory=hashlib.sha256, repr=False)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"rows": self.rows, "bytes": self.bytes, "pages": self.pages, "state": self.state}
+
+
+@dataclass
+class ExportResult:
+    export_hash: str
+    storage: str
+    location: str
+    manifest: Dict[str, Any]
+    rows: int
+    bytes: int
+    seconds: float
+
+
+def _json_default(value: Any) -> Any:
+    """ISO timestamps; Decimal money (and anything else) as exact strings."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def encode_rows(rows: Sequence[Dict[str, Any]]) -> bytes:
+    """NDJSON for one page; keys sorted so a section's hash is reproducible."""
+    return b"".join(
+        json.dumps(row, sort_keys=True, default=_json_default, ensure_ascii=False).encode() + b"\n"
+        for row in rows
+    )
+
+
+def decrypt_page(rows: List[Dict[str, Any]], names: Sequence[str]) -> List[Dict[str, Any]]:
+    """Swap each <name>_encrypted column for its plaintext, one decrypt_many() per page."""
+    columns = [f"{name}_encrypted" for name in names]
+    plaintexts = iter(decrypt_many([row.pop(column, None) for row in rows for column in columns]))
+    for row in rows:
+        for name in names:
+            row[name] = next(plaintexts)
+    return rows
+
+
+def manifest_bytes(manifest: Dict[str, Any]) -> bytes:
+    return json.dumps(manifest, sort_keys=True, indent=2).encode()
+
+
+async def ensure_dsar_export_progress(db: AsyncSession) -> None:
+    """Startup hook: create dsar_export_progress if missing."""
+    try:
+        for statement in SCHEMA_DDL:
+            await db.execute(text(statement))
+        await db.commit()
+    except Exception as e:
+        logger.warning(f"dsar_export_progress table setup failed: {e}")
+        await db.rollback()
+
+
+async def get_export_progress(db: AsyncSession, request_id: int) -> Optional[Dict[str, Any]]:
+    """Latest progress row of an export, or None if none has started."""
+    try:
+        row = (await db.execute(
+            text("SELECT * FROM dsar_export_progress WHERE request_id = :request_id"),
+            {"request_id": request_id},
+        )).mappings().fetchone()
+    except Exception as e:
+        logger.debug(f"Export progress lookup failed: {e}")
+        await db.rollback()
+        return None
+    if row is None:
+        return None
+    return {
+        key: value.isoformat() if isinstance(value, datetime) else value
+        for key, value in row.items()
+    }
+
+
+class DSARExportBuilder:
+    """Streams one user's export to a ZIP; see module docstring."""
+
+    def __init__(
+        self,
+        request_id: int,
+        user_id: int,
+        *,
+        session_factory=AsyncSessionLocal,
+        storage: Optional[str] = None,
+        storage_service=None,
+        export_dir: Optional[str] = None,
+        page_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        sections: Sequence[ExportSection] = EXPORT_SECTIONS,
+    ):
+        self.request_id = request_id
+        self.user_id = user_id
+        self._session_factory = session_factory
+        self.storage = storage or settings.DSAR_EXPORT_STORAGE
+        self._storage_service = storage_service
+        self.export_dir = export_dir or settings.DSAR_EXPORT_DIR or tempfile.gettempdir()
+        self.page_size = page_size or settings.DSAR_EXPORT_PAGE_SIZE
+        self.concurrency = max(1, concurrency or settings.DSAR_EXPORT_CONCURRENCY)
+        self.sections = tuple(sections)
+        self.progress = {section.name: SectionProgress() for section in self.sections}
+        self._report_lock = asyncio.Lock()
+        self._last_report = 0.0
+
+    def _params(self) -> Dict[str, Any]:
+        return {
+            "user_id": self.user_id,
+            "user_hash": pii_handler.hash_for_lookup(str(self.user_id)),
+            "audit_since": datetime.now(timezone.utc) - timedelta(days=AUDIT_TRAIL_DAYS),
+        }
+
+    # ----- Progress -----
+
+    async def _report(self, status: str, force: bool = False, **fields: Any) -> None:
+        """Upsert progress from its own session; throttled unless forced."""
+        now = time.monotonic()
+        if not force and (now - self._last_report < PROGRESS_INTERVAL_SECONDS or self._report_lock.locked()):
+            return
+        async with self._report_lock:
+            self._last_report = now
+            params = {
+                "request_id": self.request_id,
+                "status": status,
+                "sections": json.dumps({name: p.as_dict() for name, p in self.progress.items()}),
+                "rows_written": sum(p.rows for p in self.progress.values()),
+                "bytes_written": sum(p.bytes for p in self.progress.values()),
+                "storage": self.storage,
+                "location": None,
+                "export_hash": None,
+                "error": None,
+                "finished": status in ("complete", "failed"),
+            }
+            params.update(fields)
+            try:
+                async with self._session_factory() as db:
+                    await db.execute(UPSERT_PROGRESS_SQL, params)
+                    await db.commit()
+            except Exception as e:
+                logger.warning(f"DSAR export {self.request_id}: progress update failed: {e}")
+
+    # ----- Reading -----
+
+    async def _export_snapshot(self, db: AsyncSession) -> Optional[str]:
+        """Export a snapshot the section sessions can share (None if unsupported)."""
+        try:
+            await db.execute(text("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY"))
+            snapshot = (await db.execute(text("SELECT pg_export_snapshot()"))).scalar()
+            return snapshot if snapshot and _SNAPSHOT_ID.match(snapshot) else None
+        except Exception as e:
+            logger.info(f"DSAR export {self.request_id}: no shared snapshot ({e}); sections read independently")
+            await db.rollback()
+            return None
+
+    async def _stream_section(
+        self,
+        section: ExportSection,
+        spool_path: str,
+        params: Dict[str, Any],
+        snapshot: Optional[str],
+        slots: asyncio.Semaphore,
+    ) -> None:
+        progress = self.progress[section.name]
+        sql = text(section.page_sql())
+        async with slots, self._session_factory() as db:
+            if snapshot:
+                await db.execute(text("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY"))
+                await db.execute(text(f"SET TRANSACTION SNAPSHOT '{snapshot}'"))
+            progress.state = "running"
+            after = 0
+            with open(spool_path, "wb") as spool:
+                while True:
+                    page = (await db.execute(sql, {**params, "after": after, "page_size": self.page_size})).mappings().all()
+                    if not page:
+                        break
+                    after = page[-1]["_key"]
+                    rows = [{k: v for k, v in row.items() if k != "_key"} for row in page]
+                    if section.decrypt:
+                        rows = await asyncio.to_thread(decrypt_page, rows, section.decrypt)
+                    chunk = encode_rows(rows)
+                    spool.write(chunk)
+                    progress.sha256.update(chunk)
+                    progress.rows += len(rows)
+                    progress.bytes += len(chunk)
+                    progress.pages += 1
+                    await self._report("running")
+                    if len(page) < self.page_size:
+                        break
+            await db.rollback()
+        progress.state = "done"
+
+    # ----- Packing and storing -----
+
+    def _manifest(self, generated_at: datetime) -> Dict[str, Any]:
+        return {
+            "export_metadata": {
+                "request_id": self.request_id,
+                "user_id": self.user_id,
+                "generated_at": generated_at.isoformat(),
+                "format_version": FORMAT_VERSION,
+                "format": "zip of NDJSON sections",
+                "gdpr_article": "Article 15 - Right of Access",
+            },
+            "sections": {
+                name: {"file": f"{name}.ndjson", "rows": p.rows, "bytes": p.bytes, "sha256": p.sha256.hexdigest()}
+                for name, p in self.progress.items()
+            },
+        }
+
+    @staticmethod
+    def _pack(zip_path: str, spools: Dict[str, str], manifest: bytes) -> None:
+        with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("manifest.json", manifest)
+            for name, path in spools.items():
+                archive.write(path, arcname=f"{name}.ndjson")
+
+    async def _store(self, zip_path: str, filename: str, export_hash: str) -> str:
+        if self.storage == "s3":
+            if self._storage_service is None:
+                from app.services.storage import StorageService
+                self._storage_service = StorageService()
+            key = f"{S3_PREFIX}/{self.user_id}/{filename}"
+            uploaded = await self._storage_service.upload_file_threaded(
+                zip_path, key, content_type="application/zip",
+                metadata={"sha256-manifest": export_hash, "dsar-request": str(self.request_id)},
+            )
+            if not uploaded:
+                raise ValueError("Export upload failed")
+            return key
+        destination = os.path.join(self.export_dir, filename)
+        await asyncio.to_thread(shutil.move, zip_path, destination)
+        return destination
+
+    async def build(self) -> ExportResult:
+        """Read every section, pack, store; raises on failure (progress says 'failed')."""
+        started = time.monotonic()
+        generated_at = datetime.now(timezone.utc)
+        params = self._params()
+        # Spool next to the destination so the finished ZIP is a rename away
+        os.makedirs(self.export_dir, exist_ok=True)
+        workdir = tempfile.mkdtemp(prefix=f".dsar-{self.request_id}-", dir=self.export_dir)
+        spools = {section.name: os.path.join(workdir, f"{section.name}.ndjson") for section in self.sections}
+        await self._report("running", force=True)
+        try:
+            async with self._session_factory() as snapshot_db:
+                snapshot = await self._export_snapshot(snapshot_db)
+                slots = asyncio.Semaphore(self.concurrency)
+                tasks = [
+                    asyncio.create_task(self._stream_section(section, spools[section.name], params, snapshot, slots))
+                    for section in self.sections
+                ]
+                try:
+                    await asyncio.gather(*tasks)
+                except BaseException:
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                    raise
+                finally:
+                    await snapshot_db.rollback()
+
+            await self._report("packing", force=True)
+            manifest = self._manifest(generated_at)
+            manifest_json = manifest_bytes(manifest)
+            export_hash = hashlib.sha256(manifest_json).hexdigest()
+            filename = f"dsar-export-{self.request_id}-{secrets.token_hex(8)}.zip"
+            zip_path = os.path.join(workdir, filename)
+            await asyncio.to_thread(self._pack, zip_path, spools, manifest_json)
+
+            await self._report("storing", force=True)
+            location = await self._store(zip_path, filename, export_hash)
+            rows = sum(p.rows for p in self.progress.values())
+            size = sum(p.bytes for p in self.progress.values())
+            await self._report("complete", force=True, location=location, export_hash=export_hash)
+            logger.info(f"DSAR export {self.request_id}: {rows} rows in {len(self.sections)} sections -> {self.storage}")
+            return ExportResult(
+                export_hash=export_hash,
+                storage=self.storage,
+                location=location,
+                manifest=manifest,
+                rows=rows,
+                bytes=size,
+                seconds=round(time.monotonic() - started, 3),
+            )
+        except BaseException as e:
+            await self._report("failed", force=True, error=str(e)[:500] or type(e).__name__)
+            raise
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
@@ -10,19 +10,18 @@ Handles:
 - Rectification requests (data correction)
 """
 import hashlib
-import json
 import secrets
 from datetime import datetime, timezone, timedelta
 from typing import Optional, List, Any, Dict, AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, and_
-from sqlalchemy.orm import selectinload
 
 from app.core.config import settings
 from app.models.user import User
 from app.models.dsar_request import DSARRequest
 from app.models.user_session import UserSession
-from app.models.user_audit_log import UserAuditLog, AuditAction
+from app.models.user_audit_log import AuditAction
+from app.services.dsar_export import DSARExportBuilder
 
 
 class DSARService:
@@ -159,11 +158,15 @@ class DSARService:
     async def process_export(
         self,
         request_id: int,
-        processor_id: int = None
+        processor_id: int = None,
+        **builder_options: Any,
     ) -> Dict[str, Any]:
         """
         Process a DSAR export request.
-        Returns user data in portable JSON format.
+
+        PERF-047: Streams the user's data section by section into a ZIP of
+        NDJSON files (see dsar_export) instead of building one document in
+        memory; returns where the export was stored and its manifest.
         """
         request = await self.get_request(request_id)
         if not request:
@@ -180,16 +183,17 @@ class DSARService:
         await self.db.flush()
 
         try:
-            # Gather all user data
-            export_data = await self._gather_user_data(request.user_id)
+            user_id = (await self.db.execute(
+                select(User.id).where(User.id == request.user_id)
+            )).scalar_one_or_none()
+            if user_id is None:
+                raise ValueError("User not found")
 
-            # Generate export hash for integrity
-            export_json = json.dumps(export_data, sort_keys=True, default=str)
-            export_hash = hashlib.sha256(export_json.encode()).hexdigest()
+            export = await DSARExportBuilder(request.id, user_id, **builder_options).build()
 
-            # Mark as completed
+            # Mark as completed; the hash covers every section via the manifest
             request.complete(
-                export_url_hash=export_hash,
+                export_url_hash=export.export_hash,
                 ledger_tx_id=f"DSAR-EXPORT-{request.id}-{secrets.token_hex(8)}"
             )
 
@@ -197,8 +201,13 @@ class DSARService:
 
             return {
                 "request_id": request.id,
-                "export_data": export_data,
-                "export_hash": export_hash,
+                "export_hash": export.export_hash,
+                "storage": export.storage,
+                "location": export.location,
+                "manifest": export.manifest,
+                "rows": export.rows,
+                "bytes": export.bytes,
+                "seconds": export.seconds,
                 "completed_at": request.completed_at.isoformat(),
             }
 
@@ -207,157 +216,6 @@ class DSARService:
             await self.db.flush()
             raise
 
-    async def _gather_user_data(self, user_id: int) -> Dict[str, Any]:
-        """Gather all data for a user export (GDPR Article 15)."""
-        # Get user with relationships
-        result = await self.db.execute(
-            select(User)
-            .options(
-                selectinload(User.addresses),
-                selectinload(User.orders),
-                selectinload(User.user_roles),
-            )
-            .where(User.id == user_id)
-        )
-        user = result.scalar_one_or_none()
-
-        if not user:
-            raise ValueError("User not found")
-
-        # Build export data structure
-        export_data = {
-            "export_metadata": {
-                "generated_at": datetime.now(timezone.utc).isoformat(),
-                "user_id": user_id,
-                "format_version": "1.0.0",
-                "gdpr_article": "Article 15 - Right of Access",
-            },
-            "profile": {
-                "id": user.id,
-                "email": user.email,
-                "name": user.name,
-                "is_active": user.is_active,
-                "email_verified": user.is_email_verified,
-                "created_at": user.created_at.isoformat() if user.created_at else None,
-                "updated_at": user.updated_at.isoformat() if user.updated_at else None,
-                "last_login_at": user.last_login_at.isoformat() if user.last_login_at else None,
-            },
-            "addresses": [
-                {
-                    "id": addr.id,
-                    "name": addr.name if hasattr(addr, 'name') else None,
-                    "street": addr.street if hasattr(addr, 'street') else None,
-                    "city": addr.city if hasattr(addr, 'city') else None,
-                    "state": addr.state if hasattr(addr, 'state') else None,
-                    "postal_code": addr.postal_code if hasattr(addr, 'postal_code') else None,
-                    "country": addr.country if hasattr(addr, 'country') else None,
-                    "is_default": addr.is_default if hasattr(addr, 'is_default') else False,
-                }
-                for addr in (user.addresses or [])
-            ],
-            "orders": await self._export_orders(user_id),
-            "roles": [
-                {
-                    "role_id": ur.role_id,
-                    "assigned_at": ur.created_at.isoformat() if ur.created_at else None,
-                }
-                for ur in (user.user_roles or [])
-            ],
-            "audit_trail": await self._export_audit_trail(user_id),
-            "sessions": await self._export_sessions(user_id),
-            "dsar_history": await self._export_dsar_history(user_id),
-        }
-
-        return export_data
-
-    async def _export_orders(self, user_id: int) -> List[Dict]:
-        """Export user order history."""
-        from app.models.order import Order
-
-        result = await self.db.execute(
-            select(Order).where(Order.user_id == user_id)
-        )
-        orders = result.scalars().all()
-
-        return [
-            {
-                "id": o.id,
-                "status": o.status,
-                "total": float(o.total) if o.total else None,
-                "created_at": o.created_at.isoformat() if hasattr(o, 'created_at') and o.created_at else None,
-            }
-            for o in orders
-        ]
-
-    async def _export_audit_trail(self, user_id: int) -> List[Dict]:
-        """Export user's audit trail (last 365 days)."""
-        cutoff = datetime.now(timezone.utc) - timedelta(days=365)
-
-        result = await self.db.execute(
-            select(UserAuditLog)
-            .where(
-                and_(
-                    UserAuditLog.user_id == user_id,
-                    UserAuditLog.created_at >= cutoff
-                )
-            )
-            .order_by(UserAuditLog.created_at.desc())
-            .limit(1000)
-        )
-        logs = result.scalars().all()
-
-        return [
-            {
-                "action": log.action.value if hasattr(log.action, 'value') else str(log.action),
-                "resource_type": log.resource_type,
-                "ip_address": log.ip_address[:10] + "..." if log.ip_address else None,  # Masked
-                "created_at": log.created_at.isoformat() if log.created_at else None,
-            }
-            for log in logs
-        ]
-
-    async def _export_sessions(self, user_id: int) -> List[Dict]:
-        """Export active session info."""
-        result = await self.db.execute(
-            select(UserSession)
-            .where(
-                and_(
-                    UserSession.user_id == user_id,
-                    UserSession.is_active == True
-                )
-            )
-        )
-        sessions = result.scalars().all()
-
-        return [
-            {
-                "created_at": s.created_at.isoformat() if s.created_at else None,
-                "last_activity": s.last_activity_at.isoformat() if s.last_activity_at else None,
-                "expires_at": s.expires_at.isoformat() if s.expires_at else None,
-                "user_agent": s.user_agent[:50] + "..." if s.user_agent and len(s.user_agent) > 50 else s.user_agent,
-            }
-            for s in sessions
-        ]
-
-    async def _export_dsar_history(self, user_id: int) -> List[Dict]:
-        """Export DSAR request history."""
-        result = await self.db.execute(
-            select(DSARRequest)
-            .where(DSARRequest.user_id == user_id)
-            .order_by(DSARRequest.requested_at.desc())
-        )
-        requests = result.scalars().all()
-
-        return [
-            {
-                "type": r.request_type,
-                "status": r.status,
-                "requested_at": r.requested_at.isoformat() if r.requested_at else None,
-                "completed_at": r.completed_at.isoformat() if r.completed_at else None,
-            }
-            for r in requests
-        ]
-
     # ============================================================
     # Deletion Processing (Right to Erasure)
     # ============================================================
@@ -0,0 +1,46 @@
+"""
+Fuzzy Scoring Engine v1.0.0
+
+PERF-037: Shared primitives for the record matchers.
+
+- memoized(): LRU-cached normalizers, so each distinct title/series is
+  normalized once per process instead of once per comparison.
+- similarity(): difflib.SequenceMatcher.ratio(), the ratio the dedup
+  thresholds were tuned against.
+
+Callers: dedup_engine.FuzzyMatcher, match_scoring, sequential_enrichment.
+"""
+import os
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Any, Callable
+
+NORMALIZE_CACHE_SIZE = int(os.getenv("FUZZY_NORMALIZE_CACHE_SIZE", "50000"))
+
+
+def memoized(fn: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """LRU-memoize a single-argument normalizer (unhashable input bypasses the cache)."""
+    cached = lru_cache(maxsize=NORMALIZE_CACHE_SIZE)(fn)
+
+    def wrapper(value):
+        try:
+            return cached(value)
+        except TypeError:
+            return fn(value)
+
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    wrapper.__wrapped__ = fn
+    wrapper.__doc__ = fn.__doc__
+    wrapper.__name__ = fn.__name__
+    return wrapper
+
+
+def similarity(a: str, b: str) -> float:
+    """SequenceMatcher ratio in [0, 1]; 1.0 for two empty strings."""
+    if not a and not b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+    return SequenceMatcher(None, a, b).ratio()
+
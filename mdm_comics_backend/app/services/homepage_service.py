@@ -21,6 +21,7 @@ from app.core.redis_client import (
     set_homepage_sections_cached,
     invalidate_homepage_cache
 )
+from app.core.response_cache import invalidate_tags
 
 logger = logging.getLogger(__name__)
 
@@ -143,5 +144,6 @@ class HomepageService:
         
         # Invalidate cache
         await invalidate_homepage_cache()
+        await invalidate_tags("homepage")
 
         return await HomepageService.get_sections(db)
@@ -1,5 +1,5 @@
 """
-Match Scoring Service for PriceCharting Integration v1.0.0
+Match Scoring Service for PriceCharting Integration v1.1.0
 
 Document ID: PC-OPT-2024-001 Phase 3
 Status: APPROVED
@@ -17,6 +17,8 @@ Solution:
 - Confidence levels (high, medium, low)
 - Logging for match analysis
 
+v1.1.0: PERF-037 - Title/year/issue normalizers are memoized.
+
 Per constitution_cyberSec.json: Input validation + data quality
 """
 import logging
@@ -24,6 +26,8 @@ import re
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 
+from app.services.fuzzy_scoring import memoized
+
 logger = logging.getLogger(__name__)
 
 # Scoring thresholds
@@ -44,6 +48,7 @@ class MatchResult:
     product_name: Optional[str] = None  # For logging
 
 
+@memoized
 def normalize_title(title: str) -> str:
     """
     Normalize title for comparison.
@@ -68,6 +73,7 @@ def normalize_title(title: str) -> str:
     return title
 
 
+@memoized
 def extract_issue_number(text: str) -> Optional[str]:
     """
     Extract issue number from text.
@@ -93,6 +99,7 @@ def extract_issue_number(text: str) -> Optional[str]:
     return None
 
 
+@memoized
 def extract_year(text: str) -> Optional[int]:
     """
     Extract year from text (1900-2099).
@@ -29,7 +29,7 @@ from app.modules.shipping.carriers.base import (
     Package,
     Rate,
 )
-from app.services.encryption import decrypt_pii
+from app.services.pii_access import decrypt_address
 
 logger = logging.getLogger(__name__)
 
@@ -218,18 +218,19 @@ class MultiCarrierService:
 
         Decrypts PII fields for API calls.
         """
+        pii = decrypt_address(address)
         return AddressInput(
-            address_line1=decrypt_pii(address.address_line1_encrypted) if address.address_line1_encrypted else "",
-            address_line2=decrypt_pii(address.address_line2_encrypted) if address.address_line2_encrypted else None,
-            address_line3=decrypt_pii(address.address_line3_encrypted) if address.address_line3_encrypted else None,
+            address_line1=pii.address_line1 or "",
+            address_line2=pii.address_line2,
+            address_line3=pii.address_line3,
             city=address.city,
             state_province=address.state_province,
             postal_code=address.postal_code,
             country_code=address.country_code,
-            recipient_name=decrypt_pii(address.recipient_name_encrypted) if address.recipient_name_encrypted else None,
-            company_name=decrypt_pii(address.company_name_encrypted) if address.company_name_encrypted else None,
-            phone=decrypt_pii(address.phone_encrypted) if address.phone_encrypted else None,
-            email=decrypt_pii(address.email_encrypted) if address.email_encrypted else None,
+            recipient_name=pii.recipient_name,
+            company_name=pii.company_name,
+            phone=pii.phone,
+            email=pii.email,
             residential=address.residential if hasattr(address, 'residential') else True,
         )
 
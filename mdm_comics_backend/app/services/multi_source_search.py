@@ -41,6 +41,7 @@ from app.adapters.fandom_adapter import (
 from app.adapters.comicvine_adapter import ComicVineAdapter
 from app.adapters.mycomicshop_adapter import MyComicShopAdapter
 from app.core.adapter_registry import AdapterConfig, DataSourceType
+from app.core.http_cache import get_http_cache
 from app.core.http_client import ResilientHTTPClient, RateLimitConfig, RetryConfig
 
 # Pre-configured adapters for fallback sources
@@ -288,7 +289,7 @@ class MultiSourceSearchService:
         if self._mycomicshop_adapter is None:
             rate_limit = RateLimitConfig(requests_per_second=0.15)
             retry = RetryConfig(max_retries=2, base_delay=2.0)
-            self._mycomicshop_client = ResilientHTTPClient(rate_limit, retry)
+            self._mycomicshop_client = ResilientHTTPClient(rate_limit, retry, cache=get_http_cache())
             self._mycomicshop_adapter = MyComicShopAdapter(MYCOMICSHOP_CONFIG, self._mycomicshop_client)
 
         return self._mycomicshop_adapter
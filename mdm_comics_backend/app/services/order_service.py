@@ -38,7 +38,8 @@ def build_product_snapshot(product: Product) -> Dict[str, Any]:
         "id": product.id,
         "name": product.name,
         "sku": product.sku,
-        "price": product.price,
+        # JSON column: Numeric comes back as Decimal, which json can't encode
+        "price": float(product.price) if product.price is not None else None,
         "image_url": product.image_url,
         "category": product.category,
         "subcategory": product.subcategory,
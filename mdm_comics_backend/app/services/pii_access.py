@@ -0,0 +1,293 @@
+"""
+PII access layer v1.0.0
+
+PERF-046: One place to read encrypted PII columns without paying a Fernet
+decrypt (HMAC verify + AES) for every field on every access.
+
+- decrypt_address() decrypts the encrypted columns of an address in one
+  call (all of them, or just fields=) and returns a DecryptedAddress
+- pii_cache_scope() / pii_request_scope() bind a short-lived, size-bounded
+  cache of decrypted values to the current request (or job); lookups made
+  through decrypt_cached() inside the scope decrypt each ciphertext once
+- carrier_credentials() keeps decrypted carrier credentials in an
+  in-process cache that is itself encrypted (AES-GCM, random per-process
+  key), so carrier clients stop re-decrypting on every build
+- decrypt_many() decrypts a list of ciphertexts at once, on a thread pool
+  when the list is large (DSAR exports, reports)
+
+Safety:
+- Cached plaintext is held in bytearrays that are overwritten with zeros
+  on eviction, expiry and scope exit. str values handed to callers are
+  immutable copies Python cannot wipe, exactly as with decrypt_pii()
+- Nothing here logs plaintext or ciphertext; reprs show field names and
+  counters only, and failures raise decrypt_pii()'s ValueError unchanged
+"""
+import logging
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, fields
+from threading import Lock
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from app.services.encryption import decrypt_pii
+
+logger = logging.getLogger(__name__)
+
+# Request scope: enough for a checkout's addresses and a page of listings
+REQUEST_CACHE_MAX_ENTRIES = 256
+REQUEST_CACHE_TTL_SECONDS = 60.0
+# Carrier credentials rotate rarely; new ciphertexts miss the cache anyway
+CREDENTIAL_CACHE_TTL_SECONDS = 600.0
+CREDENTIAL_CACHE_MAX_ENTRIES = 32
+# decrypt_many() goes parallel at this many distinct ciphertexts
+PARALLEL_THRESHOLD = 256
+DEFAULT_WORKERS = 4
+
+ADDRESS_PII_FIELDS = (
+    "recipient_name",
+    "company_name",
+    "phone",
+    "email",
+    "address_line1",
+    "address_line2",
+    "address_line3",
+)
+
+
+def _zeroize(buffer: bytearray) -> None:
+    for i in range(len(buffer)):
+        buffer[i] = 0
+
+
+class PIICache:
+    """Bounded LRU of ciphertext -> plaintext with a TTL; wipes what it drops."""
+
+    def __init__(self, max_entries: int = REQUEST_CACHE_MAX_ENTRIES, ttl_seconds: float = REQUEST_CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, bytearray]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"PIICache(entries={len(self._entries)}, hits={self.hits}, misses={self.misses})"
+
+    def get(self, ciphertext: str) -> Optional[str]:
+        entry = self._entries.get(ciphertext)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, plaintext = entry
+        if time.monotonic() >= expires_at:
+            self._drop(ciphertext)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(ciphertext)
+        self.hits += 1
+        return plaintext.decode()
+
+    def put(self, ciphertext: str, plaintext: str) -> None:
+        if ciphertext in self._entries:
+            self._drop(ciphertext)
+        self._entries[ciphertext] = (time.monotonic() + self.ttl_seconds, bytearray(plaintext.encode()))
+        while len(self._entries) > self.max_entries:
+            self._drop(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _drop(self, ciphertext: str) -> None:
+        _, plaintext = self._entries.pop(ciphertext)
+        _zeroize(plaintext)
+
+    def clear(self) -> None:
+        """Zeroize and drop every entry."""
+        for _, plaintext in self._entries.values():
+            _zeroize(plaintext)
+        self._entries.clear()
+
+
+_request_cache: ContextVar[Optional[PIICache]] = ContextVar("pii_request_cache", default=None)
+
+
+@contextmanager
+def pii_cache_scope(
+    max_entries: int = REQUEST_CACHE_MAX_ENTRIES,
+    ttl_seconds: float = REQUEST_CACHE_TTL_SECONDS,
+) -> Iterator[PIICache]:
+    """Cache decrypts made through this module until the block exits."""
+    cache = PIICache(max_entries, ttl_seconds)
+    token = _request_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _request_cache.reset(token)
+        cache.clear()
+
+
+async def pii_request_scope():
+    """FastAPI dependency: one PII cache per request, zeroized afterwards."""
+    with pii_cache_scope() as cache:
+        yield cache
+
+
+def decrypt_cached(ciphertext: Optional[str]) -> str:
+    """decrypt_pii() through the current scope's cache, if any."""
+    if not ciphertext:
+        return ""
+    cache = _request_cache.get()
+    if cache is None:
+        return decrypt_pii(ciphertext)
+    plaintext = cache.get(ciphertext)
+    if plaintext is None:
+        plaintext = decrypt_pii(ciphertext)
+        cache.put(ciphertext, plaintext)
+    return plaintext
+
+
+def decrypt_optional(ciphertext: Optional[str]) -> Optional[str]:
+    """decrypt_cached(), but None (not "") for an empty column."""
+    return decrypt_cached(ciphertext) if ciphertext else None
+
+
+@dataclass(frozen=True)
+class DecryptedAddress:
+    """Plaintext PII of one address; repr never shows values."""
+    recipient_name: Optional[str] = None
+    company_name: Optional[str] = None
+    phone: Optional[str] = None
+    email: Optional[str] = None
+    address_line1: Optional[str] = None
+    address_line2: Optional[str] = None
+    address_line3: Optional[str] = None
+
+    def __repr__(self) -> str:
+        present = [f.name for f in fields(self) if getattr(self, f.name)]
+        return f"DecryptedAddress(fields={present})"
+
+    __str__ = __repr__
+
+
+def decrypt_address(address: Any, fields: Sequence[str] = ADDRESS_PII_FIELDS) -> DecryptedAddress:
+    """
+    Decrypt the <field>_encrypted columns an address has set.
+
+    Pass fields= to decrypt only what the caller reads; the others stay None.
+    """
+    unknown = set(fields) - set(ADDRESS_PII_FIELDS)
+    if unknown:
+        raise ValueError(f"Not address PII fields: {sorted(unknown)}")
+    return DecryptedAddress(**{
+        name: decrypt_optional(getattr(address, f"{name}_encrypted", None))
+        for name in fields
+    })
+
+
+# ----- Carrier credentials -----
+
+class _SealedCredentialCache:
+    """
+    Decrypted credentials kept sealed with a random per-process AES-GCM key.
+
+    Unsealing is one AEAD call on a few dozen bytes; the key never leaves
+    the process and a heap dump or stray repr shows only ciphertext.
+    """
+
+    def __init__(self, ttl_seconds: float = CREDENTIAL_CACHE_TTL_SECONDS, max_entries: int = CREDENTIAL_CACHE_MAX_ENTRIES):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._aead = AESGCM(AESGCM.generate_key(bit_length=256))
+        self._entries: "OrderedDict[Tuple[str, ...], Tuple[float, bytes, bytes]]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        return f"_SealedCredentialCache(entries={len(self._entries)})"
+
+    def get(self, ciphertexts: Tuple[str, ...]) -> Tuple[str, ...]:
+        with self._lock:
+            entry = self._entries.get(ciphertexts)
+            if entry is not None and time.monotonic() < entry[0]:
+                self._entries.move_to_end(ciphertexts)
+                self.hits += 1
+                _, nonce, sealed = entry
+                opened = bytearray(self._aead.decrypt(nonce, sealed, None))
+                try:
+                    return tuple(part.decode() for part in bytes(opened).split(b"\0"))
+                finally:
+                    _zeroize(opened)
+            self.misses += 1
+
+        values = tuple(decrypt_pii(c) if c else "" for c in ciphertexts)
+        plain = bytearray(b"\0".join(v.encode() for v in values))
+        nonce = os.urandom(12)
+        sealed = self._aead.encrypt(nonce, bytes(plain), None)
+        _zeroize(plain)
+        with self._lock:
+            self._entries[ciphertexts] = (time.monotonic() + self.ttl_seconds, nonce, sealed)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return values
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_credential_cache = _SealedCredentialCache()
+
+
+def carrier_credentials(carrier: Any, *names: str) -> Tuple[str, ...]:
+    """
+    Decrypted carrier credential columns (<name>_encrypted), "" where unset.
+
+    Keyed by the ciphertexts themselves, so re-encrypted or rotated
+    credentials are picked up on the next call.
+    """
+    return _credential_cache.get(tuple(getattr(carrier, f"{name}_encrypted", None) or "" for name in names))
+
+
+def clear_credential_cache() -> None:
+    _credential_cache.clear()
+
+
+# ----- Bulk -----
+
+def _decrypt_chunk(chunk: Sequence[str]) -> List[str]:
+    return [decrypt_pii(c) for c in chunk]
+
+
+def decrypt_many(
+    ciphertexts: Sequence[Optional[str]],
+    max_workers: int = DEFAULT_WORKERS,
+    parallel_threshold: int = PARALLEL_THRESHOLD,
+) -> List[Optional[str]]:
+    """
+    Decrypt a column's worth of ciphertexts, in input order.
+
+    Empty values map to None and repeated ciphertexts are decrypted once.
+    At parallel_threshold distinct values or more the work is split into
+    one chunk per worker on a thread pool (OpenSSL releases the GIL for
+    the HMAC and AES work). Raises ValueError on the first bad token.
+    """
+    unique = list(dict.fromkeys(c for c in ciphertexts if c))
+    if len(unique) < parallel_threshold or max_workers <= 1:
+        plaintexts = _decrypt_chunk(unique)
+    else:
+        size = -(-len(unique) // max_workers)
+        chunks = [unique[i:i + size] for i in range(0, len(unique), size)]
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pii-decrypt") as pool:
+            plaintexts = [p for part in pool.map(_decrypt_chunk, chunks) for p in part]
+
+    lookup: Dict[str, str] = dict(zip(unique, plaintexts))
+    return [lookup[c] if c else None for c in ciphertexts]
+
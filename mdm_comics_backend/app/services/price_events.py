@@ -0,0 +1,300 @@
+"""
+Price Change Events (CDC)
+
+v1.0.0: Trigger-captured price changes for funkos and comic_issues
+- price_change_events: compact queue of (entity, field, old, new) rows
+  written by statement-level triggers with transition tables, so a bulk
+  price update of 100k rows costs one INSERT ... SELECT, and unrelated
+  updates (titles, sync timestamps) write nothing
+- latest_prices: current value and last change time per (entity, field),
+  maintained by the same triggers
+- price_event_cursors: one row per consumer. Consumers drain events by
+  transaction id range up to the oldest still-running transaction, so an
+  event is delivered exactly once even when writers commit out of order
+
+sync_price_changelog is the first consumer; snapshot, movers and ML
+feature jobs can register their own consumer name and drain the same
+stream independently.
+"""
+import logging
+import os
+from typing import Any, Awaitable, Callable, Dict, List
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+# Consumed events are kept this long for late subscribers and debugging
+EVENT_RETENTION_DAYS = int(os.getenv("PRICE_EVENT_RETENTION_DAYS", "7"))
+
+# table -> (entity_type, tracked price columns)
+PRICE_CDC_SPECS: Dict[str, tuple] = {
+    "funkos": ("funko", ["price_loose", "price_cib", "price_new"]),
+    "comic_issues": ("comic", [
+        "price_loose", "price_cib", "price_new", "price_graded",
+        "price_bgs_10", "price_cgc_98", "price_cgc_96",
+    ]),
+}
+
+# Rows in this transaction-id range belong to one drain
+EVENT_RANGE = "txid >= :from_txid AND txid < :to_txid"
+
+Apply = Callable[[AsyncSession, Dict[str, int]], Awaitable[Dict[str, int]]]
+
+SCHEMA_DDL = [
+    """
+    CREATE TABLE IF NOT EXISTS price_change_events (
+        id BIGSERIAL PRIMARY KEY,
+        txid BIGINT NOT NULL,
+        entity_type VARCHAR(50) NOT NULL,
+        entity_id INTEGER NOT NULL,
+        field_name VARCHAR(100) NOT NULL,
+        old_value NUMERIC(12, 2),
+        new_value NUMERIC(12, 2),
+        changed_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_price_change_events_txid ON price_change_events (txid)",
+    """
+    CREATE TABLE IF NOT EXISTS latest_prices (
+        entity_type VARCHAR(50) NOT NULL,
+        entity_id INTEGER NOT NULL,
+        field_name VARCHAR(100) NOT NULL,
+        value NUMERIC(12, 2),
+        changed_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+        PRIMARY KEY (entity_type, entity_id, field_name)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS price_event_cursors (
+        consumer VARCHAR(100) PRIMARY KEY,
+        last_txid BIGINT NOT NULL DEFAULT 0,
+        events_consumed BIGINT NOT NULL DEFAULT 0,
+        updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+    )
+    """,
+]
+
+
+# ----- Installation -----
+
+def _field_values(columns: List[str], with_old: bool) -> str:
+    """LATERAL VALUES list of (field, old, new) for every tracked column."""
+    rows = ", ".join(
+        f"('{col}', {f'o.{col}' if with_old else 'NULL::numeric'}, n.{col})" for col in columns
+    )
+    return f"CROSS JOIN LATERAL (VALUES {rows}) AS c(field_name, old_value, new_value)"
+
+
+def _capture_sql(table: str, op: str) -> str:
+    """Queue changed fields and upsert latest_prices for one statement."""
+    entity_type, columns = PRICE_CDC_SPECS[table]
+    if op == "UPDATE":
+        source = f"new_rows n JOIN old_rows o ON o.id = n.id {_field_values(columns, True)}"
+    else:
+        source = f"new_rows n {_field_values(columns, False)}"
+    return f"""
+            WITH changes AS (
+                SELECT n.id AS entity_id, c.field_name, c.old_value, c.new_value
+                FROM {source}
+                WHERE c.old_value IS DISTINCT FROM c.new_value
+            ), queued AS (
+                INSERT INTO price_change_events (txid, entity_type, entity_id, field_name, old_value, new_value)
+                SELECT txid_current(), '{entity_type}', entity_id, field_name, old_value, new_value
+                FROM changes
+            )
+            INSERT INTO latest_prices (entity_type, entity_id, field_name, value, changed_at)
+            SELECT '{entity_type}', entity_id, field_name, new_value, NOW()
+            FROM changes
+            ON CONFLICT (entity_type, entity_id, field_name) DO UPDATE
+            SET value = EXCLUDED.value, changed_at = EXCLUDED.changed_at;"""
+
+
+def _cdc_trigger_ddl(table: str) -> List[str]:
+    entity_type, _ = PRICE_CDC_SPECS[table]
+    fn = f"price_cdc_{table}"
+    body = f"""
+        CREATE OR REPLACE FUNCTION {fn}() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN{_capture_sql(table, "INSERT")}
+            ELSIF TG_OP = 'UPDATE' THEN{_capture_sql(table, "UPDATE")}
+            ELSE
+                DELETE FROM latest_prices lp
+                USING old_rows o
+                WHERE lp.entity_type = '{entity_type}' AND lp.entity_id = o.id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """
+    statements = [body]
+    # Transition tables need one trigger per event (and no column list)
+    for op, refs in (
+        ("INSERT", "NEW TABLE AS new_rows"),
+        ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+        ("DELETE", "OLD TABLE AS old_rows"),
+    ):
+        trigger = f"trg_{fn}_{op.lower()}"
+        statements.append(f"DROP TRIGGER IF EXISTS {trigger} ON {table}")
+        statements.append(
+            f"CREATE TRIGGER {trigger} AFTER {op} ON {table} "
+            f"REFERENCING {refs} FOR EACH STATEMENT EXECUTE FUNCTION {fn}()"
+        )
+    return statements
+
+
+async def _table_exists(db: AsyncSession, table: str) -> bool:
+    result = await db.execute(text("SELECT to_regclass(:t) IS NOT NULL"), {"t": table})
+    return bool(result.scalar())
+
+
+async def install_price_cdc(db: AsyncSession, rebuild: bool = True) -> Dict[str, Any]:
+    """
+    Create the event/latest/cursor tables and capture triggers.
+
+    Idempotent. Each source table is locked (SHARE mode) while its triggers
+    are swapped in and latest_prices is reseeded from it, so no price write
+    can slip between the seed and the trigger taking over.
+    """
+    for statement in SCHEMA_DDL:
+        await db.execute(text(statement))
+
+    installed, skipped = [], []
+    for table, (entity_type, columns) in PRICE_CDC_SPECS.items():
+        if not await _table_exists(db, table):
+            skipped.append(table)
+            continue
+        if rebuild:
+            await db.execute(text(f"LOCK TABLE {table} IN SHARE MODE"))
+        for statement in _cdc_trigger_ddl(table):
+            await db.execute(text(statement))
+        if rebuild:
+            await db.execute(text("DELETE FROM latest_prices WHERE entity_type = :t"), {"t": entity_type})
+            await db.execute(text(f"""
+                INSERT INTO latest_prices (entity_type, entity_id, field_name, value, changed_at)
+                SELECT '{entity_type}', n.id, c.field_name, c.new_value, NOW()
+                FROM {table} n {_field_values(columns, False)}
+                WHERE c.new_value IS NOT NULL
+            """))
+        installed.append(table)
+
+    await db.commit()
+    logger.info(f"Price CDC installed for {installed} (skipped missing: {skipped})")
+    return {"installed": installed, "skipped": skipped}
+
+
+async def ensure_price_cdc(db: AsyncSession) -> None:
+    """Startup hook: install CDC once if the event table is missing."""
+    try:
+        if await _table_exists(db, "price_change_events"):
+            return
+        # One replica installs; others skip until the next restart
+        locked = (await db.execute(text("SELECT pg_try_advisory_xact_lock(hashtext('price_cdc_install'))"))).scalar()
+        if not locked:
+            return
+        await install_price_cdc(db)
+    except Exception as e:
+        logger.warning(f"Price CDC installation failed: {e}")
+        await db.rollback()
+
+
+async def price_cdc_installed(db: AsyncSession) -> bool:
+    return await _table_exists(db, "price_change_events")
+
+
+# ----- Consumers -----
+
+async def drain_price_events(db: AsyncSession, consumer: str, apply: Apply) -> Dict[str, Any]:
+    """
+    Hand one consumer every event committed since its last drain.
+
+    apply(db, params) runs set-based SQL over the events matching
+    EVENT_RANGE (params holds from_txid/to_txid) and returns counts. The
+    cursor advances in the same transaction, so a failed apply redelivers
+    the range. Concurrent drains of one consumer skip instead of waiting.
+    """
+    # Everything below the oldest running transaction is committed or gone;
+    # read it before this transaction takes an id of its own
+    to_txid = (await db.execute(text("SELECT txid_snapshot_xmin(txid_current_snapshot())"))).scalar()
+
+    await db.execute(
+        text("INSERT INTO price_event_cursors (consumer) VALUES (:consumer) ON CONFLICT (consumer) DO NOTHING"),
+        {"consumer": consumer},
+    )
+    row = (await db.execute(
+        text("SELECT last_txid FROM price_event_cursors WHERE consumer = :consumer FOR UPDATE SKIP LOCKED"),
+        {"consumer": consumer},
+    )).fetchone()
+    if row is None:
+        await db.rollback()
+        return {"status": "busy", "consumer": consumer}
+
+    params = {"from_txid": int(row.last_txid), "to_txid": int(to_txid)}
+    if params["to_txid"] <= params["from_txid"]:
+        await db.commit()
+        return {"status": "complete", "consumer": consumer, "events": 0}
+
+    events = (await db.execute(
+        text(f"SELECT COUNT(*) FROM price_change_events e WHERE {EVENT_RANGE}"), params,
+    )).scalar() or 0
+    applied = await apply(db, params) if events else {}
+
+    await db.execute(text("""
+        UPDATE price_event_cursors
+        SET last_txid = :to_txid, events_consumed = events_consumed + :events, updated_at = NOW()
+        WHERE consumer = :consumer
+    """), {**params, "events": events, "consumer": consumer})
+    await db.commit()
+    return {"status": "complete", "consumer": consumer, "events": int(events), **applied}
+
+
+async def fetch_price_events(db: AsyncSession, params: Dict[str, int]) -> List[Any]:
+    """Event rows in a drain range, for consumers that work in Python."""
+    result = await db.execute(text(f"""
+        SELECT e.id, e.entity_type, e.entity_id, e.field_name, e.old_value, e.new_value, e.changed_at
+        FROM price_change_events e
+        WHERE {EVENT_RANGE}
+        ORDER BY e.id
+    """), params)
+    return result.fetchall()
+
+
+async def get_price_event_stats(db: AsyncSession) -> Dict[str, Any]:
+    """Queue size and per-consumer backlog."""
+    totals = (await db.execute(text("""
+        SELECT COUNT(*) AS events, MAX(changed_at) AS last_event_at FROM price_change_events
+    """))).fetchone()
+    consumers = (await db.execute(text("""
+        SELECT c.consumer, c.events_consumed, c.updated_at,
+               (SELECT COUNT(*) FROM price_change_events e WHERE e.txid >= c.last_txid) AS pending
+        FROM price_event_cursors c
+        ORDER BY c.consumer
+    """))).fetchall()
+    return {
+        "events": totals.events,
+        "last_event_at": totals.last_event_at.isoformat() if totals.last_event_at else None,
+        "consumers": [
+            {
+                "consumer": c.consumer,
+                "pending": c.pending,
+                "events_consumed": c.events_consumed,
+                "last_drained_at": c.updated_at.isoformat() if c.updated_at else None,
+            }
+            for c in consumers
+        ],
+    }
+
+
+async def prune_price_events(db: AsyncSession, days: int = EVENT_RETENTION_DAYS) -> int:
+    """Delete events past retention that every registered consumer has drained."""
+    result = await db.execute(text("""
+        DELETE FROM price_change_events
+        WHERE changed_at < NOW() - make_interval(days => :days)
+          AND txid < COALESCE(
+              (SELECT MIN(last_txid) FROM price_event_cursors),
+              txid_snapshot_xmin(txid_current_snapshot())
+          )
+    """), {"days": days})
+    await db.commit()
+    return result.rowcount or 0
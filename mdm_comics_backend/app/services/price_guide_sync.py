@@ -0,0 +1,334 @@
+"""
+PriceCharting Price-Guide Diff Sync v1.0.0
+
+Bulk alternative to one GET /api/product per matched Funko / Comic.
+PriceCharting publishes a price-guide CSV per category; this module
+
+1. streams the CSV (downloaded once per run, or a local file) into a
+   temp staging table with COPY, in chunks
+2. diffs it against current prices with one set-based join
+3. writes one bulk INSERT into price_changelog for the changed fields and
+   one bulk UPDATE that applies new prices and marks every refreshed row
+   as synced
+
+Rows the guide does not cover stay stale, so the per-item API loop in
+pricecharting_jobs picks them up as the fallback.
+
+Semantics mirror the per-item sync: prices of 0 / blank never overwrite,
+Funkos track loose / cib / new, Comics use the CIB price as
+price_guide_value, and changelog rows share the run's sync_batch_id.
+"""
+import csv
+import logging
+import os
+import tempfile
+import time
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+PRICE_GUIDE_DOWNLOAD_URL = "https://www.pricecharting.com/price-guide/download-custom"
+
+# Rows per COPY round-trip while streaming the CSV
+COPY_CHUNK_SIZE = 5000
+
+# price_changelog.change_pct is NUMERIC(8, 2); a single outlier must not
+# abort the whole bulk insert
+MAX_CHANGE_PCT = Decimal("999999.99")
+
+STAGING_COLUMNS = ["pricecharting_id", "product_name", "loose", "cib", "new"]
+
+# entity -> time of the last successful guide pass. The guide is refreshed
+# at most daily, so items it did not cover are left to the per-item
+# fallback instead of re-loading the same CSV every run.
+_last_guide_pass: Dict[str, float] = {}
+
+STALE_PREDICATE = """
+    (:force OR {alias}.pricecharting_synced_at IS NULL
+     OR {alias}.pricecharting_synced_at < NOW() - make_interval(hours => :staleness_hours))
+"""
+
+CHANGE_PCT_EXPR = f"""
+    CASE WHEN v.old_value > 0 THEN
+        LEAST(GREATEST(ROUND((v.new_value - v.old_value) / v.old_value * 100, 2),
+                       -{MAX_CHANGE_PCT}), {MAX_CHANGE_PCT})
+    END
+"""
+
+
+def parse_guide_price(value: Optional[str]) -> Optional[Decimal]:
+    """Parse a guide price such as "$1,234.56"; blank, zero or junk -> None."""
+    if not value:
+        return None
+    cleaned = value.strip().replace("$", "").replace(",", "")
+    if not cleaned:
+        return None
+    try:
+        price = Decimal(cleaned).quantize(Decimal("0.01"))
+    except InvalidOperation:
+        return None
+    return price if price > 0 else None
+
+
+def iter_price_guide_rows(path: Path) -> Iterator[Tuple]:
+    """
+    Stream (pricecharting_id, product_name, loose, cib, new) from a guide CSV.
+
+    Rows without a numeric id are skipped; a repeated id keeps its first row.
+    """
+    seen = set()
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            try:
+                pc_id = int((row.get("id") or "").strip())
+            except ValueError:
+                continue
+            if pc_id in seen:
+                continue
+            seen.add(pc_id)
+            yield (
+                pc_id,
+                (row.get("product-name") or "")[:500] or None,
+                parse_guide_price(row.get("loose-price")),
+                parse_guide_price(row.get("cib-price")),
+                parse_guide_price(row.get("new-price")),
+            )
+
+
+async def download_price_guide(category: str, token: str, timeout: float = 300.0) -> Path:
+    """Stream a category's price-guide CSV to a temp file and return its path."""
+    fd, name = tempfile.mkstemp(prefix=f"pc_guide_{category}_", suffix=".csv")
+    try:
+        async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
+            async with client.stream(
+                "GET", PRICE_GUIDE_DOWNLOAD_URL, params={"t": token, "category": category}
+            ) as response:
+                response.raise_for_status()
+                with os.fdopen(fd, "wb") as out:
+                    async for chunk in response.aiter_bytes():
+                        out.write(chunk)
+    except Exception:
+        os.unlink(name)
+        raise
+    return Path(name)
+
+
+async def load_price_guide(db: AsyncSession, path: Path) -> int:
+    """Create the pc_price_guide staging table and COPY the CSV into it."""
+    await db.execute(text("""
+        CREATE TEMP TABLE pc_price_guide (
+            pricecharting_id INTEGER PRIMARY KEY,
+            product_name TEXT,
+            loose NUMERIC(12, 2),
+            cib NUMERIC(12, 2),
+            new NUMERIC(12, 2)
+        ) ON COMMIT DROP
+    """))
+    conn = await db.connection()
+    raw = await conn.get_raw_connection()
+    driver = raw.driver_connection
+
+    loaded = 0
+    chunk: List[Tuple] = []
+    for record in iter_price_guide_rows(path):
+        chunk.append(record)
+        if len(chunk) >= COPY_CHUNK_SIZE:
+            await driver.copy_records_to_table("pc_price_guide", records=chunk, columns=STAGING_COLUMNS)
+            loaded += len(chunk)
+            chunk = []
+    if chunk:
+        await driver.copy_records_to_table("pc_price_guide", records=chunk, columns=STAGING_COLUMNS)
+        loaded += len(chunk)
+
+    await db.execute(text("ANALYZE pc_price_guide"))
+    return loaded
+
+
+async def has_stale_matches(db: AsyncSession, entity: str, force: bool, staleness_hours: int) -> bool:
+    """Cheap check so a run with nothing stale skips the download entirely."""
+    table = "funkos" if entity == "funko" else "comic_issues"
+    stale = STALE_PREDICATE.format(alias="t")
+    result = await db.execute(text(f"""
+        SELECT EXISTS (
+            SELECT 1 FROM {table} t
+            WHERE t.pricecharting_id IS NOT NULL AND {stale}
+        )
+    """), {"force": force, "staleness_hours": staleness_hours})
+    return bool(result.scalar())
+
+
+async def apply_funko_price_guide(
+    db: AsyncSession, batch_id: str, force: bool, staleness_hours: int
+) -> Dict[str, Any]:
+    """Diff staged prices against funkos; bulk changelog INSERT then bulk UPDATE."""
+    params = {"force": force, "staleness_hours": staleness_hours, "batch_id": batch_id}
+    stale = STALE_PREDICATE.format(alias="f")
+
+    # Changelog first: it needs the pre-update values
+    changelog = await db.execute(text(f"""
+        INSERT INTO price_changelog
+            (entity_type, entity_id, entity_name, field_name,
+             old_value, new_value, change_pct, data_source, reason, sync_batch_id)
+        SELECT 'funko', f.id, LEFT(f.title, 500), v.field_name,
+               v.old_value, v.new_value, {CHANGE_PCT_EXPR},
+               'pricecharting', 'price_sync', CAST(:batch_id AS uuid)
+        FROM funkos f
+        JOIN pc_price_guide g ON g.pricecharting_id = f.pricecharting_id
+        CROSS JOIN LATERAL (VALUES
+            ('price_loose', f.price_loose, g.loose),
+            ('price_cib', f.price_cib, g.cib),
+            ('price_new', f.price_new, g.new)
+        ) AS v(field_name, old_value, new_value)
+        WHERE {stale}
+          AND v.new_value IS NOT NULL
+          AND v.new_value IS DISTINCT FROM v.old_value
+        ON CONFLICT (entity_type, entity_id, field_name, sync_batch_id)
+            WHERE sync_batch_id IS NOT NULL
+        DO NOTHING
+        RETURNING change_pct
+    """), params)
+    change_pcts = [row[0] for row in changelog.fetchall()]
+
+    updated = await db.execute(text(f"""
+        UPDATE funkos f
+        SET price_loose = COALESCE(d.loose, f.price_loose),
+            price_cib = COALESCE(d.cib, f.price_cib),
+            price_new = COALESCE(d.new, f.price_new),
+            pricecharting_synced_at = NOW(),
+            updated_at = CASE WHEN d.changed THEN NOW() ELSE f.updated_at END
+        FROM (
+            SELECT f.id, g.loose, g.cib, g.new,
+                   (g.loose IS NOT NULL AND g.loose IS DISTINCT FROM f.price_loose)
+                   OR (g.cib IS NOT NULL AND g.cib IS DISTINCT FROM f.price_cib)
+                   OR (g.new IS NOT NULL AND g.new IS DISTINCT FROM f.price_new) AS changed
+            FROM funkos f
+            JOIN pc_price_guide g ON g.pricecharting_id = f.pricecharting_id
+            WHERE {stale}
+        ) d
+        WHERE f.id = d.id
+        RETURNING d.changed
+    """), params)
+    flags = [row[0] for row in updated.fetchall()]
+
+    return {"matched": len(flags), "updated": sum(1 for f in flags if f), "change_pcts": change_pcts}
+
+
+async def apply_comic_price_guide(
+    db: AsyncSession, batch_id: str, force: bool, staleness_hours: int
+) -> Dict[str, Any]:
+    """Diff staged CIB prices against comic_issues.price_guide_value."""
+    params = {"force": force, "staleness_hours": staleness_hours, "batch_id": batch_id}
+    stale = STALE_PREDICATE.format(alias="ci")
+
+    # Per-item sync records a missing old price as 0; keep that for the changelog
+    changelog = await db.execute(text(f"""
+        INSERT INTO price_changelog
+            (entity_type, entity_id, entity_name, field_name,
+             old_value, new_value, change_pct, data_source, reason, sync_batch_id)
+        SELECT 'comic', ci.id, 'Comic #' || ci.id, 'price_guide_value',
+               v.old_value, v.new_value, {CHANGE_PCT_EXPR},
+               'pricecharting', 'price_sync', CAST(:batch_id AS uuid)
+        FROM comic_issues ci
+        JOIN pc_price_guide g ON g.pricecharting_id = ci.pricecharting_id
+        CROSS JOIN LATERAL (VALUES (COALESCE(ci.price_guide_value, 0), g.cib))
+            AS v(old_value, new_value)
+        WHERE {stale}
+          AND v.new_value IS NOT NULL
+          AND v.new_value <> v.old_value
+        ON CONFLICT (entity_type, entity_id, field_name, sync_batch_id)
+            WHERE sync_batch_id IS NOT NULL
+        DO NOTHING
+        RETURNING change_pct
+    """), params)
+    change_pcts = [row[0] for row in changelog.fetchall()]
+
+    updated = await db.execute(text(f"""
+        UPDATE comic_issues ci
+        SET price_guide_value = COALESCE(d.cib, ci.price_guide_value),
+            pricecharting_synced_at = NOW(),
+            updated_at = CASE WHEN d.changed THEN NOW() ELSE ci.updated_at END
+        FROM (
+            SELECT ci.id, g.cib,
+                   g.cib IS NOT NULL AND g.cib IS DISTINCT FROM ci.price_guide_value AS changed
+            FROM comic_issues ci
+            JOIN pc_price_guide g ON g.pricecharting_id = ci.pricecharting_id
+            WHERE {stale}
+        ) d
+        WHERE ci.id = d.id
+        RETURNING d.changed
+    """), params)
+    flags = [row[0] for row in updated.fetchall()]
+
+    return {"matched": len(flags), "updated": sum(1 for f in flags if f), "change_pcts": change_pcts}
+
+
+async def sync_from_price_guide(
+    db: AsyncSession,
+    entity: str,
+    batch_id: str,
+    source: str,
+    token: Optional[str],
+    force: bool = False,
+    staleness_hours: int = 24,
+    alert_pct: float = 20.0,
+) -> Dict[str, Any]:
+    """
+    Run one guide diff for "funko" or "comic" and commit it.
+
+    source is a local CSV path or a PriceCharting category to download.
+    Returns counts; "downloaded" tells the caller whether API quota was used.
+    """
+    result = {
+        "source": source, "downloaded": False, "guide_rows": 0,
+        "matched": 0, "updated": 0, "changelog_recorded": 0, "significant_changes": 0,
+    }
+    last_pass = _last_guide_pass.get(entity)
+    if not force and last_pass and time.time() - last_pass < staleness_hours * 3600:
+        logger.info(f"[price_guide] {entity} guide already applied this cycle, skipping")
+        return result
+    if not await has_stale_matches(db, entity, force, staleness_hours):
+        logger.info(f"[price_guide] No stale {entity} rows, skipping guide download")
+        return result
+
+    path = Path(source)
+    downloaded = not path.is_file()
+    if downloaded:
+        if not token:
+            raise ValueError("PRICECHARTING_API_TOKEN required to download the price guide")
+        path = await download_price_guide(source, token)
+        result["downloaded"] = True
+
+    try:
+        result["guide_rows"] = await load_price_guide(db, path)
+        apply = apply_funko_price_guide if entity == "funko" else apply_comic_price_guide
+        applied = await apply(db, batch_id, force, staleness_hours)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    finally:
+        if downloaded:
+            path.unlink(missing_ok=True)
+
+    _last_guide_pass[entity] = time.time()
+    change_pcts = applied.pop("change_pcts")
+    significant = [p for p in change_pcts if p is not None and abs(float(p)) >= alert_pct]
+    if significant:
+        logger.warning(
+            f"[PRICE_ALERT] {len(significant)} {entity} price changes >= {alert_pct:.0f}% "
+            f"in guide sync {batch_id}"
+        )
+    result.update(applied)
+    result["changelog_recorded"] = len(change_pcts)
+    result["significant_changes"] = len(significant)
+    logger.info(
+        f"[price_guide] {entity}: {result['guide_rows']} guide rows, {result['matched']} matched, "
+        f"{result['updated']} changed, {result['changelog_recorded']} changelog entries"
+    )
+    return result
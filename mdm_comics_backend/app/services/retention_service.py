@@ -1,25 +1,24 @@
 """
 Data Retention Service
 
-User Management System v1.0.0
+User Management System v1.1.0
 Per constitution_data_hygiene.json §4: Retention enforcement
 
 Handles automatic cleanup of expired data based on retention policies.
+
+v1.1.0 (PERF-044): Cleanups run as resumable batched purges that commit
+per batch and skip locked rows, and status/preview use planner estimates
+instead of COUNT(*) scans.
 """
 import hashlib
-import secrets
+import time
 from datetime import datetime, timezone, timedelta
 from typing import Dict, Any, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete, and_
 
-from app.core.config import settings
-from app.models.user import User
-from app.models.user_session import UserSession
-from app.models.user_audit_log import UserAuditLog
-from app.models.dsar_request import DSARRequest
-from app.models.password_reset import PasswordResetToken
-from app.models.email_verification import EmailVerificationToken
+from app.models.user_audit_log import AuditAction
+from app.services.audit_service import AuditService
+from app.services.batched_purge import PurgeSpec, estimate_rows, get_purge_cursors, run_purge
 
 
 class RetentionService:
@@ -40,306 +39,183 @@ class RetentionService:
         "soft_deleted_users": 90,         # 90 days before hard delete
     }
 
+    # PERF-044: Each retention rule as a batched purge (see batched_purge)
+    PURGE_SPECS = {
+        "password_reset_tokens": PurgeSpec(
+            name="retention.password_reset_tokens",
+            table="password_reset_tokens",
+            where="created_at < :cutoff",
+        ),
+        "email_verification_tokens": PurgeSpec(
+            name="retention.email_verification_tokens",
+            table="email_verification_tokens",
+            where="created_at < :cutoff",
+        ),
+        "user_sessions": PurgeSpec(
+            name="retention.user_sessions",
+            table="user_sessions",
+            where="created_at < :cutoff AND (revoked_at IS NOT NULL OR expires_at < NOW())",
+        ),
+        "audit_logs": PurgeSpec(
+            name="retention.audit_logs",
+            table="user_audit_log",
+            where="ts < :cutoff AND action <> ALL(:protected_actions)",
+        ),
+        "dsar_requests": PurgeSpec(
+            name="retention.dsar_requests",
+            table="dsar_requests",
+            where="status = ANY(:closed_statuses) AND completed_at < :cutoff",
+        ),
+        # Users are anonymized in place, not deleted: orders keep their
+        # foreign keys for accounting. Already purged rows are skipped.
+        "soft_deleted_users": PurgeSpec(
+            name="retention.soft_deleted_users",
+            table="users",
+            where="deleted_at < :cutoff AND email NOT LIKE 'purged\\_%@purged.local'",
+            set_clause=(
+                "email = 'purged_' || t.id || '_' || substr(md5(random()::text), 1, 8) || '@purged.local', "
+                "name = 'Purged User ' || t.id, "
+                "hashed_password = left(encode(sha512(convert_to("
+                "'FINAL_DELETE|' || t.id || '|' || clock_timestamp(), 'UTF8')), 'hex'), 60)"
+            ),
+        ),
+    }
+
+    # Security events outlive the audit log retention period
+    PROTECTED_AUDIT_ACTIONS = [
+        AuditAction.USER_LOGIN_FAILED,
+        AuditAction.USER_LOCKED,
+        AuditAction.USER_PASSWORD_RESET,
+        AuditAction.USER_PASSWORD_CHANGE,
+        AuditAction.ROLE_ASSIGNED,
+        AuditAction.ROLE_REVOKED,
+        AuditAction.RETENTION_CLEANUP,
+        # Pre-v1.1 action names
+        "login_failed",
+        "account_locked",
+        "password_reset",
+        "role_changed",
+        "permission_change",
+    ]
+
+    CLOSED_DSAR_STATUSES = ["completed", "cancelled", "failed"]
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def run_cleanup(self) -> Dict[str, int]:
+    def _purge_params(self, data_type: str) -> Dict[str, Any]:
+        params: Dict[str, Any] = {
+            "cutoff": datetime.now(timezone.utc) - timedelta(days=self.RETENTION_DAYS[data_type]),
+        }
+        if data_type == "audit_logs":
+            params["protected_actions"] = list(self.PROTECTED_AUDIT_ACTIONS)
+        elif data_type == "dsar_requests":
+            params["closed_statuses"] = list(self.CLOSED_DSAR_STATUSES)
+        return params
+
+    async def run_cleanup(self, max_seconds: Optional[float] = None) -> Dict[str, int]:
         """
         Execute retention cleanup job.
         Returns dict with counts of cleaned up records per data type.
+
+        v1.1.0: Each data type is purged in committed batches. With
+        max_seconds, a type that runs out of time stops early and the next
+        run resumes it; types not yet reached report 0.
         """
         results = {}
-
-        for data_type, retention_days in self.RETENTION_DAYS.items():
-            cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
-
-            if data_type == "password_reset_tokens":
-                count = await self._cleanup_reset_tokens(cutoff)
-            elif data_type == "email_verification_tokens":
-                count = await self._cleanup_verification_tokens(cutoff)
-            elif data_type == "user_sessions":
-                count = await self._cleanup_sessions(cutoff)
-            elif data_type == "soft_deleted_users":
-                count = await self._hard_delete_users(cutoff)
-            elif data_type == "audit_logs":
-                count = await self._trim_audit_logs(cutoff)
-            elif data_type == "dsar_requests":
-                count = await self._cleanup_dsar_requests(cutoff)
-            else:
-                count = 0
-
+        started = time.monotonic()
+
+        for data_type in self.RETENTION_DAYS:
+            remaining = None
+            if max_seconds is not None:
+                remaining = max_seconds - (time.monotonic() - started)
+                if remaining <= 0:
+                    results[data_type] = 0
+                    continue
+
+            params = self._purge_params(data_type)
+            purge = await run_purge(self.db, self.PURGE_SPECS[data_type], params, max_seconds=remaining)
+            count = purge["rows"]
             results[data_type] = count
 
             if count > 0:
                 # Record proof per constitution_data_hygiene.json §4
-                await self._record_cleanup_proof(data_type, count, cutoff)
+                await self._record_cleanup_proof(data_type, count, params["cutoff"], purge)
 
         return results
 
-    async def _cleanup_reset_tokens(self, cutoff: datetime) -> int:
-        """Clean up expired password reset tokens."""
-        result = await self.db.execute(
-            delete(PasswordResetToken).where(
-                PasswordResetToken.created_at < cutoff
-            )
-        )
-        return result.rowcount
-
-    async def _cleanup_verification_tokens(self, cutoff: datetime) -> int:
-        """Clean up expired email verification tokens."""
-        result = await self.db.execute(
-            delete(EmailVerificationToken).where(
-                EmailVerificationToken.created_at < cutoff
-            )
-        )
-        return result.rowcount
-
-    async def _cleanup_sessions(self, cutoff: datetime) -> int:
-        """Clean up expired or old inactive sessions."""
-        # Delete sessions older than cutoff or already revoked/expired
-        result = await self.db.execute(
-            delete(UserSession).where(
-                and_(
-                    UserSession.is_active == False,
-                    UserSession.created_at < cutoff
-                )
-            )
-        )
-        return result.rowcount
-
-    async def _hard_delete_users(self, cutoff: datetime) -> int:
-        """
-        Hard delete users that were soft-deleted before cutoff.
-        Per GDPR: After retention period, complete erasure.
-        """
-        # Find soft-deleted users older than cutoff
-        result = await self.db.execute(
-            select(User).where(
-                and_(
-                    User.deleted_at.isnot(None),
-                    User.deleted_at < cutoff
-                )
-            )
-        )
-        users = result.scalars().all()
-
-        count = 0
-        for user in users:
-            # Final anonymization before hard delete
-            # This removes any remaining PII that might have been missed
-            await self._final_anonymization(user)
-            count += 1
-
-        return count
-
-    async def _final_anonymization(self, user: User) -> None:
-        """
-        Final anonymization pass before hard delete.
-        Ensures all PII is cryptographically erased.
-        """
-        # Generate deletion proof hash
-        deletion_hash = hashlib.sha512(
-            f"FINAL_DELETE|{user.id}|{datetime.now(timezone.utc).isoformat()}".encode()
-        ).hexdigest()
-
-        # Complete anonymization
-        user.email = f"purged_{user.id}_{secrets.token_hex(4)}@purged.local"
-        user.name = f"Purged User {user.id}"
-        user.hashed_password = deletion_hash[:60]  # bcrypt length
-
-        # Note: We don't actually delete the user record to maintain
-        # referential integrity with orders (for accounting).
-        # The user is fully anonymized instead.
-
-    async def _trim_audit_logs(self, cutoff: datetime) -> int:
-        """
-        Trim old audit logs.
-        Note: Keep critical security events longer per policy.
-        """
-        # Only delete non-security-critical logs
-        non_critical_actions = [
-            "login_success",
-            "logout",
-            "profile_update",
-            "session_created",
-        ]
-
-        result = await self.db.execute(
-            delete(UserAuditLog).where(
-                and_(
-                    UserAuditLog.created_at < cutoff,
-                    # Don't delete security events
-                    ~UserAuditLog.action.in_([
-                        "login_failed",
-                        "account_locked",
-                        "password_reset",
-                        "role_changed",
-                        "permission_change",
-                    ])
-                )
-            )
-        )
-        return result.rowcount
-
-    async def _cleanup_dsar_requests(self, cutoff: datetime) -> int:
-        """Clean up completed DSAR requests after retention period."""
-        result = await self.db.execute(
-            delete(DSARRequest).where(
-                and_(
-                    DSARRequest.status.in_(["completed", "cancelled", "failed"]),
-                    DSARRequest.completed_at < cutoff
-                )
-            )
-        )
-        return result.rowcount
-
     async def _record_cleanup_proof(
         self,
         data_type: str,
         count: int,
-        cutoff: datetime
+        cutoff: datetime,
+        purge: Dict[str, Any],
     ) -> None:
         """
         Record proof of cleanup for compliance auditing.
         Per constitution_data_hygiene.json §4.
         """
-        # Create audit entry for cleanup
         proof_hash = hashlib.sha256(
             f"RETENTION_CLEANUP|{data_type}|{count}|{cutoff.isoformat()}".encode()
         ).hexdigest()
 
-        log_entry = UserAuditLog(
-            action="retention_cleanup",
+        await AuditService(self.db).log(
+            action=AuditAction.RETENTION_CLEANUP,
+            actor_type="system",
             resource_type=data_type,
-            details={
+            metadata={
                 "count": count,
                 "cutoff": cutoff.isoformat(),
                 "proof_hash": proof_hash,
                 "retention_days": self.RETENTION_DAYS.get(data_type),
+                "batches": purge["batches"],
+                "status": purge["status"],
             },
         )
-
-        self.db.add(log_entry)
+        await self.db.commit()
 
     async def get_retention_status(self) -> Dict[str, Any]:
-        """Get current retention status for admin dashboard."""
-        from sqlalchemy import func
-
-        status = {}
-
-        # Password reset tokens
-        reset_result = await self.db.execute(
-            select(func.count(PasswordResetToken.id))
-        )
-        status["password_reset_tokens"] = {
-            "count": reset_result.scalar() or 0,
-            "retention_days": self.RETENTION_DAYS["password_reset_tokens"],
-        }
-
-        # Email verification tokens
-        verify_result = await self.db.execute(
-            select(func.count(EmailVerificationToken.id))
-        )
-        status["email_verification_tokens"] = {
-            "count": verify_result.scalar() or 0,
-            "retention_days": self.RETENTION_DAYS["email_verification_tokens"],
-        }
-
-        # Inactive sessions
-        session_result = await self.db.execute(
-            select(func.count(UserSession.id)).where(UserSession.is_active == False)
-        )
-        status["inactive_sessions"] = {
-            "count": session_result.scalar() or 0,
-            "retention_days": self.RETENTION_DAYS["user_sessions"],
-        }
-
-        # Soft-deleted users
-        deleted_result = await self.db.execute(
-            select(func.count(User.id)).where(User.deleted_at.isnot(None))
-        )
-        status["soft_deleted_users"] = {
-            "count": deleted_result.scalar() or 0,
-            "retention_days": self.RETENTION_DAYS["soft_deleted_users"],
-        }
-
-        # Audit logs
-        audit_result = await self.db.execute(
-            select(func.count(UserAuditLog.id))
-        )
-        status["audit_logs"] = {
-            "count": audit_result.scalar() or 0,
-            "retention_days": self.RETENTION_DAYS["audit_logs"],
-        }
+        """
+        Get current retention status for admin dashboard.
 
-        # Completed DSAR requests
-        dsar_result = await self.db.execute(
-            select(func.count(DSARRequest.id)).where(
-                DSARRequest.status.in_(["completed", "cancelled", "failed"])
-            )
-        )
-        status["completed_dsar_requests"] = {
-            "count": dsar_result.scalar() or 0,
-            "retention_days": self.RETENTION_DAYS["dsar_requests"],
+        v1.1.0: Counts are planner estimates (no table scans) and carry
+        "estimated": true.
+        """
+        targets = {
+            "password_reset_tokens": ("password_reset_tokens", "TRUE", {}, "password_reset_tokens"),
+            "email_verification_tokens": ("email_verification_tokens", "TRUE", {}, "email_verification_tokens"),
+            "inactive_sessions": (
+                "user_sessions", "revoked_at IS NOT NULL OR expires_at < NOW()", {}, "user_sessions",
+            ),
+            "soft_deleted_users": ("users", "deleted_at IS NOT NULL", {}, "soft_deleted_users"),
+            "audit_logs": ("user_audit_log", "TRUE", {}, "audit_logs"),
+            "completed_dsar_requests": (
+                "dsar_requests", "status = ANY(:closed_statuses)",
+                {"closed_statuses": list(self.CLOSED_DSAR_STATUSES)}, "dsar_requests",
+            ),
         }
 
+        status = {}
+        for key, (table, where, params, data_type) in targets.items():
+            status[key] = {
+                "count": await estimate_rows(self.db, table, where, params),
+                "estimated": True,
+                "retention_days": self.RETENTION_DAYS[data_type],
+            }
+        status["purge_progress"] = await get_purge_cursors(self.db)
         return status
 
     async def preview_cleanup(self) -> Dict[str, int]:
         """
         Preview what would be cleaned up without executing.
         Useful for admin review before running cleanup.
-        """
-        from sqlalchemy import func
 
+        v1.1.0: Planner estimates of each purge's predicate, not counts.
+        """
         preview = {}
-
-        for data_type, retention_days in self.RETENTION_DAYS.items():
-            cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
-
-            if data_type == "password_reset_tokens":
-                result = await self.db.execute(
-                    select(func.count(PasswordResetToken.id)).where(
-                        PasswordResetToken.created_at < cutoff
-                    )
-                )
-            elif data_type == "email_verification_tokens":
-                result = await self.db.execute(
-                    select(func.count(EmailVerificationToken.id)).where(
-                        EmailVerificationToken.created_at < cutoff
-                    )
-                )
-            elif data_type == "user_sessions":
-                result = await self.db.execute(
-                    select(func.count(UserSession.id)).where(
-                        and_(
-                            UserSession.is_active == False,
-                            UserSession.created_at < cutoff
-                        )
-                    )
-                )
-            elif data_type == "soft_deleted_users":
-                result = await self.db.execute(
-                    select(func.count(User.id)).where(
-                        and_(
-                            User.deleted_at.isnot(None),
-                            User.deleted_at < cutoff
-                        )
-                    )
-                )
-            elif data_type == "dsar_requests":
-                result = await self.db.execute(
-                    select(func.count(DSARRequest.id)).where(
-                        and_(
-                            DSARRequest.status.in_(["completed", "cancelled", "failed"]),
-                            DSARRequest.completed_at.isnot(None),
-                            DSARRequest.completed_at < cutoff
-                        )
-                    )
-                )
-            else:
-                result = None
-
-            preview[data_type] = result.scalar() if result else 0
-
+        for data_type in self.RETENTION_DAYS:
+            spec = self.PURGE_SPECS[data_type]
+            preview[data_type] = await estimate_rows(
+                self.db, spec.table, spec.where, self._purge_params(data_type),
+            )
         return preview
@@ -0,0 +1,349 @@
+"""
+Series Resolution Store
+
+v1.0.0: Shared, persistent series -> source series ID cache
+- series_resolutions: one row per (normalized publisher|series|start year,
+  source) holding that source's series IDs, a match confidence and when it
+  was resolved. Survives restarts and is shared by every job and replica.
+- In front of it, a bounded in-process LRU (true LRU order, not
+  "drop half the keys") with hit/miss/eviction counters.
+- Concurrent lookups for the same series share one resolver call, so five
+  parallel issues of a new series cost one series search, not five.
+- Searches that found nothing are remembered for NEGATIVE_TTL_HOURS so a
+  series a source doesn't carry isn't re-searched for every issue.
+
+Enrichment paths (sequential, comprehensive, UPC backfill, multi-source
+search via MetronAdapter) call resolve()/get() before any series-search
+API call. Store failures are logged and treated as misses; the cache must
+never block enrichment.
+"""
+import asyncio
+import json
+import logging
+import os
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import AsyncSessionLocal
+from app.core.utils import utcnow
+
+logger = logging.getLogger(__name__)
+
+MEMORY_MAX_ENTRIES = int(os.getenv("SERIES_RESOLUTION_MEMORY_SIZE", "20000"))
+POSITIVE_TTL_DAYS = int(os.getenv("SERIES_RESOLUTION_TTL_DAYS", "90"))
+NEGATIVE_TTL_HOURS = int(os.getenv("SERIES_RESOLUTION_NEGATIVE_TTL_HOURS", "24"))
+
+# Resolver result: (series ids, confidence) or None when the search failed
+# (errors and rate limits are not cached)
+Resolver = Callable[[], Awaitable[Optional[Tuple[Sequence[Any], float]]]]
+
+SCHEMA_DDL = [
+    """
+    CREATE TABLE IF NOT EXISTS series_resolutions (
+        series_key VARCHAR(600) NOT NULL,
+        source VARCHAR(50) NOT NULL,
+        series_ids JSONB NOT NULL DEFAULT '[]'::jsonb,
+        confidence NUMERIC(4, 3) NOT NULL DEFAULT 0,
+        resolved_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+        PRIMARY KEY (series_key, source)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_series_resolutions_resolved_at ON series_resolutions (resolved_at)",
+]
+
+
+def _normalize(value: Optional[str]) -> str:
+    if not value:
+        return ""
+    normalized = re.sub(r"[^\w\s]", " ", str(value).lower())
+    normalized = re.sub(r"\s+", " ", normalized).strip()
+    if normalized.startswith("the "):
+        normalized = normalized[4:]
+    return normalized
+
+
+def series_key(series_name: str, publisher: Optional[str] = None, start_year: Optional[int] = None) -> str:
+    """Normalized publisher|series|start_year key (punctuation, case and leading "The" ignored)."""
+    year = ""
+    if start_year:
+        try:
+            year = str(int(start_year))
+        except (TypeError, ValueError):
+            year = ""
+    return f"{_normalize(publisher)}|{_normalize(series_name)}|{year}"[:600]
+
+
+def names_match(a: Optional[str], b: Optional[str]) -> bool:
+    """True when two series names are equal after normalization."""
+    return bool(a and b) and _normalize(a) == _normalize(b)
+
+
+@dataclass
+class SeriesResolution:
+    source: str
+    series_ids: List[Any]
+    confidence: float
+    resolved_at: datetime
+
+    @property
+    def found(self) -> bool:
+        return bool(self.series_ids)
+
+    def is_fresh(self, now: Optional[datetime] = None) -> bool:
+        now = now or utcnow()
+        ttl = timedelta(days=POSITIVE_TTL_DAYS) if self.found else timedelta(hours=NEGATIVE_TTL_HOURS)
+        return now - self.resolved_at < ttl
+
+
+class LRUCache:
+    """Bounded LRU: reads move an entry to the back, inserts evict from the front."""
+
+    def __init__(self, max_entries: int = MEMORY_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], SeriesResolution]" = OrderedDict()
+        self.evictions = 0
+
+    def get(self, key: Tuple[str, str]) -> Optional[SeriesResolution]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: Tuple[str, str], entry: SeriesResolution) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def discard(self, key: Tuple[str, str]) -> None:
+        self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SeriesResolutionStore:
+    """Memory LRU over the series_resolutions table."""
+
+    def __init__(self, max_entries: int = MEMORY_MAX_ENTRIES, session_factory=AsyncSessionLocal):
+        self._memory = LRUCache(max_entries)
+        self._session_factory = session_factory
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._stats = {"memory_hits": 0, "db_hits": 0, "misses": 0, "writes": 0, "coalesced": 0, "errors": 0}
+
+    async def get(
+        self,
+        source: str,
+        series_name: str,
+        publisher: Optional[str] = None,
+        start_year: Optional[int] = None,
+    ) -> Optional[SeriesResolution]:
+        """Fresh resolution for a series on one source, or None."""
+        if not series_name:
+            return None
+        return await self._lookup((series_key(series_name, publisher, start_year), source))
+
+    async def put(
+        self,
+        source: str,
+        series_name: str,
+        series_ids: Sequence[Any],
+        confidence: float = 1.0,
+        publisher: Optional[str] = None,
+        start_year: Optional[int] = None,
+    ) -> Optional[SeriesResolution]:
+        """Record a source's series IDs (an empty list records "not found")."""
+        if not series_name:
+            return None
+        return await self._save((series_key(series_name, publisher, start_year), source), series_ids, confidence)
+
+    async def resolve(
+        self,
+        source: str,
+        series_name: str,
+        resolver: Resolver,
+        publisher: Optional[str] = None,
+        start_year: Optional[int] = None,
+    ) -> Optional[SeriesResolution]:
+        """
+        Cached resolution, or run resolver (once across concurrent callers)
+        and store its result. Returns None if the resolver failed.
+        """
+        if not series_name:
+            return None
+        key = (series_key(series_name, publisher, start_year), source)
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self._stats["coalesced"] += 1
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if pending.cancelled():
+                    return None  # the resolving caller was cancelled
+                raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            resolution = await self._lookup(key)
+            if resolution is None:
+                outcome = await resolver()
+                if outcome is not None:
+                    ids, confidence = outcome
+                    resolution = await self._save(key, ids, confidence)
+            future.set_result(resolution)
+            return resolution
+        except Exception as e:
+            future.set_exception(e)
+            # Retrieved here so an unawaited future doesn't log a warning
+            future.exception()
+            raise
+        finally:
+            if not future.done():
+                future.cancel()
+            self._inflight.pop(key, None)
+
+    async def invalidate(
+        self,
+        source: str,
+        series_name: str,
+        publisher: Optional[str] = None,
+        start_year: Optional[int] = None,
+    ) -> None:
+        """Forget a resolution (e.g. its IDs stopped returning issues)."""
+        key = (series_key(series_name, publisher, start_year), source)
+        self._memory.discard(key)
+        try:
+            async with self._session_factory() as db:
+                await db.execute(
+                    text("DELETE FROM series_resolutions WHERE series_key = :key AND source = :source"),
+                    {"key": key[0], "source": source},
+                )
+                await db.commit()
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.debug(f"[SERIES_RESOLUTION] Invalidate failed: {e}")
+
+    async def _lookup(self, key: Tuple[str, str]) -> Optional[SeriesResolution]:
+        entry = self._memory.get(key)
+        if entry is not None:
+            if entry.is_fresh():
+                self._stats["memory_hits"] += 1
+                return entry
+            self._memory.discard(key)
+
+        try:
+            async with self._session_factory() as db:
+                row = (await db.execute(
+                    text("""
+                        SELECT series_ids, confidence, resolved_at
+                        FROM series_resolutions
+                        WHERE series_key = :key AND source = :source
+                    """),
+                    {"key": key[0], "source": key[1]},
+                )).fetchone()
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.debug(f"[SERIES_RESOLUTION] Lookup failed: {e}")
+            row = None
+
+        if row is not None:
+            entry = SeriesResolution(
+                source=key[1],
+                series_ids=list(row.series_ids or []),
+                confidence=float(row.confidence),
+                resolved_at=row.resolved_at,
+            )
+            if entry.is_fresh():
+                self._memory.put(key, entry)
+                self._stats["db_hits"] += 1
+                return entry
+
+        self._stats["misses"] += 1
+        return None
+
+    async def _save(self, key: Tuple[str, str], series_ids: Sequence[Any], confidence: float) -> SeriesResolution:
+        entry = SeriesResolution(
+            source=key[1],
+            series_ids=[i for i in series_ids if i is not None],
+            confidence=round(max(0.0, min(float(confidence), 1.0)), 3),
+            resolved_at=utcnow(),
+        )
+        self._memory.put(key, entry)
+        self._stats["writes"] += 1
+        try:
+            async with self._session_factory() as db:
+                await db.execute(
+                    text("""
+                        INSERT INTO series_resolutions (series_key, source, series_ids, confidence, resolved_at)
+                        VALUES (:key, :source, CAST(:ids AS JSONB), :confidence, :resolved_at)
+                        ON CONFLICT (series_key, source) DO UPDATE SET
+                            series_ids = EXCLUDED.series_ids,
+                            confidence = EXCLUDED.confidence,
+                            resolved_at = EXCLUDED.resolved_at
+                    """),
+                    {
+                        "key": key[0],
+                        "source": key[1],
+                        "ids": json.dumps(entry.series_ids, default=str),
+                        "confidence": entry.confidence,
+                        "resolved_at": entry.resolved_at,
+                    },
+                )
+                await db.commit()
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.debug(f"[SERIES_RESOLUTION] Write failed: {e}")
+        return entry
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit rates and sizes for the memory tier and the table behind it."""
+        hits = self._stats["memory_hits"] + self._stats["db_hits"]
+        lookups = hits + self._stats["misses"]
+        return {
+            **self._stats,
+            "entries": len(self._memory),
+            "max_entries": self._memory.max_entries,
+            "evictions": self._memory.evictions,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "memory_hit_rate": round(self._stats["memory_hits"] / lookups, 4) if lookups else 0.0,
+        }
+
+
+async def ensure_series_resolution_table(db: AsyncSession) -> None:
+    """Startup hook: create series_resolutions if missing."""
+    try:
+        for statement in SCHEMA_DDL:
+            await db.execute(text(statement))
+        await db.commit()
+    except Exception as e:
+        logger.warning(f"series_resolutions table setup failed: {e}")
+        await db.rollback()
+
+
+async def prune_series_resolutions(db: AsyncSession, days: int = POSITIVE_TTL_DAYS) -> int:
+    """Delete resolutions too old to be served."""
+    result = await db.execute(
+        text("DELETE FROM series_resolutions WHERE resolved_at < NOW() - make_interval(days => :days)"),
+        {"days": days},
+    )
+    await db.commit()
+    return result.rowcount or 0
+
+
+_store: Optional[SeriesResolutionStore] = None
+
+
+def get_series_resolution_store() -> SeriesResolutionStore:
+    """Process-wide store shared by all enrichment paths."""
+    global _store
+    if _store is None:
+        _store = SeriesResolutionStore()
+    return _store
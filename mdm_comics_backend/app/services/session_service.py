@@ -11,10 +11,19 @@ from sqlalchemy import select, and_, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user_session import UserSession
+from app.services.batched_purge import PurgeSpec, run_purge
 from app.core.pii import pii_handler
 from app.core.config import settings
 
 
+EXPIRED_SESSIONS_PURGE = PurgeSpec(
+    name="sessions.expired",
+    table="user_sessions",
+    where="revoked_at IS NULL AND expires_at <= NOW()",
+    set_clause="revoked_at = NOW(), revoke_reason = 'expired'",
+)
+
+
 class SessionService:
     """
     Service for managing user sessions.
@@ -298,25 +307,15 @@ class SessionService:
 
         Should be run periodically via scheduler.
 
+        PERF-044: Revokes in committed batches (set-based UPDATE, locked
+        sessions skipped until the next run) instead of loading every
+        expired session; commits the session's pending work first.
+
         Returns:
             Number of sessions cleaned up
         """
-        result = await self.db.execute(
-            select(UserSession)
-            .where(
-                and_(
-                    UserSession.revoked_at.is_(None),
-                    UserSession.expires_at <= datetime.now(timezone.utc),
-                )
-            )
-        )
-        expired = result.scalars().all()
-
-        for session in expired:
-            session.revoke("expired")
-
-        await self.db.flush()
-        return len(expired)
+        purge = await run_purge(self.db, EXPIRED_SESSIONS_PURGE)
+        return purge["rows"]
 
     async def get_session_by_id(self, session_id: int) -> Optional[UserSession]:
         """Get a session by ID."""
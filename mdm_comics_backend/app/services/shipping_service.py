@@ -23,7 +23,8 @@ from app.models.address import Address, AddressType, AddressValidationStatus
 from app.models.carrier import Carrier, CarrierCode
 from app.models.shipment import Shipment, ShipmentRate, ShipmentStatus, TrackingEvent
 from app.models.order import Order
-from app.services.encryption import encrypt_pii, decrypt_pii, hash_phone, get_phone_last4
+from app.services.encryption import encrypt_pii, hash_phone, get_phone_last4
+from app.services.pii_access import decrypt_address
 from app.services.ups_client import (
     UPSClient,
     UPSAddress,
@@ -37,6 +38,8 @@ logger = logging.getLogger(__name__)
 # Default package weight for comics (in lbs)
 DEFAULT_COMIC_WEIGHT = 0.5
 MIN_PACKAGE_WEIGHT = 0.1
+# Address PII a UPS validate/rate request carries
+UPS_ADDRESS_PII_FIELDS = ("recipient_name", "company_name", "address_line1", "address_line2")
 
 
 class ShippingError(Exception):
@@ -189,15 +192,16 @@ class ShippingService:
         ups_client = await self._get_ups_client()
 
         # Build UPS address from model
+        pii = decrypt_address(address, fields=UPS_ADDRESS_PII_FIELDS)
         ups_address = UPSAddress(
-            name=decrypt_pii(address.recipient_name_encrypted),
-            address_line1=decrypt_pii(address.address_line1_encrypted),
-            address_line2=decrypt_pii(address.address_line2_encrypted) if address.address_line2_encrypted else None,
+            name=pii.recipient_name or "",
+            address_line1=pii.address_line1 or "",
+            address_line2=pii.address_line2,
             city=address.city,
             state_province=address.state_province,
             postal_code=address.postal_code,
             country_code=address.country_code,
-            company_name=decrypt_pii(address.company_name_encrypted) if address.company_name_encrypted else None,
+            company_name=pii.company_name,
             residential=address.residential,
         )
 
@@ -290,15 +294,16 @@ class ShippingService:
         )
 
         # Build destination
+        pii = decrypt_address(dest_address, fields=UPS_ADDRESS_PII_FIELDS)
         destination = UPSAddress(
-            name=decrypt_pii(dest_address.recipient_name_encrypted),
-            address_line1=decrypt_pii(dest_address.address_line1_encrypted),
-            address_line2=decrypt_pii(dest_address.address_line2_encrypted) if dest_address.address_line2_encrypted else None,
+            name=pii.recipient_name or "",
+            address_line1=pii.address_line1 or "",
+            address_line2=pii.address_line2,
             city=dest_address.city,
             state_province=dest_address.state_province,
             postal_code=dest_address.postal_code,
             country_code=dest_address.country_code,
-            company_name=decrypt_pii(dest_address.company_name_encrypted) if dest_address.company_name_encrypted else None,
+            company_name=pii.company_name,
             residential=dest_address.residential,
         )
 
@@ -462,17 +467,18 @@ class ShippingService:
         )
 
         # Build destination
+        pii = decrypt_address(dest_address)
         destination = UPSAddress(
-            name=decrypt_pii(dest_address.recipient_name_encrypted),
-            address_line1=decrypt_pii(dest_address.address_line1_encrypted),
-            address_line2=decrypt_pii(dest_address.address_line2_encrypted) if dest_address.address_line2_encrypted else None,
+            name=pii.recipient_name or "",
+            address_line1=pii.address_line1 or "",
+            address_line2=pii.address_line2,
             city=dest_address.city,
             state_province=dest_address.state_province,
             postal_code=dest_address.postal_code,
             country_code=dest_address.country_code,
-            company_name=decrypt_pii(dest_address.company_name_encrypted) if dest_address.company_name_encrypted else None,
-            phone=decrypt_pii(dest_address.phone_encrypted) if dest_address.phone_encrypted else None,
-            email=decrypt_pii(dest_address.email_encrypted) if dest_address.email_encrypted else None,
+            company_name=pii.company_name,
+            phone=pii.phone,
+            email=pii.email,
             residential=dest_address.residential,
         )
 
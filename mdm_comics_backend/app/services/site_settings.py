@@ -2,15 +2,16 @@
 Site Settings Service
 
 v1.0.0: Database-driven site configuration for branding, feature flags, etc.
+v1.1.0: PERF-040 - Reads come from the shared configuration snapshot
+(app.core.config_snapshot) instead of one query per key
 """
 from typing import Dict, Optional
 import logging
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import config_snapshot
 from app.core.config import settings
-from app.models.site_settings import SiteSettings
 
 logger = logging.getLogger(__name__)
 
@@ -19,38 +20,26 @@ class SiteSettingsService:
     """
     Service for reading site settings from the database.
 
-    Provides caching and fallback to config.py values.
+    Values come from the process-wide configuration snapshot, which is
+    loaded with one query and reloaded when settings change; fallback to
+    config.py values.
     """
 
     def __init__(self, db: AsyncSession):
         self.db = db
-        self._cache: Dict[str, str] = {}
 
     async def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
         """
         Get a setting value by key.
 
-        First checks cache, then database, then falls back to default.
+        Empty or missing values fall back to default.
         """
-        # Check cache first
-        if key in self._cache:
-            return self._cache[key]
-
         try:
-            result = await self.db.execute(
-                select(SiteSettings).where(SiteSettings.key == key)
-            )
-            setting = result.scalar_one_or_none()
-
-            if setting and setting.value:
-                self._cache[key] = setting.value
-                return setting.value
-
-            return default
-
+            snapshot = await config_snapshot.get_snapshot(self.db)
         except Exception as e:
             logger.warning(f"Error fetching setting {key}: {e}")
             return default
+        return snapshot.setting(key, default)
 
     async def get_branding_urls(self) -> Dict[str, str]:
         """
@@ -59,22 +48,12 @@ class SiteSettingsService:
         Returns dict with common branding keys for use in templates.
         """
         try:
-            result = await self.db.execute(
-                select(SiteSettings).where(SiteSettings.category == "branding")
-            )
-            settings_list = result.scalars().all()
-
-            branding = {}
-            for s in settings_list:
-                if s.value:  # Only include non-empty values
-                    branding[s.key] = s.value
-                    self._cache[s.key] = s.value
-
-            return branding
-
+            snapshot = await config_snapshot.get_snapshot(self.db)
         except Exception as e:
             logger.warning(f"Error fetching branding settings: {e}")
             return {}
+        # Only non-empty values
+        return snapshot.settings_in("branding")
 
     async def get_rack_factor_logo_url(self) -> Optional[str]:
         """
@@ -0,0 +1,306 @@
+"""
+Stat Counters Service
+
+v1.0.0: Incrementally maintained dashboard counters
+- stat_counters: sharded (name, shard) -> value rows kept current by
+  statement-level triggers with transition tables, so a bulk UPDATE of
+  100k comic_issues costs one counter upsert, not 100k
+- stat_counter_hourly: per-hour insert counts for windowed metrics
+  (orders last 7 days, price changes last 24h)
+- Short-TTL in-process snapshots for counters and any remaining
+  aggregate that is fine to serve stale
+
+Readers (admin dashboard, data health overview, pipeline stats) read a
+few dozen tiny rows instead of scanning products/orders/comic_issues.
+
+Counters are shared across writers by spreading each counter over
+COUNTER_SHARDS rows keyed by backend pid; readers SUM the shards.
+"""
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+COUNTER_SHARDS = 16
+SNAPSHOT_TTL_SECONDS = 10
+APPROXIMATE_TTL_SECONDS = 300
+HOURLY_RETENTION_DAYS = 35
+
+# table -> {counter name: per-row SQL expression}; deltas are
+# SUM(expr) over inserted/new rows minus SUM(expr) over deleted/old rows
+COUNTER_SPECS: Dict[str, Dict[str, str]] = {
+    "products": {
+        "products.active": "CASE WHEN deleted_at IS NULL THEN 1 ELSE 0 END",
+        "products.inventory_value": (
+            "CASE WHEN deleted_at IS NULL THEN COALESCE(stock, 0) * COALESCE(price, 0) ELSE 0 END"
+        ),
+        "products.low_stock": (
+            "CASE WHEN deleted_at IS NULL AND stock <= COALESCE(low_stock_threshold, 5) THEN 1 ELSE 0 END"
+        ),
+    },
+    "barcode_queue": {
+        "barcode_queue.pending": "CASE WHEN status = 'pending' THEN 1 ELSE 0 END",
+    },
+    # DLQ status is a SQLAlchemy Enum, stored by member name
+    "dead_letter_queue": {
+        f"dead_letter_queue.{status}": f"CASE WHEN status::text = '{status}' THEN 1 ELSE 0 END"
+        for status in ("PENDING", "RETRYING", "RESOLVED", "ABANDONED")
+    },
+    "data_quarantine": {
+        "data_quarantine.unresolved": "CASE WHEN is_resolved = false THEN 1 ELSE 0 END",
+    },
+    "funkos": {
+        "funkos.total": "1",
+        "funkos.with_pricecharting": "CASE WHEN pricecharting_id IS NOT NULL THEN 1 ELSE 0 END",
+    },
+    "comic_issues": {
+        "comic_issues.total": "1",
+        "comic_issues.with_pricecharting": "CASE WHEN pricecharting_id IS NOT NULL THEN 1 ELSE 0 END",
+        "comic_issues.with_gcd": "CASE WHEN gcd_id IS NOT NULL THEN 1 ELSE 0 END",
+    },
+}
+
+# table -> (counter name, timestamp column) for hourly insert counts
+HOURLY_SPECS: Dict[str, Tuple[str, str]] = {
+    "orders": ("orders.created", "created_at"),
+    "price_changelog": ("price_changelog.changes", "changed_at"),
+}
+
+
+# ----- Installation -----
+
+def _counter_delta_sql(table: str, op: str) -> str:
+    """INSERT ... ON CONFLICT applying one statement's deltas for a table."""
+    parts = []
+    for name, expr in COUNTER_SPECS[table].items():
+        plus = f"(SELECT COALESCE(SUM({expr}), 0) FROM new_rows)" if op in ("INSERT", "UPDATE") else "0"
+        minus = f"(SELECT COALESCE(SUM({expr}), 0) FROM old_rows)" if op in ("DELETE", "UPDATE") else "0"
+        parts.append(f"SELECT '{name}'::text AS name, {plus} - {minus} AS delta")
+    union = "\n                UNION ALL ".join(parts)
+    return f"""
+            INSERT INTO stat_counters (name, shard, value, updated_at)
+            SELECT d.name, pg_backend_pid() % {COUNTER_SHARDS}, d.delta, NOW()
+            FROM ({union}) d
+            WHERE d.delta <> 0
+            ON CONFLICT (name, shard) DO UPDATE
+            SET value = stat_counters.value + EXCLUDED.value, updated_at = NOW();"""
+
+
+def _counter_trigger_ddl(table: str) -> List[str]:
+    fn = f"stat_counters_{table}"
+    body = f"""
+        CREATE OR REPLACE FUNCTION {fn}() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN{_counter_delta_sql(table, "INSERT")}
+            ELSIF TG_OP = 'UPDATE' THEN{_counter_delta_sql(table, "UPDATE")}
+            ELSE{_counter_delta_sql(table, "DELETE")}
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """
+    statements = [body]
+    # Transition tables need one trigger per event
+    for op, refs in (
+        ("INSERT", "NEW TABLE AS new_rows"),
+        ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+        ("DELETE", "OLD TABLE AS old_rows"),
+    ):
+        trigger = f"trg_{fn}_{op.lower()}"
+        statements.append(f"DROP TRIGGER IF EXISTS {trigger} ON {table}")
+        statements.append(
+            f"CREATE TRIGGER {trigger} AFTER {op} ON {table} "
+            f"REFERENCING {refs} FOR EACH STATEMENT EXECUTE FUNCTION {fn}()"
+        )
+    return statements
+
+
+def _hourly_trigger_ddl(table: str) -> List[str]:
+    name, column = HOURLY_SPECS[table]
+    fn = f"stat_counter_hourly_{table}"
+    trigger = f"trg_{fn}_insert"
+    return [
+        f"""
+        CREATE OR REPLACE FUNCTION {fn}() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO stat_counter_hourly (name, bucket, value)
+            SELECT '{name}', date_trunc('hour', COALESCE({column}, NOW())), COUNT(*)
+            FROM new_rows
+            GROUP BY 2
+            ON CONFLICT (name, bucket) DO UPDATE
+            SET value = stat_counter_hourly.value + EXCLUDED.value;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """,
+        f"DROP TRIGGER IF EXISTS {trigger} ON {table}",
+        f"CREATE TRIGGER {trigger} AFTER INSERT ON {table} "
+        f"REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION {fn}()",
+    ]
+
+
+async def _table_exists(db: AsyncSession, table: str) -> bool:
+    result = await db.execute(text("SELECT to_regclass(:t) IS NOT NULL"), {"t": table})
+    return bool(result.scalar())
+
+
+async def install_stat_counters(db: AsyncSession, rebuild: bool = True) -> Dict[str, Any]:
+    """
+    Create counter tables and triggers, then recount from source tables.
+
+    Idempotent. Each source table is locked (SHARE mode) while its triggers
+    are swapped in and its counters recounted, so no write can slip between
+    the recount and the trigger taking over. Missing source tables are skipped.
+    """
+    await db.execute(text("""
+        CREATE TABLE IF NOT EXISTS stat_counters (
+            name TEXT NOT NULL,
+            shard SMALLINT NOT NULL DEFAULT 0,
+            value NUMERIC NOT NULL DEFAULT 0,
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            PRIMARY KEY (name, shard)
+        )
+    """))
+    await db.execute(text("""
+        CREATE TABLE IF NOT EXISTS stat_counter_hourly (
+            name TEXT NOT NULL,
+            bucket TIMESTAMPTZ NOT NULL,
+            value BIGINT NOT NULL DEFAULT 0,
+            PRIMARY KEY (name, bucket)
+        )
+    """))
+
+    installed, skipped = [], []
+    for table in list(COUNTER_SPECS) + list(HOURLY_SPECS):
+        if not await _table_exists(db, table):
+            skipped.append(table)
+            continue
+        if rebuild:
+            await db.execute(text(f"LOCK TABLE {table} IN SHARE MODE"))
+        ddl = _counter_trigger_ddl(table) if table in COUNTER_SPECS else _hourly_trigger_ddl(table)
+        for statement in ddl:
+            await db.execute(text(statement))
+        if rebuild:
+            await _rebuild_table(db, table)
+        installed.append(table)
+
+    await db.commit()
+    logger.info(f"Stat counters installed for {installed} (skipped missing: {skipped})")
+    return {"installed": installed, "skipped": skipped}
+
+
+async def _rebuild_table(db: AsyncSession, table: str) -> None:
+    """Recount one source table's counters (caller holds the table lock)."""
+    if table in COUNTER_SPECS:
+        names = list(COUNTER_SPECS[table])
+        await db.execute(text("DELETE FROM stat_counters WHERE name = ANY(:names)"), {"names": names})
+        selects = ", ".join(f"COALESCE(SUM({expr}), 0)" for expr in COUNTER_SPECS[table].values())
+        row = (await db.execute(text(f"SELECT {selects} FROM {table}"))).fetchone()
+        for name, value in zip(names, row):
+            await db.execute(
+                text("INSERT INTO stat_counters (name, shard, value) VALUES (:name, 0, :value)"),
+                {"name": name, "value": value},
+            )
+    else:
+        name, column = HOURLY_SPECS[table]
+        await db.execute(text("DELETE FROM stat_counter_hourly WHERE name = :name"), {"name": name})
+        await db.execute(text(f"""
+            INSERT INTO stat_counter_hourly (name, bucket, value)
+            SELECT :name, date_trunc('hour', {column}), COUNT(*)
+            FROM {table}
+            WHERE {column} >= NOW() - make_interval(days => :days)
+            GROUP BY 2
+        """), {"name": name, "days": HOURLY_RETENTION_DAYS})
+
+
+async def ensure_stat_counters(db: AsyncSession) -> None:
+    """Startup hook: install counters once if the table is missing."""
+    try:
+        if await _table_exists(db, "stat_counters"):
+            return
+        # One replica installs; others skip until the next restart
+        locked = (await db.execute(text("SELECT pg_try_advisory_xact_lock(hashtext('stat_counters_install'))"))).scalar()
+        if not locked:
+            return
+        await install_stat_counters(db)
+    except Exception as e:
+        logger.warning(f"Stat counter installation failed: {e}")
+        await db.rollback()
+
+
+async def prune_hourly_counters(db: AsyncSession, days: int = HOURLY_RETENTION_DAYS) -> int:
+    """Delete hourly buckets older than the retention window."""
+    result = await db.execute(
+        text("DELETE FROM stat_counter_hourly WHERE bucket < NOW() - make_interval(days => :days)"),
+        {"days": days},
+    )
+    await db.commit()
+    return result.rowcount or 0
+
+
+# ----- Reads -----
+
+class _TTLCache:
+    """Tiny keyed TTL cache for per-process snapshots."""
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+
+    async def get_or_load(self, key: str, ttl: int, loader: Callable[[], Awaitable[Any]]) -> Any:
+        entry = self._entries.get(key)
+        now = time.monotonic()
+        if entry and now - entry[0] < ttl:
+            return entry[1]
+        value = await loader()
+        self._entries[key] = (now, value)
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_snapshot_cache = _TTLCache()
+
+
+class StatsService:
+    """Read side of the counters, with short-TTL snapshots."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_counters(self) -> Dict[str, float]:
+        """All counters summed across shards (cached SNAPSHOT_TTL_SECONDS)."""
+        async def load():
+            result = await self.db.execute(text(
+                "SELECT name, SUM(value) FROM stat_counters GROUP BY name"
+            ))
+            return {row[0]: float(row[1]) for row in result.fetchall()}
+        return await _snapshot_cache.get_or_load("counters", SNAPSHOT_TTL_SECONDS, load)
+
+    async def counter(self, name: str) -> int:
+        counters = await self.get_counters()
+        return int(counters.get(name, 0))
+
+    async def get_hourly_total(self, name: str, hours: int) -> int:
+        """Sum of hourly buckets covering the last `hours` (hour granularity)."""
+        async def load():
+            result = await self.db.execute(text("""
+                SELECT COALESCE(SUM(value), 0) FROM stat_counter_hourly
+                WHERE name = :name AND bucket >= date_trunc('hour', NOW()) - make_interval(hours => :hours)
+            """), {"name": name, "hours": hours})
+            return int(result.scalar() or 0)
+        return await _snapshot_cache.get_or_load(f"hourly:{name}:{hours}", SNAPSHOT_TTL_SECONDS, load)
+
+    async def cached(self, key: str, loader: Callable[[], Awaitable[Any]],
+                     ttl: int = APPROXIMATE_TTL_SECONDS) -> Any:
+        """Serve an arbitrary aggregate from the snapshot cache."""
+        return await _snapshot_cache.get_or_load(key, ttl, loader)
+
+
+def clear_stats_cache() -> None:
+    """Drop cached snapshots (tests, or after a manual rebuild)."""
+    _snapshot_cache.clear()
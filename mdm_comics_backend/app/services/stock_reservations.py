@@ -0,0 +1,172 @@
+"""
+Stock Reservations v1.0.0
+
+PERF-042: Checkout reserves stock without holding row locks across the
+Stripe round-trip.
+
+- reserve_stock() decrements each product with one conditional UPDATE
+  (stock >= qty), in product id order so two carts sharing SKUs can never
+  deadlock, inserts the reservation rows under a pending key and commits.
+  The product row lock lives for that one short transaction, not for the
+  PaymentIntent call, so buyers of a hot SKU queue for milliseconds
+- attach_payment_intent() re-keys the reservations to the PaymentIntent
+  id once Stripe answers; if Stripe fails, the pending key is released
+- release_reservations() deletes and restores in one statement, so a
+  cancel, a payment_failed webhook and the expiry job racing on the same
+  reservation restore its stock exactly once
+
+Expiry is unchanged: rows still carry expires_at and
+stock_cleanup.release_expired_reservations() returns abandoned stock.
+"""
+import logging
+import uuid
+from datetime import datetime
+from typing import Dict, Mapping, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Product, StockReservation
+from app.models.stock_reservation import RESERVATION_TTL_MINUTES
+from app.services.order_service import build_product_snapshot, dollars_to_cents
+
+logger = logging.getLogger(__name__)
+
+# Reservation key until the PaymentIntent exists
+PENDING_PREFIX = "pending_"
+
+DECREMENT_SQL = text("""
+    UPDATE products
+    SET stock = stock - :qty
+    WHERE id = :product_id AND stock >= :qty
+    RETURNING stock
+""")
+
+RELEASE_SQL = text("""
+    WITH released AS (
+        DELETE FROM stock_reservations
+        WHERE payment_intent_id = :payment_intent_id
+          AND (CAST(:user_id AS INTEGER) IS NULL OR user_id = CAST(:user_id AS INTEGER))
+        RETURNING product_id, quantity
+    ),
+    restored AS (
+        UPDATE products
+        SET stock = products.stock + agg.quantity
+        FROM (SELECT product_id, SUM(quantity) AS quantity FROM released GROUP BY product_id) agg
+        WHERE products.id = agg.product_id
+        RETURNING products.id
+    )
+    SELECT
+        (SELECT COUNT(*) FROM released) AS reservations,
+        (SELECT COALESCE(SUM(quantity), 0) FROM released) AS units,
+        (SELECT COUNT(*) FROM restored) AS products
+""")
+
+
+class InsufficientStockError(Exception):
+    """
+    A conditional decrement found less stock than requested.
+
+    Carries plain values, not the Product: the rollback that precedes it
+    expires every loaded instance, and reading one under AsyncSession
+    would lazy-load outside the greenlet.
+    """
+
+    def __init__(self, product_id: int, product_name: str, requested: int, available: int):
+        self.product_id = product_id
+        self.product_name = product_name
+        self.requested = requested
+        self.available = available
+        super().__init__(
+            f"Insufficient stock for {product_name} "
+            f"(requested: {requested}, available: {available})"
+        )
+
+
+def new_reservation_key() -> str:
+    return f"{PENDING_PREFIX}{uuid.uuid4().hex}"
+
+
+async def reserve_stock(
+    db: AsyncSession,
+    user_id: int,
+    quantities: Mapping[int, int],
+    products: Mapping[int, Product],
+    currency_code: str,
+    ttl_minutes: int = RESERVATION_TTL_MINUTES,
+) -> Tuple[str, datetime]:
+    """
+    Decrement stock and create reservations in one short transaction.
+
+    products are plain (unlocked) rows used for prices and snapshots;
+    availability is decided by the conditional UPDATE alone. Commits on
+    success and rolls back on InsufficientStockError, leaving no partial
+    decrement. Returns (reservation key, expires_at).
+    """
+    key = new_reservation_key()
+    expires_at = StockReservation.create_expiry(ttl_minutes)
+
+    for product_id in sorted(quantities):
+        qty = quantities[product_id]
+        row = (await db.execute(DECREMENT_SQL, {"product_id": product_id, "qty": qty})).fetchone()
+        if row is None:
+            product_name = products[product_id].name  # before rollback expires it
+            await db.rollback()
+            available = (await db.execute(
+                text("SELECT stock FROM products WHERE id = :product_id"), {"product_id": product_id},
+            )).scalar()
+            raise InsufficientStockError(product_id, product_name, qty, available or 0)
+
+    db.add_all([
+        StockReservation(
+            user_id=user_id,
+            product_id=product_id,
+            quantity=quantities[product_id],
+            payment_intent_id=key,
+            expires_at=expires_at,
+            unit_price_cents=dollars_to_cents(products[product_id].price),
+            currency_code=currency_code,
+            product_snapshot=build_product_snapshot(products[product_id]),
+        )
+        for product_id in sorted(quantities)
+    ])
+    await db.commit()
+    return key, expires_at
+
+
+async def attach_payment_intent(db: AsyncSession, reservation_key: str, payment_intent_id: str) -> int:
+    """Re-key pending reservations to their PaymentIntent. Returns rows moved."""
+    result = await db.execute(
+        text("""
+            UPDATE stock_reservations
+            SET payment_intent_id = :payment_intent_id
+            WHERE payment_intent_id = :reservation_key
+        """),
+        {"payment_intent_id": payment_intent_id, "reservation_key": reservation_key},
+    )
+    await db.commit()
+    moved = result.rowcount or 0
+    if not moved:
+        # Only possible if the expiry job ran first; confirm-order will report it
+        logger.warning(f"No pending reservations left to attach to {payment_intent_id}")
+    return moved
+
+
+async def release_reservations(
+    db: AsyncSession,
+    payment_intent_id: str,
+    user_id: Optional[int] = None,
+) -> Dict[str, int]:
+    """
+    Delete reservations for a payment and restore their stock atomically.
+
+    Optionally limited to one user's rows. Does not commit.
+    """
+    row = (await db.execute(
+        RELEASE_SQL, {"payment_intent_id": payment_intent_id, "user_id": user_id},
+    )).fetchone()
+    return {
+        "reservations_released": int(row.reservations),
+        "stock_restored": int(row.units),
+        "products_restored": int(row.products),
+    }
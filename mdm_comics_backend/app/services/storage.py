@@ -4,16 +4,19 @@ Storage Service - S3-compatible object storage
 v1.0.0: Brand assets, product images, and file uploads
 Supports AWS S3, Cloudflare R2, MinIO, and other S3-compatible services.
 """
+import asyncio
+import io
 import os
 import logging
 import hashlib
 import mimetypes
 from datetime import datetime, timezone
-from typing import Optional, BinaryIO, Tuple
+from typing import Dict, Optional, BinaryIO, Tuple
 from dataclasses import dataclass
 from threading import Lock
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
 from botocore.exceptions import ClientError
 
@@ -286,6 +289,35 @@ class StorageService:
         Returns:
             UploadResult with URL on success
         """
+        return self._put_product_image(content, filename, content_type, product_type, product_id)
+
+    async def upload_product_image_threaded(
+        self,
+        content: bytes,
+        filename: str,
+        content_type: str,
+        product_type: str = "product",
+        product_id: Optional[int] = None,
+    ) -> UploadResult:
+        """
+        Upload a product image without blocking the event loop.
+
+        The boto3 client is synchronous, so bulk callers use this variant
+        (bounded by their own semaphore) to run several uploads at once.
+        """
+        return await asyncio.to_thread(
+            self._put_product_image, content, filename, content_type, product_type, product_id
+        )
+
+    def _put_product_image(
+        self,
+        content: bytes,
+        filename: str,
+        content_type: str,
+        product_type: str,
+        product_id: Optional[int],
+    ) -> UploadResult:
+        """Validate and PUT a product image (blocking)."""
         # Validate
         is_valid, error = self._validate_image(
             content, content_type, self.MAX_PRODUCT_IMAGE_SIZE
@@ -367,6 +399,146 @@ class StorageService:
             logger.error(f"Upload failed for {key}: {e}")
             return None
 
+    async def upload_bytes_threaded(
+        self,
+        content: bytes,
+        key: str,
+        content_type: str = "application/octet-stream",
+        cache_control: str = "public, max-age=86400",
+        metadata: Optional[Dict[str, str]] = None,
+        multipart_threshold: int = 8 * 1024 * 1024,
+        multipart_chunksize: int = 8 * 1024 * 1024,
+        max_concurrency: int = 4,
+    ) -> Optional[str]:
+        """
+        upload_bytes() without blocking the event loop.
+
+        Runs in a worker thread through boto3's managed transfer: bodies of
+        at least multipart_threshold bytes go up as a multipart upload with
+        max_concurrency parts in flight. Returns the public URL, or None.
+        """
+        if not self.is_configured():
+            logger.error("S3 storage not configured")
+            return None
+
+        extra_args = {"ContentType": content_type, "CacheControl": cache_control}
+        if metadata:
+            extra_args["Metadata"] = metadata
+        transfer_config = TransferConfig(
+            multipart_threshold=multipart_threshold,
+            multipart_chunksize=multipart_chunksize,
+            max_concurrency=max_concurrency,
+        )
+
+        def put() -> None:
+            self.client.upload_fileobj(
+                io.BytesIO(content), self._bucket, key,
+                ExtraArgs=extra_args, Config=transfer_config,
+            )
+
+        try:
+            await asyncio.to_thread(put)
+            return self._get_public_url(key)
+        except Exception as e:
+            logger.error(f"Upload failed for {key}: {e}")
+            return None
+
+    async def upload_file_threaded(
+        self,
+        path: str,
+        key: str,
+        content_type: str = "application/octet-stream",
+        cache_control: str = "private, no-store",
+        metadata: Optional[Dict[str, str]] = None,
+        multipart_chunksize: int = 16 * 1024 * 1024,
+        max_concurrency: int = 4,
+    ) -> bool:
+        """
+        Upload a local file in a worker thread, streaming it from disk.
+
+        Large files go up as a multipart upload, so memory use does not
+        grow with the file. Returns True on success.
+        """
+        if not self.is_configured():
+            logger.error("S3 storage not configured")
+            return False
+
+        extra_args = {"ContentType": content_type, "CacheControl": cache_control}
+        if metadata:
+            extra_args["Metadata"] = metadata
+        transfer_config = TransferConfig(
+            multipart_threshold=multipart_chunksize,
+            multipart_chunksize=multipart_chunksize,
+            max_concurrency=max_concurrency,
+        )
+
+        try:
+            await asyncio.to_thread(
+                self.client.upload_file, path, self._bucket, key,
+                ExtraArgs=extra_args, Config=transfer_config,
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Upload failed for {key}: {e}")
+            return False
+
+    def presigned_download_url(self, key: str, expires_in: int = 3600) -> Optional[str]:
+        """Time-limited GET URL for a private object; None on failure."""
+        try:
+            return self.client.generate_presigned_url(
+                "get_object", Params={"Bucket": self._bucket, "Key": key}, ExpiresIn=expires_in,
+            )
+        except Exception as e:
+            logger.error(f"Presign failed for {key}: {e}")
+            return None
+
+    async def copy_object_threaded(
+        self,
+        source_key: str,
+        key: str,
+        content_type: str = "application/octet-stream",
+        cache_control: str = "public, max-age=86400",
+        metadata: Optional[Dict[str, str]] = None,
+    ) -> Optional[str]:
+        """
+        Server-side copy of an object in the bucket (no bytes pass through
+        this process), in a worker thread. Returns the public URL, or None.
+        """
+        if not self.is_configured():
+            logger.error("S3 storage not configured")
+            return None
+
+        def copy() -> None:
+            self.client.copy_object(
+                Bucket=self._bucket,
+                Key=key,
+                CopySource={"Bucket": self._bucket, "Key": source_key},
+                MetadataDirective="REPLACE",
+                ContentType=content_type,
+                CacheControl=cache_control,
+                Metadata=metadata or {},
+            )
+
+        try:
+            await asyncio.to_thread(copy)
+            return self._get_public_url(key)
+        except Exception as e:
+            logger.error(f"Copy failed for {source_key} -> {key}: {e}")
+            return None
+
+    async def get_object_metadata(self, key: str) -> Optional[Dict[str, str]]:
+        """User metadata of an object (HEAD, in a worker thread); None if absent."""
+        try:
+            response = await asyncio.to_thread(self.client.head_object, Bucket=self._bucket, Key=key)
+            return response.get("Metadata", {})
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") not in ("404", "NoSuchKey", "NotFound"):
+                logger.warning(f"HEAD failed for {key}: {e}")
+            return None
+        except Exception as e:
+            logger.warning(f"HEAD failed for {key}: {e}")
+            return None
+
     async def delete_object(self, key: str) -> bool:
         """Delete an object from S3."""
         try:
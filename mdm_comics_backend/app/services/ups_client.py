@@ -19,7 +19,7 @@ from dataclasses import dataclass, field
 import httpx
 
 from app.core.config import settings
-from app.services.encryption import decrypt_pii, sanitize_for_logging
+from app.services.encryption import sanitize_for_logging
 
 logger = logging.getLogger(__name__)
 
@@ -867,12 +867,15 @@ class UPSClient:
 # Factory function for creating client from carrier config
 async def create_ups_client_from_carrier(carrier) -> UPSClient:
     """Create UPS client from Carrier model instance."""
-    from app.services.encryption import decrypt_pii
+    from app.services.pii_access import carrier_credentials
 
+    client_id, client_secret, account_number = carrier_credentials(
+        carrier, "client_id", "client_secret", "account_number",
+    )
     credentials = UPSCredentials(
-        client_id=decrypt_pii(carrier.client_id_encrypted) if carrier.client_id_encrypted else "",
-        client_secret=decrypt_pii(carrier.client_secret_encrypted) if carrier.client_secret_encrypted else "",
-        account_number=decrypt_pii(carrier.account_number_encrypted) if carrier.account_number_encrypted else "",
+        client_id=client_id,
+        client_secret=client_secret,
+        account_number=account_number,
         use_sandbox=carrier.use_sandbox,
     )
 
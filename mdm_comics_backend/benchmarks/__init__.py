@@ -0,0 +1 @@
+"""Performance benchmarks for matching and ingestion hot paths (see run.py)."""
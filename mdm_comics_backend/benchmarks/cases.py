@@ -0,0 +1,157 @@
+"""
+Benchmark cases v1.0.0
+
+Each case processes `count` synthetic records through one hot path and
+returns (records processed, seconds spent in the code under test).
+Catalog generation happens between timed sections, so only the hot path
+is measured. Modules under test are imported here, before the runner
+forks, so per-case RSS growth excludes import cost.
+"""
+import random
+import time
+from typing import Callable, Dict, Tuple
+
+from app.adapters.gcd import GCDAdapter
+from app.ml.text_embeddings import hash_embedding
+from app.services.comic_cache import _phash_image_bytes
+from app.services.cross_reference import CrossReferenceMatcher
+from app.services.dedup_engine import FuzzyMatcher
+from app.services.match_scoring import find_best_match
+from app.utils.db_sanitizer import sanitize_gcd_record
+from benchmarks import catalog
+
+CaseFn = Callable[[int], Tuple[int, float]]
+
+CASES: Dict[str, CaseFn] = {}
+
+# Image hashing is ~1000x costlier per record than text paths; it runs
+# count // IMAGE_SCALE_DIVISOR covers so every scale stays practical
+IMAGE_SCALE_DIVISOR = 100
+
+
+def case(name: str) -> Callable[[CaseFn], CaseFn]:
+    def register(fn: CaseFn) -> CaseFn:
+        CASES[name] = fn
+        return fn
+    return register
+
+
+@case("match_scoring.find_best_match.comic")
+def bench_find_best_match_comic(count: int) -> Tuple[int, float]:
+    rng = random.Random(11)
+    elapsed = 0.0
+    processed = 0
+    for chunk in catalog.comic_issues(count):
+        work = [(issue, catalog.pricecharting_candidates(issue, rng)) for issue in chunk]
+        start = time.perf_counter()
+        for issue, products in work:
+            find_best_match(issue, products, item_type="comic")
+        elapsed += time.perf_counter() - start
+        processed += len(work)
+    return processed, elapsed
+
+
+@case("match_scoring.find_best_match.funko")
+def bench_find_best_match_funko(count: int) -> Tuple[int, float]:
+    elapsed = 0.0
+    processed = 0
+    for chunk in catalog.funkos(count):
+        start = time.perf_counter()
+        for funko, products in chunk:
+            find_best_match(funko, products, item_type="funko")
+        elapsed += time.perf_counter() - start
+        processed += len(chunk)
+    return processed, elapsed
+
+
+@case("dedup_engine.FuzzyMatcher.match_comics")
+def bench_fuzzy_match_comics(count: int) -> Tuple[int, float]:
+    matcher = FuzzyMatcher()
+    elapsed = 0.0
+    processed = 0
+    for left, right in zip(catalog.comic_issues(count, seed=21), catalog.comic_issues(count, seed=22)):
+        # Half the pairs are near-duplicates, as after a multi-source fetch
+        pairs = [
+            (a, dict(a, series_name=a["series_name"].upper(), upc="") if i % 2 else b)
+            for i, (a, b) in enumerate(zip(left, right))
+        ]
+        start = time.perf_counter()
+        for a, b in pairs:
+            matcher.match_comics(a, b)
+        elapsed += time.perf_counter() - start
+        processed += len(pairs)
+    return processed, elapsed
+
+
+@case("cross_reference.CrossReferenceMatcher.normalize_series_name")
+def bench_normalize_series_name(count: int) -> Tuple[int, float]:
+    matcher = CrossReferenceMatcher()
+    elapsed = 0.0
+    processed = 0
+    for chunk in catalog.gcd_rows(count):
+        names = [f"{row['series_name']} Vol. {row['volume']}" for row in chunk]
+        start = time.perf_counter()
+        for name in names:
+            matcher.normalize_series_name(name)
+        elapsed += time.perf_counter() - start
+        processed += len(names)
+    return processed, elapsed
+
+
+@case("gcd.GCDAdapter._normalize_sqlite_row")
+def bench_gcd_normalize_row(count: int) -> Tuple[int, float]:
+    adapter = GCDAdapter(client=object())  # no network; normalization only
+    elapsed = 0.0
+    processed = 0
+    for chunk in catalog.gcd_rows(count):
+        start = time.perf_counter()
+        for row in chunk:
+            adapter._normalize_sqlite_row(row)
+        elapsed += time.perf_counter() - start
+        processed += len(chunk)
+    return processed, elapsed
+
+
+@case("db_sanitizer.sanitize_gcd_record")
+def bench_sanitize_gcd_record(count: int) -> Tuple[int, float]:
+    adapter = GCDAdapter(client=object())
+    elapsed = 0.0
+    processed = 0
+    for chunk in catalog.gcd_rows(count):
+        records = []
+        for row in chunk:
+            record = adapter._normalize_sqlite_row(row)
+            record["release_date"] = record["store_date"]
+            record["cover_price"] = record["gcd_price"]
+            record["issue_number"] = record["number"]
+            records.append(record)
+        start = time.perf_counter()
+        for record in records:
+            sanitize_gcd_record(record)
+        elapsed += time.perf_counter() - start
+        processed += len(records)
+    return processed, elapsed
+
+
+@case("text_embeddings.hash_embedding")
+def bench_hash_embedding(count: int) -> Tuple[int, float]:
+    elapsed = 0.0
+    processed = 0
+    for chunk in catalog.gcd_rows(count):
+        texts = [f"{row['series_name']} #{row['issue_number']} {row['publisher_name']}" for row in chunk]
+        start = time.perf_counter()
+        for text in texts:
+            hash_embedding(text)
+        elapsed += time.perf_counter() - start
+        processed += len(texts)
+    return processed, elapsed
+
+
+@case("comic_cache.cover_phash")
+def bench_cover_phash(count: int) -> Tuple[int, float]:
+    images = max(count // IMAGE_SCALE_DIVISOR, 1)
+    pool = catalog.cover_images(images)
+    start = time.perf_counter()
+    for i in range(images):
+        _phash_image_bytes(pool[i % len(pool)])
+    return images, time.perf_counter() - start
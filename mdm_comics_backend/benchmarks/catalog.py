@@ -0,0 +1,169 @@
+"""
+Synthetic catalog generator v1.0.0
+
+Deterministic GCD-like issues, PriceCharting products and Funkos for the
+benchmark suite. Everything is generated lazily in chunks so a 1M-record
+run never holds the whole catalog in memory; the same seed always yields
+the same records, so runs are comparable across commits.
+"""
+import io
+import random
+from typing import Any, Dict, Iterator, List
+
+CHUNK_SIZE = 10_000
+
+PUBLISHERS = [
+    "Marvel", "DC", "Image", "IDW Publishing", "Dark Horse Comics",
+    "Dynamite Entertainment", "BOOM! Studios", "Archie", "Valiant", "Oni Press",
+]
+SERIES_WORDS = [
+    "Amazing", "Spider-Man", "Batman", "Detective", "Comics", "X-Men", "Uncanny",
+    "Saga", "Walking", "Dead", "Star", "Wars", "Trek", "Next", "Generation",
+    "Avengers", "Justice", "League", "Hellboy", "Invincible", "Spawn", "Sandman",
+    "Swamp", "Thing", "Fantastic", "Four", "Iron", "Man", "Wonder", "Woman",
+]
+FUNKO_WORDS = [
+    "Pop!", "Deluxe", "Rides", "Glow", "Chase", "Flocked", "Metallic", "Exclusive",
+    "Batman", "Groot", "Baby", "Yoda", "Pikachu", "Goku", "Harry", "Potter",
+]
+FUNKO_CATEGORIES = ["Marvel", "DC Comics", "Star Wars", "Anime", "Movies", "Television", "Games"]
+
+
+def scale_value(label: str) -> int:
+    """'10k' -> 10000, '1m' -> 1000000, '2500' -> 2500."""
+    label = label.strip().lower()
+    multiplier = {"k": 1_000, "m": 1_000_000}.get(label[-1:], 1)
+    digits = label[:-1] if multiplier > 1 else label
+    return int(float(digits) * multiplier)
+
+
+def _series_name(rng: random.Random) -> str:
+    name = " ".join(rng.sample(SERIES_WORDS, rng.randint(1, 4)))
+    return f"The {name}" if rng.random() < 0.1 else name
+
+
+def gcd_rows(count: int, seed: int = 1) -> Iterator[List[Dict[str, Any]]]:
+    """Chunks of rows shaped like the GCD SQLite dump query."""
+    rng = random.Random(seed)
+    for start in range(0, count, CHUNK_SIZE):
+        chunk = []
+        for gcd_id in range(start + 1, min(start + CHUNK_SIZE, count) + 1):
+            year = rng.randint(1938, 2025)
+            month = rng.randint(0, 12)
+            chunk.append({
+                "gcd_id": gcd_id,
+                "gcd_series_id": gcd_id // 40 + 1,
+                "gcd_publisher_id": rng.randint(1, len(PUBLISHERS)),
+                "gcd_brand_id": rng.randint(1, 500),
+                "gcd_indicia_publisher_id": rng.randint(1, 900),
+                "isbn": f"978{rng.randint(10**9, 10**10 - 1)}" if rng.random() < 0.1 else None,
+                "valid_isbn": None,
+                "barcode": f"{rng.randint(10**11, 10**12 - 1)}" if year >= 1980 and rng.random() < 0.7 else None,
+                "issue_number": str(rng.randint(1, 700)) if rng.random() < 0.95 else f"Annual {rng.randint(1, 30)}",
+                "volume": str(rng.randint(1, 6)),
+                "story_title": rng.choice(["", "Origin", "The End", "Rebirth", None]),
+                "page_count": rng.choice([None, "32", 36, "48.0"]),
+                "cover_price": rng.choice(["$2.99", "[none]", "0.12 USD", "$3.99; $4.99 CAD", None]),
+                "publication_date": f"{year}",
+                "key_date": f"{year}-{month:02d}-00",
+                "variant_of_gcd_id": gcd_id - 1 if rng.random() < 0.15 else None,
+                "variant_name": "Variant Cover" if rng.random() < 0.15 else None,
+                "variant_cover_status": rng.randint(0, 3),
+                "series_name": _series_name(rng),
+                "series_sort_name": None,
+                "series_year_began": year - rng.randint(0, 10),
+                "series_year_ended": None,
+                "publisher_name": rng.choice(PUBLISHERS),
+            })
+        yield chunk
+
+
+def comic_issues(count: int, seed: int = 2) -> Iterator[List[Dict[str, Any]]]:
+    """Chunks of local comic records as the matchers see them."""
+    rng = random.Random(seed)
+    for start in range(0, count, CHUNK_SIZE):
+        chunk = []
+        for issue_id in range(start + 1, min(start + CHUNK_SIZE, count) + 1):
+            year = rng.randint(1960, 2025)
+            chunk.append({
+                "id": issue_id,
+                "series_name": _series_name(rng),
+                "number": str(rng.randint(1, 400)),
+                "publisher_name": rng.choice(PUBLISHERS),
+                "cover_date": f"{year}-{rng.randint(1, 12):02d}-01",
+                "year": year,
+                "issue_name": rng.choice(["", "Part One", None]),
+                "upc": f"{rng.randint(10**11, 10**12 - 1)}" if rng.random() < 0.3 else "",
+                "isbn": "",
+                "variant_name": "Variant" if rng.random() < 0.1 else "",
+            })
+        yield chunk
+
+
+def pricecharting_candidates(issue: Dict[str, Any], rng: random.Random, count: int = 10) -> List[Dict[str, Any]]:
+    """A search result page for an issue: one near match plus noise."""
+    products = [{
+        "id": str(rng.randint(1, 10**7)),
+        "product-name": f"{issue['series_name']} #{issue['number']}",
+        "console-name": f"Comic Books {issue['publisher_name']} {issue['year']}",
+    }]
+    for _ in range(count - 1):
+        products.append({
+            "id": str(rng.randint(1, 10**7)),
+            "product-name": f"{_series_name(rng)} #{rng.randint(1, 400)}",
+            "console-name": f"Comic Books {rng.choice(PUBLISHERS)} {rng.randint(1960, 2025)}",
+        })
+    rng.shuffle(products)
+    return products
+
+
+def funkos(count: int, seed: int = 3) -> Iterator[List[Dict[str, Any]]]:
+    """Chunks of Funko records with a candidate PriceCharting page each."""
+    rng = random.Random(seed)
+    for start in range(0, count, CHUNK_SIZE):
+        chunk = []
+        for funko_id in range(start + 1, min(start + CHUNK_SIZE, count) + 1):
+            title = " ".join(rng.sample(FUNKO_WORDS, rng.randint(2, 4)))
+            box = rng.randint(1, 1500)
+            category = rng.choice(FUNKO_CATEGORIES)
+            candidates = [{
+                "id": str(rng.randint(1, 10**7)),
+                "product-name": f"{title} #{box}",
+                "console-name": f"Funko POP {category}",
+                "genre": category,
+            }]
+            for _ in range(9):
+                candidates.append({
+                    "id": str(rng.randint(1, 10**7)),
+                    "product-name": f"{' '.join(rng.sample(FUNKO_WORDS, 3))} #{rng.randint(1, 1500)}",
+                    "console-name": f"Funko POP {rng.choice(FUNKO_CATEGORIES)}",
+                    "genre": rng.choice(FUNKO_CATEGORIES),
+                })
+            chunk.append(({
+                "id": funko_id,
+                "title": title,
+                "box_number": str(box),
+                "category": category,
+                "product_type": "Pop!",
+                "license": category,
+                "series_names": category,
+            }, candidates))
+        yield chunk
+
+
+def cover_images(count: int, seed: int = 4, pool_size: int = 16) -> List[bytes]:
+    """A small pool of distinct synthetic JPEG covers (hashed repeatedly)."""
+    from PIL import Image
+
+    rng = random.Random(seed)
+    pool = []
+    for _ in range(min(count, pool_size)):
+        img = Image.new("RGB", (400, 600), tuple(rng.randint(0, 255) for _ in range(3)))
+        pixels = img.load()
+        for _ in range(4000):
+            x, y = rng.randrange(400), rng.randrange(600)
+            pixels[x, y] = tuple(rng.randint(0, 255) for _ in range(3))
+        buf = io.BytesIO()
+        img.save(buf, format="JPEG", quality=85)
+        pool.append(buf.getvalue())
+    return pool
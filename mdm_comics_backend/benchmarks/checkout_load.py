@@ -0,0 +1,229 @@
+"""
+Checkout load test v1.0.0
+
+PERF-042: Simulates a flash drop, with many concurrent buyers on one SKU,
+against a real Postgres (DATABASE_URL), and checks the reservation
+invariants.
+
+Usage (from mdm_comics_backend/):
+    python -m benchmarks.checkout_load                      # 1,000 buyers, 100 units
+    python -m benchmarks.checkout_load --buyers 5000 --stock 250 --pool-size 40
+    python -m benchmarks.checkout_load --mode locked         # old FOR UPDATE flow
+
+Each buyer runs the create-payment-intent reservation path for one unit:
+reserve_stock(), a simulated Stripe round-trip (--stripe-latency-ms), then
+attach_payment_intent(). --mode locked replays the previous flow, which
+held the product row lock (FOR UPDATE) across the Stripe call, for
+comparison.
+
+Exits 1 unless every unit is sold exactly once (no oversell, no lost
+units, reservations match the decrement) and p99 latency stays within
+--max-p99-ms. A throwaway user and product are created and removed.
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import time
+import uuid
+from typing import Any, Dict, List, Sequence
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from sqlalchemy import select, text  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.models import Product, StockReservation  # noqa: E402
+from app.services.order_service import build_product_snapshot, dollars_to_cents  # noqa: E402
+from app.services.stock_reservations import (  # noqa: E402
+    InsufficientStockError, attach_payment_intent, reserve_stock,
+)
+
+# Reservation latency no longer grows with Stripe latency x units sold (the
+# locked flow's p99 is ~17s for 100 units at 150 ms); this bound leaves
+# room for a single-core CI box, where client CPU dominates
+DEFAULT_MAX_P99_MS = 5000.0
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile (q in 0-100); 0.0 for no values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(q / 100.0 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def check_invariants(summary: Dict[str, Any], max_p99_ms: float) -> List[str]:
+    """Failed invariants of one run, as messages (empty when it passed)."""
+    failures = []
+    expected = min(summary["buyers"], summary["initial_stock"])
+    if summary["final_stock"] < 0:
+        failures.append(f"oversold: final stock {summary['final_stock']}")
+    if summary["sold"] != expected:
+        failures.append(f"sold {summary['sold']} units, expected {expected}")
+    if summary["final_stock"] != summary["initial_stock"] - summary["sold"]:
+        failures.append(
+            f"stock {summary['final_stock']} does not match "
+            f"{summary['initial_stock']} - {summary['sold']} sold"
+        )
+    if summary["reserved_units"] != summary["sold"]:
+        failures.append(f"{summary['reserved_units']} units reserved for {summary['sold']} sales")
+    if summary["errors"]:
+        failures.append(f"{summary['errors']} buyers failed with errors")
+    if summary["p99_ms"] > max_p99_ms:
+        failures.append(f"p99 {summary['p99_ms']:.1f} ms over {max_p99_ms:.0f} ms")
+    return failures
+
+
+async def _buy_reserve(session_factory, user_id, product, stripe_latency, buyer) -> str:
+    async with session_factory() as db:
+        # The route's unlocked read and early reject
+        current = (await db.execute(select(Product).where(Product.id == product.id))).scalar_one()
+        if current.stock < 1:
+            await db.rollback()
+            return "rejected"
+        try:
+            key, _ = await reserve_stock(db, user_id, {product.id: 1}, {product.id: current}, "USD")
+        except InsufficientStockError:
+            return "rejected"
+        await asyncio.sleep(stripe_latency)  # stripe.PaymentIntent.create
+        await attach_payment_intent(db, key, f"pi_load_{buyer}")
+        return "sold"
+
+
+async def _buy_locked(session_factory, user_id, product, stripe_latency, buyer) -> str:
+    async with session_factory() as db:
+        locked = (await db.execute(
+            select(Product).where(Product.id == product.id).with_for_update()
+        )).scalar_one()
+        if locked.stock < 1:
+            await db.rollback()
+            return "rejected"
+        locked.stock -= 1
+        await asyncio.sleep(stripe_latency)  # stripe.PaymentIntent.create, lock held
+        db.add(StockReservation(
+            user_id=user_id,
+            product_id=product.id,
+            quantity=1,
+            payment_intent_id=f"pi_load_{buyer}",
+            expires_at=StockReservation.create_expiry(),
+            unit_price_cents=dollars_to_cents(locked.price),
+            currency_code="USD",
+            product_snapshot=build_product_snapshot(locked),
+        ))
+        await db.commit()
+        return "sold"
+
+
+async def run_load(
+    database_url: str,
+    buyers: int,
+    stock: int,
+    pool_size: int,
+    stripe_latency_ms: float,
+    mode: str = "reserve",
+) -> Dict[str, Any]:
+    engine = create_async_engine(database_url, pool_size=pool_size, max_overflow=0, pool_timeout=300)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    tag = uuid.uuid4().hex[:12]
+
+    async with session_factory() as db:
+        user_id = (await db.execute(text("""
+            INSERT INTO users (email, hashed_password, name)
+            VALUES (:email, 'x', 'checkout load test')
+            RETURNING id
+        """), {"email": f"load-{tag}@example.invalid"})).scalar()
+        product = Product(
+            sku=f"LOAD-{tag}", name=f"Flash drop {tag}", category="supplies",
+            price=10, stock=stock,
+        )
+        db.add(product)
+        await db.commit()
+        await db.refresh(product)
+
+    buy = _buy_reserve if mode == "reserve" else _buy_locked
+    latencies: List[float] = []
+    outcomes = {"sold": 0, "rejected": 0, "errors": 0}
+    first_error = None
+
+    async def buyer(i: int) -> None:
+        nonlocal first_error
+        start = time.perf_counter()
+        try:
+            outcome = await buy(session_factory, user_id, product, stripe_latency_ms / 1000.0, i)
+        except Exception as e:
+            outcome = "errors"
+            first_error = first_error or f"{type(e).__name__}: {e}"
+        latencies.append((time.perf_counter() - start) * 1000.0)
+        outcomes[outcome] += 1
+
+    try:
+        started = time.perf_counter()
+        await asyncio.gather(*(buyer(i) for i in range(buyers)))
+        wall = time.perf_counter() - started
+
+        async with session_factory() as db:
+            final_stock = (await db.execute(
+                text("SELECT stock FROM products WHERE id = :id"), {"id": product.id},
+            )).scalar()
+            reserved = (await db.execute(
+                text("SELECT COALESCE(SUM(quantity), 0) FROM stock_reservations WHERE product_id = :id"),
+                {"id": product.id},
+            )).scalar()
+    finally:
+        async with session_factory() as db:
+            await db.execute(text("DELETE FROM stock_reservations WHERE product_id = :id"), {"id": product.id})
+            await db.execute(text("DELETE FROM products WHERE id = :id"), {"id": product.id})
+            await db.execute(text("DELETE FROM users WHERE id = :id"), {"id": user_id})
+            await db.commit()
+        await engine.dispose()
+
+    return {
+        "mode": mode,
+        "buyers": buyers,
+        "initial_stock": stock,
+        "pool_size": pool_size,
+        "stripe_latency_ms": stripe_latency_ms,
+        "sold": outcomes["sold"],
+        "rejected": outcomes["rejected"],
+        "errors": outcomes["errors"],
+        "first_error": first_error,
+        "final_stock": int(final_stock),
+        "reserved_units": int(reserved),
+        "wall_seconds": round(wall, 3),
+        "p50_ms": round(percentile(latencies, 50), 1),
+        "p95_ms": round(percentile(latencies, 95), 1),
+        "p99_ms": round(percentile(latencies, 99), 1),
+        "max_ms": round(max(latencies, default=0.0), 1),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Concurrent checkout reservation load test")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"))
+    parser.add_argument("--buyers", type=int, default=1000)
+    parser.add_argument("--stock", type=int, default=100)
+    parser.add_argument("--pool-size", type=int, default=20)
+    parser.add_argument("--stripe-latency-ms", type=float, default=150.0)
+    parser.add_argument("--max-p99-ms", type=float, default=DEFAULT_MAX_P99_MS)
+    parser.add_argument("--mode", choices=("reserve", "locked"), default="reserve")
+    args = parser.parse_args(argv)
+
+    if not args.database_url:
+        parser.error("DATABASE_URL is not set")
+
+    summary = asyncio.run(run_load(
+        args.database_url, args.buyers, args.stock, args.pool_size, args.stripe_latency_ms, args.mode,
+    ))
+    failures = check_invariants(summary, args.max_p99_ms)
+    print(json.dumps({**summary, "failures": failures}, indent=2))
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
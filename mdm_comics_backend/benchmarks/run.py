@@ -0,0 +1,179 @@
+"""
+Benchmark runner v1.0.0
+
+Usage (from mdm_comics_backend/):
+    python -m benchmarks.run                       # all cases at 10k
+    python -m benchmarks.run --scales 10k,100k,1m  # larger catalogs
+    python -m benchmarks.run --only match_scoring --no-save
+    python -m benchmarks.run --fail-on-regression  # exit 1 on slowdowns
+
+Each (case, scale) runs in a fresh child process so peak RSS is that
+case's own. Results are appended to benchmarks/results/history.json with
+the git commit and host, and compared against the previous run of the
+same case and scale on the same host: throughput drops or RSS growth past
+--threshold are reported as regressions.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from benchmarks.cases import CASES  # noqa: E402
+from benchmarks.catalog import scale_value  # noqa: E402
+
+HISTORY_PATH = os.path.join(BACKEND_DIR, "benchmarks", "results", "history.json")
+DEFAULT_THRESHOLD = 0.15
+HISTORY_LIMIT = 200
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _run_case(name: str, count: int, queue) -> None:
+    try:
+        baseline = _peak_rss_mb()
+        processed, seconds = CASES[name](count)
+        peak = _peak_rss_mb()
+        queue.put({
+            "records": processed,
+            "seconds": round(seconds, 4),
+            "records_per_sec": round(processed / seconds, 1) if seconds else None,
+            "peak_rss_mb": peak,
+            "rss_growth_mb": round(peak - baseline, 1),
+        })
+    except Exception as e:
+        queue.put({"error": f"{type(e).__name__}: {e}"})
+
+
+def run_case(name: str, count: int) -> Dict[str, Any]:
+    """Run one case at one scale in a child process."""
+    ctx = multiprocessing.get_context("fork" if sys.platform != "win32" else "spawn")
+    queue = ctx.Queue()
+    proc = ctx.Process(target=_run_case, args=(name, count, queue))
+    proc.start()
+    result = queue.get()
+    proc.join()
+    return result
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def load_history(path: str = HISTORY_PATH) -> List[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_history(history: List[Dict[str, Any]], path: str = HISTORY_PATH) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(history[-HISTORY_LIMIT:], f, indent=2)
+        f.write("\n")
+
+
+def previous_result(history: List[Dict[str, Any]], host: str, case: str, scale: str) -> Optional[Dict[str, Any]]:
+    """Most recent successful result for a case/scale on this host."""
+    for run in reversed(history):
+        if run.get("host") != host:
+            continue
+        for result in run.get("results", []):
+            if result["case"] == case and result["scale"] == scale and "error" not in result:
+                return result
+    return None
+
+
+def find_regressions(
+    current: Dict[str, Any],
+    previous: Optional[Dict[str, Any]],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[str]:
+    """Human-readable regressions of current vs previous (empty if none)."""
+    if not previous or "error" in current:
+        return []
+    problems = []
+    old_rate, new_rate = previous.get("records_per_sec"), current.get("records_per_sec")
+    if old_rate and new_rate and new_rate < old_rate * (1 - threshold):
+        problems.append(f"throughput {old_rate:,.0f} -> {new_rate:,.0f} rec/s ({new_rate / old_rate - 1:+.0%})")
+    old_rss, new_rss = previous.get("rss_growth_mb"), current.get("rss_growth_mb")
+    # Ignore noise on cases that barely allocate
+    if old_rss is not None and new_rss is not None and new_rss > max(old_rss * (1 + threshold), old_rss + 5):
+        problems.append(f"rss growth {old_rss} -> {new_rss} MB")
+    return problems
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the matching/ingestion benchmark suite")
+    parser.add_argument("--scales", default="10k", help="Comma-separated catalog sizes (10k,100k,1m)")
+    parser.add_argument("--only", default=None, help="Run cases whose name contains this substring")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Regression tolerance")
+    parser.add_argument("--history", default=HISTORY_PATH, help="Results history JSON file")
+    parser.add_argument("--no-save", action="store_true", help="Don't append this run to the history")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit 1 if any case regressed")
+    args = parser.parse_args(argv)
+
+    names = [n for n in CASES if not args.only or args.only in n]
+    scales = [s.strip().lower() for s in args.scales.split(",") if s.strip()]
+    history = load_history(args.history)
+    host = f"{platform.node()}/{platform.machine()}/py{platform.python_version()}"
+
+    run = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "host": host,
+        "cpu_count": os.cpu_count(),
+        "results": [],
+    }
+    regressions = []
+
+    print(f"{'case':<62} {'scale':>6} {'rec/s':>12} {'secs':>9} {'peak MB':>8} {'+MB':>6}")
+    for scale in scales:
+        for name in names:
+            result = {"case": name, "scale": scale, **run_case(name, scale_value(scale))}
+            run["results"].append(result)
+            if "error" in result:
+                print(f"{name:<62} {scale:>6}  ERROR {result['error']}")
+                continue
+            print(
+                f"{name:<62} {scale:>6} {result['records_per_sec'] or 0:>12,.0f} "
+                f"{result['seconds']:>9.3f} {result['peak_rss_mb']:>8} {result['rss_growth_mb']:>6}"
+            )
+            for problem in find_regressions(result, previous_result(history, host, name, scale), args.threshold):
+                regressions.append(f"{name} @ {scale}: {problem}")
+
+    if regressions:
+        print("\nRegressions vs previous run on this host:")
+        for line in regressions:
+            print(f"  - {line}")
+
+    if not args.no_save:
+        history.append(run)
+        save_history(history, args.history)
+        print(f"\nSaved to {os.path.relpath(args.history, BACKEND_DIR)}")
+
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -31,7 +31,8 @@ async def run_scan(folder_path):
         def progress(current, total):
             print(f"Processing: {current}/{total}", end='\r')
 
-        result = await service.ingest_folder(
+        # Bulk mode: one series preload, parallel hashing and uploads
+        result = await service.ingest_folder_bulk(
             folder_path=folder_path,
             user_id=1, # System user
             progress_callback=progress
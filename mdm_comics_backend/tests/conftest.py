@@ -1,6 +1,7 @@
 """
 Pytest configuration and fixtures for MDM Comics tests.
 UPS Shipping Integration v1.28.0
+v1.28.1: Shared FakeResult/FakeSession for tests that answer SQL by statement
 """
 import asyncio
 import os
@@ -36,6 +37,95 @@ def mock_db() -> AsyncMock:
     return db
 
 
+class FakeResult:
+    """
+    Stand-in for an AsyncSession result; rows double as ORM objects and
+    mappings, and the single-row accessors read the first row.
+    """
+
+    def __init__(self, rows=(), scalar=None, rowcount=0):
+        self._rows = list(rows)
+        self._scalar = scalar
+        self.rowcount = rowcount
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def one(self):
+        return self._rows[0]
+
+    def fetchall(self):
+        return self._rows
+
+    def all(self):
+        return self._rows
+
+    def scalars(self):
+        return self
+
+    def mappings(self):
+        return self
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def scalar(self):
+        return self._scalar
+
+    def scalar_one_or_none(self):
+        return self._scalar
+
+
+class FakeSession:
+    """
+    AsyncSession stand-in for tests whose queries are raw SQL. Subclasses
+    answer statements in respond(); every execute() is recorded.
+    """
+
+    def __init__(self):
+        self.executed = []
+        self.added = []
+        self.commits = self.rollbacks = 0
+
+    @property
+    def statements(self):
+        return [sql for sql, _ in self.executed]
+
+    @property
+    def committed(self):
+        return self.commits > 0
+
+    @property
+    def rolled_back(self):
+        return self.rollbacks > 0
+
+    def respond(self, sql, params):
+        return FakeResult()
+
+    async def execute(self, statement, params=None):
+        sql = str(statement)
+        self.executed.append((sql, params))
+        return self.respond(sql, params)
+
+    def add(self, obj):
+        self.added.append(obj)
+
+    def add_all(self, objs):
+        self.added.extend(objs)
+
+    async def flush(self):
+        pass
+
+    async def refresh(self, obj):
+        pass
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
 @pytest.fixture
 def mock_ups_client() -> AsyncMock:
     """Create mock UPS client."""
@@ -0,0 +1,86 @@
+"""
+Tests for incremental abandoned-cart detection.
+v1.0.0: Watermark window, concurrent-run skip, set-based queueing SQL
+"""
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from app.services.abandonment_service import (
+    QUEUE_ABANDONED_SQL,
+    SCHEMA_DDL,
+    AbandonmentService,
+)
+from tests.conftest import FakeResult, FakeSession
+
+
+class _Session(FakeSession):
+    def __init__(self, watermark=None, locked=False, queued=()):
+        super().__init__()
+        self.watermark = watermark
+        self.locked = locked
+        self.queued = list(queued)
+        self.queue_params = []
+        self.advanced_to = None
+
+    def respond(self, sql, params):
+        if "FOR UPDATE SKIP LOCKED" in sql:
+            return FakeResult([] if self.locked else [SimpleNamespace(watermark=self.watermark)])
+        if "INSERT INTO cart_abandonment_queue" in sql:
+            self.queue_params.append(params)
+            return FakeResult([SimpleNamespace(id=i) for i in self.queued])
+        if "UPDATE abandonment_watermarks" in sql:
+            self.advanced_to = params["cutoff"]
+            return FakeResult()
+        if "FROM cart_abandonment_queue" in sql:
+            return FakeResult([SimpleNamespace(id=i) for i in self.queued])
+        return super().respond(sql, params)
+
+
+async def test_first_run_looks_back_one_recovery_window_and_advances_the_watermark():
+    db = _Session(queued=[11, 12])
+    service = AbandonmentService()
+
+    queued = await service.detect_abandoned_carts(db, threshold_hours=3)
+
+    params = db.queue_params[0]
+    assert params["cutoff"] - params["since"] == timedelta(hours=service.RECOVERY_WINDOW_HOURS)
+    assert abs(datetime.now(timezone.utc) - timedelta(hours=3) - params["cutoff"]) < timedelta(seconds=5)
+    assert (params["high_value"], params["medium_value"]) == (service.HIGH_VALUE_THRESHOLD, service.MEDIUM_VALUE_THRESHOLD)
+    assert db.advanced_to == params["cutoff"]
+    assert [q.id for q in queued] == [11, 12]
+
+
+async def test_later_runs_only_examine_activity_since_the_watermark():
+    watermark = datetime.now(timezone.utc) - timedelta(hours=2, minutes=5)
+    db = _Session(watermark=watermark)
+
+    assert await AbandonmentService().detect_abandoned_carts(db) == []
+    assert db.queue_params[0]["since"] == watermark
+    assert db.advanced_to > watermark
+
+
+async def test_concurrent_run_skips_without_queueing():
+    db = _Session(locked=True)
+
+    assert await AbandonmentService().detect_abandoned_carts(db) == []
+    assert db.queue_params == [] and db.advanced_to is None
+
+
+async def test_watermark_ahead_of_cutoff_does_nothing():
+    # e.g. the threshold was raised since the last run
+    db = _Session(watermark=datetime.now(timezone.utc))
+
+    assert await AbandonmentService().detect_abandoned_carts(db) == []
+    assert db.queue_params == []
+
+
+def test_queueing_is_one_set_based_statement_matching_the_partial_index():
+    sql = str(QUEUE_ABANDONED_SQL)
+    assert "DISTINCT ON (s.cart_id)" in sql and "ORDER BY s.cart_id, s.snapshot_at DESC" in sql
+    assert "ON CONFLICT (cart_id) WHERE recovery_status IN ('pending', 'email_sent') DO NOTHING" in sql
+    # a cart with any later snapshot (more activity, conversion) is not abandoned
+    assert "newer.snapshot_at > l.snapshot_at" in sql
+
+    index = next(ddl for ddl in SCHEMA_DDL if "ix_cart_snapshots_open_activity" in ddl)
+    for predicate in ("order_id IS NULL", "item_count > 0", "snapshot_type IN ('updated', 'checkout_started')"):
+        assert predicate in index and f"s.{predicate}" in sql
@@ -0,0 +1,197 @@
+"""
+Tests for batch barcode scanning.
+v1.0.0: Batched matching, idempotent stock counting, set-based queue processing
+v1.0.1: Per-product movement numbering follows the batch order
+"""
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.barcode_matcher import (
+    CLAIM_QUEUE_SQL,
+    CLAIM_SCANS_SQL,
+    BarcodeScan,
+    process_barcode_queue_batch,
+    resolve_barcodes,
+    scan_barcodes,
+)
+from tests.conftest import FakeResult, FakeSession
+
+PRODUCTS = {
+    1: {"name": "Saga #1", "upc": "76194134182700111", "isbn": None, "stock": 2},
+    2: {"name": "Watchmen TPB", "upc": None, "isbn": "9781401245252", "stock": 0},
+}
+COMICS = {7: {"issue_name": "X-Men #1", "upc": "75960608936800111"}}
+
+
+class _Session(FakeSession):
+    """
+    Answers the batch queries from in-memory tables, remembering receipts.
+    Claims go through the same counts/bumped/ranked steps as
+    _apply_claimed_sql(), so stock and movement numbering follow the SQL.
+    """
+
+    def __init__(self, queue=()):
+        super().__init__()
+        self.receipts = set()
+        self.stock = {pid: p["stock"] for pid, p in PRODUCTS.items()}
+        self.movements = []
+        self.queue = {q.id: q for q in queue}
+
+    def respond(self, sql, params):
+        if "SELECT DISTINCT ON (upc) upc, id, name FROM products" in sql:
+            return FakeResult(SimpleNamespace(upc=p["upc"], id=i, name=p["name"])
+                              for i, p in PRODUCTS.items() if p["upc"] in params["codes"])
+        if "SELECT DISTINCT ON (isbn) isbn, id, name FROM products" in sql:
+            return FakeResult(SimpleNamespace(isbn=p["isbn"], id=i, name=p["name"])
+                              for i, p in PRODUCTS.items() if p["isbn"] in params["codes"])
+        if "FROM comic_issues" in sql:
+            return FakeResult(SimpleNamespace(upc=c["upc"], id=i, issue_name=c["issue_name"])
+                              for i, c in COMICS.items() if c["upc"] in params["codes"])
+        if sql == str(CLAIM_SCANS_SQL):
+            # ord = array_position(keys, scan_key)
+            claimed = [(k, p, ord, None) for ord, (k, p) in enumerate(zip(params["keys"], params["product_ids"]), 1)
+                       if k not in self.receipts]
+            self.receipts.update(k for k, *_ in claimed)
+            return FakeResult(self._apply(claimed))
+        if sql == str(CLAIM_QUEUE_SQL):
+            claimed = [(str(q.id), q.matched_product_id, q.id, q.id) for q in self.queue.values()
+                       if q.id in params["queue_ids"] and q.status not in ("processed", "skipped")
+                       and q.matched_product_id in PRODUCTS]
+            for key, *_ in claimed:
+                self.queue[int(key)].status = "processed"
+            return FakeResult(self._apply(claimed))
+        if "SET status = 'skipped'" in sql:
+            skipped = [q for q in self.queue.values()
+                       if q.id in params["queue_ids"] and q.status not in ("processed", "skipped")]
+            for q in skipped:
+                q.status = "skipped"
+            return FakeResult(SimpleNamespace(id=q.id) for q in skipped)
+        assert "FROM barcode_queue" in sql, sql
+        return FakeResult(q for q in self.queue.values() if q.id in params["queue_ids"])
+
+    def _apply(self, claimed):
+        counts = Counter(product_id for _, product_id, _, _ in claimed)
+        previous = {}
+        for product_id, n in counts.items():
+            previous[product_id] = self.stock[product_id]
+            self.stock[product_id] += n
+        rows, rn = [], Counter()
+        for key, product_id, _, reference_id in sorted(claimed, key=lambda c: c[2]):
+            rn[product_id] += 1
+            new_stock = previous[product_id] + rn[product_id]
+            self.movements.append((product_id, new_stock - 1, new_stock, reference_id))
+            rows.append(SimpleNamespace(key=key, product_id=product_id,
+                                        name=PRODUCTS[product_id]["name"], new_stock=new_stock))
+        return rows
+
+
+async def test_resolve_keeps_priority_and_order_with_one_query_per_identifier():
+    db = _Session()
+    scans = [
+        BarcodeScan("75960608936800111", "UPC"),
+        BarcodeScan("978-1401-245252", "ISBN"),
+        BarcodeScan("76194134182700111", "EAN"),
+        BarcodeScan("00000000", "UPC"),
+        BarcodeScan("76194134182700111", "UPC"),
+    ]
+
+    results = await resolve_barcodes(db, scans)
+
+    assert [(r.match_type, r.product_id or r.comic_id) for r in results] == [
+        ("comic_issue", 7), ("existing_product", 2), ("existing_product", 1), (None, None), ("existing_product", 1),
+    ]
+    assert results[1].message == "Found existing product: Watchmen TPB"
+    assert results[3].message == "No match found for UPC 00000000"
+    assert len(db.statements) == 3
+    assert db.stock == {1: 2, 2: 0}
+
+
+async def test_scan_batch_counts_each_scan_once_across_retries():
+    db = _Session()
+    scans = [
+        BarcodeScan("76194134182700111", "UPC", "s-1"),
+        BarcodeScan("76194134182700111", "UPC", "s-2"),
+        BarcodeScan("9781401245252", "ISBN", "s-3"),
+        BarcodeScan("76194134182700111", "UPC", "s-1"),
+        BarcodeScan("75960608936800111", "UPC", "s-4"),
+    ]
+
+    first = await scan_barcodes(db, scans, user_id=5)
+    assert [r.stock_incremented for r in first] == [True, True, True, False, False]
+    assert first[3].duplicate and [r.new_stock for r in first[:3]] == [3, 4, 1]
+    assert first[0].message == "Incremented stock for Saga #1"
+    assert sum(CLAIM_SCANS_SQL.text in s for s in db.statements) == 1
+
+    retry = await scan_barcodes(db, scans, user_id=5)
+    assert not any(r.stock_incremented for r in retry)
+    assert [r.duplicate for r in retry] == [True, True, True, True, False]
+    assert db.stock == {1: 4, 2: 1}
+
+
+async def test_scans_without_ids_always_count_and_lookup_only_mode_skips_stock():
+    db = _Session()
+    scans = [BarcodeScan("76194134182700111", "UPC")] * 2
+
+    assert [r.new_stock for r in await scan_barcodes(db, scans, user_id=5)] == [3, 4]
+    assert not any(r.stock_incremented for r in await scan_barcodes(db, scans, user_id=5, auto_increment_stock=False))
+    assert db.stock[1] == 4
+
+
+async def test_queue_batch_claims_items_once_and_explains_the_rest():
+    queue = [
+        SimpleNamespace(id=10, status="matched", matched_product_id=1),
+        SimpleNamespace(id=11, status="matched", matched_product_id=1),
+        SimpleNamespace(id=12, status="processed", matched_product_id=1),
+        SimpleNamespace(id=13, status="pending", matched_product_id=None),
+    ]
+    db = _Session(queue)
+
+    outcome = await process_barcode_queue_batch(db, [11, 10, 12, 13, 99, 10], "add_to_existing", user_id=5)
+
+    assert (outcome["processed"], outcome["errors"]) == (2, 3)
+    assert [(r["queue_id"], r["new_stock"]) for r in outcome["results"]] == [(10, 3), (11, 4)]
+    assert db.movements == [(1, 2, 3, 10), (1, 3, 4, 11)]  # numbered by queue id
+    assert [f["message"] for f in outcome["failures"]] == [
+        "Item already processed", "No matched product", "Queue item not found",
+    ]
+
+    again = await process_barcode_queue_batch(db, [10, 11, 13], "skip", user_id=5)
+    assert [r["queue_id"] for r in again["results"]] == [13]
+    assert db.stock[1] == 4
+
+
+async def test_unknown_batch_action_is_rejected():
+    with pytest.raises(ValueError):
+        await process_barcode_queue_batch(_Session(), [1], "create_product", user_id=5)
+
+
+async def test_each_scan_gets_the_next_stock_level_of_its_product_in_batch_order():
+    db = _Session()
+    # keys out of alphabetical order: numbering follows the batch, not the receipt insert
+    scans = [
+        BarcodeScan("76194134182700111", "UPC", "z"),
+        BarcodeScan("9781401245252", "ISBN", "a"),
+        BarcodeScan("76194134182700111", "UPC", "m"),
+        BarcodeScan("76194134182700111", "UPC", "b"),
+    ]
+
+    results = await scan_barcodes(db, scans, user_id=5)
+
+    assert [r.new_stock for r in results] == [3, 1, 4, 5]
+    # previous_stock + rn: one unbroken chain of movements per product
+    assert sorted(db.movements) == [(1, 2, 3, None), (1, 3, 4, None), (1, 4, 5, None), (2, 0, 1, None)]
+
+
+def test_stock_statement_locks_products_in_id_order_and_logs_every_scan():
+    for sql in (CLAIM_SCANS_SQL.text, CLAIM_QUEUE_SQL.text):
+        assert "ORDER BY p.id\n            FOR UPDATE" in sql
+        assert "SET stock = p.stock + c.n" in sql
+        assert "ROW_NUMBER() OVER (PARTITION BY product_id ORDER BY ord)" in sql
+        assert "p.stock - c.n AS previous_stock" in sql
+        assert "b.previous_stock + r.rn - 1, b.previous_stock + r.rn" in sql
+        assert "b.previous_stock + r.rn AS new_stock" in sql
+        assert "INSERT INTO stock_movements" in sql
+    assert "ON CONFLICT (scan_key) DO NOTHING" in CLAIM_SCANS_SQL.text
+    assert "q.status NOT IN ('processed', 'skipped')" in CLAIM_QUEUE_SQL.text
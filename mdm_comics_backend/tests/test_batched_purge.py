@@ -0,0 +1,143 @@
+"""
+Tests for batched retention purges.
+v1.0.0: Batch SQL, cursor advance and resume, throttling, retention wiring
+v1.1.0: Unreadable replica lag does not block a purge
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import batched_purge
+from app.services.batched_purge import (
+    MAX_BATCH_SIZE,
+    MIN_BATCH_SIZE,
+    PurgeSpec,
+    batch_sql,
+    next_batch_size,
+    run_purge,
+)
+from app.services.retention_service import RetentionService
+from app.services.session_service import EXPIRED_SESSIONS_PURGE
+from tests.conftest import FakeResult, FakeSession
+
+SPEC = PurgeSpec(name="test.rows", table="rows", where="created_at < :cutoff")
+
+
+class _Session(FakeSession):
+    """
+    Purge target with matching keys in `matching` over keys 1..max_key;
+    `cursor` stands in for the purge_cursors row.
+    """
+
+    def __init__(self, matching, max_key, cursor=None, lag=0.0):
+        super().__init__()
+        self.matching = set(matching)
+        self.max_key = max_key
+        self.cursor = cursor
+        self.lag = list(lag) if isinstance(lag, list) else [lag]
+        self.batches = []
+
+    def respond(self, sql, params):
+        if "pg_stat_replication" in sql:
+            lag = self.lag.pop(0) if len(self.lag) > 1 else self.lag[0]
+            if isinstance(lag, Exception):
+                raise lag
+            return FakeResult(scalar=lag)
+        if "FROM purge_cursors" in sql:
+            return FakeResult([self.cursor] if self.cursor else [])
+        if "MIN(id)" in sql:
+            return FakeResult([SimpleNamespace(min_key=1, max_key=self.max_key)])
+        if "WITH bound" in sql:
+            return FakeResult([self._batch(params)])
+        return super().respond(sql, params)
+
+    def _batch(self, params):
+        after = params["after"]
+        range_end = min(after + params["scan_rows"], params["max_key"])
+        keys = sorted(k for k in self.matching if after < k <= range_end)[:params["batch_size"]]
+        self.matching -= set(keys)
+        self.batches.append((after, params["batch_size"], keys))
+        return SimpleNamespace(selected=len(keys), purged=len(keys),
+                               last_key=keys[-1] if keys else None, range_end=range_end)
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    async def sleep(seconds):
+        pass
+    monkeypatch.setattr(batched_purge.asyncio, "sleep", sleep)
+
+
+def test_batch_sql_locks_a_bounded_window_and_skips_locked_rows():
+    sql = batch_sql(SPEC)
+    assert "FOR UPDATE SKIP LOCKED" in sql and "LIMIT :batch_size" in sql
+    assert "OFFSET :scan_rows" in sql and "id > :after" in sql
+    assert "DELETE FROM rows t USING batch b" in sql
+
+    revoke = batch_sql(EXPIRED_SESSIONS_PURGE)
+    assert "UPDATE user_sessions t SET revoked_at = NOW()" in revoke and "DELETE" not in revoke
+
+
+def test_batch_size_adapts_within_bounds():
+    assert next_batch_size(1000, 500.0, 250.0) == 500
+    assert next_batch_size(1000, 50.0, 250.0) == 2000  # at most doubles
+    assert next_batch_size(MIN_BATCH_SIZE, 10_000.0, 250.0) == MIN_BATCH_SIZE
+    assert next_batch_size(MAX_BATCH_SIZE, 1.0, 250.0) == MAX_BATCH_SIZE
+
+
+async def test_purge_walks_every_window_and_commits_per_batch():
+    db = _Session(matching=range(1, 1001, 3), max_key=1000)
+
+    result = await run_purge(db, SPEC, {"cutoff": None}, batch_size=100, target_batch_ms=1e9)
+
+    assert db.matching == set()
+    assert result["rows"] == 334 and result["status"] == "complete"
+    assert db.commits >= result["batches"] + 1
+    # A full batch resumes after its last key, a short one after its window
+    afters = [after for after, _, _ in db.batches]
+    assert afters == sorted(afters) and afters[0] == 0
+
+
+async def test_time_budget_leaves_a_resumable_cursor():
+    db = _Session(matching=range(1, 501), max_key=500)
+
+    partial = await run_purge(db, SPEC, batch_size=100, max_seconds=0)
+    assert partial["status"] == "partial" and partial["rows"] == 0
+
+    db.cursor = SimpleNamespace(last_key=200, max_key=500, rows_purged=200, batches=2)
+    db.matching -= set(range(1, 201))
+    resumed = await run_purge(db, SPEC, batch_size=100, target_batch_ms=1e9)
+    assert resumed["resumed_from"] == 200 and resumed["status"] == "complete"
+    assert resumed["rows"] == 500 and db.matching == set()
+
+
+async def test_waits_for_lagging_replicas():
+    db = _Session(matching=range(1, 11), max_key=10, lag=[30.0, 30.0, 0.0])
+
+    result = await run_purge(db, SPEC, batch_size=100, max_replica_lag_seconds=5)
+
+    assert result["replica_lag_waits"] == 2 and result["rows"] == 10
+
+
+async def test_unreadable_replica_lag_counts_as_none():
+    db = _Session(matching=range(1, 11), max_key=10,
+                  lag=[PermissionError("permission denied for pg_stat_replication"), 0.0])
+
+    result = await run_purge(db, SPEC, batch_size=100, max_replica_lag_seconds=5)
+
+    assert result["replica_lag_waits"] == 0 and result["rows"] == 10
+    assert db.rollbacks >= 1
+
+
+def test_retention_rules_use_real_columns_and_protect_security_events():
+    service = RetentionService(db=None)
+    assert set(service.PURGE_SPECS) == set(service.RETENTION_DAYS)
+    assert service.PURGE_SPECS["audit_logs"].where.startswith("ts < :cutoff")
+    assert "is_active" not in service.PURGE_SPECS["user_sessions"].where
+
+    params = service._purge_params("audit_logs")
+    assert "user.login_failed" in params["protected_actions"]
+    assert "retention.cleanup" in params["protected_actions"]
+    # Anonymization is an UPDATE that skips users already purged
+    users = service.PURGE_SPECS["soft_deleted_users"]
+    assert users.set_clause and "NOT LIKE" in users.where
@@ -0,0 +1,215 @@
+"""
+Tests for the staged BCW image sync pipeline.
+v1.0.0: Content dedup, S3 skip, off-loop parsing, stage bounds, bulk rows
+v1.1.0: Per-SKU keys with server-side copies, read back by both S3 listers
+"""
+import threading
+from datetime import datetime
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from app.api.routes.admin import list_bcw_images
+from app.jobs import bcw_image_sync
+from app.jobs.bcw_image_sync import (
+    BCWImagePipeline,
+    ImageResult,
+    ImageSyncConfig,
+    bulk_image_rows,
+)
+
+MEDIA = "https://www.bcwsupplies.com/media/catalog/product"
+SHARED_IMAGE = b"\xff\xd8 shared sleeve diagram"
+
+
+def _page(*images):
+    return "<html>" + "".join(f'<img src="{MEDIA}/{name}">' for name in images) + "</html>"
+
+
+PAGES = {
+    "/p/a": _page("1-box-a.jpg", "sleeve-guide.jpg"),
+    "/p/b": _page("1-box-b.jpg", "sleeve-guide-copy.jpg"),
+}
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    path = request.url.path
+    if path in PAGES:
+        return httpx.Response(200, text=PAGES[path])
+    if "sleeve-guide" in path:
+        return httpx.Response(200, content=SHARED_IMAGE)
+    return httpx.Response(200, content=b"\xff\xd8" + path.encode())
+
+
+class _Storage:
+    """In-memory bucket recording uploads, copies and HEADs."""
+
+    def __init__(self, objects=None):
+        self.objects = dict(objects or {})
+        self.uploads = []
+        self.copies = []
+        self.heads = 0
+
+    def get_public_url(self, key):
+        return f"https://cdn.test/{key}"
+
+    async def get_object_metadata(self, key):
+        self.heads += 1
+        return self.objects.get(key)
+
+    async def upload_bytes_threaded(self, content, key, content_type, metadata, **transfer):
+        self.uploads.append(key)
+        self.objects[key] = metadata
+        return self.get_public_url(key)
+
+    async def copy_object_threaded(self, source_key, key, content_type, metadata):
+        assert self.objects[source_key] == metadata
+        self.copies.append((source_key, key))
+        self.objects[key] = metadata
+        return self.get_public_url(key)
+
+
+class _S3Client:
+    """boto3 client listing a _Storage bucket, for the readers of the keys."""
+
+    def __init__(self, storage):
+        self.storage = storage
+
+    def list_objects_v2(self, Bucket, Prefix):
+        keys = sorted(k for k in self.storage.objects if k.startswith(Prefix))
+        return {"Contents": [{"Key": k, "Size": 20_000, "LastModified": datetime(2026, 1, 1)} for k in keys]}
+
+    def get_paginator(self, name):
+        return SimpleNamespace(paginate=lambda Bucket, Prefix: [self.list_objects_v2(Bucket, Prefix)])
+
+
+def _pipeline(storage, **config):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(_handler), base_url="https://www.bcwsupplies.com")
+    return BCWImagePipeline(client, storage, ImageSyncConfig(page_interval_seconds=0, **config))
+
+
+async def _sync_both(storage):
+    pipeline = _pipeline(storage)
+    a = await pipeline.process("1-BOX-A", "MDM-A", "https://www.bcwsupplies.com/p/a")
+    b = await pipeline.process("1-BOX-B", "MDM-B", "https://www.bcwsupplies.com/p/b")
+    return pipeline, a, b
+
+
+async def test_shared_images_upload_once_and_are_copied_under_each_sku():
+    storage = _Storage()
+    pipeline, a, b = await _sync_both(storage)
+
+    assert storage.uploads == [
+        "bcw-products/MDM-A/00_1-box-a.jpg", "bcw-products/MDM-A/01_1-box-a.jpg", "bcw-products/MDM-B/00_1-box-b.jpg",
+    ]
+    assert storage.copies == [("bcw-products/MDM-A/01_1-box-a.jpg", "bcw-products/MDM-B/01_1-box-b.jpg")]
+    assert b.image_urls[1] == "https://cdn.test/bcw-products/MDM-B/01_1-box-b.jpg"
+    assert (a.images_uploaded, a.images_reused) == (2, 0)
+    assert (b.images_uploaded, b.images_reused) == (1, 1)
+    assert pipeline.metrics()["dedup_hits"]["run"] == 1
+
+
+async def test_concurrent_products_wait_for_the_first_upload_of_shared_content():
+    import asyncio
+
+    storage = _Storage()
+    pipeline = _pipeline(storage)
+    await asyncio.gather(*(
+        pipeline.process(f"1-BOX-{s}", f"MDM-{s}", f"https://www.bcwsupplies.com/p/{s.lower()}")
+        for s in ("A", "B")
+    ))
+
+    assert len(storage.uploads) == 3 and len(storage.copies) == 1
+
+
+async def test_failed_shared_upload_is_retried_by_the_next_product():
+    storage = _Storage()
+    upload = storage.upload_bytes_threaded
+
+    async def flaky_upload(content, key, **kwargs):
+        if key == "bcw-products/MDM-A/01_1-box-a.jpg":
+            return None
+        return await upload(content, key, **kwargs)
+
+    storage.upload_bytes_threaded = flaky_upload
+    pipeline, a, b = await _sync_both(storage)
+
+    assert a.image_urls == ["https://cdn.test/bcw-products/MDM-A/00_1-box-a.jpg"]
+    assert storage.copies == [] and "bcw-products/MDM-B/01_1-box-b.jpg" in storage.uploads
+    assert pipeline.metrics()["upload"]["failed"] == 1
+
+
+async def test_both_s3_listers_group_every_image_under_its_sku(monkeypatch):
+    from app.migrations import bcw_populate_images
+
+    storage = _Storage()
+    await _sync_both(storage)
+    s3 = _S3Client(storage)
+
+    images = bcw_populate_images.get_s3_images_for_product(s3, "MDM-B")
+    assert [i["filename"] for i in images] == ["00_1-box-b.jpg", "01_1-box-b.jpg"]
+
+    fake_storage = SimpleNamespace(
+        is_configured=lambda: True, aws_access_key="k", aws_secret_key="s", aws_region="us-east-2", s3_bucket="b",
+    )
+    monkeypatch.setattr("app.services.storage.StorageService", lambda: fake_storage)
+    monkeypatch.setattr("boto3.client", lambda *args, **kwargs: s3)
+    listing = await list_bcw_images(current_user=None)
+    assert listing["total_skus"] == 2 and listing["total_images"] == 4
+    assert sorted(listing["images_by_sku"]) == ["MDM-A", "MDM-B"]
+
+
+async def test_images_already_in_s3_are_not_uploaded_again():
+    storage = _Storage()
+    await _pipeline(storage).process("1-BOX-A", "MDM-A", "https://www.bcwsupplies.com/p/a")
+
+    rerun = _Storage(objects=storage.objects)
+    result = await _pipeline(rerun).process("1-BOX-A", "MDM-A", "https://www.bcwsupplies.com/p/a")
+
+    assert rerun.uploads == [] and result.images_reused == 2
+    assert result.primary_image_url.endswith("00_1-box-a.jpg")
+
+
+async def test_parse_runs_off_the_event_loop(monkeypatch):
+    parse_threads = []
+    extract = bcw_image_sync.extract_image_urls
+
+    def recording_extract(html, sku):
+        parse_threads.append(threading.current_thread())
+        return extract(html, sku)
+
+    monkeypatch.setattr(bcw_image_sync, "extract_image_urls", recording_extract)
+    await _pipeline(_Storage()).process("1-BOX-A", "MDM-A", "https://www.bcwsupplies.com/p/a")
+
+    assert parse_threads and parse_threads[0] is not threading.main_thread()
+
+
+async def test_stages_stay_within_their_concurrency():
+    import asyncio
+
+    pipeline = _pipeline(_Storage(), download_concurrency=1, page_concurrency=2)
+    await asyncio.gather(*(
+        pipeline.process(f"1-BOX-{s}", f"MDM-{s}", f"https://www.bcwsupplies.com/p/{s.lower()}")
+        for s in ("A", "B")
+    ))
+
+    metrics = pipeline.metrics()
+    assert metrics["download"]["peak_in_flight"] == 1
+    assert metrics["page"]["completed"] == 2 and metrics["download"]["completed"] == 4
+    assert metrics["upload"]["bytes"] > 0
+
+
+def test_bulk_rows_write_each_product_image_once():
+    result = ImageResult("S", "MDM-S", 3, 2, "u0", image_urls=["u0", "shared", "shared"])
+    no_primary = ImageResult("T", "MDM-T", 1, 0, None, image_urls=["shared"])
+
+    products, images = bulk_image_rows([result, no_primary])
+
+    assert products == {"skus": ["MDM-S"], "urls": ["u0"], "galleries": ['["shared"]']}
+    assert images == {"skus": ["MDM-S", "MDM-S"], "urls": ["u0", "shared"], "positions": [0, 1]}
+
+
+@pytest.mark.parametrize("url,ext", [("x/a.PNG?v=2", "png"), ("x/a.bin", "jpg")])
+def test_image_extension(url, ext):
+    assert bcw_image_sync.image_extension(url) == ext
@@ -0,0 +1,35 @@
+"""
+Tests for the benchmark harness (catalog generator and regression check).
+v1.0.0: Synthetic catalogs and JSON results history
+"""
+from benchmarks.catalog import CHUNK_SIZE, gcd_rows, scale_value
+from benchmarks.run import find_regressions, previous_result
+
+
+def test_scale_labels():
+    assert scale_value("10k") == 10_000
+    assert scale_value("1M") == 1_000_000
+    assert scale_value("2500") == 2500
+
+
+def test_catalog_is_chunked_and_deterministic():
+    chunks = list(gcd_rows(CHUNK_SIZE + 5))
+    assert [len(c) for c in chunks] == [CHUNK_SIZE, 5]
+    assert chunks[1][-1]["gcd_id"] == CHUNK_SIZE + 5
+    assert next(gcd_rows(3))[0] == next(gcd_rows(3))[0]
+
+
+def test_regressions_compare_against_same_host_only():
+    history = [
+        {"host": "a", "results": [{"case": "x", "scale": "10k", "records_per_sec": 1000.0, "rss_growth_mb": 10.0}]},
+        {"host": "b", "results": [{"case": "x", "scale": "10k", "records_per_sec": 10.0, "rss_growth_mb": 1.0}]},
+    ]
+    previous = previous_result(history, "a", "x", "10k")
+    assert previous["records_per_sec"] == 1000.0
+
+    slower = {"records_per_sec": 700.0, "rss_growth_mb": 10.0}
+    assert len(find_regressions(slower, previous, threshold=0.15)) == 1
+    within_noise = {"records_per_sec": 900.0, "rss_growth_mb": 14.0}
+    assert find_regressions(within_noise, previous, threshold=0.15) == []
+    bloated = {"records_per_sec": 1000.0, "rss_growth_mb": 40.0}
+    assert find_regressions(bloated, previous)[0].startswith("rss growth")
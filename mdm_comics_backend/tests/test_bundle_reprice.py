@@ -0,0 +1,177 @@
+"""
+Tests for set-based bundle repricing.
+v1.0.0: Reprice pass parameters, SQL shape, admin price-write trigger
+v1.1.0: Admin-set item prices/costs survive repricing; product API PATCH reprices too
+v1.1.1: Bulk repricing can reset override flags first
+"""
+import os
+from decimal import Decimal
+from types import SimpleNamespace
+
+os.environ.setdefault("SECRET_KEY", "test-secret-key-for-unit-tests-only")
+
+from app.api.routes import admin_bundles
+from app.api.routes import products as product_routes
+from app.core import response_cache
+from app.api.routes.admin import ProductUpdateRequest, update_product
+from app.schemas.product import ProductUpdate
+from app.models.bundle import BundleItem
+from app.schemas.bundle import BundleItemCreate, BundleItemUpdate, BundleRepriceRequest
+from app.services.bundle_service import CLEAR_ITEM_OVERRIDES_SQL, REPRICE_BUNDLES_SQL, BundleService
+from tests.conftest import FakeResult, FakeSession
+
+
+class _Session(FakeSession):
+    def __init__(self, product=None):
+        super().__init__()
+        self.product = product
+        self.reprice_params = []
+        self.cleared_params = []
+
+    def respond(self, sql, params):
+        if sql == str(CLEAR_ITEM_OVERRIDES_SQL):
+            assert not self.reprice_params, "overrides must be cleared before repricing"
+            self.cleared_params.append(params)
+            return FakeResult(rowcount=2)
+        if sql == str(REPRICE_BUNDLES_SQL):
+            self.reprice_params.append(params)
+            return FakeResult([SimpleNamespace(bundles_checked=3, items_refreshed=4, repriced_ids=[5, 9])])
+        return FakeResult(scalar=self.product)
+
+
+async def test_reprice_passes_deduplicated_product_ids_and_reports_changed_bundles():
+    db = _Session()
+
+    result = await BundleService.reprice_for_products(db, [7, 3, 7])
+
+    assert db.reprice_params == [{"product_ids": [3, 7]}]
+    assert result == {"bundles_checked": 3, "items_refreshed": 4, "bundles_repriced": 2, "bundle_ids": [5, 9]}
+    assert db.commits == 0  # caller owns the transaction
+
+
+async def test_reprice_all_and_empty_selection():
+    db = _Session()
+
+    await BundleService.reprice_for_products(db)
+    assert db.reprice_params == [{"product_ids": None}]
+
+    assert (await BundleService.reprice_for_products(db, []))["bundles_checked"] == 0
+    assert len(db.reprice_params) == 1
+
+
+def test_reprice_is_one_statement_locking_bundles_in_id_order():
+    sql = REPRICE_BUNDLES_SQL.text
+    assert "ORDER BY b.id\n        FOR UPDATE OF b" in sql
+    assert "b.status <> 'ARCHIVED'" in sql
+    # items of changed products take the values add_item() snapshots
+    assert "COALESCE(p.price, bi.unit_price)" in sql and "COALESCE(p.original_price, bi.unit_cost)" in sql
+    # totals read the fresh values, not the (not yet visible) updated items
+    assert "SUM(f.unit_cost * f.quantity)" in sql and "SUM(f.unit_price * f.quantity)" in sql
+    # unchanged rows are not rewritten
+    assert sql.count("IS DISTINCT FROM") == 2
+    assert sql.count("GREATEST(-999.99, LEAST(999.99,") == 2
+
+
+async def test_admin_price_edit_reprices_bundles_but_other_edits_do_not():
+    product = SimpleNamespace(id=12, deleted_at=None, price=10, name="Saga #1")
+    db = _Session(product)
+    admin = SimpleNamespace(id=1)
+
+    await update_product(12, ProductUpdateRequest(name="Saga #1 (Variant)"), admin, db)
+    assert db.reprice_params == []
+
+    await update_product(12, ProductUpdateRequest(price=12.5), admin, db)
+    assert db.reprice_params == [{"product_ids": [12]}]
+    assert product.price == 12.5 and db.commits == 2
+
+
+async def test_product_api_price_edit_reprices_bundles_and_drops_their_cache(monkeypatch):
+    product = SimpleNamespace(id=12, price=10, original_price=5)
+    db = _Session(product)
+    admin = SimpleNamespace(id=1, email="admin@example.com")
+    request = SimpleNamespace(client=None, method="PATCH", path_params={"product_id": 12})
+
+    await product_routes.update_product(request, 12, ProductUpdate(stock=3), db, admin)
+    assert db.reprice_params == []
+
+    await product_routes.update_product(request, 12, ProductUpdate(original_price=6.5), db, admin)
+    assert db.reprice_params == [{"product_ids": [12]}]
+
+    dropped = []
+
+    async def invalidate_tags(*tags):
+        dropped.extend(tags)
+
+    monkeypatch.setattr(response_cache, "invalidate_tags", invalidate_tags)
+    route = next(r for r in product_routes.router.routes if r.path == "/{product_id}" and "PATCH" in r.methods)
+    async for _ in route.dependencies[0].dependency(request):
+        pass
+    assert dropped == ["products", "product:12", "bundles"]
+
+
+class _ItemSession(FakeSession):
+    """Serves add_item()/update_item() lookups in call order."""
+
+    def __init__(self, *answers):
+        super().__init__()
+        self.answers = list(answers)
+
+    def respond(self, sql, params):
+        return self.answers.pop(0)
+
+
+PRODUCT = SimpleNamespace(id=4, price=Decimal("20.00"), original_price=Decimal("11.00"))
+
+
+async def test_admin_set_item_price_is_an_override_and_product_fallback_is_not():
+    db = _ItemSession(*(FakeResult(scalar=answer) for answer in (PRODUCT, None, PRODUCT, None)))
+
+    custom = await BundleService.add_item(db, 1, BundleItemCreate(product_id=4, quantity=2, unit_price=Decimal("15.00")))
+    default = await BundleService.add_item(db, 2, BundleItemCreate(product_id=4))
+
+    assert (custom.unit_price, custom.line_price, custom.unit_cost) == (Decimal("15.00"), Decimal("30.00"), Decimal("11.00"))
+    assert (custom.price_override, custom.cost_override) == (True, False)
+    assert (default.unit_price, default.price_override, default.cost_override) == (Decimal("20.00"), False, False)
+
+
+async def test_clearing_an_item_price_reverts_to_the_product_and_drops_the_override():
+    item = BundleItem(id=9, product_id=4, quantity=3, unit_price=Decimal("15.00"), unit_cost=Decimal("8.00"),
+                      line_price=Decimal("45.00"), line_cost=Decimal("24.00"), price_override=True, cost_override=True)
+    db = _ItemSession(FakeResult(scalar=item), FakeResult([PRODUCT]))
+
+    await BundleService.update_item(db, 9, BundleItemUpdate(unit_price=None, unit_cost=Decimal("7.00")))
+
+    assert (item.unit_price, item.line_price, item.price_override) == (Decimal("20.00"), Decimal("60.00"), False)
+    assert (item.unit_cost, item.line_cost, item.cost_override) == (Decimal("7.00"), Decimal("21.00"), True)
+
+
+def test_overridden_item_values_are_kept_by_the_reprice_statement():
+    sql = REPRICE_BUNDLES_SQL.text
+    price = sql[sql.index("CASE WHEN NOT bi.price_override"):sql.index("AS unit_price,")]
+    cost = sql[sql.index("CASE WHEN NOT bi.cost_override"):sql.index("AS unit_cost")]
+    assert price.endswith("ELSE bi.unit_price END ") and "THEN COALESCE(p.price, bi.unit_price)" in price
+    assert cost.endswith("ELSE bi.unit_cost END ") and "THEN COALESCE(p.original_price, bi.unit_cost)" in cost
+
+
+async def test_bulk_reprice_keeps_overrides_unless_asked_to_reset_them():
+    db = _Session()
+    admin = SimpleNamespace(id=1)
+
+    result = await admin_bundles.reprice_bundles(BundleRepriceRequest(product_ids=[7]), db, admin)
+    assert db.cleared_params == [] and db.reprice_params == [{"product_ids": [7]}]
+    assert result["bundles_repriced"] == 2 and db.commits == 1
+
+    db = _Session()
+    await admin_bundles.reprice_bundles(BundleRepriceRequest(product_ids=[7, 3], reset_overrides=True), db, admin)
+    # the same selection is released, then repriced from product values
+    assert db.cleared_params == db.reprice_params == [{"product_ids": [3, 7]}]
+
+    db = _Session()
+    await BundleService.reprice_for_products(db, reset_overrides=True)
+    assert db.cleared_params == [{"product_ids": None}]
+
+
+def test_clearing_overrides_skips_archived_bundles_and_unflagged_items():
+    sql = CLEAR_ITEM_OVERRIDES_SQL.text
+    assert "SET price_override = FALSE,\n        cost_override = FALSE" in sql
+    assert "b.status <> 'ARCHIVED'" in sql and "(bi.price_override OR bi.cost_override)" in sql
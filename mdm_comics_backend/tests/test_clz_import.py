@@ -0,0 +1,240 @@
+"""
+Tests for the bulk CLZ import pipeline.
+v1.0.0: CSV staging records, last-row-wins outcome classification, report rows, dry-run job
+"""
+import csv
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+from app.api.routes import clz_import
+from app.api.routes.clz_import import (
+    CLASSIFY_MATCHED_SQL,
+    CLASSIFY_UNMATCHED_SQL,
+    MATCH_BY_SERIES_SQL,
+    MATCH_BY_UPC_SQL,
+    SKIP_UNKEYED_SQL,
+    STAGING_DATA_COLUMNS,
+    _assign_outcomes,
+    _build_report,
+    _resolve_matches,
+    get_import_report,
+    parse_csv_records,
+    run_bulk_import_job,
+)
+from tests.conftest import FakeResult, FakeSession
+
+HEADER = ["Series", "Issue", "Cover Year", "Cover Price", "Barcode", "Key", "Variant Description", "Variant"]
+
+# comic_issues the staged rows are matched against
+ISSUES = {
+    100: {"upc": "75960608936800111", "series_sort_name": "X-Men", "number": "1", "year": 1991},
+    200: {"upc": None, "series_sort_name": "Saga", "number": "1", "year": 2012},
+}
+
+
+def _write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADER)
+        writer.writerows(rows)
+    return path
+
+
+class _StagingSession(FakeSession):
+    """Emulates the clz_staging statements over an in-memory table."""
+
+    def __init__(self):
+        super().__init__()
+        self.rows = []
+
+    async def connection(self):
+        return self
+
+    async def get_raw_connection(self):
+        return SimpleNamespace(driver_connection=self)
+
+    async def copy_records_to_table(self, table, records, columns):
+        self.rows = [dict(zip(columns, r), matched_issue_id=None, match_method=None, outcome=None)
+                     for r in records]
+
+    def respond(self, sql, params):
+        if sql == str(MATCH_BY_UPC_SQL):
+            for row in self.rows:
+                hit = min((i for i, c in ISSUES.items() if row["upc"] and c["upc"] == row["upc"]), default=None)
+                if hit:
+                    row.update(matched_issue_id=hit, match_method="upc")
+        elif sql == str(MATCH_BY_SERIES_SQL):
+            for row in self._open(matched_issue_id=None):
+                hit = min((i for i, c in ISSUES.items()
+                           if c["series_sort_name"].lower() == row["series_key"] and c["number"] == row["number"]
+                           and row["year"] in (None, c["year"])), default=None)
+                if hit:
+                    row.update(matched_issue_id=hit, match_method="series_issue")
+        elif sql == str(SKIP_UNKEYED_SQL):
+            for row in self.rows:
+                if row["series_key"] is None or row["number"] is None:
+                    row["outcome"] = "skipped"
+        elif sql == str(CLASSIFY_MATCHED_SQL):
+            self._last_row_wins([r for r in self._open() if r["matched_issue_id"]],
+                                lambda r: r["matched_issue_id"], params["matched_outcome"])
+        elif sql == str(CLASSIFY_UNMATCHED_SQL):
+            self._last_row_wins([r for r in self._open() if not r["matched_issue_id"]],
+                                lambda r: (r["series_key"], r["number"], r["year"] or 0), params["unmatched_outcome"])
+        elif "UPDATE comic_issues ci" in sql or "INSERT INTO comic_issues" in sql:
+            outcome = "update" if "UPDATE" in sql.split()[0] else "create"
+            return FakeResult(rowcount=sum(r["outcome"] == outcome for r in self.rows))
+        elif "FROM clz_staging s" in sql and sql.lstrip().startswith("SELECT"):
+            return FakeResult(SimpleNamespace(diff={"price": [None, r["price"]]} if r["matched_issue_id"] else None, **r)
+                              for r in self.rows)
+        return FakeResult()
+
+    def _open(self, **match):
+        return [r for r in self.rows if r["outcome"] is None and all(r[k] == v for k, v in match.items())]
+
+    @staticmethod
+    def _last_row_wins(rows, key, outcome):
+        winners = {}
+        for row in rows:
+            winners[key(row)] = max(winners.get(key(row), 0), row["row_num"])
+        for row in rows:
+            row["outcome"] = outcome if row["row_num"] == winners[key(row)] else "superseded"
+
+
+def test_parse_csv_records_lays_out_staging_columns(tmp_path):
+    path = _write_csv(tmp_path / "dump.csv", [
+        ["  X-Men ", "1", "1991", "$1.75", "7-59606-08936-8 00111", "Yes", "", "Newsstand"],
+        ["", "2", "abc", "n/a", "", "", "", ""],
+        ["Saga", "1", "2012", "", "", "", "", ""],
+    ])
+
+    records = parse_csv_records(path)
+    assert [r[:2] for r in records] == [(1, "x-men"), (2, None), (3, "saga")]
+
+    first = dict(zip(STAGING_DATA_COLUMNS, records[0][2:]))
+    assert first["series_sort_name"] == "X-Men" and first["number"] == "1"
+    assert (first["year"], first["price"], first["upc"]) == (1991, 1.75, "75960608936800111")
+    assert first["is_key_issue"] is True and first["variant_name"] == "Newsstand"
+    assert '"Variant": "Newsstand"' in first["clz_raw_data"]
+
+    second = dict(zip(STAGING_DATA_COLUMNS, records[1][2:]))
+    assert (second["year"], second["price"], second["upc"]) == (None, None, None)
+
+    assert len(parse_csv_records(path, limit=2)) == 2
+
+
+async def _stage(records, mode):
+    db = _StagingSession()
+    await db.copy_records_to_table("clz_staging", records, ["row_num", "series_key", *STAGING_DATA_COLUMNS])
+    await _resolve_matches(db)
+    await _assign_outcomes(db, mode)
+    return db
+
+
+def _records(tmp_path):
+    return parse_csv_records(_write_csv(tmp_path / "dump.csv", [
+        ["X-Men", "1", "", "", "75960608936800111", "", "", ""],   # upc -> 100
+        ["Saga", "1", "2012", "2.99", "", "", "", ""],              # series -> 200
+        ["x-men ", "1", "1991", "", "", "", "", ""],                # series -> 100, last for 100
+        ["Saga", "", "", "", "", "", "", ""],                       # no number
+        ["Paper Girls", "1", "2015", "", "", "", "", ""],           # new
+        ["Paper Girls", "1", "2015", "3.99", "", "", "", ""],       # new, last for the key
+        ["Paper Girls", "1", "", "", "", "", "", ""],               # new, yearless key
+    ]))
+
+
+async def test_last_row_wins_per_issue_and_per_new_key(tmp_path):
+    db = await _stage(_records(tmp_path), "full")
+
+    assert [(r["matched_issue_id"], r["match_method"], r["outcome"]) for r in db.rows] == [
+        (100, "upc", "superseded"),
+        (200, "series_issue", "update"),
+        (100, "series_issue", "update"),
+        (None, None, "skipped"),
+        (None, None, "superseded"),
+        (None, None, "create"),
+        (None, None, "create"),
+    ]
+
+
+async def test_mode_decides_what_winners_become(tmp_path):
+    update_only = await _stage(_records(tmp_path), "update")
+    create_only = await _stage(_records(tmp_path), "create")
+
+    assert [r["outcome"] for r in update_only.rows] == [
+        "superseded", "update", "update", "skipped", "superseded", "not_found", "not_found",
+    ]
+    assert [r["outcome"] for r in create_only.rows] == [
+        "superseded", "matched", "matched", "skipped", "superseded", "create", "create",
+    ]
+
+
+def test_classification_keeps_the_highest_row_number():
+    for sql in (CLASSIFY_MATCHED_SQL.text, CLASSIFY_UNMATCHED_SQL.text):
+        assert "MAX(row_num) AS winner" in sql
+        assert "THEN" in sql and "ELSE 'superseded' END" in sql
+        assert "AND s.outcome IS NULL" in sql
+    assert "GROUP BY series_key, number, COALESCE(year, 0)" in CLASSIFY_UNMATCHED_SQL.text
+
+
+async def test_report_rows_carry_outcome_and_only_dry_runs_diff(tmp_path):
+    db = await _stage(_records(tmp_path), "full")
+
+    rows = await _build_report(db, include_diff=True)
+    assert rows[1] == {
+        "row": 2, "series": "Saga", "issue": "1", "upc": None, "issue_id": 200,
+        "match_method": "series_issue", "outcome": "update", "diff": {"price": [None, 2.99]},
+    }
+    assert rows[4]["diff"] is None and rows[4]["outcome"] == "superseded"
+    assert "jsonb_build_array(ci.price, s.price)" in db.statements[-1]
+    assert "clz_raw_data" not in db.statements[-1]
+
+    await _build_report(db, include_diff=False)
+    assert "NULL::jsonb" in db.statements[-1] and "jsonb_build_array" not in db.statements[-1]
+
+
+def _job_session(tmp_path, monkeypatch):
+    db = _StagingSession()
+    db.threaded = []
+
+    async def to_thread(func, *args):
+        db.threaded.append(func)
+        return func(*args)
+
+    @asynccontextmanager
+    async def session():
+        yield db
+
+    _records(tmp_path)
+    monkeypatch.setattr(clz_import, "CSV_PATH", tmp_path / "dump.csv")
+    monkeypatch.setattr(clz_import.asyncio, "to_thread", to_thread)
+    monkeypatch.setattr(clz_import, "get_db_session", session)
+    return db
+
+
+async def test_dry_run_parses_off_the_loop_rolls_back_and_serves_the_report(tmp_path, monkeypatch):
+    db = _job_session(tmp_path, monkeypatch)
+
+    await run_bulk_import_job(limit=0, execute=False, mode="full")
+
+    assert db.threaded == [parse_csv_records]
+    assert db.rolled_back and not db.committed
+    assert not any("INSERT INTO comic_issues" in s for s in db.statements)
+    assert clz_import.import_status["errors"] == []
+    assert clz_import.import_status["stats"] == {
+        "rows": 7, "matched": 2, "updated": 0, "created": 0, "not_found": 2, "skipped": 1, "superseded": 2,
+    }
+
+    page = await get_import_report(outcome="superseded", offset=1, limit=10)
+    assert page["total"] == 2 and [r["row"] for r in page["rows"]] == [5]
+    assert (await get_import_report(outcome=None, offset=0, limit=3))["total"] == 7
+
+
+async def test_execute_applies_winners_once_and_commits(tmp_path, monkeypatch):
+    db = _job_session(tmp_path, monkeypatch)
+
+    await run_bulk_import_job(limit=0, execute=True, mode="full")
+
+    assert db.committed and not db.rolled_back
+    stats = clz_import.import_status["stats"]
+    assert (stats["updated"], stats["created"], stats["superseded"]) == (2, 2, 2)
+    assert "NULL::jsonb" in db.statements[-1]
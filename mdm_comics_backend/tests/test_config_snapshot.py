@@ -0,0 +1,137 @@
+"""
+Tests for the shared configuration snapshot.
+v1.0.0: One-query snapshot of feature flags and site settings
+v1.0.1: Notification reloads are held until done; non-object flag configs
+"""
+import asyncio
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from app.core import config_snapshot
+from app.core.feature_flags import FeatureFlags
+from app.models.carrier import CarrierCode
+from app.services.site_settings import SiteSettingsService, get_branding_context
+
+
+def _flag(module, feature, enabled, config="{}"):
+    return SimpleNamespace(
+        kind="flag", key=f"{module}:{feature}", module=module, feature=feature,
+        is_enabled=enabled, value=config, category=None,
+    )
+
+
+def _setting(key, value, category="general"):
+    return SimpleNamespace(kind="setting", key=key, module=None, feature=None, is_enabled=None, value=value, category=category)
+
+
+class _Session:
+    def __init__(self, rows):
+        self.rows, self.queries = rows, 0
+
+    async def execute(self, statement, params=None):
+        self.queries += 1
+        return SimpleNamespace(fetchall=lambda: list(self.rows))
+
+
+@pytest.fixture(autouse=True)
+def fresh_snapshot(monkeypatch):
+    monkeypatch.setattr(config_snapshot, "_snapshot", config_snapshot.EMPTY_SNAPSHOT)
+    monkeypatch.setattr(config_snapshot, "_stale", True)
+    monkeypatch.setattr(config_snapshot, "_listening", False)
+    monkeypatch.setattr(config_snapshot, "_reload_lock", None)
+
+
+@pytest.fixture
+def db():
+    return _Session([
+        _flag("shipping", "ups", True, '{"sandbox_mode": true}'),
+        _flag("shipping", "usps", False),
+        _setting("site_logo_url", "https://cdn/logo.png", "branding"),
+        _setting("favicon_url", "", "branding"),
+        _setting("support_email", "help@example.com"),
+    ])
+
+
+@pytest.mark.asyncio
+async def test_flags_and_settings_share_one_query(db):
+    assert await FeatureFlags.is_carrier_enabled(CarrierCode.UPS, db)
+    assert not await FeatureFlags.is_enabled("shipping", "usps", db)
+    assert await FeatureFlags.get_enabled_carriers(db) == [CarrierCode.UPS]
+    assert await FeatureFlags.get_carrier_config(CarrierCode.UPS, db) == {"sandbox_mode": True}
+
+    service = SiteSettingsService(db)
+    assert await service.get("support_email") == "help@example.com"
+    assert await service.get("favicon_url", "fallback") == "fallback"
+    branding = await get_branding_context(db)
+    assert branding["site_logo_url"] == "https://cdn/logo.png"
+    assert branding["favicon_url"] == ""
+
+    assert db.queries == 1
+
+
+@pytest.mark.asyncio
+async def test_snapshot_is_immutable_and_swapped_on_invalidate(db):
+    first = await config_snapshot.get_snapshot(db)
+    with pytest.raises(TypeError):
+        first.settings["support_email"] = "x"
+    with pytest.raises(TypeError):
+        first.flags["shipping:ups"].config_json["sandbox_mode"] = False
+
+    db.rows = [_setting("support_email", "new@example.com")]
+    assert (await config_snapshot.get_snapshot(db)) is first
+
+    FeatureFlags.invalidate_cache()
+    second = await config_snapshot.get_snapshot(db)
+    assert second.version == first.version + 1
+    assert second.setting("support_email") == "new@example.com"
+    # Readers holding the old snapshot keep a consistent view
+    assert first.setting("support_email") == "help@example.com"
+
+
+@pytest.mark.asyncio
+async def test_failed_reload_keeps_previous_snapshot(db):
+    first = await config_snapshot.get_snapshot(db)
+
+    class _Broken:
+        async def execute(self, *args, **kwargs):
+            raise ConnectionError("db down")
+
+    config_snapshot.invalidate()
+    assert await config_snapshot.get_snapshot(_Broken()) is first
+
+
+def test_notify_triggers_cover_both_tables():
+    creates = [s for s in config_snapshot.SCHEMA_DDL if s.startswith("CREATE TRIGGER")]
+    assert [s.split(" ON ")[1].split()[0] for s in creates] == ["feature_flags", "site_settings"]
+    assert all("FOR EACH STATEMENT" in s and "TRUNCATE" in s for s in creates)
+
+
+@pytest.mark.asyncio
+async def test_flag_config_that_is_not_an_object_reads_as_empty(db):
+    db.rows = [_flag("shipping", "ups", True, "[1, 2]"), _flag("shipping", "usps", True, "null")]
+
+    snapshot = await config_snapshot.get_snapshot(db)
+
+    assert snapshot.flags["shipping:ups"].config_json == {}
+    assert snapshot.flags["shipping:usps"].config_json == {}
+
+
+@pytest.mark.asyncio
+async def test_notification_reload_is_held_until_done_and_failures_are_logged(monkeypatch, caplog):
+    async def reload():
+        raise ConnectionError("db down")
+
+    monkeypatch.setattr(config_snapshot, "reload", reload)
+    monkeypatch.setattr(config_snapshot, "_reload_tasks", set())
+
+    with caplog.at_level(logging.WARNING, logger=config_snapshot.__name__):
+        config_snapshot._on_notify(None, 1, config_snapshot.NOTIFY_CHANNEL, "site_settings")
+        task, = config_snapshot._reload_tasks
+        await task
+        await asyncio.sleep(0)  # done callbacks run on the next loop pass
+
+    assert config_snapshot._reload_tasks == set()
+    assert config_snapshot._stale
+    assert "reload after notification failed: db down" in caplog.text
@@ -0,0 +1,204 @@
+"""
+Tests for bulk cover ingestion helpers.
+v1.1.0: In-memory series resolution and worker-process hashing
+v1.2.0: Containment resolution as in match_to_comic_issue; files read once and streamed
+"""
+import hashlib
+import io
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+from PIL import Image
+
+from app.services import cover_ingestion
+from app.services.cover_ingestion import (
+    CoverIngestionService,
+    CoverMetadata,
+    IssueCandidate,
+    SeriesCandidate,
+    SeriesNameIndex,
+    _hash_and_thumbnail,
+)
+
+
+def _issue(issue_id, series_id, number, publisher="Marvel Comics"):
+    return IssueCandidate(
+        id=issue_id, series_id=series_id, number=number, publisher_name=publisher,
+        image=None, price_loose=None, price_cgc_98=None, pricecharting_id=None,
+    )
+
+
+SERIES = [
+    SeriesCandidate(1, "Deadpool", 5, "Marvel"),
+    SeriesCandidate(2, "Deadpool", 6, "Marvel"),
+    SeriesCandidate(3, "Batman: The Dark Knight", 1, "DC"),
+    SeriesCandidate(4, "Batman", 3, "DC"),
+]
+ISSUES = [_issue(10, 1, "1"), _issue(11, 2, "1"), _issue(12, 3, "7", "DC Comics"), _issue(13, 4, "1", "DC Comics")]
+
+
+def _index():
+    index = SeriesNameIndex(SERIES)
+    for issue in ISSUES:
+        index._issues.setdefault((issue.series_id, issue.number), []).append(issue)
+    index._loaded_series.update({1, 2, 3, 4})
+    return index
+
+
+def _cover_bytes(color="red"):
+    buf = io.BytesIO()
+    Image.new("RGB", (900, 1350), color).save(buf, format="JPEG")
+    return buf.getvalue()
+
+
+def test_resolve_series_is_case_folded_containment():
+    index = _index()
+    assert [c.series_id for c in index.resolve_series("deadpool")] == [1, 2]
+    assert [c.series_id for c in index.resolve_series("BATMAN")] == [3, 4]
+    assert [c.series_id for c in index.resolve_series("dark knight")] == [3]
+    # containment, not token matching: words out of order select nothing
+    assert index.resolve_series("Batman Dark Knight") == []
+    assert index.resolve_series("") == []
+
+
+def test_exact_series_volume_issue():
+    index = _index()
+    metadata = CoverMetadata(publisher="Marvel", series="Deadpool", volume=5, issue_number="1")
+
+    match, score, method = index.match(metadata, index.resolve_series("deadpool"))
+    assert match[1].id == 10
+    assert (score, method) == (9, "exact_series_volume_issue")
+
+
+def test_series_issue_prefers_publisher_when_ambiguous():
+    index = _index()
+    metadata = CoverMetadata(publisher="Marvel", series="Deadpool", issue_number="1")
+
+    match, score, method = index.match(metadata, index.resolve_series("Deadpool"))
+    assert (score, method) == (7, "series_issue_publisher")
+
+
+def test_same_named_series_without_the_issue_does_not_hide_a_containing_one():
+    index = _index()
+    metadata = CoverMetadata(publisher="Dc", series="Batman", volume=3, issue_number="7")
+
+    match, score, method = index.match(metadata, index.resolve_series("Batman"))
+    assert match[1].id == 12
+    assert (score, method) == (8, "series_issue")
+
+
+def test_no_match_and_insufficient_data():
+    index = _index()
+    assert index.match(CoverMetadata(publisher="Marvel", series="Deadpool", issue_number="99"),
+                       index.resolve_series("Deadpool"))[2] == "no_match"
+    assert index.match(CoverMetadata(publisher="Marvel", series=""), [])[2] == "insufficient_data"
+
+
+def test_hash_and_thumbnail():
+    content = _cover_bytes()
+
+    file_hash, thumbnail = _hash_and_thumbnail(content)
+
+    assert file_hash == hashlib.md5(content).hexdigest()
+    with Image.open(io.BytesIO(thumbnail)) as thumb:
+        assert thumb.size == (300, 450)
+    assert _hash_and_thumbnail(b"not an image")[1] is None
+
+
+class _Rows:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+    def scalars(self):
+        return self
+
+
+class _BulkSession:
+    def __init__(self, queued=()):
+        self.queued = list(queued)
+
+    async def execute(self, statement, params=None):
+        sql = str(statement)
+        if "FROM comic_series" in sql:
+            return _Rows([(c.series_id, c.name, c.volume, c.publisher_name) for c in SERIES])
+        if "FROM comic_issues" in sql:
+            return _Rows([(i.id, i.series_id, i.number, i.publisher_name, None, None, None, None) for i in ISSUES])
+        return _Rows(self.queued)
+
+
+class _Storage:
+    def __init__(self):
+        self.uploads = []
+
+    def is_configured(self):
+        return True
+
+    async def upload_product_image_threaded(self, content, filename, content_type, product_type):
+        self.uploads.append((product_type, filename))
+        return SimpleNamespace(success=True, url=f"https://cdn.test/{filename}", key=filename, error=None)
+
+
+def _bulk_run(tmp_path, monkeypatch, files, queued=()):
+    """Service over a folder of covers, recording reads and queue rows."""
+    for rel, content in files.items():
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_bytes(content)
+
+    storage = _Storage()
+    run = SimpleNamespace(storage=storage, reads=[], rows=[])
+    read_bytes = Path.read_bytes
+
+    def counting_read(path):
+        run.reads.append((path.name, len(storage.uploads)))
+        return read_bytes(path)
+
+    async def insert_rows(rows_chunk, offset, result):
+        run.rows.extend(rows_chunk)
+        result.queued_for_review += len(rows_chunk)
+
+    monkeypatch.setattr(Path, "read_bytes", counting_read)
+    monkeypatch.setattr(cover_ingestion, "ProcessPoolExecutor", ThreadPoolExecutor)
+    run.service = CoverIngestionService(_BulkSession([hashlib.md5(c).hexdigest() for c in queued]), storage)
+    monkeypatch.setattr(run.service, "_insert_queue_rows_bulk", insert_rows)
+    return run
+
+
+async def test_bulk_ingest_reads_each_file_once_and_streams_uploads(tmp_path, monkeypatch):
+    files = {
+        "marvel/Deadpool/Deadpool v5/Deadpool v5 1/deadpool v5 1.jpg": _cover_bytes("red"),
+        "marvel/Deadpool/Deadpool v6/Deadpool v6 1/deadpool v6 1.jpg": _cover_bytes("yellow"),
+        "dc/Batman/Batman v3/Batman v3 7/batman v3 7.jpg": _cover_bytes("blue"),
+        "dc/Batman/Batman v3/Batman v3 1/batman v3 1.jpg": _cover_bytes("green"),
+    }
+    run = _bulk_run(tmp_path, monkeypatch, files)
+
+    result = await run.service.ingest_folder_bulk(str(tmp_path), user_id=1, max_workers=1, upload_concurrency=1)
+
+    assert sorted(name for name, _ in run.reads) == sorted(Path(rel).name for rel in files)
+    # one pool worker + one upload slot: a third file is not read before an upload
+    assert sum(uploaded == 0 for _, uploaded in run.reads) <= 2
+    assert (result.processed, result.skipped, result.queued_for_review, result.errors) == (4, 0, 4, 0)
+    assert sum(kind == "covers/thumbs" for kind, _ in run.storage.uploads) == 4
+    methods = {row["candidate_data"]["file_path"].split("/")[-1]: (row["match_method"], row["match_score"])
+               for row in run.rows}
+    assert methods["batman v3 7.jpg"] == ("series_issue", 8)
+    assert methods["deadpool v6 1.jpg"] == ("exact_series_volume_issue", 9)
+
+
+async def test_bulk_ingest_skips_queued_and_repeated_covers(tmp_path, monkeypatch):
+    red, green = _cover_bytes("red"), _cover_bytes("green")
+    run = _bulk_run(tmp_path, monkeypatch, {
+        "marvel/Deadpool/Deadpool v5/Deadpool v5 1/deadpool v5 1.jpg": red,
+        "marvel/Deadpool/Deadpool v5/Deadpool v5 1/deadpool v5 1 copy.jpg": red,
+        "dc/Batman/Batman v3/Batman v3 1/batman v3 1.jpg": green,
+    }, queued=[green])
+
+    result = await run.service.ingest_folder_bulk(str(tmp_path), user_id=1, max_workers=1, upload_concurrency=1)
+
+    assert len(run.reads) == 3
+    assert (result.processed, result.skipped, result.queued_for_review) == (3, 2, 1)
+    assert [kind for kind, _ in run.storage.uploads] == ["covers", "covers/thumbs"]
@@ -0,0 +1,73 @@
+"""
+Tests for the background cover hash queue.
+v1.1.0: Cover hashing off the Metron search path
+"""
+import asyncio
+
+import pytest
+
+from app.services import comic_cache
+from app.services.comic_cache import ComicCacheService, CoverHashQueue
+
+
+@pytest.mark.asyncio
+async def test_enqueue_deduplicates_and_hashes_latest_url(monkeypatch):
+    hashed = []
+
+    async def fake_hash(url, client=None):
+        hashed.append(url)
+        return "abcdef0123456789", "abcdef01", bytes.fromhex("abcdef0123456789")
+
+    stored = []
+
+    async def fake_flush(self):
+        async with self._flush_lock:
+            stored.extend(self._results)
+            self._results = []
+
+    monkeypatch.setattr(comic_cache, "generate_cover_hash_from_url", fake_hash)
+    monkeypatch.setattr(CoverHashQueue, "flush", fake_flush)
+
+    queue = CoverHashQueue(workers=2)
+    assert queue.enqueue(1, "http://covers/1.jpg")
+    assert not queue.enqueue(1, "http://covers/1.jpg")
+    assert not queue.enqueue(1, "http://covers/1-new.jpg")  # updates queued URL
+    assert queue.enqueue(2, "http://covers/2.jpg")
+    assert not queue.enqueue(3, None)
+    assert queue.depth == 2
+
+    await queue.join()
+    await queue.stop()
+
+    assert sorted(hashed) == ["http://covers/1-new.jpg", "http://covers/2.jpg"]
+    assert {(r["metron_id"], r["image"]) for r in stored} == {
+        (1, "http://covers/1-new.jpg"), (2, "http://covers/2.jpg"),
+    }
+    assert queue.stats["deduplicated"] == 2
+    assert queue.depth == 0
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops(monkeypatch):
+    parked = []
+
+    async def idle_worker(self):
+        # running, but never takes an item, so the queue stays full
+        parked.append(self)
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(CoverHashQueue, "_worker", idle_worker)
+    queue = CoverHashQueue(maxsize=1, workers=1)
+    assert queue.enqueue(1, "http://covers/1.jpg")
+    await asyncio.sleep(0)
+    assert not queue.enqueue(2, "http://covers/2.jpg")
+    assert queue.stats["dropped"] == 1
+    assert parked == [queue]
+    await queue.stop()
+
+
+def test_source_cover_hash_is_normalized():
+    cover_hash, prefix, hash_bytes = ComicCacheService._normalize_cover_hash(" ABCDEF0123456789 ")
+    assert (cover_hash, prefix) == ("abcdef0123456789", "abcdef01")
+    assert hash_bytes == bytes.fromhex("abcdef0123456789")
+    assert ComicCacheService._normalize_cover_hash(None) == (None, None, None)
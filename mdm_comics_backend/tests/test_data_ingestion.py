@@ -0,0 +1,121 @@
+"""
+Tests for the streaming bulk ingestion engine.
+v1.1.0: Incremental readers, COPY + merge SQL, resumable checkpoints
+"""
+import io
+import json
+from datetime import date, datetime
+
+import pytest
+
+from app.services.data_ingestion import (
+    DataIngestionService,
+    IngestionOptions,
+    _copy_text,
+    _scan_json_array,
+    _TableMeta,
+    iter_csv_records,
+    iter_json_records,
+)
+
+
+def test_json_array_scanner_handles_records_split_across_reads():
+    records = [
+        {"name": "Batman [1940]", "notes": "a, b ] c", "price": 1234.5},
+        {"name": "X-Men", "nested": {"list": [1, 2, {"k": "}"}]}},
+        {"name": "Spawn", "issue": 1},
+    ]
+    text = " \n[ " + " ,\n ".join(json.dumps(r) for r in records) + " ]\n"
+
+    for chunk_size in (1, 3, 7, 64):
+        assert list(_scan_json_array(io.StringIO(text), chunk_size=chunk_size)) == records
+
+
+def test_json_array_scanner_rejects_non_arrays():
+    with pytest.raises(ValueError):
+        list(_scan_json_array(io.StringIO('{"data": []}')))
+
+
+def test_readers_stream_csv_json_lines_and_nested_paths(tmp_path):
+    csv_path = tmp_path / "items.csv"
+    csv_path.write_text("\ufeffsku,price\nA,1.50\nB,\n", encoding="utf-8")
+    assert list(iter_csv_records(csv_path)) == [{"sku": "A", "price": "1.50"}, {"sku": "B", "price": ""}]
+
+    jsonl = tmp_path / "items.jsonl"
+    jsonl.write_text('{"sku": "A"}\n\n{"sku": "B"}\n')
+    assert [r["sku"] for r in iter_json_records(jsonl)] == ["A", "B"]
+
+    nested = tmp_path / "items.json"
+    nested.write_text(json.dumps({"data": {"items": [{"sku": "A"}, {"sku": "B"}]}}))
+    assert [r["sku"] for r in iter_json_records(nested, "data.items")] == ["A", "B"]
+
+
+def test_copy_text_renders_values_castable_by_postgres():
+    assert _copy_text(None) is None
+    assert _copy_text(True) == "true"
+    assert _copy_text(12.5) == "12.5"
+    assert _copy_text(date(2024, 1, 2)) == "2024-01-02"
+    assert _copy_text(datetime(2024, 1, 2, 3, 4)) == "2024-01-02T03:04:00"
+    assert json.loads(_copy_text({"a": [1]})) == {"a": [1]}
+
+
+def test_merge_sql_upserts_with_real_counts():
+    meta = _TableMeta(
+        name="funkos",
+        types={"id": "integer", "upc": "character varying(50)", "title": "text", "price_loose": "numeric(12,2)"},
+        unique_keys=[["id"], ["upc"]],
+    )
+    columns = meta.columns_for([{"upc": "1", "title": "Pop", "price_loose": "9.99", "junk": "x"}])
+    assert columns == ["upc", "title", "price_loose"]
+    assert meta.unique_key_within(columns) == ["upc"]
+
+    sql = meta.merge_sql(columns, ["upc"], ["title", "price_loose"])
+    assert "NULLIF(s.price_loose, '')::numeric(12,2) AS price_loose" in sql
+    assert "DISTINCT ON (upc)" in sql and "_seq DESC" in sql
+    assert "ON CONFLICT (upc) DO UPDATE SET title = EXCLUDED.title" in sql
+    assert "RETURNING (xmax = 0) AS inserted" in sql
+
+    assert "ON CONFLICT DO NOTHING" in meta.merge_sql(columns, None, [])
+
+
+class _Session:
+    def __init__(self):
+        self.commits = 0
+
+    async def commit(self):
+        self.commits += 1
+
+
+class _RecordingService(DataIngestionService):
+    """Records batches instead of merging them."""
+
+    def __init__(self):
+        super().__init__(_Session())
+        self.batches = []
+
+    async def _process_batch(self, batch, table_name, options, stats=None):
+        self.batches.append([row["sku"] for row in batch])
+        return {"inserted": len(batch), "updated": 0, "skipped": 0}
+
+
+@pytest.mark.asyncio
+async def test_checkpoints_each_batch_and_resumes_after_it():
+    records = [{"sku": f"S{i}"} for i in range(1, 8)]
+    checkpoints = []
+
+    async def save(position):
+        checkpoints.append(position)
+
+    service = _RecordingService()
+    stats = await service.ingest_records(
+        "test", records, "funkos", IngestionOptions(batch_size=3, checkpoint_callback=save),
+    )
+    assert service.batches == [["S1", "S2", "S3"], ["S4", "S5", "S6"], ["S7"]]
+    assert checkpoints == [3, 6, 7]
+    assert service.db.commits == 3
+    assert stats.position == 7 and stats.inserted == 7
+
+    resumed = _RecordingService()
+    stats = await resumed.ingest_records("test", records, "funkos", IngestionOptions(batch_size=3, resume_from=6))
+    assert resumed.batches == [["S7"]]
+    assert stats.resumed_from == 6 and stats.processed == 1
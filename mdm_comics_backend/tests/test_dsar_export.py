@@ -0,0 +1,177 @@
+"""
+Tests for the streaming DSAR export.
+v1.0.0: Keyset paging, per-section hashes, manifest hash, progress, storage
+"""
+import hashlib
+import json
+import os
+import zipfile
+from decimal import Decimal
+from datetime import datetime, timezone
+
+os.environ.setdefault("SECRET_KEY", "test-secret-key-for-unit-tests-only")
+
+import pytest
+
+from app.services import dsar_export
+from app.services.dsar_export import (
+    EXPORT_SECTIONS,
+    DSARExportBuilder,
+    ExportSection,
+    decrypt_page,
+    encode_rows,
+)
+from app.services.encryption import encrypt_pii
+from tests.conftest import FakeResult, FakeSession
+
+SECTIONS = (
+    ExportSection(name="orders", source="orders", columns="id, total", where="user_id = :user_id"),
+    ExportSection(name="sessions", source="user_sessions", columns="created_at", where="user_id = :user_id"),
+    ExportSection(name="dsar_history", source="dsar_requests", columns="status", where="user_id = :user_id"),
+)
+
+TABLES = {
+    "orders": [{"_key": i, "id": i, "total": Decimal("9.99")} for i in range(1, 12)],
+    "user_sessions": [{"_key": i, "created_at": datetime(2025, 1, i, tzinfo=timezone.utc)} for i in range(1, 4)],
+    "dsar_requests": [],
+}
+
+
+class _Database:
+    """Shared state behind every session the fake factory hands out."""
+
+    def __init__(self, tables, fail_on=None):
+        self.tables = tables
+        self.fail_on = fail_on
+        self.pages = []
+        self.progress = []
+        self.snapshots_imported = 0
+        self.open_sessions = 0
+        self.peak_sessions = 0
+
+    def session(self):
+        return _Session(self)
+
+
+class _Session(FakeSession):
+    def __init__(self, database):
+        super().__init__()
+        self.database = database
+
+    async def __aenter__(self):
+        self.database.open_sessions += 1
+        self.database.peak_sessions = max(self.database.peak_sessions, self.database.open_sessions)
+        return self
+
+    async def __aexit__(self, *exc):
+        self.database.open_sessions -= 1
+
+    def respond(self, sql, params):
+        database = self.database
+        if "pg_export_snapshot" in sql:
+            return FakeResult(scalar="00000003-0000001B-1")
+        if "SET TRANSACTION SNAPSHOT" in sql:
+            database.snapshots_imported += 1
+        if "INSERT INTO dsar_export_progress" in sql:
+            database.progress.append(dict(params))
+        for table, rows in database.tables.items():
+            if f"FROM {table}\n" in sql:
+                if table == database.fail_on:
+                    raise RuntimeError("connection lost")
+                page = [r for r in rows if r["_key"] > params["after"]][:params["page_size"]]
+                database.pages.append((table, params["after"], len(page)))
+                return FakeResult([dict(r) for r in page])
+        return FakeResult()
+
+
+def _builder(database, tmp_path, **options):
+    options.setdefault("sections", SECTIONS)
+    options.setdefault("storage", "local")
+    return DSARExportBuilder(
+        7, 42, session_factory=database.session, export_dir=str(tmp_path),
+        page_size=4, concurrency=2, **options,
+    )
+
+
+async def test_sections_are_keyset_paged_into_a_zip_whose_manifest_hash_covers_them(tmp_path):
+    database = _Database(TABLES)
+
+    result = await _builder(database, tmp_path).build()
+
+    assert [(after, n) for table, after, n in database.pages if table == "orders"] == [(0, 4), (4, 4), (8, 3)]
+    assert database.snapshots_imported == len(SECTIONS)
+    with zipfile.ZipFile(result.location) as archive:
+        manifest = archive.read("manifest.json")
+        assert hashlib.sha256(manifest).hexdigest() == result.export_hash
+        sections = json.loads(manifest)["sections"]
+        for name, entry in sections.items():
+            assert hashlib.sha256(archive.read(entry["file"])).hexdigest() == entry["sha256"]
+        orders = [json.loads(line) for line in archive.read("orders.ndjson").splitlines()]
+
+    assert (result.rows, sections["orders"]["rows"], sections["dsar_history"]["rows"]) == (14, 11, 0)
+    assert orders[0] == {"id": 1, "total": "9.99"}  # no paging key, exact money
+    assert os.listdir(tmp_path) == [os.path.basename(result.location)]  # spools removed
+
+
+async def test_progress_is_reported_and_sessions_stay_bounded(tmp_path):
+    database = _Database(TABLES)
+
+    result = await _builder(database, tmp_path).build()
+
+    statuses = [p["status"] for p in database.progress]
+    assert statuses[0] == "running" and statuses[-2:] == ["storing", "complete"]
+    final = database.progress[-1]
+    assert final["rows_written"] == result.rows and final["location"] == result.location
+    assert json.loads(final["sections"])["orders"]["state"] == "done"
+    # two section sessions + the snapshot holder + a progress write
+    assert database.peak_sessions <= 4
+
+
+async def test_failed_section_marks_export_failed_and_cleans_up(tmp_path):
+    database = _Database(TABLES, fail_on="user_sessions")
+
+    with pytest.raises(RuntimeError):
+        await _builder(database, tmp_path).build()
+
+    assert database.progress[-1]["status"] == "failed"
+    assert "connection lost" in database.progress[-1]["error"]
+    assert os.listdir(tmp_path) == []
+
+
+async def test_s3_exports_upload_the_file_under_a_private_key(tmp_path):
+    uploads = []
+
+    class _Storage:
+        async def upload_file_threaded(self, path, key, **options):
+            with zipfile.ZipFile(path) as archive:
+                uploads.append((key, sorted(archive.namelist()), options))
+            return True
+
+    result = await _builder(_Database(TABLES), tmp_path, storage="s3", storage_service=_Storage()).build()
+
+    key, names, options = uploads[0]
+    assert result.location == key and key.startswith("dsar-exports/42/dsar-export-7-")
+    assert names == ["dsar_history.ndjson", "manifest.json", "orders.ndjson", "sessions.ndjson"]
+    assert options["metadata"]["sha256-manifest"] == result.export_hash
+
+
+def test_address_pii_is_decrypted_once_per_page(monkeypatch):
+    calls = []
+    real = dsar_export.decrypt_many
+    monkeypatch.setattr(dsar_export, "decrypt_many", lambda values: calls.append(values) or real(values))
+    token = encrypt_pii("Ada Lovelace")
+    rows = [{"recipient_name_encrypted": token, "address_line1_encrypted": None, "city": "London"}] * 2
+
+    decrypted = decrypt_page([dict(r) for r in rows], ("recipient_name", "address_line1"))
+
+    assert len(calls) == 1
+    assert decrypted[1] == {"city": "London", "recipient_name": "Ada Lovelace", "address_line1": None}
+    assert b"_encrypted" not in encode_rows(decrypted)
+
+
+def test_sections_read_real_columns():
+    by_name = {section.name: section for section in EXPORT_SECTIONS}
+    assert by_name["audit_trail"].source == "user_audit_log"
+    assert "ts >= :audit_since" in by_name["audit_trail"].where
+    assert "is_active" not in by_name["sessions"].where
+    assert by_name["addresses"].decrypt
@@ -0,0 +1,54 @@
+"""
+Tests for the shared fuzzy scoring primitives.
+v1.0.0: Matrix paths must return exactly what the per-pair scorers return
+v1.1.0: similarity() is SequenceMatcher.ratio(); the rapidfuzz bound only prunes
+v1.2.0: Batch matrix scorers removed (no production caller); memoized normalizers remain
+"""
+from difflib import SequenceMatcher
+
+from app.services.dedup_engine import FuzzyMatcher
+from app.services.fuzzy_scoring import memoized, similarity
+from app.services.match_scoring import find_best_match, normalize_title
+
+
+def test_similarity_is_sequence_matcher_ratio():
+    # SequenceMatcher's greedy blocks miss the longest common subsequence here
+    a, b = "ddaba", "bacba"
+    assert similarity(a, b) == SequenceMatcher(None, a, b).ratio() == 0.4
+    assert similarity("", "") == 1.0
+    assert similarity("batman", "") == similarity("", "batman") == 0.0
+
+
+def test_memoized_normalizer_caches_hashable_input_only():
+    calls = []
+
+    @memoized
+    def normalize(value):
+        """Lowercase."""
+        calls.append(value)
+        return str(value).lower()
+
+    assert normalize("Saga") == normalize("Saga") == "saga"
+    assert normalize(["Saga"]) == "['saga']"  # unhashable: computed, not cached
+    assert calls == ["Saga", ["Saga"]]
+    assert normalize.cache_info().currsize == 1
+    assert (normalize.__name__, normalize.__doc__) == ("normalize", "Lowercase.")
+
+
+def test_matchers_use_the_memoized_normalizers():
+    normalize_title.cache_clear()
+    issue = {"series_name": "The Amazing Spider-Man", "number": "300", "year": 1988, "publisher_name": "Marvel"}
+    products = [
+        {"id": "1", "product-name": "Amazing Spider-Man #300", "console-name": "Marvel Comics 1988"},
+        {"id": "2", "product-name": "Amazing Spider-Man #301", "console-name": "Marvel Comics 1988"},
+    ]
+
+    first = find_best_match(issue, products)
+    assert first.matched and first.pricecharting_id == 1
+    hits = normalize_title.cache_info().hits
+    assert find_best_match(issue, products) == first
+    assert normalize_title.cache_info().hits > hits
+
+    matcher = FuzzyMatcher()
+    assert matcher.normalize_issue_number("#007") == "7"
+    assert matcher.similarity_ratio("saga", "saga") == 1.0
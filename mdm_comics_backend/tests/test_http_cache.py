@@ -0,0 +1,111 @@
+"""
+Tests for the conditional-request HTTP cache.
+v2.1.0: Disk cache for scraper / wiki adapters
+"""
+import httpx
+import pytest
+
+from app.core.http_cache import HTTPCache, parse_host_ttls
+from app.core.http_client import ResilientHTTPClient, RateLimitConfig, RetryConfig
+
+
+def _client(handler, cache):
+    client = ResilientHTTPClient(
+        rate_limit_config=RateLimitConfig(requests_per_second=1000, burst_limit=1000, min_request_interval=0),
+        retry_config=RetryConfig(max_retries=0, base_delay=0, max_delay=0, jitter_factor=0),
+        timeout=5.0,
+        cache=cache,
+    )
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+@pytest.mark.asyncio
+async def test_revalidates_with_etag_and_serves_cached_body_on_304(tmp_path):
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, text="<html>issue 1</html>", headers={"ETag": '"v1"'})
+
+    cache = HTTPCache(str(tmp_path))
+    client = _client(handler, cache)
+
+    first = await client.get("https://www.comics.org/issue/1/", params={"a": "b"})
+    second = await client.get("https://www.comics.org/issue/1/", params={"a": "b"})
+    await client.close()
+
+    assert seen == [None, '"v1"']
+    assert first.text == second.text == "<html>issue 1</html>"
+    assert second.status_code == 200
+    assert second.headers["X-Cache"] == "REVALIDATED"
+
+    host = (await cache.stats())["hosts"]["www.comics.org"]
+    assert (host["misses"], host["revalidated"], host["stored"]) == (1, 1, 1)
+    assert host["bytes_saved"] == len("<html>issue 1</html>")
+    assert host["hit_ratio"] == 0.5
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_host_ttl_override_serves_without_network(tmp_path):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        return httpx.Response(200, json={"parse": {"title": "X"}}, headers={"Cache-Control": "no-cache"})
+
+    cache = HTTPCache(str(tmp_path), host_ttls=parse_host_ttls("marvel.fandom.com=3600, bad"))
+    client = _client(handler, cache)
+
+    await client.get("https://marvel.fandom.com/api.php", params={"page": "X"})
+    cached = await client.get("https://marvel.fandom.com/api.php", params={"page": "X"})
+    await client.get("https://marvel.fandom.com/api.php", params={"page": "Y"})
+    await client.close()
+
+    assert len(calls) == 2
+    assert cached.headers["X-Cache"] == "HIT"
+    assert cached.json() == {"parse": {"title": "X"}}
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_uncacheable_responses_are_not_stored(tmp_path):
+    cache = HTTPCache(str(tmp_path))
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/no-store":
+            return httpx.Response(200, text="x", headers={"Cache-Control": "no-store", "ETag": '"a"'})
+        return httpx.Response(200, text="x")  # no validators, no max-age
+
+    client = _client(handler, cache)
+    await client.get("https://example.com/no-store")
+    await client.get("https://example.com/plain")
+    await client.close()
+
+    assert (await cache.stats())["entries"] == 0
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_identical_bodies_share_a_blob_and_prune_evicts_lru(tmp_path):
+    cache = HTTPCache(str(tmp_path), default_ttl_seconds=60)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = "same" if request.url.path in ("/a", "/b") else "other" * 10
+        return httpx.Response(200, text=body)
+
+    client = _client(handler, cache)
+    for path in ("/a", "/b", "/c"):
+        await client.get(f"https://example.com{path}")
+    await client.close()
+
+    blobs = list((tmp_path / "blobs").rglob("*"))
+    assert len([b for b in blobs if b.is_file()]) == 2
+
+    evicted = await cache.prune(max_bytes=10)
+    assert evicted == 3
+    assert [b for b in (tmp_path / "blobs").rglob("*") if b.is_file()] == []
+    cache.close()
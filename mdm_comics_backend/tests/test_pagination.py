@@ -0,0 +1,112 @@
+"""
+Tests for keyset pagination helpers.
+v1.0.0: Cursors per sort order and cached totals
+v1.1.0: Plain-column sort keys with PostgreSQL NULL placement (NULLs first descending)
+"""
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.core.pagination import (
+    InvalidCursor,
+    KeysetOrder,
+    cached_total,
+    count_cache,
+    decode_cursor,
+    encode_cursor,
+    filter_signature,
+)
+from app.models.product import Product
+
+
+def test_cursor_round_trips_typed_values():
+    created = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    cursor = encode_cursor("newest", [True, created, Decimal("9.99"), 42])
+    assert decode_cursor(cursor, "newest", 4) == [True, created, Decimal("9.99"), 42]
+
+
+def test_cursor_rejects_other_orders_and_garbage():
+    cursor = encode_cursor("price_asc", [Decimal("1.00"), 1])
+    with pytest.raises(InvalidCursor):
+        decode_cursor(cursor, "price_desc", 2)
+    with pytest.raises(InvalidCursor):
+        decode_cursor(cursor, "price_asc", 3)
+    with pytest.raises(InvalidCursor):
+        decode_cursor("not-a-cursor!!", "price_asc", 2)
+
+
+def _sql(clause):
+    return str(clause.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+FEATURED = KeysetOrder("featured", Product, ["featured", "created_at", "id"], descending=True)
+CREATED = datetime(2025, 1, 2, tzinfo=timezone.utc)
+
+
+def test_keyset_order_sorts_plain_columns_with_nulls_first_descending():
+    assert [_sql(c) for c in FEATURED.order_by()] == [
+        "products.featured DESC NULLS FIRST", "products.created_at DESC NULLS FIRST", "products.id DESC",
+    ]
+    price_asc = KeysetOrder("price_asc", Product, ["price", "id"])
+    assert [_sql(c) for c in price_asc.order_by()] == ["products.price ASC", "products.id ASC"]
+    assert "coalesce" not in _sql(FEATURED.after([True, CREATED, 5]))
+
+
+def test_keyset_after_is_one_row_comparison_unless_a_null_takes_part():
+    assert _sql(FEATURED.after([True, CREATED, 5])) == (
+        "(products.featured, products.created_at, products.id) < (true, '2025-01-02 00:00:00+00:00', 5)"
+    )
+
+    # cursor in the NULL created_at group: non-NULL created_at follows it
+    assert _sql(FEATURED.after([True, None, 5])) == (
+        "products.featured < true OR products.featured = true AND "
+        "(products.created_at IS NOT NULL OR products.created_at IS NULL AND products.id < 5)"
+    )
+
+    # ascending, NULLs last: they follow any non-NULL cursor value
+    rating_asc = KeysetOrder("rating_asc", Product, ["rating", "id"])
+    assert _sql(rating_asc.after([4.5, 5])) == (
+        "products.rating > 4.5 OR products.rating IS NULL OR products.rating = 4.5 AND products.id > 5"
+    )
+    assert _sql(rating_asc.after([None, 5])) == "products.rating IS NULL AND products.id > 5"
+
+
+def test_keyset_cursor_keeps_null_values():
+    class Row:
+        featured = None
+        created_at = CREATED
+        id = 7
+
+    assert FEATURED.values_for(Row()) == [None, CREATED, 7]
+    assert decode_cursor(FEATURED.cursor_for(Row()), "featured", 3) == [None, CREATED, 7]
+
+
+def test_filter_signature_is_case_sensitive_and_ignores_none():
+    assert filter_signature("p", category="Comics") != filter_signature("p", category="comics")
+    assert filter_signature("p", category="x", search=None) == filter_signature("p", category="x")
+
+
+@pytest.mark.asyncio
+async def test_cached_total_prefers_estimate_for_large_sets_and_caches():
+    count_cache.clear()
+    calls = []
+
+    async def exact():
+        calls.append("exact")
+        return 12
+
+    async def small_estimate():
+        return 10
+
+    async def large_estimate():
+        return 1_000_000
+
+    assert await cached_total("sig-small", exact, small_estimate) == (12, False)
+    assert await cached_total("sig-small", exact, small_estimate) == (12, False)
+    assert calls == ["exact"]
+
+    assert await cached_total("sig-large", exact, large_estimate) == (1_000_000, True)
+    assert calls == ["exact"]
+    count_cache.clear()
@@ -0,0 +1,158 @@
+"""
+Tests for the PII access layer.
+v1.0.0: Address decrypt, request-scoped cache, sealed credentials, decrypt_many
+v1.1.0: Field-selective address decrypt; address responses decrypt only what they show
+"""
+import os
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+os.environ.setdefault("SECRET_KEY", "test-secret-key-for-unit-tests-only")
+
+import httpx
+import pytest
+from fastapi import APIRouter, Depends, FastAPI
+
+from app.api.routes.shipping import address_to_response
+from app.services import pii_access
+from app.services.encryption import encrypt_pii
+from app.services.pii_access import (
+    PIICache,
+    carrier_credentials,
+    decrypt_address,
+    decrypt_cached,
+    decrypt_many,
+    pii_cache_scope,
+    pii_request_scope,
+)
+
+
+@pytest.fixture
+def decrypts(monkeypatch):
+    """Count calls that reach Fernet."""
+    calls = []
+    real = pii_access.decrypt_pii
+
+    def counting(ciphertext):
+        calls.append(ciphertext)
+        return real(ciphertext)
+
+    monkeypatch.setattr(pii_access, "decrypt_pii", counting)
+    return calls
+
+
+def _address(**plain):
+    return SimpleNamespace(**{f"{k}_encrypted": encrypt_pii(v) for k, v in plain.items()},
+                           address_line2_encrypted=None)
+
+
+def test_decrypt_address_reads_every_encrypted_column_without_leaking_values():
+    address = _address(recipient_name="Ada Lovelace", address_line1="12 Analytical Way",
+                       phone="555-0100", email="ada@example.com")
+
+    pii = decrypt_address(address)
+
+    assert (pii.recipient_name, pii.address_line1, pii.phone) == ("Ada Lovelace", "12 Analytical Way", "555-0100")
+    assert pii.address_line2 is None and pii.company_name is None
+    assert "Ada" not in repr(pii) and "example.com" not in str(pii)
+
+
+def test_decrypt_address_fields_decrypts_only_those_columns(decrypts):
+    address = _address(recipient_name="Ada Lovelace", address_line1="12 Analytical Way",
+                       phone="555-0100", email="ada@example.com")
+
+    pii = decrypt_address(address, fields=("recipient_name", "address_line1"))
+
+    assert (pii.recipient_name, pii.address_line1) == ("Ada Lovelace", "12 Analytical Way")
+    assert pii.phone is None and pii.email is None
+    assert len(decrypts) == 2
+    with pytest.raises(ValueError):
+        decrypt_address(address, fields=("ssn",))
+
+
+def test_address_response_decrypts_name_company_and_first_line_only(decrypts):
+    address = _address(recipient_name="Ada Lovelace", company_name="Analytical Engines",
+                       address_line1="12 Analytical Way", address_line3="Unit 4",
+                       phone="555-0100", email="ada@example.com")
+    address.__dict__.update(id=3, address_type=None, city="London", state_province="LDN", postal_code="W1",
+                            country_code="GB", residential=True, validation_status=None, validated_at=None,
+                            is_default=True, created_at=datetime(2026, 1, 2, tzinfo=timezone.utc))
+
+    response = address_to_response(address)
+
+    assert response.recipient_name_masked == "A***" and response.company_name == "Analytical Engines"
+    assert response.address_line1_masked.startswith("12") and "Analytical" not in response.address_line1_masked
+    assert sorted(decrypts) == sorted([address.recipient_name_encrypted, address.company_name_encrypted,
+                                       address.address_line1_encrypted])
+
+
+def test_request_scope_decrypts_each_value_once_and_zeroizes_on_exit(decrypts):
+    address = _address(recipient_name="Grace Hopper", address_line1="1 Compiler Ct")
+    decrypt_address(address)
+    assert len(decrypts) == 2  # no scope, no caching
+
+    with pii_cache_scope() as cache:
+        for _ in range(3):
+            decrypt_address(address)
+        assert len(decrypts) == 4 and cache.hits == 4
+        buffers = [plaintext for _, plaintext in cache._entries.values()]
+
+    assert len(cache) == 0
+    assert all(set(buffer) == {0} for buffer in buffers)
+
+
+def test_cache_is_bounded_and_expires():
+    cache = PIICache(max_entries=2, ttl_seconds=60)
+    for i in range(3):
+        cache.put(f"c{i}", f"value {i}")
+    assert len(cache) == 2 and cache.get("c0") is None and cache.evictions == 1
+
+    expired = PIICache(ttl_seconds=0)
+    expired.put("c", "value")
+    assert expired.get("c") is None and len(expired) == 0
+
+
+def test_carrier_credentials_are_sealed_and_follow_rotation(decrypts):
+    carrier = SimpleNamespace(client_id_encrypted=encrypt_pii("client-123"),
+                              client_secret_encrypted=encrypt_pii("s3cret-value"),
+                              account_number_encrypted=None)
+
+    first = carrier_credentials(carrier, "client_id", "client_secret", "account_number")
+    second = carrier_credentials(carrier, "client_id", "client_secret", "account_number")
+
+    assert first == second == ("client-123", "s3cret-value", "")
+    assert len(decrypts) == 2  # second build served from the cache
+    sealed = b"".join(entry[2] for entry in pii_access._credential_cache._entries.values())
+    assert b"s3cret-value" not in sealed
+
+    carrier.client_secret_encrypted = encrypt_pii("rotated")
+    assert carrier_credentials(carrier, "client_id", "client_secret", "account_number")[1] == "rotated"
+
+
+def test_decrypt_many_keeps_order_and_decrypts_duplicates_once(decrypts):
+    values = [f"customer {i}" for i in range(40)]
+    tokens = [encrypt_pii(v) for v in values]
+    column = tokens + [None, "", tokens[0]]
+
+    serial = decrypt_many(column)
+    assert serial == values + [None, None, values[0]]
+    assert len(decrypts) == 40
+
+    assert decrypt_many(column, max_workers=4, parallel_threshold=8) == serial
+
+
+async def test_routes_share_one_cache_per_request(decrypts):
+    token = encrypt_pii("Katherine Johnson")
+    router = APIRouter(dependencies=[Depends(pii_request_scope)])
+
+    @router.get("/twice")
+    async def twice():
+        return {"same": decrypt_cached(token) == decrypt_cached(token)}
+
+    app = FastAPI()
+    app.include_router(router)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        for _ in range(2):
+            assert (await client.get("/twice")).json() == {"same": True}
+
+    assert len(decrypts) == 2  # once per request, not per call
@@ -0,0 +1,153 @@
+"""
+Tests for work-aware pipeline scheduling.
+v1.25.0: Backlog-driven delays and concurrency budget
+v1.25.1: Leader lease connections are invalidated, not pooled, unless unlocked
+"""
+import asyncio
+import functools
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.jobs.scheduling import (
+    BUSY_DELAY_SECONDS,
+    OUTCOME_BLOCKED,
+    OUTCOME_BUSY,
+    OUTCOME_DISABLED,
+    OUTCOME_HELD,
+    OUTCOME_IDLE,
+    OUTCOME_UNKNOWN,
+    RESOURCE_API,
+    RESOURCE_LIGHT,
+    ConcurrencyBudget,
+    JobSpec,
+    LeaderLease,
+    JobState,
+    classify_result,
+    next_delay_seconds,
+)
+
+
+# Job callable for specs whose scheduling is tested; the jobs are never run
+_noop = functools.partial(asyncio.sleep, 0)
+
+
+class TestClassifyResult:
+    def test_processed_locations(self):
+        assert classify_result({"status": "completed", "stats": {"processed": 5}}) == (OUTCOME_BUSY, 5)
+        assert classify_result({"status": "success", "processed": 0}) == (OUTCOME_IDLE, 0)
+        # GCD import reports per phase
+        gcd = {"status": "completed", "stats": {"brands": {"processed": 2}, "issues": {"processed": 3}}}
+        assert classify_result(gcd) == (OUTCOME_BUSY, 5)
+        # Sequential enrichment returns its bare stats dict
+        assert classify_result({"processed": 1, "enriched": 1}) == (OUTCOME_BUSY, 1)
+
+    def test_statuses(self):
+        assert classify_result({"status": "skipped"})[0] == OUTCOME_HELD
+        assert classify_result({"status": "paused", "stats": {"processed": 3}})[0] == OUTCOME_HELD
+        assert classify_result({"status": "disabled"})[0] == OUTCOME_DISABLED
+        assert classify_result({"status": "error", "processed": 4})[0] == OUTCOME_BLOCKED
+        assert classify_result({"status": "success", "processed": 4, "circuit_opens": 1})[0] == OUTCOME_BLOCKED
+        assert classify_result(None) == (OUTCOME_UNKNOWN, None)
+
+
+class TestNextDelay:
+    def test_adaptive_busy_then_exponential_idle(self):
+        spec = JobSpec("enrich", _noop, interval_minutes=30, adaptive=True, max_backoff_factor=8)
+        state = JobState()
+
+        assert next_delay_seconds(spec, state, OUTCOME_BUSY) == BUSY_DELAY_SECONDS
+        delays = [next_delay_seconds(spec, state, OUTCOME_IDLE) for _ in range(6)]
+        assert delays == [1800, 3600, 7200, 14400, 14400, 14400]
+
+        # Finding work again resets the backoff
+        assert next_delay_seconds(spec, state, OUTCOME_BUSY) == BUSY_DELAY_SECONDS
+        assert state.idle_streak == 0
+        assert next_delay_seconds(spec, state, OUTCOME_BLOCKED) == 1800
+
+    def test_held_and_unknown_keep_interval(self):
+        spec = JobSpec("enrich", _noop, interval_minutes=30, adaptive=True)
+        state = JobState(idle_streak=3)
+        assert next_delay_seconds(spec, state, OUTCOME_HELD) == 1800
+        assert next_delay_seconds(spec, state, OUTCOME_UNKNOWN) == 1800
+        assert state.idle_streak == 3
+
+    def test_periodic_jobs_keep_fixed_interval(self):
+        spec = JobSpec("snapshot", _noop, interval_minutes=1440)
+        state = JobState()
+        assert next_delay_seconds(spec, state, OUTCOME_BUSY) == 86400
+        assert next_delay_seconds(spec, state, OUTCOME_IDLE) == 86400
+
+    def test_backoff_capped_at_one_day(self):
+        spec = JobSpec("daily", _noop, interval_minutes=1440, adaptive=True)
+        assert next_delay_seconds(spec, JobState(idle_streak=5), OUTCOME_IDLE) == 86400
+
+
+class TestConcurrencyBudget:
+    @pytest.mark.asyncio
+    async def test_resource_limit_and_light_bypass(self):
+        budget = ConcurrencyBudget(total=2, per_resource={RESOURCE_API: 1})
+        peak = {"api": 0, "current": 0}
+
+        async def api_job(name):
+            async with budget.slot(RESOURCE_API, name):
+                peak["current"] += 1
+                peak["api"] = max(peak["api"], peak["current"])
+                await asyncio.sleep(0.01)
+                peak["current"] -= 1
+
+        await asyncio.gather(*(api_job(f"job{i}") for i in range(3)))
+        assert peak["api"] == 1
+
+        async with budget.slot(RESOURCE_API, "a"):
+            async with budget.slot(RESOURCE_LIGHT, "stall_detection"):
+                running = budget.to_dict()["running"]
+                assert running == {"api": ["a"], "light": ["stall_detection"]}
+
+
+class TestLeaderLease:
+    @staticmethod
+    def _lease(lock_result=True):
+        conn = AsyncMock()
+        conn.execute.return_value = MagicMock(scalar=MagicMock(return_value=lock_result))
+        engine = MagicMock(connect=AsyncMock(return_value=conn))
+        return LeaderLease(engine), conn
+
+    @pytest.mark.asyncio
+    async def test_lost_lease_connection_is_invalidated_not_pooled(self):
+        lease, conn = self._lease()
+        assert await lease.try_acquire()
+
+        conn.execute.side_effect = ConnectionError("server closed the connection")
+        assert not await lease.verify()
+
+        conn.invalidate.assert_awaited_once()
+        conn.close.assert_not_awaited()
+        assert not lease.held
+
+    @pytest.mark.asyncio
+    async def test_release_pools_the_connection_only_after_unlocking(self):
+        lease, conn = self._lease()
+        await lease.try_acquire()
+        await lease.release()
+        conn.close.assert_awaited_once()
+        conn.invalidate.assert_not_awaited()
+
+        lease, conn = self._lease()
+        await lease.try_acquire()
+        conn.execute.side_effect = TimeoutError()
+        await lease.release()
+        conn.invalidate.assert_awaited_once()
+        conn.close.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_lock_held_elsewhere_returns_the_connection(self):
+        lease, conn = self._lease(lock_result=False)
+        assert not await lease.try_acquire()
+        conn.close.assert_awaited_once()
+
+        lease, conn = self._lease()
+        conn.commit.side_effect = ConnectionError()
+        with pytest.raises(ConnectionError):
+            await lease.try_acquire()
+        conn.invalidate.assert_awaited_once()
@@ -0,0 +1,84 @@
+"""
+Tests for trigger-captured price change events.
+v1.0.0: CDC triggers, latest_prices and exactly-once consumer drains
+"""
+import pytest
+
+from app.services.price_events import (
+    EVENT_RANGE,
+    PRICE_CDC_SPECS,
+    _cdc_trigger_ddl,
+    drain_price_events,
+)
+from tests.conftest import FakeResult, FakeSession
+
+
+def test_cdc_triggers_use_transition_tables_per_event():
+    ddl = _cdc_trigger_ddl("funkos")
+    creates = [s for s in ddl if s.startswith("CREATE TRIGGER")]
+
+    assert len(creates) == 3
+    assert "AFTER INSERT ON funkos REFERENCING NEW TABLE AS new_rows" in creates[0]
+    assert "OLD TABLE AS old_rows NEW TABLE AS new_rows" in creates[1]
+    assert "AFTER DELETE ON funkos REFERENCING OLD TABLE AS old_rows" in creates[2]
+    assert all("FOR EACH STATEMENT" in s for s in creates)
+
+
+def test_cdc_function_captures_only_changed_price_columns():
+    function = _cdc_trigger_ddl("comic_issues")[0]
+    for column in PRICE_CDC_SPECS["comic_issues"][1]:
+        assert f"('{column}', o.{column}, n.{column})" in function
+    # Unrelated updates (titles, sync timestamps) produce no events
+    assert "c.old_value IS DISTINCT FROM c.new_value" in function
+    assert "'comic'" in function and "txid_current()" in function
+    assert "ON CONFLICT (entity_type, entity_id, field_name) DO UPDATE" in function
+
+
+class _Row:
+    last_txid = 100
+
+
+class _FakeSession(FakeSession):
+    """Answers the drain's queries in order; records the cursor update."""
+
+    def __init__(self, xmin, cursor_row, events):
+        super().__init__()
+        self.xmin, self.cursor_row, self.events = xmin, cursor_row, events
+
+    def respond(self, sql, params):
+        if "txid_snapshot_xmin" in sql:
+            return FakeResult(scalar=self.xmin)
+        if "FOR UPDATE SKIP LOCKED" in sql:
+            return FakeResult([self.cursor_row] if self.cursor_row else [])
+        if "COUNT(*)" in sql:
+            return FakeResult(scalar=self.events)
+        return FakeResult()
+
+
+@pytest.mark.asyncio
+async def test_drain_applies_range_up_to_oldest_running_transaction():
+    db = _FakeSession(xmin=250, cursor_row=_Row(), events=3)
+    seen = []
+
+    async def apply(session, params):
+        seen.append(params)
+        return {"funko": 2}
+
+    result = await drain_price_events(db, "price_changelog", apply)
+
+    assert seen == [{"from_txid": 100, "to_txid": 250}]
+    assert result == {"status": "complete", "consumer": "price_changelog", "events": 3, "funko": 2}
+    update = [p for sql, p in db.executed if "UPDATE price_event_cursors" in sql][0]
+    assert update["to_txid"] == 250 and update["events"] == 3
+    assert db.committed
+    assert EVENT_RANGE in db.statements[3]
+
+
+@pytest.mark.asyncio
+async def test_drain_skips_when_another_worker_holds_the_cursor():
+    db = _FakeSession(xmin=250, cursor_row=None, events=0)
+
+    # apply=None: calling it while the cursor is locked would raise TypeError
+    result = await drain_price_events(db, "price_changelog", apply=None)
+    assert result["status"] == "busy"
+    assert db.rolled_back
@@ -0,0 +1,115 @@
+"""
+Tests for the PriceCharting price-guide diff sync.
+v1.0.0: Bulk CSV diff ahead of per-item API fallback
+v1.0.1: Full local-guide pass: staging COPY, changelog before update, counts
+"""
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.services import price_guide_sync
+from app.services.price_guide_sync import (
+    STAGING_COLUMNS,
+    iter_price_guide_rows,
+    parse_guide_price,
+    sync_from_price_guide,
+)
+from tests.conftest import FakeResult, FakeSession
+
+GUIDE_CSV = (
+    "id,console-name,product-name,loose-price,cib-price,new-price\n"
+    "501,Funko Pop,Batman,$10.00,$20.00,$30.00\n"
+    "501,Funko Pop,Batman again,$99.00,,\n"
+    "abc,Funko Pop,Bad id,$1.00,,\n"
+    "502,Funko Pop,Robin,,$0.00,$7.50\n"
+)
+
+
+def test_parse_guide_price():
+    assert parse_guide_price("$1,234.56") == Decimal("1234.56")
+    assert parse_guide_price(" 12 ") == Decimal("12.00")
+    assert parse_guide_price("$0.00") is None
+    assert parse_guide_price("") is None
+    assert parse_guide_price(None) is None
+    assert parse_guide_price("n/a") is None
+
+
+def test_iter_price_guide_rows_streams_and_dedupes(tmp_path):
+    guide = tmp_path / "guide.csv"
+    guide.write_text(GUIDE_CSV, encoding="utf-8")
+
+    rows = list(iter_price_guide_rows(guide))
+
+    assert rows == [
+        (501, "Batman", Decimal("10.00"), Decimal("20.00"), Decimal("30.00")),
+        (502, "Robin", None, None, Decimal("7.50")),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_recent_guide_pass_skips_reload(monkeypatch):
+    has_stale_matches = AsyncMock(return_value=True)
+    monkeypatch.setattr(price_guide_sync, "has_stale_matches", has_stale_matches)
+    monkeypatch.setattr(price_guide_sync, "_last_guide_pass", {"funko": price_guide_sync.time.time()})
+
+    result = await sync_from_price_guide(None, "funko", "batch", "funko-pops", "token", staleness_hours=24)
+
+    has_stale_matches.assert_not_awaited()  # the staleness query is the first step of a reload
+    assert result["matched"] == 0
+    assert result["downloaded"] is False
+
+
+class _GuideSession(FakeSession):
+    """Stages COPYed guide rows; the diff statements return canned rows."""
+
+    def __init__(self, change_pcts, changed_flags):
+        super().__init__()
+        self.change_pcts = change_pcts
+        self.changed_flags = changed_flags
+        self.copied = []
+
+    async def connection(self):
+        return self
+
+    async def get_raw_connection(self):
+        return self
+
+    @property
+    def driver_connection(self):
+        return self
+
+    async def copy_records_to_table(self, table, records, columns):
+        assert (table, columns) == ("pc_price_guide", STAGING_COLUMNS)
+        self.copied.extend(records)
+
+    def respond(self, sql, params):
+        if "SELECT EXISTS" in sql:
+            return FakeResult(scalar=True)
+        if "INSERT INTO price_changelog" in sql:
+            return FakeResult([(pct,) for pct in self.change_pcts])
+        if "UPDATE funkos f" in sql:
+            return FakeResult([(flag,) for flag in self.changed_flags])
+        return FakeResult()
+
+
+@pytest.mark.asyncio
+async def test_local_guide_is_staged_diffed_and_counted(tmp_path, monkeypatch):
+    monkeypatch.setattr(price_guide_sync, "_last_guide_pass", {})
+    guide = tmp_path / "guide.csv"
+    guide.write_text(GUIDE_CSV, encoding="utf-8")
+    db = _GuideSession(change_pcts=[Decimal("25.00"), None, Decimal("-5.00")], changed_flags=[True, False])
+
+    result = await sync_from_price_guide(db, "funko", "batch-1", str(guide), token=None)
+
+    assert result == {
+        "source": str(guide), "downloaded": False, "guide_rows": 2,
+        "matched": 2, "updated": 1, "changelog_recorded": 3, "significant_changes": 1,
+    }
+    assert [r[0] for r in db.copied] == [501, 502]
+    diff = [(sql, params) for sql, params in db.executed if "pc_price_guide g" in sql]
+    # changelog first: it needs the pre-update prices
+    assert [sql.split()[0] for sql, _ in diff] == ["INSERT", "UPDATE"]
+    assert all(params == {"force": False, "staleness_hours": 24, "batch_id": "batch-1"} for _, params in diff)
+    assert (db.commits, db.rollbacks) == (1, 0)
+    assert "funko" in price_guide_sync._last_guide_pass
@@ -0,0 +1,159 @@
+"""
+Tests for quantile sketches and sketch-backed MetricsCollector histograms.
+PERF-026: Mergeable streaming latency sketches
+"""
+import random
+
+import pytest
+
+from app.core.monitoring import MetricsCollector, get_prometheus_metrics, metrics
+from app.core.quantile_sketch import QuantileSketch, WindowedSketch, sketch_stats
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestQuantileSketch:
+    """Accuracy, merging and serialization."""
+
+    def test_quantiles_within_relative_accuracy(self):
+        rng = random.Random(42)
+        values = [rng.lognormvariate(-3, 1) for _ in range(20000)]
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for v in values:
+            sketch.add(v)
+
+        values.sort()
+        for q in (0.5, 0.95, 0.99, 0.999):
+            exact = values[int(q * (len(values) - 1))]
+            assert sketch.quantile(q) == pytest.approx(exact, rel=0.02)
+
+        assert sketch.count == 20000
+        assert sketch.min == values[0]
+        assert sketch.max == values[-1]
+
+    def test_merge_matches_single_sketch(self):
+        a, b, combined = QuantileSketch(), QuantileSketch(), QuantileSketch()
+        for i in range(1, 1001):
+            (a if i % 2 else b).add(i / 100)
+            combined.add(i / 100)
+
+        a.merge(b)
+
+        assert a.count == combined.count
+        assert a.bins == combined.bins
+        assert a.quantile(0.95) == combined.quantile(0.95)
+
+    def test_merge_rejects_different_accuracy(self):
+        a = QuantileSketch(relative_accuracy=0.01)
+        b = QuantileSketch(relative_accuracy=0.05)
+        b.add(1.0)
+        with pytest.raises(ValueError):
+            a.merge(b)
+
+    def test_bins_are_bounded(self):
+        sketch = QuantileSketch(max_bins=64)
+        for exp in range(-9, 4):
+            for step in range(1, 50):
+                sketch.add(step * 10 ** exp)
+        assert len(sketch.bins) <= 64
+        # High quantiles keep their accuracy when low bins collapse
+        assert sketch.quantile(1.0) == sketch.max
+
+    def test_zero_values_and_empty(self):
+        sketch = QuantileSketch()
+        assert sketch.quantile(0.5) == 0.0
+        sketch.add(0.0)
+        sketch.add(-1.0)
+        assert sketch.zero_count == 2
+        assert sketch.quantile(0.5) == 0.0
+
+    def test_round_trip_serialization(self):
+        sketch = QuantileSketch()
+        for v in (0.0, 0.01, 0.2, 3.5):
+            sketch.add(v)
+        restored = QuantileSketch.from_dict(sketch.to_dict())
+        assert restored.bins == sketch.bins
+        assert restored.count == sketch.count
+        assert restored.quantile(0.5) == sketch.quantile(0.5)
+
+    def test_cumulative_counts(self):
+        sketch = QuantileSketch()
+        for v in (0.001, 0.02, 0.02, 0.3, 4.0):
+            sketch.add(v)
+        counts = dict(sketch.cumulative_counts([0.005, 0.05, 0.5, 5.0]))
+        assert counts == {0.005: 1, 0.05: 3, 0.5: 4, 5.0: 5}
+
+    def test_sketch_stats_shape(self):
+        assert sketch_stats(QuantileSketch())["p999"] == 0
+        sketch = QuantileSketch()
+        sketch.add(2.0)
+        stats = sketch_stats(sketch)
+        assert stats["count"] == 1
+        assert stats["p50"] == pytest.approx(2.0)
+
+
+class TestWindowedSketch:
+    """Slice rotation."""
+
+    def test_old_slices_leave_window(self):
+        clock = FakeClock()
+        windowed = WindowedSketch(window_seconds=60, slices=6, clock=clock)
+        windowed.add(1.0)
+        clock.now += 30
+        windowed.add(2.0)
+
+        assert windowed.window(60).count == 2
+        assert windowed.window(10).count == 1
+
+        clock.now += 61
+        assert windowed.window(60).count == 0
+        # Cumulative sketch keeps everything for Prometheus export
+        assert windowed.total.count == 2
+
+    def test_reset_stale(self):
+        clock = FakeClock()
+        windowed = WindowedSketch(window_seconds=60, slices=6, clock=clock)
+        windowed.add(1.0)
+        clock.now += 120
+        windowed.reset_stale()
+        assert all(epoch == -1 for epoch in windowed._ring_epoch)
+
+
+class TestMetricsCollectorHistograms:
+    """Collector integration."""
+
+    def test_labeled_observations_roll_up(self):
+        collector = MetricsCollector()
+        collector.observe("latency", 0.1, {"path": "/a"})
+        collector.observe("latency", 0.3, {"path": "/b"})
+
+        assert collector.get_histogram_stats("latency", {"path": "/a"})["count"] == 1
+        rollup = collector.get_histogram_stats("latency")
+        assert rollup["count"] == 2
+        assert rollup["max"] == 0.3
+        assert collector.get_histogram_stats("missing")["count"] == 0
+
+    def test_export_sketches(self):
+        collector = MetricsCollector()
+        collector.observe("latency", 0.1, {"path": "/a"})
+        exported = collector.export_sketches()
+        entry = exported["latency{path=/a}"]
+        assert entry["labels"] == {"path": "/a"}
+        assert QuantileSketch.from_dict(entry["window"]).count == 1
+
+    def test_prometheus_histogram_export(self):
+        metrics.observe("test_sketch_seconds", 0.02, {"method": "GET"})
+        metrics.observe("http_request_duration_seconds", 0.02, {"method": "GET"})
+        text = get_prometheus_metrics()
+
+        assert "# TYPE test_sketch_seconds histogram" in text
+        assert 'test_sketch_seconds_bucket{le="0.025",method="GET"} 1' in text
+        assert 'test_sketch_seconds_bucket{le="+Inf",method="GET"} 1' in text
+        assert 'test_sketch_seconds_count{method="GET"} 1' in text
+        assert 'http_request_duration_window_seconds{quantile="0.99"}' in text
@@ -0,0 +1,147 @@
+"""
+Tests for the distributed rate limit storage.
+v1.0.0: Exact Redis limits, locally batched high-volume limits, local fallback
+"""
+from math import floor
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from slowapi import Limiter
+from slowapi.errors import RateLimitExceeded
+from slowapi.middleware import SlowAPIMiddleware
+from starlette.requests import Request
+
+from app.core.rate_limit import rate_limit_exceeded_handler
+from app.core.rate_limit_storage import STORAGE_SCHEME, HybridRedisStorage, route_of
+
+KEY = "LIMITER/1.2.3.4/app.api.routes.auth.login/5/1/MINUTE"
+CATALOG_KEY = "LIMITER/1.2.3.4/app.api.routes.products.list_products/100/1/MINUTE"
+
+
+class _FakeRedis:
+    """Shared in-memory Redis evaluating SLIDING_WINDOW_LUA in Python."""
+
+    def __init__(self):
+        self.data = {}
+        self.calls = 0
+        self.down = False
+
+    def register_script(self, source):
+        return _FakeScript(self)
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    def run(self, keys, args):
+        self.calls += 1
+        if self.down:
+            raise ConnectionError("redis down")
+        limit, expiry, amount, weight = int(args[0]), int(args[1]), int(args[2]), float(args[3])
+        previous, current = self.data.get(keys[1], 0), self.data.get(keys[0], 0)
+        if limit > 0 and floor(previous * weight) + current + amount > limit:
+            return [0, previous, current]
+        self.data[keys[0]] = current = current + amount
+        return [1, previous, current]
+
+
+class _FakeScript:
+    def __init__(self, redis):
+        self.redis = redis
+
+    def __call__(self, keys, args, client=None):
+        if isinstance(client, _FakePipeline):
+            client.queued.append((keys, args))
+            return client
+        return self.redis.run(keys, args)
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self.redis, self.queued = redis, []
+
+    def execute(self):
+        return [self.redis.run(keys, args) for keys, args in self.queued]
+
+
+def _replica(redis=None, **options):
+    storage = HybridRedisStorage(
+        redis_url="redis://fake" if redis else "",
+        batch_threshold=100,
+        sync_interval_ms=60_000,  # tests flush explicitly
+        **options,
+    )
+    if redis:
+        storage._client = redis
+        storage._script = redis.register_script("")
+    return storage
+
+
+def test_route_is_parsed_from_limit_key():
+    assert route_of(KEY) == "app.api.routes.auth.login"
+
+
+def test_exact_limits_are_shared_across_replicas():
+    redis = _FakeRedis()
+    a, b = _replica(redis), _replica(redis)
+
+    results = [(a if i % 2 else b).acquire_sliding_window_entry(KEY, 5, 60) for i in range(8)]
+
+    assert results == [True] * 5 + [False] * 3
+    assert redis.calls == 8  # one script call per request, no local decision
+    assert a.stats()["routes"]["app.api.routes.auth.login"]["mode"] == "exact"
+
+
+def test_high_volume_limits_batch_and_sync():
+    redis = _FakeRedis()
+    a, b = _replica(redis), _replica(redis)
+
+    assert all(a.acquire_sliding_window_entry(CATALOG_KEY, 100, 60) for _ in range(70))
+    assert redis.calls == 0  # no Redis round trip on the request path
+    assert a.flush() == 1 and redis.calls == 1
+
+    # b learns a's 70 hits on its first sync and stops at the shared limit
+    b.acquire_sliding_window_entry(CATALOG_KEY, 100, 60)
+    b.flush()
+    allowed = sum(b.acquire_sliding_window_entry(CATALOG_KEY, 100, 60) for _ in range(50))
+    assert allowed == 29
+    assert b.stats()["routes"]["app.api.routes.products.list_products"]["limited"] == 21
+
+
+def test_local_fallback_is_bounded_and_recovers_from_redis_errors():
+    local = _replica(max_local_keys=3)
+    for ip in range(5):
+        local.acquire_sliding_window_entry(f"LIMITER/10.0.0.{ip}/r/5/1/MINUTE", 5, 60)
+    assert local.stats()["local_keys"] == 3 and local.stats()["evictions"] == 2
+
+    redis = _FakeRedis()
+    redis.down = True
+    storage = _replica(redis)
+    assert [storage.acquire_sliding_window_entry(KEY, 2, 60) for _ in range(3)] == [True, True, False]
+    assert redis.calls == 1  # backs off after the first failure
+    stats = storage.stats()
+    assert not stats["redis_available"] and stats["routes"]["app.api.routes.auth.login"]["local"] == 3
+
+
+@pytest.mark.asyncio
+async def test_default_limits_apply_through_middleware():
+    limiter = Limiter(
+        key_func=lambda request: "client",
+        default_limits=["3/minute"],
+        strategy="sliding-window-counter",
+        storage_uri=f"{STORAGE_SCHEME}://",
+        key_style="endpoint",
+    )
+    app = FastAPI()
+    app.state.limiter = limiter
+    app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
+    app.add_middleware(SlowAPIMiddleware)
+
+    @app.get("/catalog")
+    async def catalog(request: Request):
+        return {"ok": True}
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        statuses = [(await client.get("/catalog")).status_code for _ in range(4)]
+
+    assert statuses == [200, 200, 200, 429]
@@ -0,0 +1,173 @@
+"""
+Tests for the public response cache.
+v1.0.0: Shared cached JSON responses with ETags and tag invalidation
+"""
+import httpx
+import pytest
+from fastapi import Depends, FastAPI
+
+from app.core import response_cache
+from app.core.response_cache import (
+    ResponseCacheMiddleware,
+    cached_response,
+    etag_matches,
+    invalidates,
+    normalize_query,
+)
+
+
+class _Pipeline:
+    def __init__(self, redis):
+        self.redis, self.calls = redis, []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+    async def execute(self):
+        return [await getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+
+
+class _MemoryRedis:
+    """The handful of Redis commands the cache uses (decode_responses=True)."""
+
+    def __init__(self):
+        self.values, self.sets = {}, {}
+
+    def pipeline(self, transaction=False):
+        return _Pipeline(self)
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+
+    async def sadd(self, key, member):
+        self.sets.setdefault(key, set()).add(member)
+
+    async def expire(self, key, seconds):
+        return True
+
+    async def smembers(self, key):
+        return set(self.sets.get(key, ()))
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+            self.sets.pop(key, None)
+
+
+def _app():
+    app = FastAPI()
+    app.add_middleware(ResponseCacheMiddleware)
+    calls = {"list": 0}
+
+    @app.get("/items", dependencies=[Depends(cached_response(60, ["items"]))])
+    async def list_items(category: str = None, page: int = 1):
+        calls["list"] += 1
+        return {"category": category, "page": page, "calls": calls["list"]}
+
+    @app.get("/items/special")
+    async def special():
+        return {"special": True}
+
+    @app.get("/items/{item_id}", dependencies=[Depends(cached_response(60, ["item:{item_id}"]))])
+    async def get_item(item_id: int):
+        return {"id": item_id}
+
+    @app.patch("/items/{item_id}", dependencies=[Depends(invalidates("items", "item:{item_id}"))])
+    async def update_item(item_id: int):
+        return {"id": item_id}
+
+    return app, calls
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = _MemoryRedis()
+
+    async def get_redis():
+        return fake
+
+    monkeypatch.setattr(response_cache, "get_redis", get_redis)
+    return fake
+
+
+def _client(app):
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+def test_normalize_query_sorts_and_drops_unknown_and_blank_params():
+    assert normalize_query("page=2&category=dc&_=123&search=", ["category", "page", "search"]) == "category=dc&page=2"
+
+
+def test_etag_matches_lists_and_weak_tags():
+    assert etag_matches('"a", W/"b"', '"b"')
+    assert etag_matches("*", '"x"')
+    assert not etag_matches('"a"', '"b"')
+    assert not etag_matches(None, '"b"')
+
+
+@pytest.mark.asyncio
+async def test_hit_serves_stored_bytes_without_running_the_endpoint(redis):
+    app, calls = _app()
+    async with _client(app) as client:
+        first = await client.get("/items?page=2&category=dc")
+        second = await client.get("/items?category=dc&page=2&utm_source=x")
+
+    assert first.headers["x-cache"] == "MISS" and second.headers["x-cache"] == "HIT"
+    assert second.content == first.content
+    assert second.headers["etag"] == first.headers["etag"]
+    assert calls["list"] == 1
+
+
+@pytest.mark.asyncio
+async def test_if_none_match_gets_304(redis):
+    app, _ = _app()
+    async with _client(app) as client:
+        etag = (await client.get("/items/7")).headers["etag"]
+        response = await client.get("/items/7", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+@pytest.mark.asyncio
+async def test_write_invalidates_tagged_entries(redis):
+    app, calls = _app()
+    async with _client(app) as client:
+        await client.get("/items")
+        await client.get("/items/7")
+        await client.patch("/items/7")
+        listing = await client.get("/items")
+        detail = await client.get("/items/7")
+
+    assert listing.headers["x-cache"] == "MISS" and detail.headers["x-cache"] == "MISS"
+    assert calls["list"] == 2
+
+
+@pytest.mark.asyncio
+async def test_uncached_route_shadowing_a_cached_pattern_passes_through(redis):
+    app, _ = _app()
+    async with _client(app) as client:
+        response = await client.get("/items/special")
+
+    assert response.json() == {"special": True}
+    assert "x-cache" not in response.headers
+    assert redis.values == {}
+
+
+@pytest.mark.asyncio
+async def test_without_redis_responses_still_carry_etags(monkeypatch):
+    async def no_redis():
+        return None
+
+    monkeypatch.setattr(response_cache, "get_redis", no_redis)
+    app, calls = _app()
+    async with _client(app) as client:
+        etag = (await client.get("/items")).headers["etag"]
+        response = await client.get("/items", headers={"If-None-Match": etag})
+
+    # Body differs per call ("calls" counter), so the second ETag is new
+    assert response.status_code == 200
+    assert calls["list"] == 2
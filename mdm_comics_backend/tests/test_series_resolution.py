@@ -0,0 +1,113 @@
+"""
+Tests for the series resolution store.
+v1.0.0: Shared series -> source ID cache with an LRU front
+v1.1.0: Volumes stored by the sequential job are found by the comprehensive job
+"""
+import asyncio
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.adapters.comicvine_adapter import COMICVINE_CONFIG, ComicVineAdapter
+from app.core.utils import utcnow
+from app.services import series_resolution
+from app.services.series_resolution import (
+    LRUCache,
+    SeriesResolution,
+    SeriesResolutionStore,
+    series_key,
+)
+
+
+def _unavailable_db():
+    """Session factory for a database that is down; the store must still work from memory."""
+    raise ConnectionError("database unavailable")
+
+
+def _entry(ids=(1,)):
+    return SeriesResolution(source="metron", series_ids=list(ids), confidence=1.0, resolved_at=utcnow())
+
+
+def test_series_key_normalizes_name_publisher_and_year():
+    assert series_key("The Amazing Spider-Man", "Marvel", 1963) == series_key("amazing spider man", "MARVEL", "1963")
+    assert series_key("Batman", "DC", 2011) != series_key("Batman", "DC", 2016)
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(max_entries=2)
+    cache.put(("a", "metron"), _entry())
+    cache.put(("b", "metron"), _entry())
+    assert cache.get(("a", "metron")) is not None  # a is now most recent
+    cache.put(("c", "metron"), _entry())
+    assert cache.get(("b", "metron")) is None
+    assert cache.get(("a", "metron")) is not None
+    assert cache.evictions == 1
+
+
+def test_negative_resolutions_expire_sooner():
+    old = utcnow() - timedelta(days=2)
+    assert SeriesResolution("metron", [5], 1.0, old).is_fresh()
+    assert not SeriesResolution("metron", [], 0.0, old).is_fresh()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_resolves_share_one_search():
+    store = SeriesResolutionStore(session_factory=_unavailable_db)
+    calls = []
+
+    async def resolver():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return [101, 102], 1.0
+
+    results = await asyncio.gather(*[
+        store.resolve("metron", "Amazing Spider-Man", resolver, publisher="Marvel") for _ in range(5)
+    ])
+    assert len(calls) == 1
+    assert all(r.series_ids == [101, 102] for r in results)
+
+    again = await store.resolve("metron", "amazing spider-man", resolver, publisher="marvel")
+    assert again.series_ids == [101, 102] and len(calls) == 1
+
+    stats = store.get_stats()
+    assert stats["coalesced"] == 4
+    assert stats["memory_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_search_is_not_cached():
+    store = SeriesResolutionStore(session_factory=_unavailable_db)
+    calls = []
+
+    async def failing():
+        calls.append(1)
+        return None
+
+    assert await store.resolve("comicvine", "Saga", failing) is None
+    assert await store.resolve("comicvine", "Saga", failing) is None
+    assert len(calls) == 2
+
+
+async def test_volume_stored_with_start_year_is_found_by_volume_lookup(monkeypatch):
+    store = SeriesResolutionStore(session_factory=_unavailable_db)
+    monkeypatch.setattr(series_resolution, "_store", store)
+    adapter = ComicVineAdapter(COMICVINE_CONFIG, client=None, api_key="test")
+    searches = []
+
+    async def search_volumes(name, limit=20):
+        searches.append(name)
+        return SimpleNamespace(success=True, records=[])
+
+    monkeypatch.setattr(adapter, "search_volumes", search_volumes)
+
+    # sequential job: a matched issue stores its volume under the series start year
+    await store.put("comicvine", "Batman", [796], publisher="DC Comics", start_year=2011)
+
+    # comprehensive job: same series, publisher and start year
+    assert await adapter.resolve_volume_ids("Batman", "DC Comics", 2011) == [796]
+    assert searches == []
+
+    # a yearless key is a different entry, so the lookup would search again
+    assert await adapter.resolve_volume_ids("Batman", "DC Comics") == []
+    assert searches == ["Batman"]
@@ -0,0 +1,95 @@
+"""
+Tests for trigger-maintained stat counters.
+v1.0.0: Statement-level counter triggers and snapshot caching
+v1.0.1: Counter and hourly reads sum shards and share the snapshot
+"""
+from decimal import Decimal
+
+import pytest
+
+from app.services.stat_counters import (
+    COUNTER_SHARDS,
+    COUNTER_SPECS,
+    StatsService,
+    _TTLCache,
+    _counter_trigger_ddl,
+    _hourly_trigger_ddl,
+    clear_stats_cache,
+)
+from tests.conftest import FakeResult, FakeSession
+
+
+def test_counter_trigger_uses_transition_tables_per_event():
+    ddl = _counter_trigger_ddl("funkos")
+    creates = [s for s in ddl if s.startswith("CREATE TRIGGER")]
+
+    assert len(creates) == 3
+    assert "AFTER INSERT ON funkos REFERENCING NEW TABLE AS new_rows" in creates[0]
+    assert "OLD TABLE AS old_rows NEW TABLE AS new_rows" in creates[1]
+    assert "AFTER DELETE ON funkos REFERENCING OLD TABLE AS old_rows" in creates[2]
+    assert all("FOR EACH STATEMENT" in s for s in creates)
+
+
+def test_counter_function_covers_every_counter_and_shards():
+    function = _counter_trigger_ddl("comic_issues")[0]
+    for name in COUNTER_SPECS["comic_issues"]:
+        assert f"'{name}'::text" in function
+    assert f"pg_backend_pid() % {COUNTER_SHARDS}" in function
+    # Zero deltas are never written, so unrelated updates don't touch counters
+    assert "WHERE d.delta <> 0" in function
+
+
+def test_dlq_counters_match_enum_names():
+    assert set(COUNTER_SPECS["dead_letter_queue"]) == {
+        "dead_letter_queue.PENDING", "dead_letter_queue.RETRYING",
+        "dead_letter_queue.RESOLVED", "dead_letter_queue.ABANDONED",
+    }
+
+
+def test_hourly_trigger_buckets_by_timestamp_column():
+    function = _hourly_trigger_ddl("orders")[0]
+    assert "date_trunc('hour', COALESCE(created_at, NOW()))" in function
+    assert "'orders.created'" in function
+
+
+@pytest.mark.asyncio
+async def test_ttl_cache_reuses_until_cleared():
+    cache = _TTLCache()
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        return len(calls)
+
+    assert await cache.get_or_load("k", 60, loader) == 1
+    assert await cache.get_or_load("k", 60, loader) == 1
+    cache.clear()
+    assert await cache.get_or_load("k", 60, loader) == 2
+
+
+class _CounterSession(FakeSession):
+    """stat_counters already summed per name, plus one hourly total."""
+
+    def respond(self, sql, params):
+        if "FROM stat_counters GROUP BY name" in sql:
+            return FakeResult([("funkos.total", Decimal("1200")), ("products.inventory_value", Decimal("8450.75"))])
+        return FakeResult(scalar=Decimal("37"))
+
+
+async def test_counter_reads_share_one_snapshot_until_cleared():
+    clear_stats_cache()
+    db = _CounterSession()
+    stats = StatsService(db)
+
+    assert await stats.get_counters() == {"funkos.total": 1200.0, "products.inventory_value": 8450.75}
+    assert await stats.counter("funkos.total") == 1200
+    assert await stats.counter("dead_letter_queue.PENDING") == 0  # no rows yet reads as zero
+    assert await stats.get_hourly_total("price_changelog.changes", hours=24) == 37
+    assert await stats.get_hourly_total("price_changelog.changes", hours=24) == 37
+
+    assert len(db.executed) == 2
+    assert db.executed[1][1] == {"name": "price_changelog.changes", "hours": 24}
+
+    clear_stats_cache()
+    await stats.counter("funkos.total")
+    assert len(db.executed) == 3